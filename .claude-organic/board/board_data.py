@@ -10,8 +10,19 @@ import json
 import os
 import re
 import subprocess
+import sys
 import time
 
+# engine/ 의 git_state(디스크 직접 읽기 브랜치 조회)를 import 하기 위한 경로 설정
+# 구조: .claude-organic/board/board_data.py → .claude-organic/engine/
+_ENGINE_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'engine')
+)
+if _ENGINE_DIR not in sys.path:
+    sys.path.insert(0, _ENGINE_DIR)
+
+from git_state import current_branch  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -233,21 +244,23 @@ def _list_workflow_entries(project_root: str) -> list[str]:
 def _get_git_branch(project_root: str) -> str:
     """현재 git 브랜치명을 반환한다.
 
-    git 명령 실행 실패 또는 타임아웃 시 빈 문자열을 반환한다.
+    git_state 가 HEAD 를 디스크에서 직접 읽는다 (HEAD stat 1회, 변경 시에만 재파싱).
+    판정 실패 시 빈 문자열을 반환한다.
     """
-    try:
-        result = subprocess.run(
-            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            capture_output=True, text=True, timeout=3,
-            cwd=project_root,
-        )
-        return result.stdout.strip() if result.returncode == 0 else ''
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return ''
+    return current_branch(project_root) or ''
+
 
+def _workflow_detail(project_root: str, entry_rel: str, file_map: bool = True) -> list[dict]:
+    """워크플로우 엔트리 1개의 상세 정보를 반환한다.
+
+    Args:
+        project_root: 프로젝트 루트 절대 경로
+        entry_rel: 엔트리 상대 경로 (예: .claude-organic/runs/20260325-150854/)
+        file_map: False 면 산출물 파일 stat 을 생략하고 fileMap 키를 넣지 않는다 (요약 모드)
 
-def _workflow_detail(project_root: str, entry_rel: str) -> list[dict]:
-    """워크플로우 엔트리 1개의 상세 정보를 반환한다."""
+    Returns:
+        task/command 별 상세 dict 목록.
+    """
     entry_name = entry_rel.rstrip('/').rsplit('/', 1)[-1]
     entry_abs = os.path.join(project_root, entry_rel.strip('/'))
     if not os.path.isdir(entry_abs):
@@ -279,23 +292,7 @@ def _workflow_detail(project_root: str, entry_rel: str) -> list[dict]:
                 continue
             # basePath: relative URL matching client convention
             base_path = entry_rel + task + '/' + cmd + '/'
-            # file map
-            file_map: dict = {}
-            for wf in WF_DETAIL_FILES:
-                fp = os.path.join(cmd_abs, wf['file'])
-                exists = os.path.isfile(fp)
-                file_map[wf['key']] = {
-                    'exists': exists,
-                    'url': base_path + wf['file'] if exists else '',
-                }
-            work_dir = os.path.join(cmd_abs, 'work')
-            has_work = os.path.isdir(work_dir)
-            file_map['work'] = {
-                'exists': has_work,
-                'url': base_path + 'work/' if has_work else '',
-                'isDir': True,
-            }
-            items.append({
+            item = {
                 'entry': entry_name,
                 'task': task,
                 'command': cmd,
@@ -304,11 +301,33 @@ def _workflow_detail(project_root: str, entry_rel: str) -> list[dict]:
                 'created_at': status.get('created_at', ''),
                 'updated_at': status.get('updated_at', ''),
                 'transitions': status.get('transitions', []),
-                'fileMap': file_map,
-            })
+            }
+            if file_map:
+                item['fileMap'] = _workflow_file_map(cmd_abs, base_path)
+            items.append(item)
     return items
 
 
+def _workflow_file_map(cmd_abs: str, base_path: str) -> dict:
+    """command 디렉터리의 산출물 존재 여부/URL 맵을 반환한다."""
+    result: dict = {}
+    for wf in WF_DETAIL_FILES:
+        fp = os.path.join(cmd_abs, wf['file'])
+        exists = os.path.isfile(fp)
+        result[wf['key']] = {
+            'exists': exists,
+            'url': base_path + wf['file'] if exists else '',
+        }
+    work_dir = os.path.join(cmd_abs, 'work')
+    has_work = os.path.isdir(work_dir)
+    result['work'] = {
+        'exists': has_work,
+        'url': base_path + 'work/' if has_work else '',
+        'isDir': True,
+    }
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Memory helpers
 # ---------------------------------------------------------------------------
@@ -69,6 +69,21 @@ logger = logging.getLogger(__name__)
 PORT_RANGE_START: int = 9900
 PORT_RANGE_END: int = 9999
 WATCH_INTERVAL: float = 1.0
+# 파일 감시 백엔드: auto(inotify 가능 시 inotify) | inotify | poll
+WATCH_BACKEND: str = os.environ.get('BOARD_WATCH_BACKEND', 'auto').strip().lower() or 'auto'
+# inotify 이벤트 버스트 병합 창: 마지막 이벤트 후 조용한 시간 / 첫 이벤트부터 최대 지연 (초)
+WATCH_COALESCE_QUIET: float = 0.05
+WATCH_COALESCE_MAX: float = 0.25
+# SSE 클라이언트별 outbound 큐 크기와 오버플로 정책: coalesce(stdout 델타 병합) | drop(클라이언트 끊기)
+SSE_QUEUE_SIZE: int = int(os.environ.get('BOARD_SSE_QUEUE_SIZE', '512') or 512)
+SSE_OVERFLOW_POLICY: str = os.environ.get('BOARD_SSE_OVERFLOW', 'coalesce').strip().lower() or 'coalesce'
+# 서버 코어: asyncio(SSE 를 이벤트 루프에서 직접 스트리밍, 나머지 요청은 executor) | threading(ThreadingHTTPServer)
+SERVER_CORE: str = os.environ.get('BOARD_SERVER_CORE', 'asyncio').strip().lower() or 'asyncio'
+# asyncio 코어에서 일반(블로킹) 핸들러를 실행할 executor 스레드 수
+EXECUTOR_WORKERS: int = int(os.environ.get('BOARD_EXECUTOR_WORKERS', '32') or 32)
+# SSE heartbeat 간격 (초): /events, /terminal/events · /terminal/workflow/events
+SSE_HEARTBEAT_INTERVAL: float = 1.0
+TERMINAL_HEARTBEAT_INTERVAL: float = 0.25
 SERVER_STARTED_AT: str = time.strftime('%Y-%m-%d %H:%M:%S')
 SERVER_PID: int = os.getpid()
 
@@ -14,6 +14,7 @@ import time
 from http.server import ThreadingHTTPServer
 
 from ._common import (
+    SERVER_CORE,
     PORT_RANGE_START,
     PORT_RANGE_END,
     WATCH_INTERVAL,
@@ -21,6 +22,7 @@ from ._common import (
     logger,
     _resolve_memory_dir,
 )
+from .async_server import AsyncBoardServer
 from .http_router import BoardHTTPRequestHandler
 from .sse_client_manager import FileWatcher, GitBranchWatcher, SSEClientManager
 from .terminal_channel import TerminalSSEChannel
@@ -33,6 +35,9 @@ from .state import (
     terminal_sse_channel,
     claude_process,
     workflow_registry,
+    static_assets,
+    ticket_index,
+    workflow_index,
 )
 
 
@@ -137,6 +142,12 @@ def _run_server(project_root: str) -> None:
     with open(url_file, 'w') as f:
         f.write(f'{base}/index.html\n{base}/terminal.html')
 
+    # 정적 자산 ETag / gzip 압축본 사전 생성 (요청 처리를 막지 않도록 백그라운드)
+    static_dir = os.path.join(project_root, '.claude-organic', 'board', 'static')
+    threading.Thread(
+        target=static_assets.warm, args=(static_dir,), name='static-warm', daemon=True,
+    ).start()
+
     # Memory 디렉터리를 WATCH_DIRS에 동적 등록 (절대경로 → os.path.join에서 그대로 사용됨)
     mem_dir = _resolve_memory_dir(project_root)
     if os.path.isdir(mem_dir):
@@ -145,6 +156,11 @@ def _run_server(project_root: str) -> None:
     # FileWatcher 시작
     def on_change(event_type: str, files: list[str]) -> None:
         """파일 변경 감지 콜백."""
+        if event_type == 'kanban':
+            # 클라이언트가 이벤트를 받고 조회하기 전에 티켓 인덱스를 먼저 갱신
+            ticket_index.refresh(project_root, files)
+        elif event_type == 'workflow':
+            workflow_index.invalidate(project_root, files)
         sse_manager.broadcast(event_type, files)
         poll_tracker.add(event_type, files)
 
@@ -190,9 +206,14 @@ def _run_server(project_root: str) -> None:
     zombie_gc_thread.start()
     logger.info('[zombie-gc] started — interval=60s')
 
-    # ThreadingHTTPServer 시작
-    server = ThreadingHTTPServer(('0.0.0.0', port), BoardHTTPRequestHandler)
-    server.daemon_threads = True
+    # HTTP 서버 시작: 기본은 asyncio 코어 (SSE 는 이벤트 루프, 나머지는 executor),
+    # BOARD_SERVER_CORE=threading 이면 요청마다 스레드를 쓰는 ThreadingHTTPServer
+    if SERVER_CORE == 'threading':
+        server = ThreadingHTTPServer(('0.0.0.0', port), BoardHTTPRequestHandler)
+        server.daemon_threads = True
+    else:
+        server = AsyncBoardServer(('0.0.0.0', port), BoardHTTPRequestHandler)
+    logger.info('[server] core=%s port=%d', SERVER_CORE, port)
     try:
         server.serve_forever()
     except KeyboardInterrupt:
@@ -0,0 +1,411 @@
+"""AsyncBoardServer — asyncio serving core (SSE on the event loop, other handlers via executor).
+
+ThreadingHTTPServer 는 SSE 클라이언트마다 heartbeat 루프를 도는 전용 스레드를 하나씩
+붙잡는다. 이 모듈은 하나의 이벤트 루프에서 연결을 받고,
+
+- ``/events``, ``/terminal/events``, 라이브 ``/terminal/workflow/events`` 는 루프에서 직접
+  스트리밍한다. 클라이언트 큐(SSEClientQueue)의 listener 로 루프를 깨우고, heartbeat 는
+  단일 타이머 휠(HeartbeatWheel) 태스크가 유휴 클라이언트에만 보낸다.
+- 그 외 요청(/poll 포함)은 기존 BoardHTTPRequestHandler 를 그대로 ThreadPoolExecutor 에서
+  실행한다. 라우트 테이블과 핸들러 mixin 은 바뀌지 않으며, 소켓 대신 요청 바이트(rfile)와
+  루프로 쓰기를 넘기는 wfile 어댑터를 받는다.
+
+핸들러가 HTTP/1.0 이므로 연결당 요청 1건을 처리하고 응답 후 연결을 닫는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import io
+import threading
+from http.client import HTTPMessage, parse_headers
+
+from ._common import EXECUTOR_WORKERS, logger
+
+# heartbeat 타이머 휠 tick(초) / 슬롯 수
+HEARTBEAT_TICK: float = 0.25
+HEARTBEAT_SLOTS: int = 64
+# 요청 헤더 최대 크기 (바이트)
+MAX_HEADER_BYTES: int = 64 * 1024
+
+_SSE_HEADERS: bytes = (
+    b'Content-Type: text/event-stream; charset=utf-8\r\n'
+    b'Cache-Control: no-cache\r\n'
+    b'Connection: keep-alive\r\n'
+    b'Access-Control-Allow-Origin: *\r\n'
+)
+_HEARTBEAT: bytes = b': heartbeat\n\n'
+
+
+class SSEStream:
+    """이벤트 루프에서 스트리밍하는 SSE 클라이언트 1개.
+
+    put() 을 호출하는 스레드(파일 감시기, Claude stdout reader 등)는 ``wake()`` 로 루프에
+    알리기만 하고, 소켓 쓰기는 이 연결의 writer 태스크만 수행한다.
+
+    Attributes:
+        interval: heartbeat 간격(초)
+        last_write: 마지막 쓰기 시각 (loop.time())
+        heartbeat_due: 다음 깨어남에 heartbeat 를 쓸지 여부
+        closed: 연결 종료 여부
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, interval: float) -> None:
+        """초기화한다.
+
+        Args:
+            loop: 연결을 처리하는 이벤트 루프
+            interval: heartbeat 간격(초)
+        """
+        self.interval: float = interval
+        self.last_write: float = loop.time()
+        self.heartbeat_due: bool = False
+        self.closed: bool = False
+        self._loop: asyncio.AbstractEventLoop = loop
+        self._event: asyncio.Event = asyncio.Event()
+        self._pending: bool = False
+
+    def wake(self) -> None:
+        """writer 태스크를 깨운다. 임의의 스레드에서 호출할 수 있다."""
+        if self._pending:
+            return
+        self._pending = True
+        try:
+            self._loop.call_soon_threadsafe(self._set)
+        except RuntimeError:
+            # 루프가 이미 닫힘 (서버 종료 중)
+            self._pending = False
+
+    def _set(self) -> None:
+        self._pending = False
+        self._event.set()
+
+    def request_heartbeat(self) -> None:
+        """heartbeat 를 요청한다. 루프 스레드에서 호출."""
+        self.heartbeat_due = True
+        self._event.set()
+
+    def close(self) -> None:
+        """스트림을 닫는다. 루프 스레드에서 호출."""
+        self.closed = True
+        self._event.set()
+
+    async def wait(self) -> None:
+        """깨어날 때까지 대기한다."""
+        await self._event.wait()
+        self._event.clear()
+
+
+class HeartbeatWheel:
+    """SSE heartbeat 용 해시 타이머 휠 (단일 asyncio 태스크).
+
+    클라이언트를 ``interval / tick`` 만큼 뒤의 슬롯에 예약하고, 슬롯이 돌아오면 그동안
+    쓰기가 없었던 클라이언트에만 heartbeat 를 요청한다. 최근에 프레임을 보낸 클라이언트는
+    남은 시간만큼 뒤로 다시 예약하므로 heartbeat 가 프레임 사이에 끼어들지 않는다.
+
+    Attributes:
+        tick: 휠 한 칸의 시간(초)
+    """
+
+    def __init__(self, tick: float = HEARTBEAT_TICK, slots: int = HEARTBEAT_SLOTS) -> None:
+        """초기화한다.
+
+        Args:
+            tick: 휠 한 칸의 시간(초)
+            slots: 슬롯 수 (tick * slots 보다 긴 지연은 회전 수로 표현)
+        """
+        self.tick: float = tick
+        self._slots: list[list[list]] = [[] for _ in range(max(1, slots))]
+        self._cursor: int = 0
+
+    def __len__(self) -> int:
+        return sum(len(slot) for slot in self._slots)
+
+    def schedule(self, stream: SSEStream, delay: float) -> None:
+        """delay 초 뒤에 stream 을 점검하도록 예약한다.
+
+        Args:
+            stream: 대상 스트림
+            delay: 지연(초). 최소 1 tick.
+        """
+        ticks = max(1, round(delay / self.tick))
+        rounds, offset = divmod(ticks - 1, len(self._slots))
+        self._slots[(self._cursor + 1 + offset) % len(self._slots)].append([rounds, stream])
+
+    def advance(self, now: float) -> None:
+        """한 칸 전진하며 만기된 스트림을 점검한다.
+
+        Args:
+            now: 현재 시각 (loop.time())
+        """
+        self._cursor = (self._cursor + 1) % len(self._slots)
+        due, keep = self._slots[self._cursor], []
+        self._slots[self._cursor] = keep
+        for entry in due:
+            rounds, stream = entry
+            if stream.closed:
+                continue
+            if rounds > 0:
+                entry[0] = rounds - 1
+                keep.append(entry)
+                continue
+            idle = now - stream.last_write
+            if idle + self.tick / 2 >= stream.interval:
+                stream.request_heartbeat()
+                self.schedule(stream, stream.interval)
+            else:
+                self.schedule(stream, stream.interval - idle)
+
+    async def run(self) -> None:
+        """tick 마다 advance() 를 호출하는 루프 (서버 종료 시 취소된다)."""
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        while True:
+            next_at += self.tick
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+            self.advance(loop.time())
+
+
+class _LoopWriter(io.RawIOBase):
+    """executor 스레드의 핸들러 출력을 이벤트 루프의 StreamWriter 로 넘기는 wfile 어댑터.
+
+    write() 는 루프에서 drain 까지 끝날 때까지 블로킹하므로 기존 핸들러의 흐름 제어
+    (느린 클라이언트에서 쓰기가 막히는 동작)가 그대로 유지된다.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, writer: asyncio.StreamWriter) -> None:
+        super().__init__()
+        self._loop: asyncio.AbstractEventLoop = loop
+        self._writer: asyncio.StreamWriter = writer
+
+    def writable(self) -> bool:
+        return True
+
+    async def _write(self, data: bytes) -> None:
+        if self._writer.is_closing():
+            raise BrokenPipeError('client disconnected')
+        self._writer.write(data)
+        await self._writer.drain()
+
+    def write(self, data: bytes) -> int:
+        if not data:
+            return 0
+        data = bytes(data)
+        try:
+            asyncio.run_coroutine_threadsafe(self._write(data), self._loop).result()
+        except (BrokenPipeError, ConnectionError, RuntimeError) as e:
+            raise BrokenPipeError(str(e) or 'client disconnected') from e
+        return len(data)
+
+
+class _BridgedHandlerMixin:
+    """소켓 대신 미리 읽은 요청 바이트와 _LoopWriter 로 동작하게 하는 핸들러 mixin."""
+
+    def setup(self) -> None:
+        raw, wfile = self.request
+        self.connection = None
+        self.rfile = io.BytesIO(raw)
+        self.wfile = wfile
+
+    def finish(self) -> None:
+        # 연결 종료는 이벤트 루프 쪽에서 수행한다
+        pass
+
+
+class AsyncBoardServer:
+    """asyncio 기반 Board HTTP 서버.
+
+    Attributes:
+        server_address: 바인딩된 (host, port). serve_forever() 가 바인딩한 뒤 채워진다.
+        ready: 바인딩 완료 이벤트
+        handler_class: 일반 요청을 처리할 핸들러 클래스
+    """
+
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        handler_class: type,
+        workers: int = EXECUTOR_WORKERS,
+    ) -> None:
+        """초기화한다.
+
+        Args:
+            server_address: 바인딩할 (host, port). port 0 이면 임의 포트.
+            handler_class: BaseHTTPRequestHandler 계열 핸들러 (async_sse_route 를 제공하면
+                해당 SSE 경로는 루프에서 직접 스트리밍)
+            workers: executor 스레드 수
+        """
+        self.server_address: tuple[str, int] = server_address
+        self.handler_class: type = handler_class
+        self.ready: threading.Event = threading.Event()
+        self._bridged: type = type(
+            f'Bridged{handler_class.__name__}', (_BridgedHandlerMixin, handler_class), {},
+        )
+        self._executor: concurrent.futures.ThreadPoolExecutor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix='board-http',
+        )
+        self._wheel: HeartbeatWheel = HeartbeatWheel()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopped: asyncio.Event | None = None
+        self._connections: dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    # ── 수명 주기 ──
+
+    def serve_forever(self) -> None:
+        """shutdown() 이 호출될 때까지 요청을 처리한다 (호출 스레드를 점유)."""
+        asyncio.run(self._serve())
+
+    def shutdown(self) -> None:
+        """serve_forever() 를 멈춘다. 다른 스레드에서 호출한다."""
+        loop, stopped = self._loop, self._stopped
+        if loop is not None and stopped is not None:
+            try:
+                loop.call_soon_threadsafe(stopped.set)
+            except RuntimeError:
+                pass
+
+    def server_close(self) -> None:
+        """executor 를 정리한다."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        host, port = self.server_address
+        server = await asyncio.start_server(
+            self._handle_connection, host, port, limit=MAX_HEADER_BYTES, reuse_address=True,
+        )
+        self.server_address = server.sockets[0].getsockname()[:2]
+        wheel_task = asyncio.create_task(self._wheel.run())
+        self.ready.set()
+        try:
+            async with server:
+                await self._stopped.wait()
+                # 장기 연결(SSE)을 먼저 닫고 연결 태스크가 정리될 때까지 잠시 기다린다
+                for writer in list(self._connections):
+                    writer.close()
+                if self._connections:
+                    await asyncio.wait(list(self._connections.values()), timeout=2.0)
+        finally:
+            wheel_task.cancel()
+            self.ready.clear()
+
+    # ── 연결 처리 ──
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections[writer] = asyncio.current_task()
+        try:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                return
+            request_line, _, header_block = head.partition(b'\r\n')
+            headers: HTTPMessage = parse_headers(io.BytesIO(header_block))
+            parts = request_line.decode('latin-1').split()
+            method = parts[0] if parts else ''
+            path = parts[1] if len(parts) > 1 else ''
+
+            route = None
+            if method == 'GET':
+                route_of = getattr(self.handler_class, 'async_sse_route', None)
+                route = route_of(path) if route_of is not None else None
+            if route is not None:
+                await self._stream_sse(reader, writer, route[0], route[1], path)
+                return
+
+            try:
+                length = int(headers.get('Content-Length', 0) or 0)
+            except ValueError:
+                length = 0
+            body = await reader.readexactly(length) if length > 0 else b''
+            await self._run_handler(head + body, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception:
+            logger.exception('[async-server] 요청 처리 실패')
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def _run_handler(self, raw: bytes, writer: asyncio.StreamWriter) -> None:
+        """기존 핸들러를 executor 에서 실행한다."""
+        loop = asyncio.get_running_loop()
+        wfile = _LoopWriter(loop, writer)
+        peer = writer.get_extra_info('peername') or ('', 0)
+        await loop.run_in_executor(self._executor, self._invoke_handler, raw, wfile, peer[:2])
+
+    def _invoke_handler(self, raw: bytes, wfile: _LoopWriter, peer: tuple) -> None:
+        try:
+            self._bridged((raw, wfile), peer, self)
+        except BrokenPipeError:
+            pass
+        except Exception:
+            logger.exception('[async-server] 핸들러 예외')
+
+    async def _stream_sse(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        channel: object,
+        interval: float,
+        path: str,
+    ) -> None:
+        """SSE 클라이언트를 이벤트 루프에서 직접 스트리밍한다.
+
+        channel 은 add(key)/remove(key)/queue(key) 를 제공하는 SSEClientManager 또는
+        TerminalSSEChannel 이다. 연결 객체를 클라이언트 키로 사용한다.
+        """
+        loop = asyncio.get_running_loop()
+        writer.write(b'HTTP/1.0 200 OK\r\n' + _SSE_HEADERS + b'\r\n: connected\n\n')
+        await writer.drain()
+        logger.debug('[async-server] SSE 연결: %s', path)
+
+        stream = SSEStream(loop, interval)
+        channel.add(stream)
+        queue = channel.queue(stream)
+        if queue is None:
+            channel.remove(stream)
+            return
+        queue.set_listener(stream.wake)
+        self._wheel.schedule(stream, interval)
+
+        async def _watch_eof() -> None:
+            # SSE 클라이언트는 본문을 보내지 않으므로 읽기 완료 = 연결 종료
+            try:
+                while await reader.read(4096):
+                    pass
+            except ConnectionError:
+                pass
+            stream.close()
+
+        eof_task = asyncio.create_task(_watch_eof())
+        try:
+            while not stream.closed:
+                await stream.wait()
+                if stream.closed or writer.is_closing():
+                    break
+                frames = queue.get(0)
+                if frames is None:
+                    break
+                if frames:
+                    chunk = b''.join(f.encode() for f in frames)
+                elif stream.heartbeat_due:
+                    chunk = _HEARTBEAT
+                else:
+                    continue
+                stream.heartbeat_due = False
+                writer.write(chunk)
+                await writer.drain()
+                stream.last_write = loop.time()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            stream.closed = True
+            queue.set_listener(None)
+            channel.remove(stream)
+            eof_task.cancel()
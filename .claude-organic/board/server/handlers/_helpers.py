@@ -118,3 +118,36 @@ def _import_metrics_cli():
         sys.path.insert(0, engine_dir)
     from flow import metrics_cli  # noqa: WPS433
     return metrics_cli
+
+
+def _import_kanban_service():
+    """kanban_service 모듈을 lazy import 한다.
+
+    카드 이동/삭제를 flow-kanban 서브프로세스 대신 Board 프로세스 안에서 처리하기
+    위해 engine/ 디렉터리를 sys.path 에 보충한 뒤 ``flow.kanban_service`` 를 import.
+    In Progress → Open 전이 시 세션 종료가 HTTP 로 자기 자신을 호출하지 않도록
+    Board 의 워크플로우 세션 레지스트리를 직접 쓰는 종료 함수를 등록한다.
+    """
+    engine_dir = os.path.normpath(
+        os.path.join(os.getcwd(), '.claude-organic', 'engine'),
+    )
+    if engine_dir not in sys.path:
+        sys.path.insert(0, engine_dir)
+    from flow import kanban_service  # noqa: WPS433
+    kanban_service.set_session_killer(_kill_ticket_session)
+    return kanban_service
+
+
+def _kill_ticket_session(ticket: str) -> bool:
+    """티켓에 연결된 워크플로우 세션 프로세스를 종료한다 (POST /terminal/workflow/kill 과 동일).
+
+    Returns:
+        종료할 세션이 있었으면 True.
+    """
+    from ..state import workflow_registry  # noqa: WPS433
+
+    session = workflow_registry.get_by_ticket(ticket)
+    if session is None:
+        return False
+    session.process.kill()
+    return True
@@ -10,6 +10,7 @@ import subprocess
 from ._helpers import (
     _classify_done_failure,
     _DONE_MERGE_OK_RE,
+    _import_kanban_service,
 )
 
 
@@ -19,7 +20,7 @@ def handle_kanban_done_force(handler, ticket: str, force_dirty: bool,
 
     1. open/<ticket>.xml 존재 검증
     2. dirty 워크트리 가드 (force_dirty=false 면 409 차단)
-    3. flow-kanban move <ticket> done --force 호출
+    3. kanban_service.move_ticket(<ticket>, 'done', force=True) in-process 호출
     4. worktree_manager.remove_worktree 로 워크트리/브랜치 정리
     """
     open_xml = os.path.join(
@@ -58,30 +59,22 @@ def handle_kanban_done_force(handler, ticket: str, force_dirty: bool,
     except ImportError:
         wt_path = None  # 워크트리 비활성 환경 — 가드 생략
 
-    # flow-kanban move <ticket> done --force 호출
+    # flow-kanban move <ticket> done --force 와 같은 서비스를 in-process 로 호출
     try:
-        result = subprocess.run(
-            [flow_kanban, 'move', ticket, 'done', '--force'],
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-    except subprocess.TimeoutExpired:
-        handler._send_error(504, 'flow-kanban move timed out (30s)')
+        service = _import_kanban_service()
+    except ImportError as e:
+        handler._send_error(500, f'kanban service unavailable: {e}')
         return
-    except FileNotFoundError:
-        handler._send_error(500, f'flow-kanban not found: {flow_kanban}')
-        return
-
-    if result.returncode != 0:
-        stderr = (result.stderr or result.stdout or '').strip()
+    lines: list[str] = []
+    try:
+        service.move_ticket(ticket, 'done', force=True, emit=lines.append)
+    except service.KanbanError as e:
         handler._send_json_with_status(409, {
             'ok': False,
             'error_kind': 'other',
             'conflicts': [],
             'dirty_files': [],
-            'message': stderr or 'flow-kanban move done --force failed',
+            'message': f'에러: {e}',
             'ticket': ticket,
         })
         return
@@ -105,7 +98,7 @@ def handle_kanban_done_force(handler, ticket: str, force_dirty: bool,
         'ticket': ticket,
         'force': True,
         'worktree_removed': worktree_removed,
-        'stdout': (result.stdout or '').strip(),
+        'stdout': '\n'.join(lines),
     })
 
 
@@ -4,18 +4,17 @@ from __future__ import annotations
 
 import json
 import os
-import time
 
-from ..state import sse_manager, poll_tracker
+from ..state import sse_manager, poll_tracker, terminal_sse_channel, ticket_index, workflow_index
+from ..workflow_index import DEFAULT_PAGE_LIMIT
 from .._common import (
     SERVER_STARTED_AT,
     SERVER_PID,
+    SSE_HEARTBEAT_INTERVAL,
     _parse_env_file,
     _read_kanban_tickets,
     _read_dashboard,
-    _list_workflow_entries,
     _get_git_branch,
-    _workflow_detail,
     _resolve_memory_dir,
     _list_memory_files,
     _read_memory_file,
@@ -43,25 +42,51 @@ class GenericHandlerMixin:
 
         if path == '/api/env':
             self._send_json(_parse_env_file(project_root))
+        elif path == '/api/kanban' and 'since' in qs:
+            # 파싱된 티켓 인덱스의 커서 이후 변경분 (since=0 이면 전체)
+            try:
+                cursor = int(qs['since'][0])
+            except ValueError:
+                cursor = 0
+            self._send_json(ticket_index.since(project_root, cursor))
         elif path == '/api/kanban':
             files_param = qs.get('files', [None])[0]
             files = files_param.split(",") if files_param else None
             self._send_json(_read_kanban_tickets(project_root, files))
         elif path == '/api/dashboard':
             self._send_json(_read_dashboard(project_root))
+        elif path == '/api/workflow/entries' and ('before' in qs or 'limit' in qs):
+            # 커서 페이지 (?before=<key>&limit=&detail=full|summary)
+            try:
+                limit = int(qs.get('limit', [DEFAULT_PAGE_LIMIT])[0])
+            except ValueError:
+                limit = DEFAULT_PAGE_LIMIT
+            self._send_json(workflow_index.page(
+                project_root,
+                before=qs.get('before', [None])[0],
+                limit=limit,
+                detail=qs.get('detail', [None])[0],
+            ))
         elif path == '/api/workflow/entries':
-            self._send_json(_list_workflow_entries(project_root))
+            self._send_json(workflow_index.entries(project_root))
         elif path == '/api/workflow/detail':
             entry = qs.get('entry', [None])[0]
             if not entry:
                 self._send_json([])
                 return
-            self._send_json(_workflow_detail(project_root, entry))
+            summary = qs.get('summary', ['0'])[0] in ('1', 'true')
+            self._send_json(workflow_index.detail(project_root, entry, file_map=not summary))
         elif path == '/api/server-info':
             self._send_json({
                 'pid': SERVER_PID,
                 'started_at': SERVER_STARTED_AT,
             })
+        elif path == '/api/sse/stats':
+            # SSE 클라이언트 큐 깊이/병합/드롭 지표
+            self._send_json({
+                'events': sse_manager.stats(),
+                'terminal': terminal_sse_channel.stats(),
+            })
         elif path == '/api/branch':
             self._send_json({'branch': _get_git_branch(project_root)})
         elif path == '/api/roadmap':
@@ -125,6 +150,9 @@ class GenericHandlerMixin:
         elif path == '/api/metrics/regression':
             last = self._parse_metrics_last(qs, default=20)
             self._handle_metrics_regression(last)
+        elif path == '/api/metrics/hooks':
+            last = self._parse_metrics_last(qs, default=500)
+            self._handle_metrics_hooks(last)
         elif path == '/api/worktree/uncommitted/all':
             self._handle_worktree_uncommitted_all()
         else:
@@ -132,9 +160,22 @@ class GenericHandlerMixin:
             self.end_headers()
 
     def _handle_poll(self) -> None:
-        """폴링 엔드포인트를 처리한다."""
-        changes = poll_tracker.flush()
-        body = json.dumps(changes).encode("utf-8")
+        """폴링 엔드포인트를 처리한다.
+
+        ``/poll?since=<seq>`` 는 커서 이후 변경분을 ``{seq, resync, changes}`` 로 반환한다.
+        커서 없는 ``/poll`` 은 레거시 형식(이벤트 타입별 파일 목록 dict)을 유지한다.
+        """
+        from urllib.parse import urlparse, parse_qs
+        qs = parse_qs(urlparse(self.path).query)
+        if 'since' in qs:
+            try:
+                cursor = int(qs['since'][0])
+            except ValueError:
+                cursor = -1
+            payload = poll_tracker.since(cursor)
+        else:
+            payload = poll_tracker.flush()
+        body = json.dumps(payload).encode("utf-8")
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.send_header("Cache-Control", "no-cache")
@@ -159,16 +200,7 @@ class GenericHandlerMixin:
 
         sse_manager.add(self.wfile)
         try:
-            while True:
-                time.sleep(1)
-                client_lock = sse_manager.get_lock(self.wfile)
-                if client_lock is None:
-                    break
-                try:
-                    with client_lock:
-                        self.wfile.write(b": heartbeat\n\n")
-                        self.wfile.flush()
-                except (BrokenPipeError, ConnectionResetError, OSError):
-                    break
+            # 이 핸들러 스레드가 클라이언트 큐의 writer (heartbeat 포함)
+            sse_manager.pump(self.wfile, heartbeat_interval=SSE_HEARTBEAT_INTERVAL)
         finally:
             sse_manager.remove(self.wfile)
@@ -1,4 +1,8 @@
-"""Kanban DnD POST handlers (move/submit/done/delete) — preserves cb7427f regression fixes."""
+"""Kanban DnD POST handlers (move/submit/done/delete) — preserves cb7427f regression fixes.
+
+move / delete / force done 은 flow-kanban 서브프로세스 대신 engine 의 kanban_service 를
+in-process 로 호출한다. submit(flow-launcher) 과 Review → Done(병합 파이프라인)은 CLI 위임.
+"""
 
 from __future__ import annotations
 
@@ -7,7 +11,7 @@ import re
 import sys
 import subprocess
 
-from ._helpers import _TICKET_RE, _KANBAN_ALL_DIRS
+from ._helpers import _TICKET_RE, _KANBAN_ALL_DIRS, _import_kanban_service
 from ._kanban_done_helpers import (
     handle_kanban_done_force,
     handle_kanban_done_review,
@@ -48,24 +52,19 @@ class KanbanHandlerMixin:
             self._send_error(400, 'DnD allows only "todo" / "open" / "review" transitions')
             return
 
-        project_root = os.getcwd()
-        flow_kanban = os.path.join(project_root, '.claude-organic', 'bin', 'flow-kanban')
+        # flow-kanban 과 같은 서비스를 in-process 로 호출 (티켓 잠금으로 동시 이동 직렬화)
         try:
-            result = subprocess.run(
-                [flow_kanban, 'move', ticket, to],
-                cwd=project_root, capture_output=True, text=True, timeout=10,
-            )
-        except subprocess.TimeoutExpired:
-            self._send_error(504, 'flow-kanban move timed out')
-            return
-        except FileNotFoundError:
-            self._send_error(500, f'flow-kanban not found: {flow_kanban}')
+            service = _import_kanban_service()
+        except ImportError as e:
+            self._send_error(500, f'kanban service unavailable: {e}')
             return
-
-        if result.returncode != 0:
-            self._send_error(400, f'flow-kanban move failed: {(result.stderr or result.stdout or "").strip()}')
+        lines: list[str] = []
+        try:
+            service.move_ticket(ticket, to, emit=lines.append)
+        except service.KanbanError as e:
+            self._send_error(400, f'flow-kanban move failed: {e}')
             return
-        self._send_json({'ok': True, 'ticket': ticket, 'to': to, 'stdout': result.stdout.strip()})
+        self._send_json({'ok': True, 'ticket': ticket, 'to': to, 'stdout': '\n'.join(lines)})
 
     def _handle_kanban_submit(self) -> None:
         """POST /api/kanban/submit — {"ticket","command"}: flow-launcher 위임, LAUNCH:/INLINE: 파싱."""
@@ -160,23 +159,18 @@ class KanbanHandlerMixin:
             })
             return
 
-        flow_kanban = os.path.join(project_root, '.claude-organic', 'bin', 'flow-kanban')
         try:
-            result = subprocess.run(
-                [flow_kanban, 'delete', ticket],
-                cwd=project_root, capture_output=True, text=True, timeout=30,
-            )
-        except subprocess.TimeoutExpired:
-            self._send_error(504, 'flow-kanban delete timed out (30s)')
+            service = _import_kanban_service()
+        except ImportError as e:
+            self._send_error(500, f'kanban service unavailable: {e}')
             return
-        except FileNotFoundError:
-            self._send_error(500, f'flow-kanban not found: {flow_kanban}')
-            return
-
-        if result.returncode != 0:
+        lines: list[str] = []
+        try:
+            service.delete_ticket(ticket, emit=lines.append)
+        except service.KanbanError as e:
             self._send_json_with_status(409, {
                 'ok': False, 'error_kind': 'other', 'blocked_by': [],
-                'message': (result.stderr or result.stdout or '').strip() or 'flow-kanban delete failed',
+                'message': f'에러: {e}',
                 'ticket': ticket,
             })
             return
@@ -195,6 +189,6 @@ class KanbanHandlerMixin:
 
         self._send_json({
             'ok': True, 'ticket': ticket,
-            'stdout': (result.stdout or '').strip(),
+            'stdout': '\n'.join(lines),
             'worktree_removed': worktree_removed,
         })
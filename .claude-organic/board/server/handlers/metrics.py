@@ -1,4 +1,4 @@
-"""Metrics handlers (W06): run/aggregate/regression."""
+"""Metrics handlers (W06): run/aggregate/regression/hooks."""
 
 from __future__ import annotations
 
@@ -10,7 +10,7 @@ logger = logging.getLogger(__name__)
 
 
 class MetricsHandlerMixin:
-    """Metrics handlers (W06): run/aggregate/regression."""
+    """Metrics handlers (W06): run/aggregate/regression/hooks."""
 
     @staticmethod
     def _parse_metrics_last(qs: dict, default: int) -> int:
@@ -70,3 +70,16 @@ class MetricsHandlerMixin:
         data = dict(data)
         data['last'] = last
         self._send_json(data)
+
+    def _handle_metrics_hooks(self, last: int) -> None:
+        """GET /api/metrics/hooks?last=N — 최근 N번 훅 호출의 지연 분위수 응답."""
+        try:
+            cli = _import_metrics_cli()
+            data = cli.hook_latency_report(last)
+        except Exception as exc:  # noqa: BLE001
+            logger.exception('metrics.hooks failed: %s', exc)
+            self._send_error(500, f'hook_latency_report failed: {exc}')
+            return
+        data = dict(data)
+        data['last'] = last
+        self._send_json(data)
@@ -5,16 +5,20 @@ from __future__ import annotations
 import datetime
 import json
 import os
-import time
 import uuid
 from urllib.parse import parse_qs, urlparse
 
 from ..state import terminal_sse_channel, claude_process, workflow_registry
-from .._common import logger, _get_git_branch
+from .._common import TERMINAL_HEARTBEAT_INTERVAL, logger, _get_git_branch
 from ..event_filter import is_user_visible
 from ..terminal_channel import _resolve_last_event_id
 from ..claude_process import _validate_images
 from .._attachments_persist import AttachmentsSidecar
+from ..session_catalog import (
+    TITLE_SKIP_EXACT as _TITLE_SKIP_EXACT,
+    TITLE_SKIP_PREFIXES as _TITLE_SKIP_PREFIXES,
+    get_catalog,
+)
 
 
 # T-429: jsonl content 배열에 첨부 text 블록 prefix 가 들어가는 경우의 안전
@@ -229,90 +233,6 @@ def _build_render_events(data: dict) -> list[dict]:
     return events
 
 
-_TITLE_SKIP_PREFIXES = (
-    '<local-command-',
-    '<command-message>',
-    '<command-name>',
-    '<command-stdout>',
-    '<command-args>',
-    '<system-reminder>',
-)
-_TITLE_SKIP_EXACT = (
-    "첫 메시지입니다. '세션이 초기화 되었습니다.' 라고만 답하세요.",
-)
-_TITLE_MAX_LENGTH = 100
-_TITLE_SCAN_MAX_LINES = 300
-
-
-def _extract_session_meta(filepath: str) -> tuple[str | None, str]:
-    """jsonl 파일에서 (title, branch) 를 한 번의 스캔으로 추출한다.
-
-    title: 첫 유효 user 메시지 (필터 규칙은 기존 _extract_session_title 동일)
-    branch: 가장 최근에 등장한 ``gitBranch`` 필드 값 (없으면 빈 문자열)
-
-    - toolUseResult 포함 메시지(툴 결과)는 title 후보에서 스킵
-    - 슬래시 명령 래퍼(<command-*>)는 스킵하되 플래그를 세워두고
-      그 직후의 `# ` 시작 마크다운은 명령어 .md 본문 주입으로 간주하여 추가 스킵
-    - 로컬 커맨드 / 시스템 리마인더 래퍼도 스킵
-    - resume 초기화 템플릿 메시지는 스킵
-    - 최대 _TITLE_SCAN_MAX_LINES 라인까지만 검사 (branch 도 같은 범위에서만 추출)
-    - title 이 끝까지 없으면 (None, branch) 반환 → 호출부에서 결과 제외 판단
-    """
-    title: str | None = None
-    branch = ''
-    command_context = False
-    try:
-        with open(filepath, 'r', encoding='utf-8') as fp:
-            for index, line in enumerate(fp):
-                if index > _TITLE_SCAN_MAX_LINES:
-                    break
-                try:
-                    event = json.loads(line)
-                except (ValueError, json.JSONDecodeError):
-                    continue
-
-                # branch: 모든 라인에서 가능한 만큼 갱신 (마지막 등장 값)
-                if isinstance(event.get('gitBranch'), str) and event['gitBranch']:
-                    branch = event['gitBranch']
-
-                if title is not None:
-                    # title 이미 확정 → branch 만 계속 추적
-                    continue
-
-                if event.get('type') != 'user':
-                    continue
-                if 'toolUseResult' in event:
-                    continue
-                message = event.get('message') or {}
-                content = message.get('content', '')
-                text = ''
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get('type') == 'text':
-                            text = block.get('text', '') or ''
-                            break
-                elif isinstance(content, str):
-                    text = content
-                text = text.strip()
-                if not text:
-                    continue
-                if text.startswith(('<command-message>', '<command-name>',
-                                    '<command-stdout>', '<command-args>')):
-                    command_context = True
-                    continue
-                if command_context and text.startswith('# '):
-                    continue
-                command_context = False
-                if text.startswith(_TITLE_SKIP_PREFIXES):
-                    continue
-                if text in _TITLE_SKIP_EXACT:
-                    continue
-                title = text[:_TITLE_MAX_LENGTH]
-    except (OSError, IOError) as err:
-        logger.debug('세션 메타 추출 실패 (%s): %s', filepath, err)
-    return title, branch
-
-
 class TerminalHandlerMixin:
     """Terminal main-session HTTP endpoints."""
 
@@ -352,17 +272,8 @@ class TerminalHandlerMixin:
             skip_replay=skip_replay,
         )
         try:
-            while True:
-                time.sleep(0.25)
-                client_lock = terminal_sse_channel.get_lock(self.wfile)
-                if client_lock is None:
-                    break
-                try:
-                    with client_lock:
-                        self.wfile.write(b': heartbeat\n\n')
-                        self.wfile.flush()
-                except (BrokenPipeError, ConnectionResetError, OSError):
-                    break
+            # 이 핸들러 스레드가 클라이언트 큐의 writer (heartbeat 포함)
+            terminal_sse_channel.pump(self.wfile, heartbeat_interval=TERMINAL_HEARTBEAT_INTERVAL)
         finally:
             terminal_sse_channel.remove(self.wfile)
 
@@ -389,11 +300,16 @@ class TerminalHandlerMixin:
     def _handle_terminal_sessions(self) -> None:
         """세션 목록 조회 엔드포인트를 처리한다.
 
-        GET /terminal/sessions: ~/.claude/projects/<project-path>/ 디렉터리에서
-        .jsonl 파일을 mtime 기준 내림차순으로 전수 스캔하여 JSON 배열로 반환한다.
-        각 파일에서 최초 유효 user 메시지를 파싱하여 title 필드를 추출한다.
+        GET /terminal/sessions[?limit=N][&before=<last_active>[&before_id=<uuid>]]:
+        ~/.claude/projects/<project-path>/ 디렉터리의 .jsonl 세션을 last_active
+        내림차순으로 반환한다. title/branch 는 SessionCatalog 의 영속 캐시에서 읽으며,
+        변경된 파일만 새로 append 된 바이트를 증분 스캔한다.
         유효 메시지가 없는 임시/초기화 세션은 결과에서 제외한다.
 
+        limit / before 가 없으면 전체 목록을 JSON 배열로 반환한다. 있으면 페이지
+        모드로 ``{"sessions": [...], "has_more": bool}`` 를 반환한다. 다음 페이지는
+        마지막 항목의 last_active 와 session_id 를 before / before_id 로 넘긴다.
+
         응답 항목:
             session_id: UUID (파일명에서 추출)
             last_active: mtime 기반 ISO 8601 형식 시각
@@ -412,6 +328,18 @@ class TerminalHandlerMixin:
         project_slug = project_root.replace('/', '-')
         sessions_dir = os.path.join(home_dir, '.claude', 'projects', project_slug)
 
+        limit_param = self._parse_query_param('limit')
+        before = self._parse_query_param('before')
+        before_id = self._parse_query_param('before_id') or ''
+        paged = limit_param is not None or before is not None
+        limit: int | None = None
+        if limit_param is not None:
+            try:
+                limit = max(0, int(limit_param))
+            except ValueError:
+                self._send_error(400, 'limit must be an integer')
+                return
+
         # is_current = "지금 실행 중"인 세션. status == 'stopped' 인 경우
         # .last-session-id 에서 복원된 session_id 는 '마지막 세션'(is_last)
         # 이지 '현재 세션'이 아니다.
@@ -420,50 +348,38 @@ class TerminalHandlerMixin:
             last_session_id if claude_process.status != 'stopped' else ''
         )
 
-        entries: list[tuple[float, str, str, int]] = []  # (mtime, session_id, filepath, size)
-        try:
-            with os.scandir(sessions_dir) as it:
-                for entry in it:
-                    if not entry.name.endswith('.jsonl'):
-                        continue
-                    stem = entry.name[:-6]  # ".jsonl" 제거
-                    try:
-                        uuid.UUID(stem)
-                    except ValueError:
-                        continue
-                    try:
-                        st = entry.stat()
-                    except OSError:
-                        continue
-                    entries.append((st.st_mtime, stem, entry.path, st.st_size))
-        except OSError as e:
-            logger.debug('세션 디렉터리 스캔 실패: %s', e)
-            self._send_json([])
-            return
-
-        # mtime 내림차순 정렬
-        entries.sort(key=lambda x: x[0], reverse=True)
+        rows = [
+            (datetime.datetime.fromtimestamp(
+                meta.mtime, tz=datetime.timezone.utc
+            ).strftime('%Y-%m-%dT%H:%M:%SZ'), meta)
+            for meta in get_catalog(sessions_dir).refresh()
+        ]
+        if paged:
+            # 페이지 커서가 안정적이도록 (last_active, session_id) 내림차순으로 고정
+            rows.sort(key=lambda row: (row[0], row[1].session_id), reverse=True)
 
         result = []
-        for mtime, session_id, filepath, size_bytes in entries:
-            title, branch = _extract_session_meta(filepath)
-            if title is None:
-                # 제목 추출 실패 = 임시/초기화 세션으로 간주하여 제외
+        has_more = False
+        for last_active, meta in rows:
+            if before is not None and (last_active, meta.session_id) >= (before, before_id):
                 continue
-            last_active = datetime.datetime.fromtimestamp(
-                mtime, tz=datetime.timezone.utc
-            ).strftime('%Y-%m-%dT%H:%M:%SZ')
+            if limit is not None and len(result) >= limit:
+                has_more = True
+                break
             result.append({
-                'session_id': session_id,
+                'session_id': meta.session_id,
                 'last_active': last_active,
-                'is_current': bool(current_session_id) and session_id == current_session_id,
-                'is_last': bool(last_session_id) and session_id == last_session_id,
-                'title': title,
-                'branch': branch,
-                'size_bytes': size_bytes,
+                'is_current': bool(current_session_id) and meta.session_id == current_session_id,
+                'is_last': bool(last_session_id) and meta.session_id == last_session_id,
+                'title': meta.title,
+                'branch': meta.branch,
+                'size_bytes': meta.size,
             })
 
-        self._send_json(result)
+        if paged:
+            self._send_json({'sessions': result, 'has_more': has_more})
+        else:
+            self._send_json(result)
 
     def _handle_terminal_history(self) -> None:
         """세션 대화 히스토리 조회 엔드포인트를 처리한다.
@@ -5,12 +5,12 @@ from __future__ import annotations
 import json
 import os
 import sys
-import time
 import uuid
 
 from ..state import workflow_registry
-from .._common import logger
+from .._common import TERMINAL_HEARTBEAT_INTERVAL, logger
 from ..event_filter import is_user_visible
+from ..session_index import SessionIndex
 from ..terminal_channel import _resolve_last_event_id, TerminalSSEChannel
 from ..claude_process import _validate_images
 
@@ -31,6 +31,28 @@ if _ENGINE_DIR not in sys.path:
 _REST_CLASSIFIER = TerminalSSEChannel()
 
 
+def _history_entry(obj: dict) -> tuple[str, dict] | None:
+    """persist jsonl 한 줄(dict)을 SSE live 경로와 같은 (event, data) 로 변환한다.
+
+    Args:
+        obj: 파싱된 jsonl 줄
+
+    Returns:
+        (이벤트 타입, data dict). _meta 줄이거나 사용자 비가시 이벤트면 None.
+    """
+    if '_meta' in obj:
+        return None
+    # 사용자 가시성 정책 적용 (isMeta 등 제외)
+    if not is_user_visible(obj):
+        return None
+    # workflow_step 은 _classify_event 매핑 밖 — 직접 처리
+    if obj.get('type', '') == 'workflow_step':
+        return 'workflow_step', {k: v for k, v in obj.items() if k != 'type'}
+    # SSE live 경로와 동일하게 이벤트 분류 + payload 빌드
+    event_type = _REST_CLASSIFIER._classify_event(obj)
+    return event_type, _REST_CLASSIFIER._build_payload(obj, event_type)
+
+
 class WorkflowHandlerMixin:
     """Workflow session HTTP endpoints."""
 
@@ -248,17 +270,8 @@ class WorkflowHandlerMixin:
         last_event_id = _resolve_last_event_id(self.headers, self.path)
         session.channel.add(self.wfile, last_event_id=last_event_id)
         try:
-            while True:
-                time.sleep(0.25)
-                client_lock = session.channel.get_lock(self.wfile)
-                if client_lock is None:
-                    break
-                try:
-                    with client_lock:
-                        self.wfile.write(b': heartbeat\n\n')
-                        self.wfile.flush()
-                except (BrokenPipeError, ConnectionResetError, OSError):
-                    break
+            # 이 핸들러 스레드가 클라이언트 큐의 writer (heartbeat 포함)
+            session.channel.pump(self.wfile, heartbeat_interval=TERMINAL_HEARTBEAT_INTERVAL)
         finally:
             session.channel.remove(self.wfile)
 
@@ -330,17 +343,24 @@ class WorkflowHandlerMixin:
         self._send_json({'ok': True, 'step': step})
 
     def _handle_workflow_history(self) -> None:
-        """워크플로우 세션 전체 이벤트 이력을 JSON으로 반환한다.
+        """워크플로우 세션 이벤트 이력을 JSON으로 반환한다.
 
-        GET /terminal/workflow/history?session_id=wf-T-NNN-...
+        GET /terminal/workflow/history?session_id=wf-T-NNN-...[&since=S][&before=B][&limit=N]
 
         레지스트리에 등록된 세션이면 persist_path, 없으면 archived 복원 경로로
         jsonl 파일을 읽어 이벤트 배열로 변환한다. _meta 첫 줄은 skip하고,
-        나머지 줄을 {seq, event, data} 형태로 반환한다. 파싱 실패 라인은
+        사용자 가시 이벤트를 {seq, event, data} 형태로 반환한다. 파싱 실패 라인은
         logger.error 기록 후 skip (전체 실패로 확장 금지).
 
+        seq 는 파일의 이벤트 줄 번호이며 (_meta 제외, 비가시 이벤트 포함), total_count 는
+        전체 이벤트 줄 수이다. 페이지/전체 모드가 같은 번호를 쓴다.
+        since / before / limit 중 하나라도 있으면 페이지 모드로 동작한다. 희소 인덱스
+        (.jsonl.idx)로 since 직전 위치에 seek 하므로 파일 전체를 다시 파싱하지 않는다. limit 은 범위 안의
+        최신 N 개를 반환한다 (newest-first 지연 로드: 다음 페이지는 before=first_seq).
+
         응답:
             {"session_id": ..., "total_count": N, "events": [{seq, event, data}, ...]}
+            페이지 모드는 추가로 {"has_more": bool, "first_seq": int|null, "last_seq": int|null}
         """
         session_id = self._parse_query_param('session_id')
         if not session_id:
@@ -349,11 +369,14 @@ class WorkflowHandlerMixin:
 
         # jsonl 파일 경로 결정: 등록 세션 우선, 없으면 archived 경로
         jsonl_path: str | None = None
+        index: SessionIndex | None = None
 
         session = workflow_registry.get(session_id)
         if session is not None:
-            # 활성 세션: channel의 persist_path 사용
+            # 활성 세션: channel의 persist_path 사용 (write-behind 버퍼를 먼저 기록)
+            session.channel.flush_persist()
             jsonl_path = session.channel._persist_path
+            index = session.channel.persist_index
         else:
             # archived 세션: registry의 _session_file 경로 직접 사용
             candidate = workflow_registry._session_file(session_id)
@@ -364,61 +387,48 @@ class WorkflowHandlerMixin:
             self._send_error(404, f'Session not found: {session_id}')
             return
 
-        events: list[dict] = []
-        seq = 0
+        paging = {
+            key: self._parse_query_param(key) for key in ('since', 'before', 'limit')
+        }
+        paged = any(value is not None for value in paging.values())
         try:
-            with open(jsonl_path, 'r', encoding='utf-8') as f:
-                for raw_line in f:
-                    line = raw_line.strip()
-                    if not line:
-                        continue
-                    try:
-                        obj = json.loads(line)
-                    except json.JSONDecodeError as exc:
-                        logger.error(
-                            "workflow_history[%s]: jsonl 파싱 실패 (seq=%d): %s — %r",
-                            session_id, seq, exc, line[:120],
-                        )
-                        seq += 1
-                        continue
-
-                    # _meta 첫 줄 skip
-                    if '_meta' in obj:
-                        continue
-
-                    # 사용자 가시성 정책 적용 (isMeta 등 제외)
-                    if not is_user_visible(obj):
-                        continue
-
-                    # workflow_step 은 _classify_event 매핑 밖 — 직접 처리
-                    obj_type = obj.get('type', '')
-                    if obj_type == 'workflow_step':
-                        event_type = 'workflow_step'
-                        data_field = {k: v for k, v in obj.items() if k != 'type'}
-                    else:
-                        # SSE live 경로와 동일하게 이벤트 분류 + payload 빌드
-                        event_type = _REST_CLASSIFIER._classify_event(obj)
-                        data_field = _REST_CLASSIFIER._build_payload(obj, event_type)
-
-                    events.append({
-                        'seq': seq,
-                        'event': event_type,
-                        'data': data_field,
-                    })
-                    seq += 1
-        except OSError as exc:
-            logger.error(
-                "workflow_history[%s]: jsonl 파일 읽기 실패 (%s): %s",
-                session_id, jsonl_path, exc,
-            )
-            self._send_error(500, f'Failed to read session history: {exc}')
-            return
-
-        self._send_json({
+            since = int(paging['since']) if paging['since'] is not None else -1
+            before = int(paging['before']) if paging['before'] is not None else None
+            limit = int(paging['limit']) if paging['limit'] is not None else None
+        except ValueError:
+            self._send_error(400, 'since/before/limit must be integers')
+            return
+        if index is None:
+            index = SessionIndex(jsonl_path)
+        # 페이지/전체 모드 모두 인덱스의 seq (_meta 를 뺀 이벤트 줄 번호) 를 쓴다.
+        # 비가시 이벤트도 seq 를 차지하므로 두 모드의 seq/커서가 같은 메시지를 가리킨다.
+        lines, total = index.read_range(since=since, before=before, limit=limit)
+        events = []
+        for seq, line in lines:
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError as exc:
+                logger.error(
+                    "workflow_history[%s]: jsonl 파싱 실패 (seq=%d): %s — %r",
+                    session_id, seq, exc, line[:120],
+                )
+                continue
+            entry = _history_entry(obj)
+            if entry is not None:
+                events.append({'seq': seq, 'event': entry[0], 'data': entry[1]})
+        response: dict = {
             'session_id': session_id,
-            'total_count': len(events),
+            'total_count': total,
             'events': events,
-        })
+        }
+        if paged:
+            first_seq = lines[0][0] if lines else None
+            response.update({
+                'has_more': first_seq is not None and first_seq > since + 1,
+                'first_seq': first_seq,
+                'last_seq': lines[-1][0] if lines else None,
+            })
+        self._send_json(response)
 
     def _handle_workflow_stop(self) -> None:
         """워크플로우를 강제 중지하고 4축(프로세스/jsonl/칸반/워크트리)을 정리한다.
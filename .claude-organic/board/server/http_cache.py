@@ -0,0 +1,158 @@
+"""HTTP 조건부 요청 / gzip 지원 — ETag, If-None-Match, Accept-Encoding, 정적 자산 캐시."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import threading
+
+# gzip 으로 압축할 정적 자산 확장자 (이미 압축된 이미지/폰트는 제외)
+COMPRESSIBLE_EXTS: tuple[str, ...] = (
+    '.html', '.js', '.mjs', '.css', '.json', '.svg', '.txt', '.map', '.md', '.xml',
+)
+# 이보다 작은 본문은 압축하지 않는다 (헤더 오버헤드가 더 큼)
+GZIP_MIN_BYTES: int = 1024
+GZIP_LEVEL: int = 6
+# 이보다 큰 정적 파일은 캐시하지 않고 SimpleHTTPRequestHandler 에 위임한다
+STATIC_CACHE_MAX_FILE_BYTES: int = 8 * 1024 * 1024
+
+
+def make_etag(body: bytes) -> str:
+    """본문 내용 해시 기반 strong ETag 를 반환한다."""
+    return '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더가 etag 와 일치하는지 판정한다.
+
+    콤마로 구분된 목록과 ``*`` 를 지원하며, 약한 비교(W/ 접두어 무시)를 사용한다.
+
+    Args:
+        if_none_match: If-None-Match 헤더 값 (없으면 None)
+        etag: 현재 표현의 ETag
+
+    Returns:
+        일치하면 True (304 응답 대상).
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*':
+            return True
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Accept-Encoding 헤더가 gzip 을 허용하는지 판정한다 (``q=0`` 이면 거부)."""
+    if not accept_encoding:
+        return False
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        if coding.strip().lower() not in ('gzip', '*'):
+            continue
+        params = params.replace(' ', '')
+        if params.startswith('q='):
+            try:
+                return float(params[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def gzip_body(body: bytes) -> bytes:
+    """본문을 gzip 으로 압축한다 (mtime=0 으로 결정적 출력)."""
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class StaticAsset:
+    """캐시된 정적 파일 1개.
+
+    Attributes:
+        mtime_ns: 캐시 시점의 파일 mtime (ns)
+        size: 원본 크기 (bytes)
+        etag: 내용 해시 기반 strong ETag
+        body: 원본 본문
+        gzip_body: 압축 본문. 압축 대상이 아니거나 이득이 없으면 None.
+    """
+
+    __slots__ = ('mtime_ns', 'size', 'etag', 'body', 'gzip_body')
+
+    def __init__(self, mtime_ns: int, size: int, body: bytes) -> None:
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.etag = make_etag(body)
+        self.body = body
+        self.gzip_body: bytes | None = None
+
+
+class StaticAssetCache:
+    """정적 자산의 ETag 와 gzip 압축본을 메모리에 보관하는 캐시.
+
+    파일은 (mtime, size) 가 바뀔 때만 다시 읽고 해시/압축하므로, 요청마다 압축하지 않는다.
+    서버 시작 시 warm() 으로 static 트리 전체를 미리 압축해 둔다.
+
+    Attributes:
+        _assets: 절대 경로 -> StaticAsset
+        _lock: thread-safe 접근용 Lock
+    """
+
+    def __init__(self) -> None:
+        """초기화한다."""
+        self._assets: dict[str, StaticAsset] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, abs_path: str) -> StaticAsset | None:
+        """파일의 캐시 항목을 반환한다. 파일이 바뀌었으면 다시 읽는다.
+
+        Args:
+            abs_path: 정적 파일 절대 경로
+
+        Returns:
+            StaticAsset. 파일이 없거나 너무 크면 None.
+        """
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            return None
+        with self._lock:
+            asset = self._assets.get(abs_path)
+        if asset is not None and asset.mtime_ns == st.st_mtime_ns and asset.size == st.st_size:
+            return asset
+        if st.st_size > STATIC_CACHE_MAX_FILE_BYTES:
+            return None
+        try:
+            with open(abs_path, 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+        asset = StaticAsset(st.st_mtime_ns, st.st_size, body)
+        if abs_path.lower().endswith(COMPRESSIBLE_EXTS) and len(body) >= GZIP_MIN_BYTES:
+            compressed = gzip_body(body)
+            if len(compressed) < len(body):
+                asset.gzip_body = compressed
+        with self._lock:
+            self._assets[abs_path] = asset
+        return asset
+
+    def warm(self, static_dir: str) -> int:
+        """static_dir 하위 모든 파일을 미리 읽어 ETag 와 압축본을 만든다.
+
+        Args:
+            static_dir: 정적 파일 루트 디렉터리
+
+        Returns:
+            캐시된 파일 수.
+        """
+        count = 0
+        for dirpath, _dirnames, filenames in os.walk(static_dir):
+            for name in filenames:
+                if self.get(os.path.join(dirpath, name)) is not None:
+                    count += 1
+        return count
@@ -7,12 +7,16 @@ import os
 from http.server import SimpleHTTPRequestHandler
 
 from ._common import (
+    SSE_HEARTBEAT_INTERVAL,
+    TERMINAL_HEARTBEAT_INTERVAL,
     logger,
     _update_env_value,
     _delete_memory_file,
     _delete_rules_file,
     _delete_prompt_file,
 )
+from .http_cache import GZIP_MIN_BYTES, accepts_gzip, etag_matches, gzip_body, make_etag
+from .state import sse_manager, static_assets, terminal_sse_channel, workflow_registry
 from .handlers.files import FilesHandlerMixin
 from .handlers.sync import SyncHandlerMixin
 from .handlers.generic import GenericHandlerMixin
@@ -44,6 +48,9 @@ class BoardHTTPRequestHandler(
     /api/* 경로는 JSON API로 처리하고,
     그 외 경로는 SimpleHTTPRequestHandler의 정적 파일 서빙으로 위임한다.
     정적 파일은 ``.claude-organic/board/static`` 디렉터리를 루트로 서빙한다.
+
+    static 트리의 파일과 JSON API 응답은 내용 해시 ETag 를 붙여 If-None-Match 일치 시
+    304 로 응답하고, Accept-Encoding 이 gzip 을 허용하면 압축 본문을 보낸다.
     """
 
     def __init__(self, *args, **kwargs) -> None:
@@ -74,17 +81,43 @@ class BoardHTTPRequestHandler(
             return os.path.join(self._project_root, rel)
         return super().translate_path(path)
 
+    @staticmethod
+    def async_sse_route(path: str) -> tuple[object, float] | None:
+        """이벤트 루프에서 직접 스트리밍할 수 있는 SSE 경로의 채널을 찾는다.
+
+        asyncio 서버 코어(async_server)가 do_GET 의 SSE 분기와 같은 규칙으로 호출한다.
+        라이브 채널이 없는 경로(아카이브/없는 워크플로우 세션 등)는 None 을 반환하여
+        기존 핸들러가 executor 에서 처리하게 한다.
+
+        Args:
+            path: 요청 경로 (쿼리 포함)
+
+        Returns:
+            (add/remove/queue 를 제공하는 채널, heartbeat 간격) 또는 None.
+        """
+        from urllib.parse import urlparse, parse_qs
+        if path == '/events':
+            return sse_manager, SSE_HEARTBEAT_INTERVAL
+        if path.startswith('/terminal/events'):
+            return terminal_sse_channel, TERMINAL_HEARTBEAT_INTERVAL
+        if path.startswith('/terminal/workflow/events'):
+            session_id = parse_qs(urlparse(path).query).get('session_id', [None])[0]
+            session = workflow_registry.get(session_id) if session_id else None
+            if session is not None:
+                return session.channel, TERMINAL_HEARTBEAT_INTERVAL
+        return None
+
     def do_GET(self) -> None:
         """GET 요청을 처리한다."""
         if self.path == '/events':
             self._handle_sse()
-        elif self.path == '/poll':
+        elif self.path == '/poll' or self.path.startswith('/poll?'):
             self._handle_poll()
         elif self.path.startswith('/terminal/events'):
             self._handle_terminal_sse()
         elif self.path == '/terminal/status':
             self._handle_terminal_status()
-        elif self.path == '/terminal/sessions':
+        elif self.path == '/terminal/sessions' or self.path.startswith('/terminal/sessions?'):
             self._handle_terminal_sessions()
         elif self.path.startswith('/terminal/history'):
             self._handle_terminal_history()
@@ -98,9 +131,71 @@ class BoardHTTPRequestHandler(
             self._handle_workflow_history()
         elif self.path.startswith('/api/'):
             self._handle_api()
-        else:
+        elif not self._serve_static():
             super().do_GET()
 
+    def _serve_static(self) -> bool:
+        """static 트리의 파일을 ETag/gzip 캐시로 서빙한다.
+
+        Returns:
+            처리했으면 True. static 밖의 경로, 디렉터리 리다이렉트, 캐시하지 않는
+            대용량 파일은 False (SimpleHTTPRequestHandler 로 위임).
+        """
+        path = os.path.normpath(self.translate_path(self.path))
+        if os.path.isdir(path):
+            if not self.path.split('?', 1)[0].endswith('/'):
+                return False
+            path = os.path.join(path, 'index.html')
+        if not path.startswith(os.path.join(os.path.normpath(self.directory), '')):
+            return False
+        asset = static_assets.get(path)
+        if asset is None:
+            return False
+
+        # JS/CSS 도 no-store 대신 ETag 재검증(no-cache)으로 항상 최신본을 받게 한다
+        self._revalidate = True
+        try:
+            if etag_matches(self.headers.get('If-None-Match'), asset.etag):
+                self._send_not_modified(asset.etag)
+                return True
+            self.send_response(200)
+            self.send_header('Content-Type', self.guess_type(path))
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('ETag', asset.etag)
+            self._write_body(asset.body, asset.gzip_body)
+        finally:
+            self._revalidate = False
+        return True
+
+    def _send_not_modified(self, etag: str) -> None:
+        """304 Not Modified 응답을 전송한다.
+
+        Args:
+            etag: 현재 표현의 ETag
+        """
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+
+    def _write_body(self, body: bytes, gzipped: bytes | None = None) -> None:
+        """헤더를 마무리하고 본문을 전송한다.
+
+        gzipped 가 있고 클라이언트가 gzip 을 허용하면 압축 본문을 보낸다.
+
+        Args:
+            body: 원본 본문
+            gzipped: 미리 압축한 본문 (없으면 None)
+        """
+        if gzipped is not None and accepts_gzip(self.headers.get('Accept-Encoding')):
+            body = gzipped
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_POST(self) -> None:
         """POST 요청을 처리한다."""
         if self.path == '/api/env':
@@ -222,14 +317,25 @@ class BoardHTTPRequestHandler(
             self.end_headers()
 
     def _send_json(self, data: object) -> None:
-        """JSON 응답을 전송한다."""
+        """JSON 응답을 전송한다.
+
+        GET 요청은 본문 해시 ETag 가 If-None-Match 와 일치하면 304 로 응답하고,
+        GZIP_MIN_BYTES 이상의 본문은 클라이언트가 허용하면 gzip 으로 보낸다.
+        """
         body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        etag = make_etag(body)
+        if self.command == 'GET' and etag_matches(self.headers.get('If-None-Match'), etag):
+            self._send_not_modified(etag)
+            return
+        gzipped = None
+        if len(body) >= GZIP_MIN_BYTES and accepts_gzip(self.headers.get('Accept-Encoding')):
+            gzipped = gzip_body(body)
         self.send_response(200)
         self.send_header('Content-Type', 'application/json; charset=utf-8')
         self.send_header('Cache-Control', 'no-cache')
         self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(body)
+        self.send_header('ETag', etag)
+        self._write_body(body, gzipped)
 
     def _parse_query_param(self, key: str) -> str | None:
         """URL 쿼리 파라미터에서 지정한 키의 값을 추출한다.
@@ -330,9 +436,9 @@ class BoardHTTPRequestHandler(
         """CORS 헤더를 추가한 후 헤더를 종료한다."""
         # SSE, poll, terminal 외 요청에도 CORS 헤더 추가 (index.html에서의 fetch 호환)
         # /events, /poll, /terminal/*은 각 핸들러에서 직접 CORS 헤더를 추가하므로 제외
-        if self.path not in ('/events', '/poll') and not self.path.startswith('/terminal/'):
+        if self.path.split('?', 1)[0] not in ('/events', '/poll') and not self.path.startswith('/terminal/'):
             self.send_header('Access-Control-Allow-Origin', '*')
-        # JS/CSS 파일 캐시 방지
-        if self.path.endswith(('.js', '.css')):
+        # JS/CSS 파일 캐시 방지 (ETag 재검증으로 서빙하는 static 응답은 제외)
+        if self.path.endswith(('.js', '.css')) and not getattr(self, '_revalidate', False):
             self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
         super().end_headers()
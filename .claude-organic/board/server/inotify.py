@@ -0,0 +1,173 @@
+"""Linux inotify binding (ctypes) for FileWatcher / GitBranchWatcher.
+
+외부 의존성 없이 libc 의 inotify_init1 / inotify_add_watch / inotify_rm_watch 를
+ctypes 로 호출한다. Linux 외 플랫폼이거나 libc 에 심볼이 없으면
+``inotify_available()`` 이 False 를 반환하고 호출자는 폴링으로 폴백한다.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+from dataclasses import dataclass
+
+# <sys/inotify.h>
+IN_MODIFY: int = 0x00000002
+IN_ATTRIB: int = 0x00000004
+IN_CLOSE_WRITE: int = 0x00000008
+IN_MOVED_FROM: int = 0x00000040
+IN_MOVED_TO: int = 0x00000080
+IN_CREATE: int = 0x00000100
+IN_DELETE: int = 0x00000200
+IN_DELETE_SELF: int = 0x00000400
+IN_MOVE_SELF: int = 0x00000800
+IN_Q_OVERFLOW: int = 0x00004000
+IN_IGNORED: int = 0x00008000
+IN_ONLYDIR: int = 0x01000000
+IN_MASK_ADD: int = 0x20000000
+IN_ISDIR: int = 0x40000000
+
+IN_NONBLOCK: int = os.O_NONBLOCK
+IN_CLOEXEC: int = os.O_CLOEXEC if hasattr(os, 'O_CLOEXEC') else 0o2000000
+
+# 디렉터리 엔트리 생성/삭제/변경 전체
+DIR_ENTRY_MASK: int = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+# 하위 디렉터리의 엔트리 목록 변경만 (하위 디렉터리 mtime 변화와 동일한 범위)
+SUBDIR_MASK: int = (
+    IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct('iIII')
+_READ_SIZE: int = 64 * 1024
+
+_libc: ctypes.CDLL | None = None
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    """inotify 심볼을 가진 libc 를 로드한다. 불가하면 None."""
+    global _libc
+    if _libc is not None:
+        return _libc
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_init1.restype = ctypes.c_int
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_add_watch.restype = ctypes.c_int
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        libc.inotify_rm_watch.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        return None
+    _libc = libc
+    return _libc
+
+
+def inotify_available() -> bool:
+    """현재 플랫폼에서 inotify 를 사용할 수 있는지 반환한다."""
+    return _load_libc() is not None
+
+
+@dataclass(frozen=True)
+class InotifyEvent:
+    """inotify_event 1건.
+
+    Attributes:
+        wd: watch descriptor
+        mask: 이벤트 마스크 (IN_*)
+        name: 감시 디렉터리 내 엔트리 이름 (디렉터리 자체 이벤트면 빈 문자열)
+    """
+
+    wd: int
+    mask: int
+    name: str
+
+
+class Inotify:
+    """inotify 인스턴스 (fd 1개) 래퍼.
+
+    Attributes:
+        fd: inotify 파일 디스크립터
+    """
+
+    def __init__(self) -> None:
+        """inotify 인스턴스를 생성한다.
+
+        Raises:
+            OSError: inotify 를 사용할 수 없거나 생성에 실패한 경우.
+        """
+        libc = _load_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, 'inotify unavailable')
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._libc: ctypes.CDLL = libc
+        self.fd: int = fd
+
+    def add_watch(self, path: str, mask: int) -> int:
+        """경로에 watch 를 추가하고 wd 를 반환한다.
+
+        Args:
+            path: 감시할 경로
+            mask: IN_* 마스크
+
+        Returns:
+            watch descriptor.
+
+        Raises:
+            OSError: 경로가 없거나(ENOENT) watch 한도 초과(ENOSPC) 등.
+        """
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        """watch 를 제거한다. 이미 제거된 wd 는 무시한다."""
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self, timeout: float | None) -> list[InotifyEvent]:
+        """이벤트를 기다렸다가 읽을 수 있는 만큼 읽어 반환한다.
+
+        Args:
+            timeout: 최대 대기 시간(초). None 이면 무한 대기.
+
+        Returns:
+            이벤트 목록. timeout 시 빈 목록.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            buf = os.read(self.fd, _READ_SIZE)
+        except BlockingIOError:
+            return []
+        events: list[InotifyEvent] = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = buf[offset:offset + length]
+            offset += length
+            events.append(InotifyEvent(wd, mask, os.fsdecode(raw_name.rstrip(b'\0'))))
+        return events
+
+    def close(self) -> None:
+        """fd 를 닫는다."""
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
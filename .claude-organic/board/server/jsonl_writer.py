@@ -0,0 +1,142 @@
+"""BufferedJsonlWriter — write-behind append writer for session JSONL journals.
+
+TerminalSSEChannel 은 스트리밍 이벤트(text_delta 포함)마다 persist JSONL 에 한 줄을
+추가한다. 줄마다 open/close 하던 방식 대신 append 핸들을 유지하고, 줄을 메모리
+버퍼에 모았다가 다음 조건 중 하나에서 한 번에 기록한다.
+
+    - 크기: 버퍼가 PERSIST_FLUSH_BYTES 이상
+    - 시간: 첫 미기록 줄 이후 PERSIST_FLUSH_INTERVAL 경과 (타이머)
+    - 즉시: 호출자가 urgent=True 로 요청 (result / process_exit 등)
+    - 종료: atexit 에서 살아있는 모든 writer 를 flush (SIGTERM → sys.exit 경로 포함)
+
+이력 reader 는 파일을 읽기 전에 flush() 를 호출하여 미기록 버퍼까지 보게 한다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import weakref
+from typing import BinaryIO
+
+from ._common import logger
+from .session_index import SessionIndex
+
+# 버퍼 크기 기준 flush 임계값 (bytes, UTF-8 근사치로 문자 수 사용)
+PERSIST_FLUSH_BYTES: int = 64 * 1024
+# 시간 기준 flush 지연 (초)
+PERSIST_FLUSH_INTERVAL: float = 0.05
+
+_LIVE_WRITERS: weakref.WeakSet[BufferedJsonlWriter] = weakref.WeakSet()
+
+
+class BufferedJsonlWriter:
+    """append 핸들 + write-behind 버퍼를 가진 JSONL writer.
+
+    Attributes:
+        path: 기록 대상 파일 경로
+        index: 기록과 함께 갱신할 희소 seq 인덱스 (None 이면 미사용)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_bytes: int = PERSIST_FLUSH_BYTES,
+        flush_interval: float = PERSIST_FLUSH_INTERVAL,
+        index: SessionIndex | None = None,
+    ) -> None:
+        """초기화한다. 파일은 첫 flush 때 append 모드로 연다.
+
+        Args:
+            path: 기록 대상 파일 경로
+            flush_bytes: 크기 기준 flush 임계값
+            flush_interval: 시간 기준 flush 지연(초)
+            index: 기록과 함께 갱신할 희소 seq 인덱스
+        """
+        self.path: str = path
+        self.index: SessionIndex | None = index
+        self._flush_bytes: int = flush_bytes
+        self._flush_interval: float = flush_interval
+        self._pending: list[str] = []
+        self._pending_size: int = 0
+        self._handle: BinaryIO | None = None
+        self._timer: threading.Timer | None = None
+        self._lock: threading.Lock = threading.Lock()
+        _LIVE_WRITERS.add(self)
+
+    def append(self, line: str, urgent: bool = False) -> None:
+        """한 줄을 버퍼에 추가한다.
+
+        Args:
+            line: 개행 포함 JSONL 한 줄
+            urgent: True 이면 즉시 flush
+        """
+        with self._lock:
+            self._pending.append(line)
+            self._pending_size += len(line)
+            if urgent or self._pending_size >= self._flush_bytes:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._flush_interval, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _on_timer(self) -> None:
+        """시간 기준 flush 타이머 콜백."""
+        with self._lock:
+            self._timer = None
+            self._flush_locked()
+
+    def flush(self) -> None:
+        """미기록 버퍼를 파일에 기록한다."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """버퍼를 기록하고 핸들을 닫는다. 이후 append 시 다시 연다."""
+        with self._lock:
+            self._flush_locked()
+            if self._handle is not None:
+                try:
+                    self._handle.close()
+                except OSError:
+                    pass
+                self._handle = None
+
+    def _flush_locked(self) -> None:
+        """버퍼를 기록한다. _lock 보유 상태에서 호출."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        data = ''.join(self._pending).encode('utf-8')
+        self._pending.clear()
+        self._pending_size = 0
+        try:
+            if self._handle is None:
+                self._handle = open(self.path, 'ab')
+            start_offset = os.fstat(self._handle.fileno()).st_size
+            self._handle.write(data)
+            self._handle.flush()
+        except OSError as exc:
+            logger.error("jsonl_writer: persist 쓰기 실패 (%s): %s", self.path, exc)
+            if self._handle is not None:
+                try:
+                    self._handle.close()
+                except OSError:
+                    pass
+            self._handle = None
+            return
+        if self.index is not None:
+            self.index.record(data, start_offset)
+
+
+def flush_all() -> None:
+    """살아있는 모든 writer 의 버퍼를 기록한다 (종료 시 호출)."""
+    for writer in list(_LIVE_WRITERS):
+        writer.flush()
+
+
+atexit.register(flush_all)
@@ -1,40 +1,78 @@
-"""PollChangeTracker — diff-only polling state."""
+"""PollChangeTracker — sequence-numbered change journal for /poll."""
 
 from __future__ import annotations
 
+import collections
 import threading
 
+# 저널(ring buffer)에 보관할 최대 변경 항목 수
+POLL_JOURNAL_SIZE: int = 4096
+
 
 class PollChangeTracker:
-    """폴링 클라이언트를 위한 변경 이벤트 축적기.
+    """폴링 클라이언트를 위한 변경 저널.
+
+    변경 이벤트를 단조 증가 시퀀스 번호가 붙은 ``(seq, event_type, file)`` 항목으로
+    고정 크기 ring buffer 에 기록한다. 클라이언트는 마지막으로 받은 seq 를 커서로
+    ``since(cursor)`` 를 호출하여 그 이후의 변경만 받으므로, 여러 탭/폴러가 서로의
+    변경을 소비하지 않고 동시에 폴링할 수 있다.
 
-    마지막 폴링 이후 변경된 이벤트 타입별 파일명을 dict로 축적한다.
-    flush() 호출 시 축적된 변경 내역을 반환하고 초기화한다.
+    커서가 ring 밖으로 밀려났거나(오래된 커서) 현재 seq 보다 크면(서버 재시작)
+    변경분을 확정할 수 없으므로 resync 플래그를 세운다.
 
     Attributes:
-        _changes: 이벤트 타입 -> 변경 파일명 set 매핑
+        _journal: (seq, event_type, file) ring buffer. file 이 None 이면 파일 없는 이벤트.
+        _seq: 마지막으로 발급한 시퀀스 번호 (0 = 발급 없음)
+        _flush_cursor: 커서 없는 레거시 flush() 호출용 서버측 커서
         _lock: thread-safe 접근용 Lock
     """
 
-    def __init__(self) -> None:
-        """초기화한다."""
-        self._changes: dict[str, set[str]] = {}
+    def __init__(self, capacity: int = POLL_JOURNAL_SIZE) -> None:
+        """초기화한다.
+
+        Args:
+            capacity: 저널 최대 항목 수
+        """
+        self._journal: collections.deque[tuple[int, str, str | None]] = collections.deque(maxlen=capacity)
+        self._seq: int = 0
+        self._flush_cursor: int = 0
         self._lock: threading.Lock = threading.Lock()
 
     def add(self, event_type: str, files: list[str]) -> None:
-        """변경 이벤트 타입과 파일명 목록을 추가한다.
+        """변경 이벤트 타입과 파일명 목록을 저널에 추가한다.
+
+        파일 목록이 비어 있으면 파일 없는 항목 1건을 기록한다 (이벤트 타입만 통지).
 
         Args:
             event_type: 추가할 이벤트 타입 (kanban, workflow, dashboard)
             files: 변경된 파일명 목록
         """
         with self._lock:
-            if event_type not in self._changes:
-                self._changes[event_type] = set()
-            self._changes[event_type].update(files)
+            for name in (files or [None]):
+                self._seq += 1
+                self._journal.append((self._seq, event_type, name))
+
+    def since(self, cursor: int) -> dict:
+        """커서 이후의 변경분을 반환한다. 저널은 변경하지 않는다.
+
+        Args:
+            cursor: 클라이언트가 마지막으로 받은 seq. 음수면 커서 없음(resync).
+
+        Returns:
+            ``{"seq": int, "resync": bool, "changes": {event_type: [file, ...]}}``.
+            resync 가 True 이면 changes 는 비어 있고 클라이언트는 전체 재조회 후
+            반환된 seq 를 새 커서로 사용한다.
+        """
+        with self._lock:
+            valid = self._cursor_valid(cursor)
+            return {
+                'seq': self._seq,
+                'resync': not valid,
+                'changes': self._collect(cursor) if valid else {},
+            }
 
     def flush(self) -> dict[str, list[str]]:
-        """축적된 변경 이벤트를 반환하고 초기화한다.
+        """직전 flush() 이후의 변경 이벤트를 반환한다 (커서 없는 레거시 /poll 용).
 
         Returns:
             이벤트 타입별 변경 파일명 목록 dict.
@@ -42,6 +80,25 @@ class PollChangeTracker:
             변경 없으면 빈 dict.
         """
         with self._lock:
-            result = {k: list(v) for k, v in self._changes.items()}
-            self._changes.clear()
+            result = self._collect(self._flush_cursor)
+            self._flush_cursor = self._seq
             return result
+
+    def _cursor_valid(self, cursor: int) -> bool:
+        """커서 이후 변경분이 저널에 온전히 남아 있는지 판정한다. lock 보유 상태에서 호출."""
+        if cursor < 0 or cursor > self._seq:
+            return False
+        if cursor == self._seq or not self._journal:
+            return True
+        return self._journal[0][0] <= cursor + 1
+
+    def _collect(self, cursor: int) -> dict[str, list[str]]:
+        """커서 이후 항목을 이벤트 타입별 중복 제거 파일 목록으로 묶는다. lock 보유 상태에서 호출."""
+        grouped: dict[str, dict[str, None]] = {}
+        for seq, event_type, name in reversed(self._journal):
+            if seq <= cursor:
+                break
+            files = grouped.setdefault(event_type, {})
+            if name is not None:
+                files[name] = None
+        return {event_type: list(reversed(files)) for event_type, files in reversed(grouped.items())}
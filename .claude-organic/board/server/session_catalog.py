@@ -0,0 +1,335 @@
+"""SessionCatalog — persistent metadata cache for Claude session JSONL files.
+
+GET /terminal/sessions 는 ``~/.claude/projects/<slug>/*.jsonl`` 마다 title/branch 를
+추출한다. 매 요청마다 파일 앞부분을 JSON 파싱하던 방식 대신, 파일별 메타데이터를
+``(path, size, mtime_ns)`` 로 검증하는 영속 캐시에 보관한다.
+
+    - 적중: size/mtime_ns 가 같으면 파일을 열지 않는다.
+    - 증가: 직전에 읽은 오프셋부터 새로 append 된 바이트만 읽어 branch 를 갱신한다.
+      title 은 한 번 확정되면 다시 찾지 않는다.
+    - 축소/재작성: 처음부터 다시 스캔한다.
+
+처음 보는 파일은 앞부분 _TITLE_SCAN_MAX_LINES 줄로 title 을 찾고, 파일 끝
+TAIL_SCAN_BYTES 만 읽어 최신 branch 를 구한다. 이후에는 증분 tail 읽기만 한다.
+
+캐시 파일: ``$XDG_CACHE_HOME/claude-organic/sessions-<slug>.json``
+(미설정 시 ``~/.cache`` 기준). 기록 실패는 무시한다 (다음 기동 때 재스캔).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import threading
+import uuid
+from dataclasses import asdict, dataclass, fields
+
+from ._common import logger
+
+# title 후보 스킵 규칙 (handlers/terminal.py 의 기존 규칙과 동일)
+TITLE_SKIP_PREFIXES: tuple[str, ...] = (
+    '<local-command-',
+    '<command-message>',
+    '<command-name>',
+    '<command-stdout>',
+    '<command-args>',
+    '<system-reminder>',
+)
+TITLE_SKIP_EXACT: tuple[str, ...] = (
+    "첫 메시지입니다. '세션이 초기화 되었습니다.' 라고만 답하세요.",
+)
+_COMMAND_WRAPPER_PREFIXES: tuple[str, ...] = (
+    '<command-message>', '<command-name>', '<command-stdout>', '<command-args>',
+)
+TITLE_MAX_LENGTH: int = 100
+TITLE_SCAN_MAX_LINES: int = 300
+
+# 처음 보는 파일에서 최신 branch 를 찾기 위해 읽는 파일 끝 바이트 수
+TAIL_SCAN_BYTES: int = 256 * 1024
+
+# 캐시 포맷 버전 (필드 변경 시 증가 → 기존 캐시 무시)
+CATALOG_VERSION: int = 1
+
+# 최상위 "gitBranch" 필드. 문자열 안에 중첩된 경우는 따옴표가 이스케이프되어 매칭되지 않는다.
+_BRANCH_RE = re.compile(rb'"gitBranch"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+@dataclass
+class SessionMeta:
+    """세션 JSONL 한 개의 캐시 항목.
+
+    Attributes:
+        session_id: 파일명 stem (UUID)
+        size: 마지막 스캔 시 파일 크기
+        mtime_ns: 마지막 스캔 시 mtime (ns)
+        offset: 완결된 줄 기준으로 읽은 바이트 위치 (증분 스캔 시작점)
+        title: 첫 유효 user 메시지 (없으면 None)
+        branch: 가장 최근 ``gitBranch`` 값 (없으면 "")
+        lines_scanned: title 탐색에 소비한 줄 수
+        command_context: 직전 user 메시지가 슬래시 명령 래퍼였는지 여부
+    """
+
+    session_id: str
+    size: int = 0
+    mtime_ns: int = 0
+    offset: int = 0
+    title: str | None = None
+    branch: str = ''
+    lines_scanned: int = 0
+    command_context: bool = False
+
+    @property
+    def title_done(self) -> bool:
+        """title 탐색이 끝났는지 (확정되었거나 탐색 범위 초과)."""
+        return self.title is not None or self.lines_scanned > TITLE_SCAN_MAX_LINES
+
+    @property
+    def mtime(self) -> float:
+        """mtime (초)."""
+        return self.mtime_ns / 1e9
+
+
+_META_FIELDS = frozenset(f.name for f in fields(SessionMeta))
+
+
+def catalog_file_path(sessions_dir: str) -> str:
+    """sessions_dir 에 대응하는 영속 캐시 파일 경로를 반환한다.
+
+    Args:
+        sessions_dir: ``~/.claude/projects/<slug>`` 디렉터리
+
+    Returns:
+        ``$XDG_CACHE_HOME/claude-organic/sessions-<slug>.json``
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    slug = os.path.basename(os.path.normpath(sessions_dir)) or 'root'
+    return os.path.join(base, 'claude-organic', f'sessions-{slug}.json')
+
+
+def _title_candidate(event: dict, meta: SessionMeta) -> str | None:
+    """user 이벤트 한 건을 title 규칙에 통과시킨다. command_context 를 갱신한다.
+
+    Args:
+        event: 파싱된 JSONL 이벤트
+        meta: 갱신할 캐시 항목
+
+    Returns:
+        title 로 채택할 텍스트 (최대 TITLE_MAX_LENGTH). 후보가 아니면 None.
+    """
+    if event.get('type') != 'user' or 'toolUseResult' in event:
+        return None
+    message = event.get('message') or {}
+    content = message.get('content', '')
+    text = ''
+    if isinstance(content, list):
+        for block in content:
+            if isinstance(block, dict) and block.get('type') == 'text':
+                text = block.get('text', '') or ''
+                break
+    elif isinstance(content, str):
+        text = content
+    text = text.strip()
+    if not text:
+        return None
+    if text.startswith(_COMMAND_WRAPPER_PREFIXES):
+        meta.command_context = True
+        return None
+    if meta.command_context and text.startswith('# '):
+        return None
+    meta.command_context = False
+    if text.startswith(TITLE_SKIP_PREFIXES) or text in TITLE_SKIP_EXACT:
+        return None
+    return text[:TITLE_MAX_LENGTH]
+
+
+def _last_branch(chunk: bytes) -> str | None:
+    """바이트 덩어리에서 마지막으로 등장한 비어있지 않은 gitBranch 값을 찾는다."""
+    for match in reversed(_BRANCH_RE.findall(chunk)):
+        try:
+            value = json.loads(b'"' + match + b'"')
+        except ValueError:
+            continue
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def scan_session(path: str, meta: SessionMeta, size: int) -> None:
+    """meta.offset 부터 파일을 읽어 meta 를 갱신한다.
+
+    title 탐색이 끝나지 않았으면 줄 단위로 JSON 을 파싱하고, 끝났으면 branch 만
+    정규식으로 찾는다. 처음 보는 큰 파일은 title 탐색 후 파일 끝 TAIL_SCAN_BYTES 로
+    건너뛴다. 기록 중인 미완결 마지막 줄은 다음 스캔에서 다시 읽는다.
+
+    Args:
+        path: JSONL 파일 경로
+        meta: 갱신할 캐시 항목 (offset/title/branch 등이 in-place 로 바뀐다)
+        size: stat 으로 얻은 현재 파일 크기
+    """
+    with open(path, 'rb') as fp:
+        fp.seek(meta.offset)
+        while not meta.title_done:
+            line = fp.readline()
+            if not line.endswith(b'\n'):
+                return
+            meta.offset += len(line)
+            meta.lines_scanned += 1
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(event, dict):
+                continue
+            branch = event.get('gitBranch')
+            if isinstance(branch, str) and branch:
+                meta.branch = branch
+            meta.title = _title_candidate(event, meta)
+
+        if size - meta.offset > TAIL_SCAN_BYTES:
+            # 중간 구간은 건너뛰고 끝부분에서만 최신 branch 를 찾는다
+            fp.seek(size - TAIL_SCAN_BYTES)
+            fp.readline()  # 잘린 줄 버림
+        start = fp.tell()
+        chunk = fp.read()
+    end = chunk.rfind(b'\n') + 1
+    if end <= 0:
+        return
+    branch = _last_branch(chunk[:end])
+    if branch is not None:
+        meta.branch = branch
+    meta.offset = start + end
+
+
+class SessionCatalog:
+    """sessions_dir 의 세션 메타데이터 카탈로그.
+
+    Attributes:
+        sessions_dir: ``~/.claude/projects/<slug>`` 디렉터리
+        cache_path: 영속 캐시 파일 경로
+    """
+
+    def __init__(self, sessions_dir: str, cache_path: str | None = None) -> None:
+        """초기화한다. 영속 캐시는 첫 refresh() 때 읽는다.
+
+        Args:
+            sessions_dir: 세션 JSONL 디렉터리
+            cache_path: 영속 캐시 파일 경로 (None 이면 catalog_file_path())
+        """
+        self.sessions_dir: str = sessions_dir
+        self.cache_path: str = cache_path or catalog_file_path(sessions_dir)
+        self._entries: dict[str, SessionMeta] | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def refresh(self) -> list[SessionMeta]:
+        """디렉터리를 stat 하여 캐시를 갱신하고 title 이 있는 세션을 반환한다.
+
+        Returns:
+            mtime 내림차순 SessionMeta 목록 (title 이 없는 임시 세션 제외).
+            디렉터리가 없으면 빈 목록.
+        """
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            seen: dict[str, SessionMeta] = {}
+            dirty = False
+            try:
+                with os.scandir(self.sessions_dir) as it:
+                    for entry in it:
+                        if not entry.name.endswith('.jsonl'):
+                            continue
+                        stem = entry.name[:-6]  # ".jsonl" 제거
+                        try:
+                            uuid.UUID(stem)
+                        except ValueError:
+                            continue
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        meta = self._entries.get(stem)
+                        if meta is None or meta.size != st.st_size or meta.mtime_ns != st.st_mtime_ns:
+                            meta = self._rescan(entry.path, stem, meta, st.st_size, st.st_mtime_ns)
+                            dirty = True
+                        seen[stem] = meta
+            except OSError as err:
+                logger.debug('세션 디렉터리 스캔 실패: %s', err)
+                return []
+            if dirty or len(seen) != len(self._entries):
+                self._entries = seen
+                self._store()
+            result = [meta for meta in seen.values() if meta.title is not None]
+        result.sort(key=lambda meta: meta.mtime_ns, reverse=True)
+        return result
+
+    def _rescan(
+        self,
+        path: str,
+        session_id: str,
+        prev: SessionMeta | None,
+        size: int,
+        mtime_ns: int,
+    ) -> SessionMeta:
+        """변경된 파일의 항목을 증분(또는 전체) 스캔으로 갱신한다."""
+        if prev is None or size < prev.offset:
+            meta = SessionMeta(session_id=session_id)
+        else:
+            meta = SessionMeta(**asdict(prev))
+        try:
+            scan_session(path, meta, size)
+        except OSError as err:
+            logger.debug('세션 메타 추출 실패 (%s): %s', path, err)
+        meta.size = size
+        meta.mtime_ns = mtime_ns
+        return meta
+
+    def _load(self) -> dict[str, SessionMeta]:
+        """영속 캐시를 읽는다. 없거나 손상/버전 불일치면 빈 dict."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != CATALOG_VERSION:
+            return {}
+        entries: dict[str, SessionMeta] = {}
+        for raw in data.get('sessions') or []:
+            if not isinstance(raw, dict) or set(raw) != _META_FIELDS:
+                continue
+            try:
+                meta = SessionMeta(**raw)
+            except TypeError:
+                continue
+            entries[meta.session_id] = meta
+        return entries
+
+    def _store(self) -> None:
+        """캐시를 원자적으로 기록한다. 실패는 무시한다."""
+        payload = {
+            'version': CATALOG_VERSION,
+            'sessions_dir': self.sessions_dir,
+            'sessions': [asdict(meta) for meta in (self._entries or {}).values()],
+        }
+        directory = os.path.dirname(self.cache_path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix='.sessions-', suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp, self.cache_path)
+        except OSError as err:
+            logger.debug('세션 카탈로그 저장 실패 (%s): %s', self.cache_path, err)
+
+
+_CATALOGS: dict[str, SessionCatalog] = {}
+_CATALOGS_LOCK = threading.Lock()
+
+
+def get_catalog(sessions_dir: str) -> SessionCatalog:
+    """sessions_dir 별 SessionCatalog 싱글턴을 반환한다."""
+    with _CATALOGS_LOCK:
+        catalog = _CATALOGS.get(sessions_dir)
+        if catalog is None:
+            catalog = _CATALOGS[sessions_dir] = SessionCatalog(sessions_dir)
+        return catalog
@@ -0,0 +1,226 @@
+"""SessionIndex — sparse seq → byte offset sidecar index for session JSONL.
+
+워크플로우 세션 persist 파일(``<session_id>.jsonl``)의 이벤트 줄 번호(seq)를
+바이트 오프셋으로 매핑하는 희소 인덱스를 ``<session_id>.jsonl.idx`` 에 유지한다.
+INDEX_STRIDE 개 이벤트마다 ``"<seq> <offset>\\n"`` 한 줄을 append 한다.
+
+seq 는 ``_meta`` 첫 줄을 제외한 이벤트 줄의 0-based 번호이다. 특정 seq 이후를
+읽을 때 seq 이하의 가장 가까운 인덱스 항목으로 seek 한 뒤 최대 INDEX_STRIDE 줄만
+건너뛰면 되므로, 긴 세션의 재접속/페이지 조회 비용이 파일 전체가 아닌 tail 에 비례한다.
+
+인덱스가 없거나(기존 세션) 파일보다 뒤처져 있으면 마지막 항목부터 파일 끝까지
+스캔하여 보충한다. 인덱스가 파일과 맞지 않으면(오프셋이 파일 크기 초과) 재구축한다.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+
+from ._common import logger
+
+# 인덱스 항목 간격 (이벤트 수)
+INDEX_STRIDE: int = 256
+
+INDEX_SUFFIX: str = '.idx'
+
+_META_PREFIX: bytes = b'{"_meta"'
+
+
+def index_path(jsonl_path: str) -> str:
+    """JSONL 파일의 sidecar 인덱스 경로를 반환한다."""
+    return jsonl_path + INDEX_SUFFIX
+
+
+def _is_event_line(line: bytes) -> bool:
+    """seq 를 차지하는 이벤트 줄인지 판정한다 (빈 줄/_meta 제외)."""
+    stripped = line.strip()
+    return bool(stripped) and not stripped.startswith(_META_PREFIX)
+
+
+class SessionIndex:
+    """세션 JSONL 의 희소 seq 인덱스.
+
+    Attributes:
+        jsonl_path: 대상 JSONL 파일 경로
+        stride: 인덱스 항목 간격
+    """
+
+    def __init__(self, jsonl_path: str, stride: int = INDEX_STRIDE) -> None:
+        """초기화한다. 인덱스 파일은 첫 sync() 때 읽는다.
+
+        Args:
+            jsonl_path: 대상 JSONL 파일 경로
+            stride: 인덱스 항목 간격
+        """
+        self.jsonl_path: str = jsonl_path
+        self.stride: int = max(1, stride)
+        self._seqs: list[int] = []
+        self._offsets: list[int] = []
+        self._count: int = 0
+        self._size: int = -1
+        self._lock: threading.Lock = threading.Lock()
+
+    # -- 유지 ----------------------------------------------------------------
+
+    def sync(self) -> tuple[int, int]:
+        """인덱스를 파일 끝까지 보충하고 (이벤트 수, 파일 크기) 를 반환한다."""
+        with self._lock:
+            return self._sync_locked()
+
+    def _sync_locked(self) -> tuple[int, int]:
+        try:
+            size = os.path.getsize(self.jsonl_path)
+        except OSError:
+            return 0, 0
+        if size == self._size:
+            return self._count, self._size
+        if self._size < 0 or size < self._size:
+            self._load()
+            if self._offsets and self._offsets[-1] > size:
+                self._reset()
+        if self._size >= 0:
+            # 직전 sync 지점부터 증분 스캔
+            seq, offset = self._count, self._size
+        else:
+            # 마지막 인덱스 항목(또는 파일 처음)부터 끝까지 스캔
+            seq = self._seqs[-1] if self._seqs else 0
+            offset = self._offsets[-1] if self._offsets else 0
+        new_entries: list[tuple[int, int]] = []
+        try:
+            with open(self.jsonl_path, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # 기록 중인 미완결 줄: 다음 sync 에서 다시 읽는다
+                        break
+                    if _is_event_line(line):
+                        if seq % self.stride == 0 and (not self._seqs or seq > self._seqs[-1]):
+                            new_entries.append((seq, offset))
+                            self._seqs.append(seq)
+                            self._offsets.append(offset)
+                        seq += 1
+                    offset += len(line)
+        except OSError:
+            return self._count, max(self._size, 0)
+        self._count = seq
+        self._size = offset
+        self._append_entries(new_entries)
+        return self._count, self._size
+
+    def record(self, data: bytes, start_offset: int) -> None:
+        """writer 가 start_offset 에 data 를 기록한 직후 호출하여 인덱스를 갱신한다.
+
+        Args:
+            data: 방금 기록한 바이트 (완결된 줄들)
+            start_offset: 기록 시작 오프셋
+        """
+        with self._lock:
+            if self._size != start_offset:
+                self._sync_locked()
+                return
+            seq = self._count
+            offset = start_offset
+            new_entries: list[tuple[int, int]] = []
+            for line in data.splitlines(keepends=True):
+                if _is_event_line(line):
+                    if seq % self.stride == 0 and (not self._seqs or seq > self._seqs[-1]):
+                        new_entries.append((seq, offset))
+                        self._seqs.append(seq)
+                        self._offsets.append(offset)
+                    seq += 1
+                offset += len(line)
+            self._count = seq
+            self._size = offset
+            self._append_entries(new_entries)
+
+    def _load(self) -> None:
+        """인덱스 파일을 읽는다. 손상된 줄은 무시한다."""
+        self._reset()
+        try:
+            with open(index_path(self.jsonl_path), 'r', encoding='ascii') as f:
+                for raw in f:
+                    parts = raw.split()
+                    if len(parts) != 2:
+                        continue
+                    try:
+                        seq, offset = int(parts[0]), int(parts[1])
+                    except ValueError:
+                        continue
+                    if self._seqs and (seq <= self._seqs[-1] or offset <= self._offsets[-1]):
+                        continue
+                    self._seqs.append(seq)
+                    self._offsets.append(offset)
+        except OSError:
+            pass
+
+    def _reset(self) -> None:
+        """메모리 인덱스를 비우고 인덱스 파일을 삭제한다 (재구축)."""
+        if self._seqs:
+            try:
+                os.remove(index_path(self.jsonl_path))
+            except OSError:
+                pass
+        self._seqs = []
+        self._offsets = []
+        self._count = 0
+        self._size = -1
+
+    def _append_entries(self, entries: list[tuple[int, int]]) -> None:
+        """인덱스 항목을 sidecar 파일에 append 한다. 실패는 기록만 한다."""
+        if not entries:
+            return
+        try:
+            with open(index_path(self.jsonl_path), 'a', encoding='ascii') as f:
+                f.write(''.join(f"{seq} {offset}\n" for seq, offset in entries))
+        except OSError as exc:
+            logger.error("session_index: 인덱스 쓰기 실패 (%s): %s", self.jsonl_path, exc)
+
+    # -- 조회 ----------------------------------------------------------------
+
+    def read_range(
+        self,
+        since: int = -1,
+        before: int | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[tuple[int, str]], int]:
+        """seq 범위 (since, before) 의 이벤트 줄을 읽는다.
+
+        limit 이 있으면 범위 안에서 가장 최근 limit 개를 반환한다 (newest-first 페이징).
+
+        Args:
+            since: 이 seq 이후 (exclusive). -1 이면 처음부터.
+            before: 이 seq 이전 (exclusive). None 이면 끝까지.
+            limit: 최대 이벤트 수. None 이면 제한 없음.
+
+        Returns:
+            ([(seq, 줄 문자열), ...] seq 오름차순, 전체 이벤트 수).
+        """
+        with self._lock:
+            total, _ = self._sync_locked()
+            end = total if before is None else max(0, min(before, total))
+            start = max(0, since + 1)
+            if limit is not None:
+                start = max(start, end - max(0, limit))
+            if start >= end:
+                return [], total
+            pos = bisect.bisect_right(self._seqs, start) - 1
+            seq = self._seqs[pos] if pos >= 0 else 0
+            offset = self._offsets[pos] if pos >= 0 else 0
+
+        events: list[tuple[int, str]] = []
+        try:
+            with open(self.jsonl_path, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not _is_event_line(line):
+                        continue
+                    if seq >= end:
+                        break
+                    if seq >= start:
+                        events.append((seq, line.decode('utf-8', errors='replace').strip()))
+                    seq += 1
+        except OSError as exc:
+            logger.error("session_index: JSONL 읽기 실패 (%s): %s", self.jsonl_path, exc)
+        return events, total
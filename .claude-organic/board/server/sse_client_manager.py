@@ -2,46 +2,102 @@
 
 from __future__ import annotations
 
+import errno
 import json
 import logging
 import os
-import threading
 import time
 import uuid
 from collections.abc import Callable
 
-from ._common import WATCH_DIRS, WATCH_INTERVAL, logger
+from ._common import (
+    WATCH_BACKEND,
+    WATCH_COALESCE_MAX,
+    WATCH_COALESCE_QUIET,
+    WATCH_DIRS,
+    WATCH_INTERVAL,
+    logger,
+)
+from .inotify import (
+    DIR_ENTRY_MASK,
+    IN_ATTRIB,
+    IN_CLOSE_WRITE,
+    IN_CREATE,
+    IN_IGNORED,
+    IN_ISDIR,
+    IN_MASK_ADD,
+    IN_MOVED_TO,
+    IN_ONLYDIR,
+    IN_Q_OVERFLOW,
+    SUBDIR_MASK,
+    Inotify,
+    InotifyEvent,
+    inotify_available,
+)
+from .sse_queue import SSEClientQueue, SSEClientRegistry, SSEFrame
 from board_data import _get_git_branch
+from git_state import head_path
+
+
+def _use_inotify(backend: str) -> bool:
+    """감시 백엔드 설정값으로 inotify 사용 여부를 판정한다.
+
+    Args:
+        backend: 'auto' | 'inotify' | 'poll'
+
+    Returns:
+        inotify 백엔드를 사용하면 True. 'poll' 이거나 inotify 를 쓸 수 없으면 False.
+    """
+    if backend == 'poll':
+        return False
+    return inotify_available()
 
 
 class FileWatcher:
     """파일 시스템 변경 감시기.
 
-    os.scandir() 기반으로 감시 대상 디렉터리의 엔트리 mtime을 추적하고,
-    변경 감지 시 콜백을 호출한다.
+    감시 대상 디렉터리의 엔트리 mtime 스냅샷을 유지하고, 변경 감지 시 콜백을 호출한다.
+    백엔드는 두 가지이다.
+
+    - inotify (Linux, 기본): 감시 디렉터리와 그 직속 하위 디렉터리에 watch 를 걸고,
+      이벤트가 온 디렉터리만 재스캔한다. 버스트(예: 티켓의 상태 디렉터리 이동)는
+      WATCH_COALESCE_QUIET 동안 추가 이벤트가 없을 때까지(최대 WATCH_COALESCE_MAX)
+      모아서 event_type 별 1회의 콜백으로 병합한다.
+    - poll (폴백): WATCH_INTERVAL 마다 모든 감시 디렉터리를 os.scandir() 로 재스캔한다.
+
+    두 백엔드 모두 같은 스냅샷 diff 로 파일명을 산출하므로 콜백 인자는 동일하다.
+    BOARD_WATCH_BACKEND=poll 로 폴링을 강제할 수 있다.
 
     Attributes:
         _project_root: 프로젝트 루트 절대 경로
         _snapshots: 디렉터리별 {파일경로: mtime} 스냅샷
         _on_change: 변경 감지 시 호출할 콜백 Callable[[str, list[str]], None]
         _running: 감시 루프 실행 플래그
+        _backend: 감시 백엔드 설정값 ('auto' | 'inotify' | 'poll')
     """
 
     def __init__(
         self,
         project_root: str,
         on_change: Callable[[str, list[str]], None],
+        backend: str | None = None,
     ) -> None:
         """초기화한다.
 
         Args:
             project_root: 프로젝트 루트 절대 경로
             on_change: 변경 감지 시 호출할 콜백, event_type(str)과 변경 파일명 목록(list[str])을 인자로 받음
+            backend: 감시 백엔드. None 이면 WATCH_BACKEND 설정값
         """
         self._project_root: str = project_root
         self._snapshots: dict[str, dict[str, float]] = {}
         self._on_change: Callable[[str, list[str]], None] = on_change
         self._running: bool = False
+        self._backend: str = backend or WATCH_BACKEND
+        # inotify: wd -> 이 watch 의 이벤트가 더럽히는 감시 디렉터리 집합.
+        # 같은 inode 는 같은 wd 를 받으므로 (runs 하위의 runs/.history) 집합으로 관리한다.
+        self._wd_dirs: dict[int, set[str]] = {}
+        self._top_wds: dict[str, int] = {}
         self._build_initial_snapshots()
 
     def _build_initial_snapshots(self) -> None:
@@ -80,6 +136,16 @@ class FileWatcher:
     def run(self) -> None:
         """감시 루프를 실행한다. daemon 스레드에서 호출된다."""
         self._running = True
+        if _use_inotify(self._backend):
+            try:
+                self._run_inotify()
+                return
+            except OSError:
+                logger.warning('FileWatcher inotify 백엔드 사용 불가, 폴링으로 전환', exc_info=True)
+        self._run_poll()
+
+    def _run_poll(self) -> None:
+        """폴링 백엔드 루프."""
         while self._running:
             time.sleep(WATCH_INTERVAL)
             self._check_changes()
@@ -88,12 +154,139 @@ class FileWatcher:
         """감시 루프를 중지한다."""
         self._running = False
 
-    def _check_changes(self) -> None:
-        """모든 감시 대상의 변경 여부를 확인하고 콜백을 호출한다."""
+    # -- inotify 백엔드 ------------------------------------------------------
+
+    def _run_inotify(self) -> None:
+        """inotify 백엔드 루프.
+
+        존재하지 않는 감시 디렉터리는 WATCH_INTERVAL 마다 watch 추가를 재시도하고,
+        추가되는 순간 해당 디렉터리를 재스캔하여 폴링과 동일하게 생성분을 통지한다.
+
+        Raises:
+            OSError: inotify 인스턴스 생성 또는 watch 추가가 ENOENT 외 사유로 실패한 경우
+                (호출자가 폴링으로 폴백한다).
+        """
+        notifier = Inotify()
+        self._wd_dirs.clear()
+        self._top_wds.clear()
+        try:
+            missing = {rel_dir for rel_dir in WATCH_DIRS if not self._attach(notifier, rel_dir)}
+            last_attach = time.monotonic()
+            while self._running:
+                dirty: set[str] = set()
+                events = notifier.read_events(WATCH_INTERVAL)
+                if events:
+                    deadline = time.monotonic() + WATCH_COALESCE_MAX
+                    while events:
+                        self._absorb(notifier, events, dirty, missing)
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        events = notifier.read_events(min(WATCH_COALESCE_QUIET, remaining))
+                if missing and time.monotonic() - last_attach >= WATCH_INTERVAL:
+                    last_attach = time.monotonic()
+                    for rel_dir in sorted(missing):
+                        if self._attach(notifier, rel_dir):
+                            missing.discard(rel_dir)
+                            dirty.add(rel_dir)
+                if dirty and self._running:
+                    self._check_changes(dirty)
+        finally:
+            notifier.close()
+
+    def _attach(self, notifier: Inotify, rel_dir: str) -> bool:
+        """감시 디렉터리와 직속 하위 디렉터리에 watch 를 추가한다.
+
+        하위 디렉터리 watch 는 엔트리 생성/삭제/이동만 받는다 — 폴링 스냅샷에서
+        하위 디렉터리 mtime 이 바뀌는 경우와 같은 범위이다.
+
+        Args:
+            notifier: inotify 인스턴스
+            rel_dir: WATCH_DIRS 키
+
+        Returns:
+            watch 추가 성공 여부. 디렉터리가 없으면 False.
+
+        Raises:
+            OSError: ENOENT/ENOTDIR 외 사유로 실패한 경우 (예: watch 한도 초과).
+        """
+        abs_dir = os.path.join(self._project_root, rel_dir)
+        try:
+            wd = notifier.add_watch(abs_dir, DIR_ENTRY_MASK | IN_MASK_ADD)
+        except OSError as exc:
+            if exc.errno in (errno.ENOENT, errno.ENOTDIR):
+                return False
+            raise
+        self._top_wds[rel_dir] = wd
+        self._wd_dirs.setdefault(wd, set()).add(rel_dir)
+        try:
+            with os.scandir(abs_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        self._attach_subdir(notifier, rel_dir, entry.path)
+        except OSError:
+            pass
+        return True
+
+    def _attach_subdir(self, notifier: Inotify, rel_dir: str, path: str) -> None:
+        """감시 디렉터리의 직속 하위 디렉터리에 watch 를 추가한다. 실패는 무시한다."""
+        try:
+            wd = notifier.add_watch(path, SUBDIR_MASK | IN_MASK_ADD)
+        except OSError:
+            return
+        self._wd_dirs.setdefault(wd, set()).add(rel_dir)
+
+    def _absorb(
+        self,
+        notifier: Inotify,
+        events: list[InotifyEvent],
+        dirty: set[str],
+        missing: set[str],
+    ) -> None:
+        """inotify 이벤트를 더럽혀진 감시 디렉터리 집합으로 누적한다.
+
+        Args:
+            notifier: inotify 인스턴스 (새 하위 디렉터리 watch 추가용)
+            events: 읽은 이벤트 목록
+            dirty: 재스캔할 WATCH_DIRS 키 집합 (갱신됨)
+            missing: watch 가 없는 WATCH_DIRS 키 집합 (갱신됨)
+        """
+        for event in events:
+            if event.mask & IN_Q_OVERFLOW:
+                dirty.update(WATCH_DIRS)
+                continue
+            rel_dirs = self._wd_dirs.get(event.wd)
+            if not rel_dirs:
+                continue
+            dirty.update(rel_dirs)
+            if event.mask & IN_IGNORED:
+                # 디렉터리 삭제/이동 → watch 소멸. 감시 디렉터리 자체였다면 재부착 대기
+                self._wd_dirs.pop(event.wd, None)
+                for rel_dir in rel_dirs:
+                    if self._top_wds.get(rel_dir) == event.wd:
+                        del self._top_wds[rel_dir]
+                        missing.add(rel_dir)
+                continue
+            if event.mask & IN_ISDIR and event.mask & (IN_CREATE | IN_MOVED_TO) and event.name:
+                for rel_dir in list(rel_dirs):
+                    if self._top_wds.get(rel_dir) == event.wd:
+                        abs_dir = os.path.join(self._project_root, rel_dir)
+                        self._attach_subdir(notifier, rel_dir, os.path.join(abs_dir, event.name))
+
+    # -- 스냅샷 diff ---------------------------------------------------------
+
+    def _check_changes(self, rel_dirs: set[str] | None = None) -> None:
+        """감시 대상의 변경 여부를 확인하고 event_type 별로 콜백을 호출한다.
+
+        Args:
+            rel_dirs: 재스캔할 WATCH_DIRS 키 집합. None 이면 전체.
+        """
         changed_files: dict[str, list[str]] = {}
-        for rel_dir, event_type in WATCH_DIRS.items():
+        for rel_dir, event_type in list(WATCH_DIRS.items()):
+            if rel_dirs is not None and rel_dir not in rel_dirs:
+                continue
             abs_dir = os.path.join(self._project_root, rel_dir)
-            old_snapshot = self._snapshots[rel_dir]
+            old_snapshot = self._snapshots.get(rel_dir, {})
             new_snapshot = self._scan_dir(abs_dir)
             if new_snapshot != old_snapshot:
                 self._snapshots[rel_dir] = new_snapshot
@@ -126,12 +319,15 @@ class FileWatcher:
 class GitBranchWatcher:
     """현재 git 브랜치 변경 감시기.
 
-    `.git/HEAD` 파일의 mtime 을 짧은 주기로 폴링하여 변경이 감지될 때만
-    `_get_git_branch()` 로 브랜치명을 재조회하고, 직전 값과 다르면 콜백을 호출한다.
-    HEAD 파일이 바뀌는 순간(checkout/branch 전환)만 git 명령을 실행하므로
-    상시 부하가 거의 없다.
+    `.git/HEAD` 변경이 감지될 때만 `_get_git_branch()` 로 브랜치명을 재조회하고,
+    직전 값과 다르면 콜백을 호출한다. HEAD 파일이 바뀌는 순간(checkout/branch 전환)만
+    git 명령을 실행하므로 상시 부하가 거의 없다.
+
+    inotify 를 쓸 수 있으면 `.git` 디렉터리에 watch 를 걸어 HEAD 교체(HEAD.lock →
+    rename) 를 즉시 감지하고, 아니면 HEAD mtime 을 WATCH_INTERVAL 주기로 폴링한다.
 
-    worktree(`.git` 가 파일인 경우)도 mtime 추적 후 subprocess 폴백으로 정상 동작한다.
+    HEAD 경로는 git_state 로 해석하므로 worktree(`.git` 가 파일인 경우)도
+    실제 gitdir 의 HEAD 를 감시한다. 브랜치 재조회도 git 프로세스 없이 HEAD 를 읽는다.
 
     Attributes:
         _project_root: 프로젝트 루트 절대 경로
@@ -140,25 +336,29 @@ class GitBranchWatcher:
         _last_branch: 직전 감시한 브랜치명
         _last_head_mtime: 직전 .git/HEAD 의 mtime
         _head_path: `.git/HEAD` 절대 경로
+        _backend: 감시 백엔드 설정값 ('auto' | 'inotify' | 'poll')
     """
 
     def __init__(
         self,
         project_root: str,
         on_change: Callable[[str], None],
+        backend: str | None = None,
     ) -> None:
         """초기화한다.
 
         Args:
             project_root: 프로젝트 루트 절대 경로
             on_change: 브랜치 변경 시 호출할 콜백, 새 브랜치명을 인자로 받음
+            backend: 감시 백엔드. None 이면 WATCH_BACKEND 설정값
         """
         self._project_root: str = project_root
         self._on_change: Callable[[str], None] = on_change
         self._running: bool = False
         self._last_branch: str = _get_git_branch(project_root)
-        self._head_path: str = os.path.join(project_root, '.git', 'HEAD')
+        self._head_path: str = head_path(project_root) or os.path.join(project_root, '.git', 'HEAD')
         self._last_head_mtime: float = self._read_head_mtime()
+        self._backend: str = backend or WATCH_BACKEND
 
     def _read_head_mtime(self) -> float:
         """.git/HEAD 의 mtime 을 반환한다. 없으면 0.0."""
@@ -170,10 +370,36 @@ class GitBranchWatcher:
     def run(self) -> None:
         """감시 루프를 실행한다. daemon 스레드에서 호출된다."""
         self._running = True
+        if _use_inotify(self._backend) and os.path.isdir(os.path.dirname(self._head_path)):
+            try:
+                self._run_inotify()
+                return
+            except OSError:
+                logger.warning('GitBranchWatcher inotify 백엔드 사용 불가, 폴링으로 전환', exc_info=True)
         while self._running:
             time.sleep(WATCH_INTERVAL)
             self._check()
 
+    def _run_inotify(self) -> None:
+        """inotify 백엔드 루프. `.git` 디렉터리의 HEAD 엔트리 이벤트에만 반응한다.
+
+        Raises:
+            OSError: inotify 생성 또는 watch 추가 실패 (호출자가 폴링으로 폴백한다).
+        """
+        notifier = Inotify()
+        try:
+            notifier.add_watch(
+                os.path.dirname(self._head_path),
+                IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_ATTRIB | IN_ONLYDIR,
+            )
+            head_name = os.path.basename(self._head_path)
+            while self._running:
+                events = notifier.read_events(WATCH_INTERVAL)
+                if any(e.name == head_name or e.mask & IN_Q_OVERFLOW for e in events):
+                    self._check()
+        finally:
+            notifier.close()
+
     def stop(self) -> None:
         """감시 루프를 중지한다."""
         self._running = False
@@ -201,20 +427,17 @@ class GitBranchWatcher:
 class SSEClientManager:
     """SSE 클라이언트 연결 관리자.
 
-    연결된 클라이언트 목록을 thread-safe하게 관리하고,
-    이벤트를 모든 클라이언트에 브로드캐스트한다.
+    연결된 클라이언트별 bounded outbound 큐를 관리하고, 이벤트를 모든 클라이언트
+    큐에 적재한다. broadcast() 는 소켓에 쓰지 않으므로 호출 스레드(파일 감시기 등)가
+    느린 클라이언트에 막히지 않는다. 소켓 쓰기는 각 SSE 핸들러 스레드가 pump() 로 한다.
 
     Attributes:
-        _clients: 연결된 클라이언트의 wfile 객체 목록
-        _lock: 클라이언트 목록 접근용 Lock
-        _client_locks: wfile별 per-client Lock 딕셔너리
+        _registry: wfile 별 SSEClientQueue 레지스트리
     """
 
     def __init__(self) -> None:
         """초기화한다."""
-        self._clients: list = []
-        self._lock: threading.Lock = threading.Lock()
-        self._client_locks: dict = {}
+        self._registry: SSEClientRegistry = SSEClientRegistry()
 
     def add(self, wfile: object) -> None:
         """클라이언트를 추가한다.
@@ -222,9 +445,7 @@ class SSEClientManager:
         Args:
             wfile: HTTP 핸들러의 wfile (소켓 출력 스트림)
         """
-        with self._lock:
-            self._clients.append(wfile)
-            self._client_locks[id(wfile)] = threading.Lock()
+        self._registry.add(wfile)
 
     def remove(self, wfile: object) -> None:
         """클라이언트를 제거한다.
@@ -232,24 +453,24 @@ class SSEClientManager:
         Args:
             wfile: 제거할 클라이언트의 wfile
         """
-        with self._lock:
-            try:
-                self._clients.remove(wfile)
-            except ValueError:
-                pass
-            self._client_locks.pop(id(wfile), None)
+        self._registry.remove(wfile)
 
-    def get_lock(self, wfile: object) -> threading.Lock | None:
-        """wfile에 대응하는 per-client lock을 반환한다.
+    def pump(self, wfile: object, heartbeat_interval: float = 1.0) -> None:
+        """클라이언트 큐를 소켓으로 흘려보낸다. 연결이 끝날 때까지 반환하지 않는다.
 
         Args:
-            wfile: lock을 획득할 클라이언트의 wfile
-
-        Returns:
-            해당 wfile의 Lock. 클라이언트가 존재하지 않으면 None.
+            wfile: add() 로 등록한 클라이언트의 wfile
+            heartbeat_interval: 프레임이 없을 때 heartbeat 간격(초)
         """
-        with self._lock:
-            return self._client_locks.get(id(wfile))
+        self._registry.pump(wfile, heartbeat_interval)
+
+    def queue(self, wfile: object) -> SSEClientQueue | None:
+        """add() 로 등록한 클라이언트의 큐를 반환한다 (이벤트 루프 writer 용). 미등록이면 None."""
+        return self._registry.get(wfile)
+
+    def stats(self) -> dict:
+        """클라이언트 큐 깊이/드롭 지표를 반환한다."""
+        return self._registry.stats()
 
     def broadcast(
         self,
@@ -257,10 +478,9 @@ class SSEClientManager:
         files: list | None = None,
         data: dict | None = None,
     ) -> None:
-        """모든 클라이언트에 SSE 이벤트를 전송한다.
+        """모든 클라이언트 큐에 SSE 이벤트를 적재한다.
 
-        전송 실패한 클라이언트(연결 끊김)는 목록에서 제거한다.
-        per-client lock으로 heartbeat 루프와의 concurrent write를 방지한다.
+        큐가 넘친 클라이언트는 오버플로 정책에 따라 끊긴다 (SSE_OVERFLOW_POLICY).
 
         Args:
             event_type: SSE 이벤트 타입 (kanban, workflow, dashboard, git_branch 등)
@@ -274,32 +494,7 @@ class SSEClientManager:
             body = json.dumps({"files": files})
         else:
             body = str(int(time.time()))
-        message = f"event: {event_type}\ndata: {body}\n\n"
-        encoded = message.encode('utf-8')
-
-        dead_clients: list = []
-        with self._lock:
-            clients_snapshot = list(self._clients)
-
-        for wfile in clients_snapshot:
-            client_lock = self._client_locks.get(id(wfile))
-            if client_lock is None:
-                continue
-            try:
-                with client_lock:
-                    wfile.write(encoded)
-                    wfile.flush()
-            except (BrokenPipeError, ConnectionResetError, OSError):
-                dead_clients.append(wfile)
-
-        if dead_clients:
-            with self._lock:
-                for wfile in dead_clients:
-                    try:
-                        self._clients.remove(wfile)
-                    except ValueError:
-                        pass
-                    self._client_locks.pop(id(wfile), None)
+        self._registry.publish(SSEFrame(event_type, body))
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,317 @@
+"""Per-client bounded SSE outbound queues (non-blocking fan-out).
+
+broadcast 호출 스레드(파일 감시기, Claude stdout reader 등)는 클라이언트 소켓에
+직접 쓰지 않고 클라이언트별 큐에 프레임을 넣기만 한다. 실제 소켓 쓰기는 각 SSE
+요청을 처리 중인 HTTP 핸들러 스레드가 ``SSEClientRegistry.pump()`` 로 수행하므로,
+느리거나 멈춘 브라우저 탭 하나가 다른 클라이언트나 NDJSON reader 를 붙잡지 않는다.
+
+큐가 가득 찼을 때의 정책 (SSE_OVERFLOW_POLICY):
+    - ``coalesce``: 큐 안의 연속된 stdout 델타(text_delta / input_json_delta)를
+      한 프레임으로 합쳐 공간을 만든다. 그래도 공간이 없으면 클라이언트를 끊는다.
+    - ``drop``: 즉시 클라이언트를 끊는다 (클라이언트는 재접속 후 REST 로 복원).
+"""
+
+from __future__ import annotations
+
+import collections
+import json
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from ._common import SSE_OVERFLOW_POLICY, SSE_QUEUE_SIZE
+
+# 합칠 수 있는 stdout 델타 kind
+_MERGEABLE_KINDS: frozenset[str] = frozenset({'text_delta', 'input_json_delta'})
+
+
+@dataclass
+class SSEFrame:
+    """큐에 적재되는 SSE 프레임 1건.
+
+    Attributes:
+        event: SSE event 이름
+        data: data 필드 (JSON 문자열 등)
+        seq: id 필드. None 이면 id 줄을 쓰지 않는다.
+    """
+
+    event: str
+    data: str
+    seq: int | None = None
+
+    def encode(self) -> bytes:
+        """SSE wire 형식 바이트로 인코딩한다."""
+        head = f"id: {self.seq}\n" if self.seq is not None else ''
+        return f"{head}event: {self.event}\ndata: {self.data}\n\n".encode('utf-8')
+
+
+def merge_stdout_frames(prev: SSEFrame, new: SSEFrame) -> SSEFrame | None:
+    """연속된 stdout 델타 두 프레임을 하나로 합친다.
+
+    Args:
+        prev: 앞 프레임
+        new: 뒤 프레임
+
+    Returns:
+        합친 프레임 (뒤 프레임의 seq 유지). 합칠 수 없으면 None.
+    """
+    if prev.event != 'stdout' or new.event != 'stdout':
+        return None
+    try:
+        a = json.loads(prev.data)
+        b = json.loads(new.data)
+    except ValueError:
+        return None
+    if not isinstance(a, dict) or not isinstance(b, dict):
+        return None
+    kind = a.get('kind')
+    if kind not in _MERGEABLE_KINDS or b.get('kind') != kind or set(a) != {'kind', 'chunk'} or set(b) != {'kind', 'chunk'}:
+        return None
+    merged = {'kind': kind, 'chunk': a.get('chunk', '') + b.get('chunk', '')}
+    return SSEFrame(new.event, json.dumps(merged, ensure_ascii=False), new.seq)
+
+
+class SSEClientQueue:
+    """클라이언트 1개의 bounded outbound 큐.
+
+    Attributes:
+        capacity: 최대 적재 프레임 수
+        policy: 오버플로 정책 ('coalesce' | 'drop')
+        closed: 닫힘 여부 (오버플로 drop 또는 remove)
+        coalesced: 오버플로 시 합쳐진 프레임 수
+        max_depth: 관측된 최대 큐 깊이
+    """
+
+    def __init__(self, capacity: int = SSE_QUEUE_SIZE, policy: str = SSE_OVERFLOW_POLICY) -> None:
+        """초기화한다.
+
+        Args:
+            capacity: 최대 적재 프레임 수
+            policy: 오버플로 정책 ('coalesce' | 'drop')
+        """
+        self.capacity: int = max(1, capacity)
+        self.policy: str = policy
+        self.closed: bool = False
+        self.coalesced: int = 0
+        self.max_depth: int = 0
+        self._frames: collections.deque[SSEFrame] = collections.deque()
+        self._cond: threading.Condition = threading.Condition()
+        self._listener: Callable[[], None] | None = None
+
+    @property
+    def depth(self) -> int:
+        """현재 큐 깊이."""
+        with self._cond:
+            return len(self._frames)
+
+    def set_listener(self, listener: Callable[[], None] | None) -> None:
+        """적재/닫힘 시 호출할 콜백을 등록한다 (스레드 대신 이벤트 루프가 읽는 writer 용).
+
+        콜백은 put()/close() 를 호출한 스레드에서 락 밖으로 호출되므로 블로킹하지 않아야 한다.
+        이미 프레임이 있거나 닫힌 큐이면 등록 즉시 한 번 호출한다.
+
+        Args:
+            listener: 인자 없는 콜백. None 이면 해제.
+        """
+        with self._cond:
+            self._listener = listener
+            pending = bool(self._frames) or self.closed
+        if listener is not None and pending:
+            listener()
+
+    def put(self, frame: SSEFrame) -> bool:
+        """프레임을 적재한다. 블로킹하지 않는다.
+
+        Args:
+            frame: 적재할 프레임
+
+        Returns:
+            적재(또는 합침) 성공 시 True. 오버플로로 클라이언트를 끊었거나
+            이미 닫힌 큐이면 False.
+        """
+        with self._cond:
+            if self.closed:
+                return False
+            accepted = True
+            if len(self._frames) >= self.capacity:
+                if self.policy != 'coalesce' or not self._make_room(frame):
+                    self.closed = True
+                    self._frames.clear()
+                    self._cond.notify_all()
+                    accepted = False
+            else:
+                self._frames.append(frame)
+            if accepted:
+                self.max_depth = max(self.max_depth, len(self._frames))
+                self._cond.notify()
+            listener = self._listener
+        if listener is not None:
+            listener()
+        return accepted
+
+    def _make_room(self, frame: SSEFrame) -> bool:
+        """coalesce 정책으로 frame 을 수용한다. _cond 보유 상태에서 호출.
+
+        새 프레임을 마지막 프레임에 합칠 수 있으면 합치고, 아니면 큐 안의 연속
+        stdout 델타를 압축한 뒤 공간이 생기면 적재한다.
+
+        Returns:
+            수용 성공 여부.
+        """
+        merged = merge_stdout_frames(self._frames[-1], frame) if self._frames else None
+        if merged is not None:
+            self._frames[-1] = merged
+            self.coalesced += 1
+            return True
+        compacted: collections.deque[SSEFrame] = collections.deque()
+        for queued in self._frames:
+            joined = merge_stdout_frames(compacted[-1], queued) if compacted else None
+            if joined is not None:
+                compacted[-1] = joined
+                self.coalesced += 1
+            else:
+                compacted.append(queued)
+        self._frames = compacted
+        if len(self._frames) >= self.capacity:
+            return False
+        self._frames.append(frame)
+        return True
+
+    def get(self, timeout: float) -> list[SSEFrame] | None:
+        """적재된 프레임을 모두 꺼낸다.
+
+        Args:
+            timeout: 프레임이 없을 때 최대 대기 시간(초)
+
+        Returns:
+            프레임 목록 (timeout 시 빈 목록). 큐가 닫혔으면 None.
+        """
+        with self._cond:
+            if not self._frames and not self.closed:
+                self._cond.wait(timeout)
+            if self.closed:
+                return None
+            frames = list(self._frames)
+            self._frames.clear()
+            return frames
+
+    def close(self) -> None:
+        """큐를 닫고 대기 중인 writer 를 깨운다."""
+        with self._cond:
+            self.closed = True
+            self._frames.clear()
+            self._cond.notify_all()
+            listener = self._listener
+        if listener is not None:
+            listener()
+
+
+class SSEClientRegistry:
+    """wfile 별 SSEClientQueue 레지스트리 + 지표.
+
+    SSEClientManager / TerminalSSEChannel 이 공통으로 사용한다.
+
+    Attributes:
+        dropped_clients: 오버플로로 끊은 클라이언트 누계
+    """
+
+    def __init__(self, capacity: int = SSE_QUEUE_SIZE, policy: str = SSE_OVERFLOW_POLICY) -> None:
+        """초기화한다.
+
+        Args:
+            capacity: 클라이언트별 큐 크기
+            policy: 오버플로 정책 ('coalesce' | 'drop')
+        """
+        self._capacity: int = capacity
+        self._policy: str = policy
+        self._queues: dict[int, SSEClientQueue] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self.dropped_clients: int = 0
+        self._coalesced_closed: int = 0
+
+    def add(self, wfile: object) -> SSEClientQueue:
+        """클라이언트를 등록하고 큐를 반환한다."""
+        queue = SSEClientQueue(self._capacity, self._policy)
+        with self._lock:
+            self._queues[id(wfile)] = queue
+        return queue
+
+    def remove(self, wfile: object) -> None:
+        """클라이언트를 제거하고 큐를 닫는다."""
+        with self._lock:
+            queue = self._queues.pop(id(wfile), None)
+            if queue is not None:
+                self._coalesced_closed += queue.coalesced
+        if queue is not None:
+            queue.close()
+
+    def get(self, wfile: object) -> SSEClientQueue | None:
+        """wfile 의 큐를 반환한다. 미등록이면 None."""
+        with self._lock:
+            return self._queues.get(id(wfile))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._queues)
+
+    def publish(self, frame: SSEFrame) -> None:
+        """모든 클라이언트 큐에 프레임을 적재한다 (블로킹 없음).
+
+        오버플로로 닫힌 클라이언트는 레지스트리에서 제거한다. 해당 핸들러
+        스레드는 pump() 에서 닫힘을 감지하고 연결을 종료한다.
+        """
+        with self._lock:
+            queues = list(self._queues.items())
+        overflowed = [(key, queue) for key, queue in queues if not queue.put(frame)]
+        if overflowed:
+            with self._lock:
+                for key, queue in overflowed:
+                    if self._queues.get(key) is queue:
+                        del self._queues[key]
+                        self.dropped_clients += 1
+                        self._coalesced_closed += queue.coalesced
+
+    def pump(self, wfile: object, heartbeat_interval: float) -> None:
+        """클라이언트 큐를 소켓으로 흘려보내는 writer 루프 (핸들러 스레드에서 호출).
+
+        프레임이 없으면 heartbeat_interval 마다 heartbeat 주석을 쓴다.
+        큐가 닫히거나(remove/오버플로) 소켓 쓰기가 실패하면 반환한다.
+
+        Args:
+            wfile: HTTP 핸들러의 wfile
+            heartbeat_interval: heartbeat 간격(초)
+        """
+        queue = self.get(wfile)
+        if queue is None:
+            return
+        while True:
+            frames = queue.get(heartbeat_interval)
+            if frames is None:
+                return
+            chunk = b''.join(f.encode() for f in frames) if frames else b': heartbeat\n\n'
+            try:
+                wfile.write(chunk)
+                wfile.flush()
+            except (BrokenPipeError, ConnectionResetError, OSError):
+                return
+
+    def stats(self) -> dict:
+        """큐 깊이/드롭 지표를 반환한다.
+
+        Returns:
+            ``{"clients", "queue_capacity", "policy", "depths", "max_depth",
+            "coalesced", "dropped_clients"}`` dict.
+        """
+        with self._lock:
+            queues = list(self._queues.values())
+            dropped = self.dropped_clients
+            coalesced = self._coalesced_closed
+        return {
+            'clients': len(queues),
+            'queue_capacity': self._capacity,
+            'policy': self._policy,
+            'depths': [q.depth for q in queues],
+            'max_depth': max((q.max_depth for q in queues), default=0),
+            'coalesced': coalesced + sum(q.coalesced for q in queues),
+            'dropped_clients': dropped,
+        }
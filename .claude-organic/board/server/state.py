@@ -9,6 +9,9 @@ from .poll_tracker import PollChangeTracker
 from .terminal_channel import TerminalSSEChannel
 from .claude_process import ClaudeProcess
 from .workflow_session import WorkflowSessionRegistry
+from .http_cache import StaticAssetCache
+from .ticket_index import TicketIndex
+from .workflow_index import WorkflowIndex
 
 # 모듈 레벨 SSE 클라이언트 매니저 (서버 인스턴스와 공유)
 sse_manager: SSEClientManager = SSEClientManager()
@@ -25,3 +28,12 @@ claude_process: ClaudeProcess = ClaudeProcess(
 
 # 모듈 레벨 워크플로우 세션 레지스트리
 workflow_registry: WorkflowSessionRegistry = WorkflowSessionRegistry()
+
+# 모듈 레벨 정적 자산 캐시 (ETag + gzip 압축본)
+static_assets: StaticAssetCache = StaticAssetCache()
+
+# 모듈 레벨 파싱된 티켓 인덱스 (/api/kanban?since=)
+ticket_index: TicketIndex = TicketIndex()
+
+# 모듈 레벨 워크플로우 엔트리/상세 캐시 (/api/workflow/entries, /api/workflow/detail)
+workflow_index: WorkflowIndex = WorkflowIndex()
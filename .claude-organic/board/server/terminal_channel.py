@@ -14,7 +14,10 @@ from collections.abc import Callable
 
 from ._common import logger
 from .event_filter import is_user_visible
+from .jsonl_writer import BufferedJsonlWriter
+from .session_index import SessionIndex
 from .sse_client_manager import _NDJSON_EVENT_MAP
+from .sse_queue import SSEClientQueue, SSEClientRegistry, SSEFrame
 
 # ---------------------------------------------------------------------------
 # Workflow step detection patterns (stdout banner parsing)
@@ -101,10 +104,12 @@ class TerminalSSEChannel:
     링버퍼(deque)는 제거되었으며, 재접속 시 과거 이벤트는 REST /workflow/history
     엔드포인트를 통해 jsonl 파일에서 복원한다.
 
+    클라이언트별 bounded 큐(SSEClientRegistry)에 적재만 하므로 토큰 델타 버스트가
+    느린 클라이언트 때문에 subprocess 파이프를 막지 않는다.
+
     Attributes:
-        _clients: 연결된 클라이언트의 wfile 객체 목록
-        _lock: 클라이언트 목록 접근용 Lock
-        _client_locks: wfile별 per-client Lock 딕셔너리
+        _registry: wfile 별 SSEClientQueue 레지스트리
+        _lock: seq 발급/적재 순서 보장용 Lock
     """
 
     def __init__(self, persist_path: str | None = None) -> None:
@@ -113,12 +118,17 @@ class TerminalSSEChannel:
         Args:
             persist_path: 이벤트를 저장할 JSONL 파일 경로. None이면 persist 비활성.
         """
-        self._clients: list = []
+        self._registry: SSEClientRegistry = SSEClientRegistry()
         self._lock: threading.Lock = threading.Lock()
-        self._client_locks: dict = {}
         self._next_seq: int = 0
         self._persist_path: str | None = persist_path
-        self._persist_lock: threading.Lock = threading.Lock()
+        self.persist_index: SessionIndex | None = (
+            SessionIndex(persist_path) if persist_path is not None else None
+        )
+        self._persist_writer: BufferedJsonlWriter | None = (
+            BufferedJsonlWriter(persist_path, index=self.persist_index)
+            if persist_path is not None else None
+        )
         # stdout 기반 워크플로우 단계 감지
         self._step_buffer: str = ''
         self._current_step: str = ''
@@ -144,9 +154,7 @@ class TerminalSSEChannel:
             last_event_id: (미사용, 하위호환 유지)
             skip_replay: (미사용, 하위호환 유지)
         """
-        with self._lock:
-            self._clients.append(wfile)
-            self._client_locks[id(wfile)] = threading.Lock()
+        self._registry.add(wfile)
 
     def remove(self, wfile: object) -> None:
         """클라이언트를 제거한다.
@@ -154,24 +162,24 @@ class TerminalSSEChannel:
         Args:
             wfile: 제거할 클라이언트의 wfile
         """
-        with self._lock:
-            try:
-                self._clients.remove(wfile)
-            except ValueError:
-                pass
-            self._client_locks.pop(id(wfile), None)
+        self._registry.remove(wfile)
 
-    def get_lock(self, wfile: object) -> threading.Lock | None:
-        """wfile에 대응하는 per-client lock을 반환한다.
+    def pump(self, wfile: object, heartbeat_interval: float = 0.25) -> None:
+        """클라이언트 큐를 소켓으로 흘려보낸다. 연결이 끝날 때까지 반환하지 않는다.
 
         Args:
-            wfile: lock을 획득할 클라이언트의 wfile
-
-        Returns:
-            해당 wfile의 Lock. 클라이언트가 존재하지 않으면 None.
+            wfile: add() 로 등록한 클라이언트의 wfile
+            heartbeat_interval: 프레임이 없을 때 heartbeat 간격(초)
         """
-        with self._lock:
-            return self._client_locks.get(id(wfile))
+        self._registry.pump(wfile, heartbeat_interval)
+
+    def queue(self, wfile: object) -> SSEClientQueue | None:
+        """add() 로 등록한 클라이언트의 큐를 반환한다 (이벤트 루프 writer 용). 미등록이면 None."""
+        return self._registry.get(wfile)
+
+    def stats(self) -> dict:
+        """클라이언트 큐 깊이/드롭 지표를 반환한다."""
+        return self._registry.stats()
 
     def broadcast(self, data: dict) -> None:
         """NDJSON 메시지를 SSE 이벤트로 변환하여 모든 클라이언트에 전송한다.
@@ -185,7 +193,7 @@ class TerminalSSEChannel:
         - attachment (skill_listing) -> event: skill_listing
         - 기타 -> event: stdout (기본값)
 
-        전송 실패한 클라이언트(연결 끊김)는 목록에서 제거한다.
+        큐가 넘친 클라이언트는 오버플로 정책에 따라 끊긴다 (SSE_OVERFLOW_POLICY).
 
         Args:
             data: 파싱된 NDJSON 메시지 dict
@@ -198,52 +206,34 @@ class TerminalSSEChannel:
 
         self._emit_event(event_name, json_payload)
 
-        # 파일 persist (서버 재시작 시 복원용) - 별도 락 사용
-        if self._persist_path is not None:
+        # 파일 persist (서버 재시작 시 복원용) - write-behind 버퍼 경유
+        if self._persist_writer is not None:
             try:
                 line = json.dumps(data, ensure_ascii=False) + '\n'
-                with self._persist_lock:
-                    with open(self._persist_path, 'a', encoding='utf-8') as f:
-                        f.write(line)
-            except (OSError, TypeError) as exc:
-                logger.error("terminal_channel: broadcast persist 쓰기 실패 (%s): %s", self._persist_path, exc)
+            except TypeError as exc:
+                logger.error("terminal_channel: broadcast persist 직렬화 실패 (%s): %s", self._persist_path, exc)
+            else:
+                if data.get('subtype') == 'process_exit':
+                    # 프로세스 종료: 버퍼를 기록하고 핸들을 반납 (다음 실행 시 다시 연다)
+                    self._persist_writer.append(line)
+                    self._persist_writer.close()
+                else:
+                    self._persist_writer.append(line, urgent=(event_name == 'result'))
 
         # stdout 기반 워크플로우 단계 감지
         self._detect_step_from_broadcast(event_name, payload)
 
     def _emit_event(self, event_name: str, json_payload: str) -> None:
-        """SSE 이벤트를 seq_id 부여 후 연결된 모든 클라이언트에 전송한다.
+        """SSE 이벤트를 seq_id 부여 후 연결된 모든 클라이언트 큐에 적재한다.
 
-        링버퍼 저장 및 replay 버퍼링 로직은 제거되었다.
+        소켓 쓰기는 각 클라이언트 핸들러 스레드의 pump() 가 수행하므로 호출자
+        (Claude stdout reader 스레드)는 느린 클라이언트에 막히지 않는다.
+        seq 순서를 보존하도록 발급과 적재를 같은 Lock 안에서 수행한다 (적재는 블로킹 없음).
         """
-        dead_clients: list = []
         with self._lock:
             seq_id = self._next_seq
             self._next_seq += 1
-            message = f"id: {seq_id}\nevent: {event_name}\ndata: {json_payload}\n\n"
-            encoded = message.encode('utf-8')
-            clients_snapshot = list(self._clients)
-
-        for wfile in clients_snapshot:
-            wfile_id = id(wfile)
-            client_lock = self._client_locks.get(wfile_id)
-            if client_lock is None:
-                continue
-            try:
-                with client_lock:
-                    wfile.write(encoded)
-                    wfile.flush()
-            except (BrokenPipeError, ConnectionResetError, OSError):
-                dead_clients.append(wfile)
-
-        if dead_clients:
-            with self._lock:
-                for wfile in dead_clients:
-                    try:
-                        self._clients.remove(wfile)
-                    except ValueError:
-                        pass
-                    self._client_locks.pop(id(wfile), None)
+            self._registry.publish(SSEFrame(event_name, json_payload, seq_id))
 
     def _classify_event(self, data: dict) -> str:
         """NDJSON 메시지 타입으로부터 SSE 이벤트 이름을 결정한다.
@@ -495,11 +485,20 @@ class TerminalSSEChannel:
                 payload[key] = data[key]
         return payload
 
+    def flush_persist(self) -> None:
+        """persist 버퍼의 미기록 이벤트를 파일에 기록한다 (이력 reader 가 읽기 전 호출)."""
+        if self._persist_writer is not None:
+            self._persist_writer.flush()
+
+    def close_persist(self) -> None:
+        """persist 버퍼를 기록하고 파일 핸들을 닫는다."""
+        if self._persist_writer is not None:
+            self._persist_writer.close()
+
     @property
     def client_count(self) -> int:
         """현재 연결된 클라이언트 수를 반환한다."""
-        with self._lock:
-            return len(self._clients)
+        return len(self._registry)
 
     @property
     def current_step(self) -> str:
@@ -527,17 +526,14 @@ class TerminalSSEChannel:
         self._emit_event('workflow_step', json.dumps(payload, ensure_ascii=False))
 
         # jsonl 기록 (broadcast 미경유이므로 직접 persist)
-        if self._persist_path is not None:
+        if self._persist_writer is not None:
             try:
                 record = {'type': 'workflow_step', 'step': step_name, 'prev_step': prev}
                 if detail:
                     record.update(detail)
-                line = json.dumps(record, ensure_ascii=False) + '\n'
-                with self._persist_lock:
-                    with open(self._persist_path, 'a', encoding='utf-8') as f:
-                        f.write(line)
-            except (OSError, TypeError) as exc:
-                logger.error("terminal_channel: emit_step persist 쓰기 실패 (%s): %s", self._persist_path, exc)
+                self._persist_writer.append(json.dumps(record, ensure_ascii=False) + '\n')
+            except TypeError as exc:
+                logger.error("terminal_channel: emit_step persist 직렬화 실패 (%s): %s", self._persist_path, exc)
 
         if self.on_step:
             try:
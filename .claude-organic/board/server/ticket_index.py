@@ -0,0 +1,300 @@
+"""TicketIndex — versioned in-memory index of parsed kanban tickets for /api/kanban?since=."""
+
+from __future__ import annotations
+
+import collections
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+from ._common import KANBAN_DIRS_LIST
+
+# 삭제 기록(tombstone) 최대 보관 수. 밀려난 기록보다 오래된 커서는 전체 재동기화한다.
+TOMBSTONE_CAPACITY: int = 4096
+# 디렉터리 mtime 이 그대로여도 이 시간(초)이 지나면 요청 시 전체 stat 스캔 (제자리 수정 보정)
+FULL_SCAN_SECONDS: float = 30.0
+
+
+def _text(el: ET.Element) -> str:
+    """DOM textContent 와 같은 하위 텍스트 전체."""
+    return ''.join(el.itertext())
+
+
+def _children_map(el: ET.Element, lower: bool = False, squeeze: bool = False) -> dict[str, str]:
+    """자식 요소 {태그: 텍스트} (빈 텍스트 제외)."""
+    result: dict[str, str] = {}
+    for child in el:
+        value = _text(child).strip()
+        if squeeze:
+            value = '\n'.join(line.strip() for line in value.split('\n') if line.strip())
+        if value:
+            result[child.tag.lower() if lower else child.tag] = value
+    return result
+
+
+def parse_ticket_xml(text: str) -> dict | None:
+    """티켓 XML 을 보드 티켓 객체로 파싱한다.
+
+    브라우저 ``Board.util.parseTicket`` (static/js/core/common.js) 과 같은 결과를 만든다.
+
+    Args:
+        text: 티켓 XML 문자열
+
+    Returns:
+        {number, title, created, updated, status, command, prompt, result, relations}.
+        XML 이 올바르지 않거나 <ticket> 이 없으면 None.
+    """
+    try:
+        doc = ET.fromstring(text)
+    except ET.ParseError:
+        return None
+    root = next(doc.iter('ticket'), None)
+    if root is None:
+        return None
+
+    ticket: dict = {
+        'number': '', 'title': '', 'created': '', 'updated': '', 'status': 'Open',
+        'command': '', 'prompt': None, 'result': None,
+        'relations': [],
+    }
+
+    meta = next(root.iter('metadata'), None)
+    if meta is not None:
+        for field in ('number', 'title', 'created', 'updated', 'status'):
+            el = next(meta.iter(field), None)
+            if el is not None and _text(el):
+                ticket[field] = _text(el).strip()
+        # 레거시 호환: <datetime> → created/updated 폴백
+        if not ticket['created'] or not ticket['updated']:
+            dt_el = next(meta.iter('datetime'), None)
+            if dt_el is not None and _text(dt_el):
+                dt_val = _text(dt_el).strip()
+                ticket['created'] = ticket['created'] or dt_val
+                ticket['updated'] = ticket['updated'] or dt_val
+        cmd_el = next(meta.iter('command'), None)
+        if cmd_el is not None:
+            ticket['command'] = _text(cmd_el).strip()
+
+    prompt_el = root.find('prompt')
+    if prompt_el is not None:
+        ticket['prompt'] = _children_map(prompt_el, squeeze=True) or None
+    result_el = root.find('result')
+    if result_el is not None:
+        ticket['result'] = _children_map(result_el, lower=True) or None
+
+    # 레거시 done 티켓 폴백 (읽기 전용): <submit>/<subnumber> 구조
+    if not ticket['prompt'] and not ticket['command']:
+        submit_el = next(root.iter('submit'), None)
+        if submit_el is not None:
+            subs = list(submit_el.iter('subnumber'))
+            active = next((s for s in subs if s.get('active') == 'true'), subs[-1] if subs else None)
+            if active is not None:
+                cmd_el = next(active.iter('command'), None)
+                legacy_cmd = _text(cmd_el) if cmd_el is not None else ''
+                if legacy_cmd:
+                    ticket['command'] = legacy_cmd.strip()
+                legacy_prompt = next(active.iter('prompt'), None)
+                if legacy_prompt is not None and _children_map(legacy_prompt):
+                    ticket['prompt'] = _children_map(legacy_prompt)
+                legacy_result = next(active.iter('result'), None)
+                if legacy_result is not None and _children_map(legacy_result, lower=True):
+                    ticket['result'] = _children_map(legacy_result, lower=True)
+
+    relations_el = next(root.iter('relations'), None)
+    if relations_el is not None:
+        for rel in relations_el.iter('relation'):
+            rel_type = rel.get('type') or ''
+            rel_ticket = rel.get('ticket') or ''
+            if rel_type and rel_ticket:
+                ticket['relations'].append({'type': rel_type, 'ticket': rel_ticket})
+
+    return ticket
+
+
+class TicketIndex:
+    """파싱된 칸반 티켓의 버전 인덱스.
+
+    티켓 파일명마다 (디렉터리, mtime, size, 파싱 결과, 변경 버전) 을 보관하고, 변경이
+    감지될 때마다 단조 증가 버전을 발급한다. 클라이언트는 마지막으로 받은 버전을 커서로
+    ``since(version)`` 을 호출해 그 이후 바뀐/이동한 티켓과 삭제된 파일명만 받는다.
+
+    갱신 경로는 두 가지이다.
+
+    - FileWatcher 의 kanban 이벤트 → ``refresh(files)`` 로 해당 파일만 재파싱
+    - 요청 시 상태 디렉터리 mtime 이 바뀌었거나 FULL_SCAN_SECONDS 가 지났으면 전체 stat 스캔
+      (바뀐 파일만 다시 읽고 파싱한다)
+
+    버전은 인덱스 생성 시각(ms)에서 시작하므로 서버가 재시작해도 이전 커서와 겹치지 않는다.
+    커서가 0 이하, tombstone 보관 범위 밖, 현재 버전보다 크면 전체 목록을 돌려준다.
+
+    Attributes:
+        _root: 인덱스 대상 프로젝트 루트 (다른 루트로 호출되면 초기화)
+        _records: 파일명 -> {'dir', 'mtime_ns', 'size', 'ticket', 'version'}
+        _tombstones: 삭제된 파일명 -> 삭제 버전 (오래된 순)
+        _floor: tombstone 이 밀려나 변경분을 확정할 수 없는 최대 버전
+        _version: 마지막으로 발급한 버전
+        _dir_mtimes: 마지막 전체 스캔 시점의 상태 디렉터리 mtime
+        _scanned_at: 마지막 전체 스캔 시각 (monotonic)
+        _lock: thread-safe 접근용 Lock
+    """
+
+    def __init__(self, tombstone_capacity: int = TOMBSTONE_CAPACITY) -> None:
+        """초기화한다.
+
+        Args:
+            tombstone_capacity: 삭제 기록 최대 보관 수
+        """
+        self._capacity: int = tombstone_capacity
+        self._root: str | None = None
+        self._records: dict[str, dict] = {}
+        self._tombstones: collections.OrderedDict[str, int] = collections.OrderedDict()
+        self._floor: int = 0
+        self._version: int = int(time.time() * 1000)
+        self._dir_mtimes: dict[str, int] | None = None
+        self._scanned_at: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    # ── 내부 ──
+
+    def _tickets_dir(self) -> str:
+        return os.path.join(self._root or '', '.claude-organic', 'tickets')
+
+    def _reset(self, project_root: str) -> None:
+        self._root = project_root
+        self._records.clear()
+        self._tombstones.clear()
+        self._floor = self._version
+        self._dir_mtimes = None
+
+    def _stat_dirs(self) -> dict[str, int]:
+        mtimes: dict[str, int] = {}
+        for d in KANBAN_DIRS_LIST:
+            try:
+                mtimes[d] = os.stat(os.path.join(self._tickets_dir(), d)).st_mtime_ns
+            except OSError:
+                mtimes[d] = 0
+        return mtimes
+
+    def _bump(self) -> int:
+        self._version += 1
+        return self._version
+
+    def _update(self, name: str, col: str, st: os.stat_result) -> None:
+        """파일이 바뀌었으면 다시 읽고 파싱하여 새 버전을 붙인다."""
+        rec = self._records.get(name)
+        if rec is not None and (rec['dir'], rec['mtime_ns'], rec['size']) == (col, st.st_mtime_ns, st.st_size):
+            return
+        try:
+            with open(os.path.join(self._tickets_dir(), col, name), encoding='utf-8') as f:
+                ticket = parse_ticket_xml(f.read())
+        except (OSError, UnicodeDecodeError):
+            ticket = None
+        self._tombstones.pop(name, None)
+        self._records[name] = {
+            'dir': col, 'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+            'ticket': ticket, 'version': self._bump(),
+        }
+
+    def _delete(self, name: str) -> None:
+        if self._records.pop(name, None) is None:
+            return
+        self._tombstones[name] = self._bump()
+        while len(self._tombstones) > self._capacity:
+            _name, version = self._tombstones.popitem(last=False)
+            self._floor = max(self._floor, version)
+
+    def _full_scan(self) -> None:
+        """모든 상태 디렉터리를 stat 스캔한다 (먼저 나온 디렉터리 우선)."""
+        self._dir_mtimes = self._stat_dirs()
+        self._scanned_at = time.monotonic()
+        found: dict[str, tuple[str, os.stat_result]] = {}
+        for col in KANBAN_DIRS_LIST:
+            try:
+                with os.scandir(os.path.join(self._tickets_dir(), col)) as entries:
+                    for e in entries:
+                        if e.name in found or not e.name.endswith('.xml') or not e.is_file():
+                            continue
+                        try:
+                            found[e.name] = (col, e.stat())
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+        for name in sorted(found):
+            self._update(name, *found[name])
+        for name in [n for n in self._records if n not in found]:
+            self._delete(name)
+
+    def _ensure_fresh(self, project_root: str) -> None:
+        if project_root != self._root:
+            self._reset(project_root)
+        if (
+            self._dir_mtimes is None
+            or time.monotonic() - self._scanned_at >= FULL_SCAN_SECONDS
+            or self._stat_dirs() != self._dir_mtimes
+        ):
+            self._full_scan()
+
+    # ── 공개 API ──
+
+    def refresh(self, project_root: str, files: list[str] | None = None) -> int:
+        """인덱스를 갱신하고 현재 버전을 반환한다.
+
+        Args:
+            project_root: 프로젝트 루트 절대 경로
+            files: 변경된 티켓 파일명 목록 (FileWatcher kanban 이벤트). None 이면 전체 스캔.
+
+        Returns:
+            갱신 후 버전.
+        """
+        with self._lock:
+            if project_root != self._root:
+                self._reset(project_root)
+            if files is None or self._dir_mtimes is None:
+                self._full_scan()
+                return self._version
+            for name in files:
+                if not name.endswith('.xml') or os.sep in name:
+                    continue
+                for col in KANBAN_DIRS_LIST:
+                    try:
+                        st = os.stat(os.path.join(self._tickets_dir(), col, name))
+                    except OSError:
+                        continue
+                    self._update(name, col, st)
+                    break
+                else:
+                    self._delete(name)
+            return self._version
+
+    def since(self, project_root: str, version: int) -> dict:
+        """커서 이후 변경분을 반환한다.
+
+        Args:
+            project_root: 프로젝트 루트 절대 경로
+            version: 클라이언트가 마지막으로 받은 버전 (0 이하면 전체)
+
+        Returns:
+            {'version': 현재 버전, 'full': 전체 목록 여부,
+             'tickets': {파일명: 티켓}, 'deleted': [파일명]}.
+            full 이면 tickets 는 전체 목록이고 deleted 는 빈 목록이다.
+            파싱할 수 없는 티켓은 tickets 에서 제외한다.
+        """
+        with self._lock:
+            self._ensure_fresh(project_root)
+            full = version <= 0 or version < self._floor or version > self._version
+            order = {col: i for i, col in enumerate(KANBAN_DIRS_LIST)}
+            changed = sorted(
+                (
+                    (name, rec) for name, rec in self._records.items()
+                    if rec['ticket'] is not None and (full or rec['version'] > version)
+                ),
+                key=lambda item: (order.get(item[1]['dir'], 0), item[0]),
+            )
+            return {
+                'version': self._version,
+                'full': full,
+                'tickets': {name: rec['ticket'] for name, rec in changed},
+                'deleted': [] if full else [n for n, v in self._tombstones.items() if v > version],
+            }
@@ -0,0 +1,218 @@
+"""WorkflowIndex — cached workflow entry list / detail for /api/workflow/entries and /api/workflow/detail."""
+
+from __future__ import annotations
+
+import collections
+import os
+import threading
+
+from ._common import WF_BASE, WF_HISTORY, _list_workflow_entries, _workflow_detail
+
+# 상세 캐시 최대 엔트리 수 (LRU). 넘치면 가장 오래 조회하지 않은 엔트리부터 버린다.
+DETAIL_CAPACITY: int = 2048
+# 페이지 크기 기본값 / 상한
+DEFAULT_PAGE_LIMIT: int = 50
+MAX_PAGE_LIMIT: int = 500
+
+
+def entry_key(entry: str) -> str:
+    """엔트리 경로 또는 이름에서 정렬 키(타임스탬프 디렉터리명)를 뽑는다."""
+    return entry.rstrip('/').rsplit('/', 1)[-1]
+
+
+class WorkflowIndex:
+    """워크플로우 엔트리 목록과 엔트리별 상세의 캐시.
+
+    엔트리 목록은 ``runs/`` 와 ``runs/.history/`` 디렉터리 mtime 이 바뀌었거나 FileWatcher
+    의 workflow 이벤트가 들어왔을 때만 다시 스캔한다.
+
+    엔트리 상세는 엔트리 경로별로 서명과 함께 보관한다.
+
+    - ``.history`` 엔트리(보관된 실행)는 엔트리 디렉터리 mtime 만 서명으로 쓴다
+    - ``runs/`` 의 진행 중 엔트리는 task/command 디렉터리 mtime 과 status.json (mtime, size)
+      까지 서명에 넣는다 — status.json 을 읽거나 산출물을 stat 하지 않고 변경을 판별한다
+    - workflow 이벤트로 들어온 엔트리명은 서명과 무관하게 캐시에서 버린다
+
+    요약 모드(file_map=False)로 만든 상세는 fileMap 이 없으므로 전체 상세 요청 시 다시 만든다.
+
+    Attributes:
+        _root: 캐시 대상 프로젝트 루트 (다른 루트로 호출되면 초기화)
+        _entries: 최신순 엔트리 경로 목록 (None 이면 재스캔 필요)
+        _dir_mtimes: 마지막 목록 스캔 시점의 runs/, runs/.history mtime
+        _details: 엔트리 경로 -> {'sig', 'items', 'file_map'} (LRU 순)
+        _lock: thread-safe 접근용 Lock
+    """
+
+    def __init__(self, capacity: int = DETAIL_CAPACITY) -> None:
+        """초기화한다.
+
+        Args:
+            capacity: 상세 캐시 최대 엔트리 수
+        """
+        self._capacity: int = capacity
+        self._root: str | None = None
+        self._entries: list[str] | None = None
+        self._dir_mtimes: tuple[int, int] | None = None
+        self._details: collections.OrderedDict[str, dict] = collections.OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    # ── 내부 ──
+
+    def _reset(self, project_root: str) -> None:
+        self._root = project_root
+        self._entries = None
+        self._dir_mtimes = None
+        self._details.clear()
+
+    def _stat_dirs(self) -> tuple[int, int]:
+        mtimes: list[int] = []
+        for rel in (WF_BASE, WF_HISTORY):
+            try:
+                mtimes.append(os.stat(os.path.join(self._root or '', rel)).st_mtime_ns)
+            except OSError:
+                mtimes.append(0)
+        return mtimes[0], mtimes[1]
+
+    def _signature(self, entry_rel: str) -> tuple | None:
+        """엔트리 변경 판별용 서명. 엔트리 디렉터리가 없으면 None."""
+        entry_abs = os.path.join(self._root or '', entry_rel.strip('/'))
+        try:
+            sig: list = [os.stat(entry_abs).st_mtime_ns]
+        except OSError:
+            return None
+        if entry_rel.strip('/').startswith(WF_HISTORY):
+            return tuple(sig)
+        try:
+            with os.scandir(entry_abs) as tasks:
+                task_entries = sorted((e for e in tasks if e.is_dir()), key=lambda e: e.name)
+            for task in task_entries:
+                sig.append((task.name, task.stat().st_mtime_ns))
+                with os.scandir(task.path) as cmds:
+                    cmd_entries = sorted((e for e in cmds if e.is_dir()), key=lambda e: e.name)
+                for cmd in cmd_entries:
+                    try:
+                        st = os.stat(os.path.join(cmd.path, 'status.json'))
+                        status_sig = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        status_sig = None
+                    sig.append((task.name, cmd.name, cmd.stat().st_mtime_ns, status_sig))
+        except OSError:
+            # 스캔 중 디렉터리가 사라짐 (.history 로 이동 등) — 다음 요청에서 다시 판별
+            sig.append(None)
+        return tuple(sig)
+
+    def _list(self, project_root: str) -> list[str]:
+        if project_root != self._root:
+            self._reset(project_root)
+        mtimes = self._stat_dirs()
+        if self._entries is None or mtimes != self._dir_mtimes:
+            self._dir_mtimes = mtimes
+            self._entries = _list_workflow_entries(project_root)
+        return self._entries
+
+    def _detail(self, entry_rel: str, file_map: bool) -> list[dict]:
+        sig = self._signature(entry_rel)
+        if sig is None:
+            self._details.pop(entry_rel, None)
+            return []
+        rec = self._details.get(entry_rel)
+        if rec is None or rec['sig'] != sig or (file_map and not rec['file_map']):
+            rec = {
+                'sig': sig,
+                'items': _workflow_detail(self._root or '', entry_rel, file_map=file_map),
+                'file_map': file_map,
+            }
+            self._details[entry_rel] = rec
+            while len(self._details) > self._capacity:
+                self._details.popitem(last=False)
+        self._details.move_to_end(entry_rel)
+        if file_map:
+            return rec['items']
+        return [{k: v for k, v in item.items() if k != 'fileMap'} for item in rec['items']]
+
+    # ── 공개 API ──
+
+    def invalidate(self, project_root: str, files: list[str] | None = None) -> None:
+        """FileWatcher workflow 이벤트로 캐시를 무효화한다.
+
+        Args:
+            project_root: 프로젝트 루트 절대 경로
+            files: 변경된 엔트리 디렉터리명 목록. None 이면 전체 무효화.
+        """
+        with self._lock:
+            if project_root != self._root or files is None:
+                self._reset(project_root)
+                return
+            self._entries = None
+            names = set(files)
+            for rel in [r for r in self._details if entry_key(r) in names]:
+                del self._details[rel]
+
+    def entries(self, project_root: str) -> list[str]:
+        """workflow + .history 엔트리 경로를 최신순으로 반환한다 (_list_workflow_entries 와 동일)."""
+        with self._lock:
+            return list(self._list(project_root))
+
+    def page(
+        self,
+        project_root: str,
+        before: str | None = None,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        detail: str | None = None,
+    ) -> dict:
+        """커서 기반 엔트리 페이지를 반환한다.
+
+        Args:
+            project_root: 프로젝트 루트 절대 경로
+            before: 이 키(엔트리명 또는 경로)보다 오래된 엔트리부터. None 이면 최신부터.
+            limit: 페이지 크기 (1 ~ MAX_PAGE_LIMIT 로 보정)
+            detail: 'full' 이면 페이지 엔트리의 상세를, 'summary' 면 fileMap 없는 상세를
+                    items 로 함께 반환한다. None 이면 items 를 넣지 않는다.
+
+        Returns:
+            {'entries': [엔트리 경로], 'next': 다음 페이지 커서 또는 None, 'total': 전체 수}
+            (+ detail 지정 시 'items': 페이지 엔트리들의 상세 목록).
+        """
+        limit = max(1, min(limit, MAX_PAGE_LIMIT))
+        with self._lock:
+            entries = self._list(project_root)
+            start = 0
+            if before:
+                cursor = entry_key(before)
+                # 최신순(내림차순) 정렬이므로 cursor 보다 작은 첫 위치를 찾는다
+                lo, hi = 0, len(entries)
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if entry_key(entries[mid]) >= cursor:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                start = lo
+            chunk = entries[start:start + limit]
+            result: dict = {
+                'entries': chunk,
+                'next': entry_key(chunk[-1]) if chunk and start + limit < len(entries) else None,
+                'total': len(entries),
+            }
+            if detail in ('full', 'summary'):
+                items: list[dict] = []
+                for rel in chunk:
+                    items.extend(self._detail(rel, file_map=(detail == 'full')))
+                result['items'] = items
+            return result
+
+    def detail(self, project_root: str, entry_rel: str, file_map: bool = True) -> list[dict]:
+        """엔트리 1개의 상세를 반환한다 (_workflow_detail 과 동일, 캐시 경유).
+
+        Args:
+            project_root: 프로젝트 루트 절대 경로
+            entry_rel: 엔트리 상대 경로
+            file_map: False 면 fileMap 없는 요약 상세
+
+        Returns:
+            task/command 별 상세 dict 목록.
+        """
+        with self._lock:
+            if project_root != self._root:
+                self._reset(project_root)
+            return self._detail(entry_rel, file_map)
@@ -13,6 +13,7 @@ from dataclasses import dataclass, field
 
 from ._common import logger
 from .claude_process import ClaudeProcess
+from .session_index import index_path
 from .terminal_channel import TerminalSSEChannel
 
 
@@ -194,6 +195,9 @@ class WorkflowSessionRegistry:
 
     def purge(self, session_id: str) -> bool:
         """세션을 레지스트리와 디스크에서 완전히 제거한다."""
+        session = self.get(session_id)
+        if session is not None:
+            session.channel.close_persist()
         removed = self.remove(session_id)
         if removed and self._persist_dir is not None:
             fpath = self._session_file(session_id)
@@ -202,6 +206,11 @@ class WorkflowSessionRegistry:
                     os.remove(fpath)
                 except OSError as exc:
                     logger.error("workflow_session[%s]: 세션 파일 삭제 실패 (%s): %s", session_id, fpath, exc)
+            if fpath:
+                try:
+                    os.remove(index_path(fpath))
+                except OSError:
+                    pass
         return removed
 
     def load_archived(self, session_id: str) -> 'WorkflowSession | None':
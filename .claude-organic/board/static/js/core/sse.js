@@ -25,6 +25,7 @@
   let sseConnected = false;
   let sseGaveUp = false;         // SSE abandoned, polling mode active
   let sseRetryTimerId = null;
+  let pollCursor = -1;           // /poll?since= cursor (-1: unknown -> server asks resync)
   let pollTimerId = null;
 
   let prevTicketJson = "";
@@ -238,10 +239,22 @@
 
   /** Performs a single poll request and schedules the next one. */
   function pollChanges() {
-    fetch("/poll").then(function (res) {
+    fetch("/poll?since=" + pollCursor).then(function (res) {
       if (!res.ok) throw new Error("poll failed");
       return res.json();
-    }).then(function (changes) {
+    }).then(function (journal) {
+      pollCursor = journal.seq;
+      if (journal.resync) {
+        // cursor unknown or fell out of the server ring: full refetch
+        refreshKanban(null);
+        refreshWorkflow();
+        refreshDashboard();
+        refreshMemory();
+        if (Board.render.refreshRoadmap) Board.render.refreshRoadmap();
+        refreshBranch(null);
+        return;
+      }
+      var changes = journal.changes;
       if (changes.kanban) {
         refreshKanban(changes.kanban);
       }
@@ -35,7 +35,7 @@ const DASH_FILES = ["usage", "logs", "skills"];
  * @returns {Promise<Object>} the dashData object
  */
 function fetchAllDashboardFiles() {
-  return fetch("/api/dashboard", { cache: "no-store" }).then(function (res) {
+  return fetch("/api/dashboard", { cache: "no-cache" }).then(function (res) {
     if (!res.ok) return Board.state.dashData;
     return res.json();
   }).then(function (data) {
@@ -12,7 +12,7 @@
 "use strict";
 
 (function () {
-  const { esc, badge, fetchXmlList, parseTicket, CMD_COLORS, COLUMNS, KANBAN_SORT_LS_KEY } = Board.util;
+  const { esc, badge, fetchXmlList, CMD_COLORS, COLUMNS, KANBAN_SORT_LS_KEY } = Board.util;
 
   // ── Column Collapsed State (Done / To Do) ──
   // 컬럼 키별로 접힘 상태를 독립 저장한다. "Done"은 기존 키를 유지해 사용자 설정
@@ -166,20 +166,30 @@
     });
   }
 
-  /** Fetches all tickets via /api/kanban (single request). */
+  // Ticket index version of the last /api/kanban?since= response (0 = none yet).
+  var _kanbanVersion = 0;
+
+  /**
+   * Collects the parsed tickets of a /api/kanban?since= response in server order.
+   * @param {{tickets: Object<string, Object>}} payload
+   * @returns {Object[]}
+   */
+  function ticketsOf(payload) {
+    var tickets = [];
+    Object.keys(payload.tickets || {}).forEach(function (fn) {
+      if (payload.tickets[fn]) tickets.push(payload.tickets[fn]);
+    });
+    return tickets;
+  }
+
+  /** Fetches all tickets via /api/kanban?since=0 (server-parsed, single request). */
   function fetchTickets() {
-    return fetch("/api/kanban", { cache: "no-store" }).then(function (res) {
+    return fetch("/api/kanban?since=0", { cache: "no-cache" }).then(function (res) {
       if (!res.ok) return [];
-      return res.json();
-    }).then(function (map) {
-      var tickets = [];
-      Object.keys(map).forEach(function (fn) {
-        if (map[fn]) {
-          var t = parseTicket(map[fn]);
-          if (t) tickets.push(t);
-        }
+      return res.json().then(function (payload) {
+        _kanbanVersion = payload.version || 0;
+        return ticketsOf(payload);
       });
-      return tickets;
     }).catch(function () { return []; }).then(function (tickets) {
       // Co-fetch worktree uncommitted so renderKanban always has fresh data.
       return fetchAndCacheWorktreeUncommitted().then(
@@ -190,27 +200,31 @@
   }
 
   /**
-   * Selectively fetches and updates tickets by file names via /api/kanban?files=...
-   * @param {string[]} files - Changed file names (e.g. ["T-038.xml"])
+   * Applies ticket changes since the last fetched index version via /api/kanban?since=...
+   * The server answers with only changed/moved tickets and deleted file names
+   * (or the full list when the cursor is too old).
+   * @param {string[]} files - Changed file names (e.g. ["T-038.xml"]); kept for the SSE caller
    * @returns {Promise<void>}
    */
   function fetchTicketsByFiles(files) {
-    return fetch("/api/kanban?files=" + encodeURIComponent(files.join(",")), { cache: "no-store" }).then(function (res) {
+    return fetch("/api/kanban?since=" + _kanbanVersion, { cache: "no-cache" }).then(function (res) {
       if (!res.ok) return;
-      return res.json().then(function (map) {
-        Object.keys(map).forEach(function (fn) {
+      return res.json().then(function (payload) {
+        _kanbanVersion = payload.version || 0;
+        if (payload.full) {
+          Board.state.TICKETS = ticketsOf(payload);
+          return;
+        }
+        (payload.deleted || []).forEach(function (fn) {
           var baseName = fn.replace(/\.xml$/, "");
-          if (map[fn] === null) {
-            Board.state.TICKETS = Board.state.TICKETS.filter(function (t) { return t.number !== baseName; });
+          Board.state.TICKETS = Board.state.TICKETS.filter(function (t) { return t.number !== baseName; });
+        });
+        ticketsOf(payload).forEach(function (incoming) {
+          var idx = Board.state.TICKETS.findIndex(function (t) { return t.number === incoming.number; });
+          if (idx !== -1) {
+            Board.state.TICKETS[idx] = incoming;
           } else {
-            var incoming = parseTicket(map[fn]);
-            if (!incoming) return;
-            var idx = Board.state.TICKETS.findIndex(function (t) { return t.number === incoming.number; });
-            if (idx !== -1) {
-              Board.state.TICKETS[idx] = incoming;
-            } else {
-              Board.state.TICKETS.push(incoming);
-            }
+            Board.state.TICKETS.push(incoming);
           }
         });
       });
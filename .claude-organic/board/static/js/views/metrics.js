@@ -3,15 +3,17 @@
  *
  * Metrics 탭 — 워크플로우 metrics.jsonl 집계 시각화 (T-400 / W06).
  *
- * 4 위젯:
+ * 5 위젯:
  *   1) 단계별 duration line chart (registryKey x축, INIT/PLAN/WORK/REPORT/DONE y축 ms)
  *   2) 토큰 사용량 stacked bar (input/output/cache_creation/cache_read 4종)
  *   3) FAILED 비율 bar (단계별 outcome=fail 비율)
  *   4) Top 회귀 패턴 list (kind 별 빈도 + signal_summary)
+ *   5) 훅 지연 표 (훅/가드/tool_name 별 p50/p95/p99 — hook-spans 스풀)
  *
  * 데이터 소스:
  *   GET /api/metrics/aggregate?last=20  → 최근 N개 run summary list
  *   GET /api/metrics/regression?last=20 → 회귀 패턴 빈도 + 예시
+ *   GET /api/metrics/hooks?last=500     → 훅 지연 분위수 (flow-metrics hooks 와 동일)
  *
  * Depends on: common.js (Board.state, Board.util.esc, Board.util.formatTokens),
  *             vendor/chart-4.5.0.min.js (Chart.js)
@@ -26,6 +28,13 @@
 
   // ── Constants ──
   var DEFAULT_LAST = 20;             // 한 번 fetch 할 최근 run 개수
+  var HOOK_LAST = 500;               // 훅 지연 집계 대상 최근 훅 호출 수
+  // 훅 지연 표 섹션 (report 키, 제목, 가드 전용 decided/cached 열 표시 여부)
+  var LATENCY_SECTIONS = [
+    { key: "hooks",  title: "hook",      decided: false },
+    { key: "guards", title: "guard",     decided: true },
+    { key: "tools",  title: "tool_name", decided: false },
+  ];
   var STEP_ORDER = ["INIT", "PLAN", "WORK", "REPORT", "DONE"];
   // 테라코타 강조색 (테마 컬러). border-left 한쪽 색상 X — 차트 stroke/legend 위주 사용.
   var ACCENT = "#D97757";
@@ -61,6 +70,7 @@
     last: DEFAULT_LAST,
     runs: [],          // aggregate_recent 결과 (최근순; 차트는 chrono 로 reverse)
     regression: null,  // regression_counts 결과
+    hooks: null,       // hook_latency_report 결과 (실패해도 다른 위젯은 표시)
     error: null,
   };
 
@@ -92,6 +102,7 @@
     state.last = last;
     var aggUrl = "/api/metrics/aggregate?last=" + encodeURIComponent(last);
     var regUrl = "/api/metrics/regression?last=" + encodeURIComponent(last);
+    var hooksUrl = "/api/metrics/hooks?last=" + HOOK_LAST;
     return Promise.all([
       fetch(aggUrl, { cache: "no-store" }).then(function (res) {
         if (!res.ok) throw new Error("aggregate HTTP " + res.status);
@@ -101,9 +112,13 @@
         if (!res.ok) throw new Error("regression HTTP " + res.status);
         return res.json();
       }),
+      fetch(hooksUrl, { cache: "no-store" }).then(function (res) {
+        return res.ok ? res.json() : null;
+      }).catch(function () { return null; }),
     ]).then(function (results) {
       state.runs = (results[0] && results[0].runs) || [];
       state.regression = results[1] || null;
+      state.hooks = results[2] || null;
       state.fetched = true;
       state.fetching = false;
     }).catch(function (err) {
@@ -432,6 +447,49 @@
       + '</section>';
   }
 
+  // ── Widget 5: Hook Latency Table ──
+  function formatMs(v) {
+    return (v === null || v === undefined) ? "-" : Number(v).toFixed(1);
+  }
+
+  function renderHookLatencyCard() {
+    var report = state.hooks;
+    if (!report || !report.invocations) {
+      return emptyCard("훅 지연 (ms)", "hook-spans 스풀에 기록된 훅 호출이 없습니다");
+    }
+    var sectionsHtml = LATENCY_SECTIONS.map(function (sec) {
+      var rows = report[sec.key] || [];
+      if (rows.length === 0) return "";
+      var head = ''
+        + '<li class="metrics-latency-row metrics-regression-head">'
+        +   '<span class="metrics-latency-name">' + esc(sec.title) + '</span>'
+        +   '<span>count</span><span>p50</span><span>p95</span><span>p99</span>'
+        +   '<span>' + (sec.decided ? 'decided' : '') + '</span>'
+        + '</li>';
+      var body = rows.map(function (r) {
+        return ''
+          + '<li class="metrics-latency-row">'
+          +   '<span class="metrics-latency-name">' + esc(r.name) + '</span>'
+          +   '<span>' + r.count + '</span>'
+          +   '<span>' + formatMs(r.p50) + '</span>'
+          +   '<span>' + formatMs(r.p95) + '</span>'
+          +   '<span class="metrics-latency-p99">' + formatMs(r.p99) + '</span>'
+          +   '<span>' + (sec.decided ? (r.decided || 0) + (r.cached ? ' (cached ' + r.cached + ')' : '') : '') + '</span>'
+          + '</li>';
+      }).join('');
+      return '<ul class="metrics-regression-list">' + head + body + '</ul>';
+    }).join('');
+
+    return ''
+      + '<section class="metrics-card metrics-card--list">'
+      +   '<header class="metrics-card-head">'
+      +     '<h3>훅 지연 (ms)</h3>'
+      +     '<span class="metrics-card-hint">최근 훅 호출: ' + report.invocations + '회</span>'
+      +   '</header>'
+      +   '<div class="metrics-card-body">' + sectionsHtml + '</div>'
+      + '</section>';
+  }
+
   // ── Loading / Error ──
   function renderStatusBlock(content) {
     return '<div class="metrics-status">' + content + '</div>';
@@ -485,6 +543,7 @@
         + emptyCard("토큰 사용량 (stacked)", "metrics.jsonl 이 아직 기록되지 않았습니다")
         + emptyCard("FAILED 비율 (단계별)", "metrics.jsonl 이 아직 기록되지 않았습니다")
         + emptyCard("Top 회귀 패턴", "회귀 데이터가 없습니다")
+        + renderHookLatencyCard()
         + '</div>';
       el.innerHTML = html;
       bindToolbar();
@@ -496,6 +555,7 @@
     html += hasRuns ? renderTokenStackCard() : emptyCard("토큰 사용량 (stacked)", "데이터 없음");
     html += hasRuns ? renderFailRatioCard() : emptyCard("FAILED 비율 (단계별)", "데이터 없음");
     html += renderRegressionCard();
+    html += renderHookLatencyCard();
     html += '</div>';
     el.innerHTML = html;
 
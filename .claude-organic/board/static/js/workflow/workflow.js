@@ -48,7 +48,7 @@ const WF_PAGE_SIZE = 50;
  * @returns {Promise<string[]>}
  */
 function fetchWorkflowEntries() {
-  return fetch("/api/workflow/entries", { cache: "no-store" }).then(function (res) {
+  return fetch("/api/workflow/entries", { cache: "no-cache" }).then(function (res) {
     if (!res.ok) return [];
     return res.json();
   }).catch(function () { return []; });
@@ -66,6 +66,21 @@ function fetchEntryDetail(entryHref) {
   }).catch(function () { return []; });
 }
 
+/**
+ * Fetches one page of workflow entries with details via /api/workflow/entries?before=&limit=&detail=full.
+ * @param {string|null} before - entry key (timestamp dir name) to page after, null for newest
+ * @param {number} limit - page size
+ * @returns {Promise<Array|null>} flat array of workflow item objects, null on failure
+ */
+function fetchWorkflowPage(before, limit) {
+  let url = "/api/workflow/entries?detail=full&limit=" + limit;
+  if (before) url += "&before=" + encodeURIComponent(before);
+  return fetch(url, { cache: "no-store" }).then(function (res) {
+    if (!res.ok) return null;
+    return res.json().then(function (page) { return page.items || []; });
+  }).catch(function () { return null; });
+}
+
 // ── Ticket-Workflow Linkage ──
 
 /**
@@ -160,10 +175,16 @@ function sortWorkflows(list) {
 function loadMoreWorkflows() {
   if (Board.state.wfLoading || Board.state.wfLoadedIndex >= Board.state.wfEntryHrefs.length) return;
   Board.state.wfLoading = true;
-  const batch = Board.state.wfEntryHrefs.slice(Board.state.wfLoadedIndex, Board.state.wfLoadedIndex + WF_PAGE_SIZE);
+  const start = Board.state.wfLoadedIndex;
+  const batch = Board.state.wfEntryHrefs.slice(start, start + WF_PAGE_SIZE);
   Board.state.wfLoadedIndex += batch.length;
   updateWfStatus();
-  Promise.all(batch.map(fetchEntryDetail)).then(function (results) {
+  // One paged request per batch; fall back to per-entry detail if the page API fails
+  const before = start > 0 ? wfLastSegment(Board.state.wfEntryHrefs[start - 1]) : null;
+  fetchWorkflowPage(before, batch.length).then(function (pageItems) {
+    if (pageItems) return [pageItems];
+    return Promise.all(batch.map(fetchEntryDetail));
+  }).then(function (results) {
     const newItems = [];
     results.forEach(function (items) {
       items.forEach(function (w) { Board.state.WORKFLOWS.push(w); newItems.push(w); });
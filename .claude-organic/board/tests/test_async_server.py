@@ -0,0 +1,136 @@
+"""asyncio 서버 코어(AsyncBoardServer) / HeartbeatWheel 테스트.
+
+  TC1: 타이머 휠은 유휴 클라이언트에만 interval 마다 heartbeat 를 요청한다
+  TC2: 일반 요청은 기존 핸들러가 executor 에서 처리한다 (GET JSON + POST 본문 + 404)
+  TC3: /events 는 루프에서 스트리밍 — broadcast 프레임 + heartbeat, 끊으면 클라이언트 제거
+"""
+
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+_WORKTREE_ROOT = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', '..'),
+)
+_BOARD_ROOT = os.path.normpath(os.path.join(_WORKTREE_ROOT, '.claude-organic', 'board'))
+for _p in (_WORKTREE_ROOT, _BOARD_ROOT):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+from server.async_server import AsyncBoardServer, HeartbeatWheel, SSEStream  # noqa: E402
+from server.http_router import BoardHTTPRequestHandler  # noqa: E402
+from server.state import sse_manager  # noqa: E402
+
+
+class TestHeartbeatWheel(unittest.TestCase):
+    """타이머 휠 예약 검증."""
+
+    def test_01_idle_only(self) -> None:
+        """쓰기가 있던 클라이언트는 남은 시간만큼 미루고, 닫힌 클라이언트는 버린다."""
+        loop = asyncio.new_event_loop()
+        try:
+            wheel = HeartbeatWheel(tick=0.25, slots=4)
+            idle = SSEStream(loop, 1.0)
+            busy = SSEStream(loop, 1.0)
+            gone = SSEStream(loop, 0.25)
+            idle.last_write = busy.last_write = gone.last_write = 0.0
+            for stream in (idle, busy, gone):
+                wheel.schedule(stream, stream.interval)
+            gone.closed = True
+
+            busy.last_write = 0.5
+            for i in range(1, 4):
+                wheel.advance(i * 0.25)
+            self.assertFalse(idle.heartbeat_due)
+            wheel.advance(1.0)
+            self.assertTrue(idle.heartbeat_due)
+            self.assertFalse(busy.heartbeat_due)
+            self.assertEqual(len(wheel), 2)
+
+            wheel.advance(1.25)
+            self.assertFalse(busy.heartbeat_due)
+            wheel.advance(1.5)
+            self.assertTrue(busy.heartbeat_due)
+        finally:
+            loop.close()
+
+
+class TestAsyncBoardServer(unittest.TestCase):
+    """실제 서버 왕복 검증."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self._cwd = os.getcwd()
+        os.makedirs(os.path.join(self._tmp.name, '.claude-organic', 'board', 'static'))
+        os.chdir(self._tmp.name)
+        self.server = AsyncBoardServer(('127.0.0.1', 0), BoardHTTPRequestHandler, workers=4)
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        self.assertTrue(self.server.ready.wait(5))
+        self.port = self.server.server_address[1]
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self._thread.join(5)
+        self.server.server_close()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _request(self, method: str, path: str, body: bytes | None = None) -> tuple[int, bytes]:
+        conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+        try:
+            conn.request(method, path, body=body, headers={'Content-Type': 'application/json'})
+            res = conn.getresponse()
+            return res.status, res.read()
+        finally:
+            conn.close()
+
+    def test_02_executor_handlers(self) -> None:
+        """기존 라우트 테이블 / 핸들러가 그대로 동작."""
+        status, body = self._request('GET', '/api/server-info')
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)['pid'], os.getpid())
+
+        status, body = self._request('POST', '/api/env', json.dumps({'key': 'A'}).encode())
+        self.assertEqual(status, 400)
+        self.assertEqual(self._request('GET', '/api/nope')[0], 404)
+
+    def test_03_sse_on_loop(self) -> None:
+        """broadcast 프레임 + heartbeat 수신, 연결 종료 시 클라이언트 제거."""
+        before = sse_manager.stats()['clients']
+        sock = socket.create_connection(('127.0.0.1', self.port), timeout=5)
+        try:
+            sock.sendall(b'GET /events HTTP/1.1\r\nHost: localhost\r\n\r\n')
+            received = b''
+            while b': connected' not in received:
+                received += sock.recv(4096)
+            self.assertTrue(received.startswith(b'HTTP/1.0 200 OK\r\n'))
+            self.assertIn(b'Content-Type: text/event-stream', received)
+
+            deadline = time.monotonic() + 5
+            while sse_manager.stats()['clients'] <= before and time.monotonic() < deadline:
+                time.sleep(0.01)
+            sse_manager.broadcast('kanban', ['T-001.xml'])
+            while b'event: kanban' not in received or b': heartbeat' not in received:
+                received += sock.recv(4096)
+            self.assertIn(b'T-001.xml', received)
+        finally:
+            sock.close()
+
+        deadline = time.monotonic() + 5
+        while sse_manager.stats()['clients'] > before and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(sse_manager.stats()['clients'], before)
+
+
+if __name__ == '__main__':
+    unittest.main()
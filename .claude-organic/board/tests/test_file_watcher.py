@@ -0,0 +1,122 @@
+"""FileWatcher inotify/poll 백엔드 회귀 테스트.
+
+  TC1: 티켓 상태 디렉터리 이동 버스트 → inotify 백엔드가 kanban 콜백 1회로 병합
+  TC2: 같은 변경에 대해 inotify/poll 백엔드의 (event_type, files) 가 동일
+  TC3: 기동 시 없던 감시 디렉터리가 생성되면 inotify 백엔드도 생성분을 통지
+  TC4: 하위 디렉터리 엔트리 추가(runs/<key>/file) → workflow 통지
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+_WORKTREE_ROOT = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', '..'),
+)
+_BOARD_ROOT = os.path.normpath(os.path.join(_WORKTREE_ROOT, '.claude-organic', 'board'))
+for _p in (_WORKTREE_ROOT, _BOARD_ROOT):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+from server.inotify import inotify_available  # noqa: E402
+from server.sse_client_manager import FileWatcher  # noqa: E402
+
+_TICKETS = os.path.join('.claude-organic', 'tickets')
+_RUNS = os.path.join('.claude-organic', 'runs')
+
+
+class _Recorder:
+    """on_change 호출 기록기."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, list[str]]] = []
+        self.event = threading.Event()
+
+    def __call__(self, event_type: str, files: list[str]) -> None:
+        self.calls.append((event_type, sorted(files)))
+        self.event.set()
+
+
+class TestFileWatcher(unittest.TestCase):
+    """FileWatcher 백엔드 동작 검증."""
+
+    def setUp(self) -> None:
+        self.root = tempfile.mkdtemp(prefix='board-watch-')
+        for status in ('open', 'progress'):
+            os.makedirs(os.path.join(self.root, _TICKETS, status))
+        os.makedirs(os.path.join(self.root, _RUNS))
+        self._write(os.path.join(_TICKETS, 'open', 'T-001.xml'))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _write(self, rel_path: str) -> None:
+        with open(os.path.join(self.root, rel_path), 'w', encoding='utf-8') as f:
+            f.write('<ticket/>')
+
+    def _start(self, backend: str) -> tuple[FileWatcher, _Recorder]:
+        recorder = _Recorder()
+        watcher = FileWatcher(self.root, recorder, backend=backend)
+        threading.Thread(target=watcher.run, daemon=True).start()
+        self.addCleanup(watcher.stop)
+        time.sleep(0.2)  # watch 부착 대기
+        return watcher, recorder
+
+    def _move_ticket(self) -> None:
+        os.rename(
+            os.path.join(self.root, _TICKETS, 'open', 'T-001.xml'),
+            os.path.join(self.root, _TICKETS, 'progress', 'T-001.xml'),
+        )
+        self._write(os.path.join(_TICKETS, 'progress', 'T-001.xml'))
+
+    @unittest.skipUnless(inotify_available(), 'inotify 필요')
+    def test_01_burst_coalesced(self) -> None:
+        """상태 디렉터리 간 이동 + 재기록이 kanban 콜백 1회로 병합된다."""
+        _, recorder = self._start('inotify')
+        self._move_ticket()
+        self.assertTrue(recorder.event.wait(1.0))
+        time.sleep(0.4)
+        self.assertEqual(recorder.calls, [('kanban', ['T-001.xml', 'T-001.xml'])])
+
+    @unittest.skipUnless(inotify_available(), 'inotify 필요')
+    def test_02_backends_equal(self) -> None:
+        """inotify 와 poll 백엔드의 콜백 인자가 같다."""
+        results = []
+        for backend in ('inotify', 'poll'):
+            self.tearDown()
+            self.setUp()
+            watcher, recorder = self._start(backend)
+            self._move_ticket()
+            self.assertTrue(recorder.event.wait(3.0))
+            time.sleep(0.3)
+            watcher.stop()
+            results.append(list(recorder.calls))
+        self.assertEqual(results[0], results[1])
+
+    @unittest.skipUnless(inotify_available(), 'inotify 필요')
+    def test_03_missing_dir_attached(self) -> None:
+        """기동 후 생성된 감시 디렉터리의 엔트리를 통지한다."""
+        _, recorder = self._start('inotify')
+        os.makedirs(os.path.join(self.root, _TICKETS, 'done'))
+        self._write(os.path.join(_TICKETS, 'done', 'T-002.xml'))
+        self.assertTrue(recorder.event.wait(3.0))
+        self.assertIn(('kanban', ['T-002.xml']), recorder.calls)
+
+    @unittest.skipUnless(inotify_available(), 'inotify 필요')
+    def test_04_subdir_entry(self) -> None:
+        """runs/<key>/ 에 파일이 추가되면 workflow 이벤트가 발생한다."""
+        os.makedirs(os.path.join(self.root, _RUNS, '20260101-000000-abc'))
+        _, recorder = self._start('inotify')
+        self._write(os.path.join(_RUNS, '20260101-000000-abc', 'status.json'))
+        self.assertTrue(recorder.event.wait(1.0))
+        self.assertEqual(recorder.calls, [('workflow', ['20260101-000000-abc'])])
+
+
+if __name__ == '__main__':
+    unittest.main()
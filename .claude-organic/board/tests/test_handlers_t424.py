@@ -525,7 +525,7 @@ class TestForceDoneDirtyGuard(unittest.TestCase):
         self.assertEqual(data['error_kind'], 'dirty_worktree')
 
     def test_force_done_dirty_guard_skipped_when_force_dirty_true(self):
-        """force_dirty=True 이면 dirty 가드를 건너뛰고 subprocess.run 을 호출한다."""
+        """force_dirty=True 이면 dirty 가드를 건너뛰고 kanban_service.move_ticket 을 호출한다."""
         from board.server.handlers._kanban_done_helpers import handle_kanban_done_force
 
         handler = _make_handler()
@@ -535,10 +535,9 @@ class TestForceDoneDirtyGuard(unittest.TestCase):
         mock_wm.get_worktree_path.return_value = '/fake/wt'
         mock_wm.has_uncommitted_changes.return_value = True
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = 'done'
-        mock_result.stderr = ''
+        mock_service = MagicMock()
+        mock_service.KanbanError = type('KanbanError', (Exception,), {})
+        mock_service.move_ticket.return_value = {'ticket': 'T-424', 'changed': True}
 
         import builtins
         orig_import = builtins.__import__
@@ -551,15 +550,94 @@ class TestForceDoneDirtyGuard(unittest.TestCase):
             return orig_import(name, *args, **kwargs)
 
         with patch('board.server.handlers._kanban_done_helpers.os.path.isfile', return_value=True), \
-             patch('board.server.handlers._kanban_done_helpers.subprocess.run', return_value=mock_result) as mock_sub, \
+             patch('board.server.handlers._kanban_done_helpers._import_kanban_service', return_value=mock_service), \
              patch.object(builtins, '__import__', side_effect=mock_import_wm):
             handle_kanban_done_force(handler, 'T-424', True, '/fake/root', '/fake/flow-kanban')
 
-        # force_dirty=True 이므로 dirty 가드 분기를 통과하고 subprocess 호출 도달
-        mock_sub.assert_called_once()
-        cmd_args = mock_sub.call_args[0][0]
-        self.assertIn('--force', cmd_args)
-        self.assertIn('T-424', cmd_args)
+        # force_dirty=True 이므로 dirty 가드 분기를 통과하고 in-process 강제 이동 도달
+        mock_service.move_ticket.assert_called_once()
+        call = mock_service.move_ticket.call_args
+        self.assertEqual(call[0][:2], ('T-424', 'done'))
+        self.assertTrue(call[1]['force'])
+        handler._send_json.assert_called_once()
+
+
+# ==============================================================================
+# T07 – in-process 카드 이동 (kanban_service)
+# ==============================================================================
+
+
+class TestKanbanMoveInProcess(unittest.TestCase):
+    """_handle_kanban_move 가 Board 프로세스 안에서 kanban_service 를 호출할 때의 안전성."""
+
+    _COLUMNS = {'To Do': 'todo', 'Open': 'open', 'In Progress': 'progress', 'Review': 'review', 'Done': 'done'}
+
+    def setUp(self):
+        import tempfile
+        from board.server.handlers._helpers import _import_kanban_service
+
+        self.service = _import_kanban_service()
+        from flow import ticket_repository
+
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tickets = os.path.join(self._tmp.name, '.claude-organic', 'tickets')
+        dirs = {status: os.path.join(self.tickets, col) for status, col in self._COLUMNS.items()}
+        for path in dirs.values():
+            os.makedirs(path)
+        status_map = dict(ticket_repository.STATUS_DIR_MAP)
+        status_map.update(dirs)
+        patches = [
+            patch.object(ticket_repository, 'KANBAN_DIR', self.tickets),
+            patch.object(ticket_repository, 'STATUS_DIR_MAP', status_map),
+            patch.object(ticket_repository, 'refresh_for_ticket', lambda path: None),
+            patch.object(self.service, '_cleanup_worktree_on_leave', lambda ticket, emit: None),
+        ]
+        for status, col in self._COLUMNS.items():
+            patches.append(patch.object(ticket_repository, f'KANBAN_{col.upper()}_DIR', dirs[status]))
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _move(self, ticket, to):
+        from board.server.handlers.kanban import KanbanHandlerMixin
+
+        handler = _make_handler()
+        handler._read_json_body = MagicMock(return_value={'ticket': ticket, 'to': to})
+        KanbanHandlerMixin._handle_kanban_move(handler)
+        return handler
+
+    def test_corrupt_ticket_returns_400_without_exiting(self):
+        """손상된 티켓 XML 은 SystemExit 가 아닌 400 응답으로 끝난다."""
+        with open(os.path.join(self.tickets, 'open', 'T-001.xml'), 'w', encoding='utf-8') as f:
+            f.write('<ticket><metadata><status>Open</status>')
+
+        try:
+            handler = self._move('T-001', 'todo')
+        except SystemExit:
+            self.fail('corrupt ticket XML raised SystemExit inside the board process')
+
+        handler._send_error.assert_called_once()
+        self.assertEqual(handler._send_error.call_args[0][0], 400)
+        self.assertIn('파싱 실패', handler._send_error.call_args[0][1])
+        handler._send_json.assert_not_called()
+
+    def test_progress_to_open_kills_session_in_process(self):
+        """In Progress → Open 세션 종료는 HTTP 자기 호출 없이 세션 레지스트리를 직접 쓴다."""
+        with open(os.path.join(self.tickets, 'progress', 'T-002.xml'), 'w', encoding='utf-8') as f:
+            f.write(
+                '<ticket><metadata><number>T-002</number><title>t</title>'
+                '<status>In Progress</status><command>implement</command></metadata></ticket>\n'
+            )
+        session = MagicMock()
+        with patch('board.server.state.workflow_registry.get_by_ticket', return_value=session) as get_by_ticket, \
+             patch('urllib.request.urlopen', side_effect=AssertionError('HTTP self-call')):
+            handler = self._move('T-002', 'open')
+
+        handler._send_json.assert_called_once()
+        get_by_ticket.assert_called_once_with('T-002')
+        session.process.kill.assert_called_once()
+        self.assertTrue(os.path.isfile(os.path.join(self.tickets, 'open', 'T-002.xml')))
 
 
 if __name__ == '__main__':
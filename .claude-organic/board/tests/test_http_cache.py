@@ -0,0 +1,118 @@
+"""정적 자산 / JSON API 조건부 요청과 gzip 테스트.
+
+  TC1: If-None-Match / Accept-Encoding 헤더 파싱
+  TC2: static 파일은 ETag + gzip 압축본으로 서빙하고, 일치하는 If-None-Match 에는 304
+  TC3: JSON API 는 본문 해시 ETag 로 304, 파일이 바뀌면 새 ETag
+"""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer
+
+_WORKTREE_ROOT = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', '..'),
+)
+_BOARD_ROOT = os.path.normpath(os.path.join(_WORKTREE_ROOT, '.claude-organic', 'board'))
+for _p in (_WORKTREE_ROOT, _BOARD_ROOT):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+from server.http_cache import accepts_gzip, etag_matches  # noqa: E402
+from server.http_router import BoardHTTPRequestHandler  # noqa: E402
+
+_APP_JS = 'function render(card) { return "<li>" + card.title + "</li>"; }\n' * 200
+
+
+class TestHeaderParsing(unittest.TestCase):
+    """헤더 파싱 검증."""
+
+    def test_01_etag_and_encoding(self) -> None:
+        """목록 / W/ 접두어 / * / q=0 처리."""
+        self.assertTrue(etag_matches('"a", "b"', '"b"'))
+        self.assertTrue(etag_matches('W/"b"', '"b"'))
+        self.assertTrue(etag_matches('*', '"b"'))
+        self.assertFalse(etag_matches(None, '"b"'))
+        self.assertFalse(etag_matches('"a"', '"b"'))
+        self.assertTrue(accepts_gzip('gzip, deflate, br'))
+        self.assertTrue(accepts_gzip('br;q=1.0, gzip;q=0.8'))
+        self.assertFalse(accepts_gzip('gzip;q=0'))
+        self.assertFalse(accepts_gzip('identity'))
+        self.assertFalse(accepts_gzip(None))
+
+
+class TestConditionalServing(unittest.TestCase):
+    """실제 서버 왕복 검증."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self._cwd = os.getcwd()
+        static_dir = os.path.join(self._tmp.name, '.claude-organic', 'board', 'static')
+        os.makedirs(os.path.join(static_dir, 'js'))
+        self.app_js = os.path.join(static_dir, 'js', 'app.js')
+        with open(self.app_js, 'w', encoding='utf-8') as f:
+            f.write(_APP_JS)
+        os.chdir(self._tmp.name)
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), BoardHTTPRequestHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _get(self, path: str, headers: dict[str, str] | None = None) -> tuple[int, dict[str, str], bytes]:
+        conn = http.client.HTTPConnection('127.0.0.1', self.server.server_address[1], timeout=5)
+        try:
+            conn.request('GET', path, headers=headers or {})
+            res = conn.getresponse()
+            return res.status, {k.lower(): v for k, v in res.getheaders()}, res.read()
+        finally:
+            conn.close()
+
+    def test_02_static_etag_gzip(self) -> None:
+        """gzip 본문 + ETag, 재검증 시 304, no-store 대신 no-cache."""
+        status, headers, body = self._get('/js/app.js', {'Accept-Encoding': 'gzip'})
+        self.assertEqual(status, 200)
+        self.assertEqual(headers['content-encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(body).decode('utf-8'), _APP_JS)
+        self.assertLess(len(body), len(_APP_JS) // 10)
+        self.assertEqual(headers['cache-control'], 'no-cache')
+        etag = headers['etag']
+
+        status, headers, body = self._get('/js/app.js', {'If-None-Match': etag})
+        self.assertEqual((status, body), (304, b''))
+        self.assertEqual(headers['etag'], etag)
+
+        status, headers, body = self._get('/js/app.js')
+        self.assertEqual(status, 200)
+        self.assertNotIn('content-encoding', headers)
+        self.assertEqual(body.decode('utf-8'), _APP_JS)
+
+        with open(self.app_js, 'a', encoding='utf-8') as f:
+            f.write('// changed\n')
+        status, headers, _body = self._get('/js/app.js', {'If-None-Match': etag})
+        self.assertEqual(status, 200)
+        self.assertNotEqual(headers['etag'], etag)
+
+        self.assertEqual(self._get('/js/missing.js')[0], 404)
+
+    def test_03_json_etag(self) -> None:
+        """JSON API 응답 ETag 재검증."""
+        status, headers, body = self._get('/api/server-info')
+        self.assertEqual(status, 200)
+        self.assertIn(b'"pid"', body)
+        status, _headers, body = self._get('/api/server-info', {'If-None-Match': headers['etag']})
+        self.assertEqual((status, body), (304, b''))
+
+
+if __name__ == '__main__':
+    unittest.main()
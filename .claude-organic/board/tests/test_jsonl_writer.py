@@ -0,0 +1,90 @@
+"""BufferedJsonlWriter / TerminalSSEChannel persist 버퍼링 테스트.
+
+  TC1: 일반 이벤트는 버퍼에 머물다 시간 기준으로 기록된다
+  TC2: result 이벤트는 즉시 기록, flush_persist() 는 미기록분을 노출
+  TC3: 크기 임계값 초과 시 즉시 기록, flush_all() 이 종료 시 잔여분 기록
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+_WORKTREE_ROOT = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', '..'),
+)
+_BOARD_ROOT = os.path.normpath(os.path.join(_WORKTREE_ROOT, '.claude-organic', 'board'))
+for _p in (_WORKTREE_ROOT, _BOARD_ROOT):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+from server.jsonl_writer import BufferedJsonlWriter, flush_all  # noqa: E402
+from server.terminal_channel import TerminalSSEChannel  # noqa: E402
+
+
+def _delta(text: str) -> dict:
+    return {
+        'type': 'stream_event',
+        'event': {'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': text}},
+    }
+
+
+class TestBufferedPersist(unittest.TestCase):
+    """write-behind persist 검증."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.mkdtemp(prefix='jsonl-writer-')
+        self.path = os.path.join(self.tmp, 'session.jsonl')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _lines(self) -> list[dict]:
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def test_01_time_flush(self) -> None:
+        """delta 는 즉시 기록되지 않고 flush 간격 후 기록된다."""
+        writer = BufferedJsonlWriter(self.path, flush_interval=0.05)
+        writer.append('{"a": 1}\n')
+        self.assertEqual(self._lines(), [])
+        time.sleep(0.2)
+        self.assertEqual(self._lines(), [{'a': 1}])
+        writer.close()
+
+    def test_02_result_and_reader_flush(self) -> None:
+        """result 는 즉시 기록, flush_persist 가 대기 중 delta 를 노출한다."""
+        channel = TerminalSSEChannel(persist_path=self.path)
+        channel._persist_writer._flush_interval = 60.0
+        channel.broadcast(_delta('hi'))
+        self.assertEqual(self._lines(), [])
+        channel.flush_persist()
+        self.assertEqual(len(self._lines()), 1)
+
+        channel.broadcast(_delta('more'))
+        channel.broadcast({'type': 'result', 'subtype': 'success', 'result': 'ok'})
+        self.assertEqual([line['type'] for line in self._lines()], ['stream_event', 'stream_event', 'result'])
+        channel.close_persist()
+
+    def test_03_size_and_shutdown_flush(self) -> None:
+        """크기 임계값과 종료 flush."""
+        writer = BufferedJsonlWriter(self.path, flush_bytes=20, flush_interval=60.0)
+        writer.append('{"n": 1}\n')
+        self.assertEqual(self._lines(), [])
+        writer.append('{"n": 2, "pad": 1}\n')
+        self.assertEqual(len(self._lines()), 2)
+        writer.append('{"n": 3}\n')
+        flush_all()
+        self.assertEqual([line['n'] for line in self._lines()], [1, 2, 3])
+        writer.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
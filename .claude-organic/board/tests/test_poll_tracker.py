@@ -0,0 +1,79 @@
+"""PollChangeTracker 커서 기반 변경 저널 테스트.
+
+  TC1: 여러 클라이언트가 각자 커서로 같은 변경분을 받는다 (서로 소비하지 않음)
+  TC2: 커서가 ring 밖으로 밀려나거나 서버 seq 보다 크면 resync
+  TC3: 파일 없는 이벤트도 이벤트 타입 키로 전달, 중복 파일명 제거
+  TC4: 커서 없는 레거시 flush() 는 직전 flush 이후 변경분만 반환
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+
+_WORKTREE_ROOT = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', '..'),
+)
+_BOARD_ROOT = os.path.normpath(os.path.join(_WORKTREE_ROOT, '.claude-organic', 'board'))
+for _p in (_WORKTREE_ROOT, _BOARD_ROOT):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+from server.poll_tracker import PollChangeTracker  # noqa: E402
+
+
+class TestPollChangeTracker(unittest.TestCase):
+    """변경 저널 검증."""
+
+    def test_01_independent_cursors(self) -> None:
+        """두 클라이언트가 같은 변경을 각각 받는다."""
+        tracker = PollChangeTracker()
+        start = tracker.since(0)
+        self.assertEqual(start, {'seq': 0, 'resync': False, 'changes': {}})
+
+        tracker.add('kanban', ['T-001.xml'])
+        a = tracker.since(0)
+        b = tracker.since(0)
+        self.assertEqual(a, b)
+        self.assertEqual(a['changes'], {'kanban': ['T-001.xml']})
+
+        tracker.add('workflow', ['run-1'])
+        self.assertEqual(tracker.since(a['seq'])['changes'], {'workflow': ['run-1']})
+        self.assertEqual(
+            tracker.since(0)['changes'],
+            {'kanban': ['T-001.xml'], 'workflow': ['run-1']},
+        )
+
+    def test_02_resync(self) -> None:
+        """오래된 커서, 미래 커서, 음수 커서는 resync."""
+        tracker = PollChangeTracker(capacity=3)
+        tracker.add('kanban', ['a', 'b', 'c', 'd'])
+        self.assertTrue(tracker.since(0)['resync'])
+        self.assertFalse(tracker.since(1)['resync'])
+        self.assertEqual(tracker.since(1)['changes'], {'kanban': ['b', 'c', 'd']})
+        self.assertTrue(tracker.since(99)['resync'])
+        self.assertTrue(tracker.since(-1)['resync'])
+        self.assertEqual(tracker.since(-1)['seq'], 4)
+
+    def test_03_empty_files_and_dedup(self) -> None:
+        """파일 없는 이벤트 전달 + 중복 파일명 제거."""
+        tracker = PollChangeTracker()
+        tracker.add('workflow', [])
+        tracker.add('kanban', ['T-001.xml', 'T-002.xml'])
+        tracker.add('kanban', ['T-001.xml'])
+        changes = tracker.since(0)['changes']
+        self.assertEqual(changes['workflow'], [])
+        self.assertEqual(sorted(changes['kanban']), ['T-001.xml', 'T-002.xml'])
+
+    def test_04_legacy_flush(self) -> None:
+        """flush() 는 직전 flush 이후 변경분만 반환하고 저널 커서에 영향이 없다."""
+        tracker = PollChangeTracker()
+        tracker.add('kanban', ['T-001.xml'])
+        self.assertEqual(tracker.flush(), {'kanban': ['T-001.xml']})
+        self.assertEqual(tracker.flush(), {})
+        self.assertEqual(tracker.since(0)['changes'], {'kanban': ['T-001.xml']})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""SessionCatalog 세션 메타데이터 캐시 테스트.
+
+  TC1: title/branch 추출 규칙 (명령 래퍼·툴 결과 스킵), title 없는 세션 제외
+  TC2: 변경 없는 파일은 재스캔하지 않음 (재시작 후 영속 캐시 포함)
+  TC3: append 는 새 바이트만 읽어 branch 갱신, 재작성(축소)은 전체 재스캔
+  TC4: 큰 파일은 앞부분 title + 끝부분 branch 만 읽는다
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import uuid
+from unittest import mock
+
+_WORKTREE_ROOT = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', '..'),
+)
+_BOARD_ROOT = os.path.normpath(os.path.join(_WORKTREE_ROOT, '.claude-organic', 'board'))
+for _p in (_WORKTREE_ROOT, _BOARD_ROOT):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+from server import session_catalog  # noqa: E402
+from server.session_catalog import SessionCatalog  # noqa: E402
+
+
+def _user(text: str, branch: str = 'main', **extra: object) -> str:
+    event = {'type': 'user', 'gitBranch': branch, 'message': {'role': 'user', 'content': text}}
+    event.update(extra)
+    return json.dumps(event, ensure_ascii=False) + '\n'
+
+
+def _assistant(text: str, branch: str = 'main') -> str:
+    return json.dumps({
+        'type': 'assistant', 'gitBranch': branch,
+        'message': {'role': 'assistant', 'content': [{'type': 'text', 'text': text}]},
+    }, ensure_ascii=False) + '\n'
+
+
+class TestSessionCatalog(unittest.TestCase):
+    """영속 캐시 + 증분 스캔 검증."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.mkdtemp(prefix='session-catalog-')
+        self.sessions_dir = os.path.join(self.tmp, 'projects', '-work-demo')
+        os.makedirs(self.sessions_dir)
+        self.cache_path = os.path.join(self.tmp, 'cache', 'sessions.json')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _write(self, lines: list[str], session_id: str | None = None, mode: str = 'w') -> str:
+        session_id = session_id or str(uuid.uuid4())
+        with open(os.path.join(self.sessions_dir, f'{session_id}.jsonl'), mode, encoding='utf-8') as f:
+            f.writelines(lines)
+        return session_id
+
+    def _catalog(self) -> SessionCatalog:
+        return SessionCatalog(self.sessions_dir, cache_path=self.cache_path)
+
+    def test_01_title_rules(self) -> None:
+        """명령 래퍼와 뒤따르는 본문, 툴 결과는 title 이 되지 않는다."""
+        sid = self._write([
+            _user('<command-name>/wf</command-name>'),
+            _user('# 명령어 본문'),
+            _user('결과', toolUseResult={}),
+            _user('실제 질문입니다', branch='feat/x'),
+            _assistant('답변', branch='feat/y'),
+        ])
+        self._write([_user('<system-reminder>only</system-reminder>')])
+        sessions = self._catalog().refresh()
+        self.assertEqual([m.session_id for m in sessions], [sid])
+        self.assertEqual(sessions[0].title, '실제 질문입니다')
+        self.assertEqual(sessions[0].branch, 'feat/y')
+
+    def test_02_unchanged_files_are_not_rescanned(self) -> None:
+        """size/mtime 이 같으면 파일을 다시 읽지 않는다 (새 인스턴스 포함)."""
+        self._write([_user('hello')])
+        self.assertEqual(len(self._catalog().refresh()), 1)
+        with mock.patch.object(session_catalog, 'scan_session') as scan:
+            catalog = self._catalog()
+            self.assertEqual(catalog.refresh()[0].title, 'hello')
+            self.assertEqual(catalog.refresh()[0].title, 'hello')
+            scan.assert_not_called()
+
+    def test_03_incremental_append_and_rewrite(self) -> None:
+        """append 는 직전 오프셋부터, 축소는 처음부터 다시 읽는다."""
+        sid = self._write([_user('first'), _assistant('ok')])
+        catalog = self._catalog()
+        before = catalog.refresh()[0]
+        self._write([_assistant('later', branch='release')], session_id=sid, mode='a')
+
+        offsets: list[int] = []
+        real_scan = session_catalog.scan_session
+
+        def _spy(path: str, meta: session_catalog.SessionMeta, size: int) -> None:
+            offsets.append(meta.offset)
+            real_scan(path, meta, size)
+
+        with mock.patch.object(session_catalog, 'scan_session', _spy):
+            after = catalog.refresh()[0]
+            self.assertEqual(offsets, [before.offset])
+            self.assertEqual((after.title, after.branch), ('first', 'release'))
+
+            self._write([_user('rewritten', branch='dev')], session_id=sid)
+            rewritten = catalog.refresh()[0]
+            self.assertEqual(offsets[-1], 0)
+            self.assertEqual((rewritten.title, rewritten.branch), ('rewritten', 'dev'))
+
+    def test_04_large_file_reads_head_and_tail(self) -> None:
+        """중간 구간을 건너뛰어도 최신 branch 를 찾는다."""
+        filler = [_assistant('x' * 200, branch='old') for _ in range(50)]
+        sid = self._write([_user('big session')] + filler + [_assistant('end', branch='newest')])
+        with mock.patch.object(session_catalog, 'TAIL_SCAN_BYTES', 1024):
+            meta = self._catalog().refresh()[0]
+        self.assertEqual(meta.session_id, sid)
+        self.assertEqual((meta.title, meta.branch), ('big session', 'newest'))
+        self.assertEqual(meta.offset, meta.size)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""SessionIndex 희소 seq 인덱스 테스트.
+
+  TC1: writer 경유 기록 시 stride 마다 인덱스 항목 생성, read_range 가 인덱스로 seek
+  TC2: 인덱스 없는 기존 파일 → 첫 조회에서 구축, 외부 append 도 보충
+  TC3: limit 페이징은 범위 안 최신 N 개 반환 (before 로 이전 페이지)
+  TC4: /terminal/workflow/history 의 페이지/전체 모드가 isMeta 줄을 포함한 같은 seq 를 쓴다
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+_WORKTREE_ROOT = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', '..'),
+)
+_BOARD_ROOT = os.path.normpath(os.path.join(_WORKTREE_ROOT, '.claude-organic', 'board'))
+for _p in (_WORKTREE_ROOT, _BOARD_ROOT):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+from server.jsonl_writer import BufferedJsonlWriter  # noqa: E402
+from server.session_index import SessionIndex, index_path  # noqa: E402
+
+
+def _line(n: int) -> str:
+    return json.dumps({'type': 'system', 'n': n, 'text': '가' * (n % 7)}, ensure_ascii=False) + '\n'
+
+
+class TestSessionIndex(unittest.TestCase):
+    """희소 인덱스 유지/조회 검증."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.mkdtemp(prefix='session-index-')
+        self.path = os.path.join(self.tmp, 'wf-T-1.jsonl')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'_meta': {'session_id': 'wf-T-1'}}) + '\n')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _ns(self, lines: list[tuple[int, str]]) -> list[int]:
+        return [json.loads(line)['n'] for _, line in lines]
+
+    def test_01_writer_maintains_index(self) -> None:
+        """writer 기록과 함께 인덱스가 갱신되고 since 조회가 seek 한다."""
+        index = SessionIndex(self.path, stride=10)
+        writer = BufferedJsonlWriter(self.path, flush_bytes=200, index=index)
+        for n in range(95):
+            writer.append(_line(n))
+        writer.close()
+
+        with open(index_path(self.path), encoding='ascii') as f:
+            seqs = [int(row.split()[0]) for row in f]
+        self.assertEqual(seqs, list(range(0, 95, 10)))
+
+        lines, total = index.read_range(since=90)
+        self.assertEqual(total, 95)
+        self.assertEqual([seq for seq, _ in lines], [91, 92, 93, 94])
+        self.assertEqual(self._ns(lines), [91, 92, 93, 94])
+
+        # 새 인스턴스(서버 재시작)도 sidecar 로 같은 결과
+        self.assertEqual(SessionIndex(self.path, stride=10).read_range(since=90)[0], lines)
+
+    def test_02_build_for_existing_file(self) -> None:
+        """인덱스 없는 파일은 첫 조회에서 구축하고, 외부 append 를 보충한다."""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.writelines(_line(n) for n in range(30))
+        index = SessionIndex(self.path, stride=8)
+        self.assertEqual(self._ns(index.read_range(since=27)[0]), [28, 29])
+        self.assertTrue(os.path.exists(index_path(self.path)))
+
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.writelines(_line(n) for n in range(30, 40))
+        lines, total = index.read_range(since=35)
+        self.assertEqual(total, 40)
+        self.assertEqual(self._ns(lines), [36, 37, 38, 39])
+
+    def test_03_newest_first_paging(self) -> None:
+        """limit 은 최신 N 개, before 로 이전 페이지."""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.writelines(_line(n) for n in range(25))
+        index = SessionIndex(self.path, stride=4)
+        page, _ = index.read_range(limit=10)
+        self.assertEqual([seq for seq, _ in page], list(range(15, 25)))
+        older, _ = index.read_range(before=page[0][0], limit=10)
+        self.assertEqual([seq for seq, _ in older], list(range(5, 15)))
+        oldest, _ = index.read_range(before=older[0][0], limit=10)
+        self.assertEqual([seq for seq, _ in oldest], list(range(0, 5)))
+
+
+class TestWorkflowHistorySeq(unittest.TestCase):
+    """history 엔드포인트의 두 모드가 같은 seq 번호를 쓰는지 검증."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.mkdtemp(prefix='session-history-')
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.path = os.path.join(self.tmp, 'wf-T-1.jsonl')
+        rows = [
+            {'_meta': {'session_id': 'wf-T-1'}},
+            {'type': 'system', 'n': 0},
+            {'type': 'user', 'isMeta': True, 'message': {'content': 'skill wrapper'}},
+            {'type': 'system', 'n': 2},
+        ]
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(row) + '\n' for row in rows)
+
+    def _history(self, **query: str) -> dict:
+        from server.handlers import workflow as workflow_mod
+
+        handler = mock.MagicMock()
+        params = {'session_id': 'wf-T-1', **query}
+        handler._parse_query_param.side_effect = params.get
+        with mock.patch.object(workflow_mod.workflow_registry, 'get', return_value=None), \
+                mock.patch.object(workflow_mod.workflow_registry, '_session_file', return_value=self.path):
+            workflow_mod.WorkflowHandlerMixin._handle_workflow_history(handler)
+        handler._send_error.assert_not_called()
+        return handler._send_json.call_args[0][0]
+
+    def test_04_paged_and_full_share_seq(self) -> None:
+        """isMeta 줄은 숨겨지지만 seq 는 차지하며, 두 모드의 seq/total_count 가 같다."""
+        full = self._history()
+        paged = self._history(since='-1', limit='10')
+        self.assertEqual([e['seq'] for e in full['events']], [0, 2])
+        self.assertEqual([e['seq'] for e in paged['events']], [0, 2])
+        self.assertEqual(full['total_count'], paged['total_count'])
+        self.assertEqual(full['events'], paged['events'])
+        self.assertEqual([e['seq'] for e in self._history(since='1')['events']], [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
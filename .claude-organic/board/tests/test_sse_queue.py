@@ -0,0 +1,130 @@
+"""SSE 클라이언트별 bounded 큐 fan-out 테스트.
+
+  TC1: 멈춘 클라이언트가 있어도 broadcast 가 즉시 반환, 다른 클라이언트는 수신
+  TC2: coalesce 정책 — 오버플로 시 연속 stdout 델타를 한 프레임으로 병합 (마지막 seq 유지)
+  TC3: drop 정책 — 오버플로 시 클라이언트를 끊고 pump 종료, 지표 반영
+  TC4: TerminalSSEChannel 의 seq 가 큐 적재 순서대로 부여됨
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+
+_WORKTREE_ROOT = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', '..'),
+)
+_BOARD_ROOT = os.path.normpath(os.path.join(_WORKTREE_ROOT, '.claude-organic', 'board'))
+for _p in (_WORKTREE_ROOT, _BOARD_ROOT):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+from server.sse_client_manager import SSEClientManager  # noqa: E402
+from server.sse_queue import SSEClientQueue, SSEClientRegistry, SSEFrame  # noqa: E402
+from server.terminal_channel import TerminalSSEChannel  # noqa: E402
+
+
+class _StalledWfile(io.BytesIO):
+    """release 전까지 write 가 멈추는 wfile."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, data: bytes) -> int:
+        self.release.wait()
+        return super().write(data)
+
+
+def _delta(text: str, seq: int) -> SSEFrame:
+    return SSEFrame('stdout', json.dumps({'kind': 'text_delta', 'chunk': text}), seq)
+
+
+class TestSSEQueue(unittest.TestCase):
+    """non-blocking fan-out 검증."""
+
+    def test_01_stalled_client_does_not_block(self) -> None:
+        """멈춘 클라이언트가 broadcast 와 다른 클라이언트를 막지 않는다."""
+        manager = SSEClientManager()
+        stalled, healthy = _StalledWfile(), io.BytesIO()
+        for wfile in (stalled, healthy):
+            manager.add(wfile)
+            threading.Thread(target=manager.pump, args=(wfile, 0.05), daemon=True).start()
+
+        start = time.monotonic()
+        for _ in range(100):
+            manager.broadcast('kanban', ['T-001.xml'])
+        self.assertLess(time.monotonic() - start, 0.5)
+
+        time.sleep(0.2)
+        self.assertIn(b'event: kanban\ndata: {"files": ["T-001.xml"]}\n\n', healthy.getvalue())
+        stalled.release.set()
+        manager.remove(stalled)
+        manager.remove(healthy)
+
+    def test_02_coalesce_overflow(self) -> None:
+        """가득 찬 큐에 stdout 델타가 오면 합쳐서 수용한다."""
+        queue = SSEClientQueue(capacity=3, policy='coalesce')
+        self.assertTrue(queue.put(_delta('a', 1)))
+        self.assertTrue(queue.put(SSEFrame('result', '{}', 2)))
+        self.assertTrue(queue.put(_delta('b', 3)))
+        self.assertTrue(queue.put(_delta('c', 4)))
+        frames = queue.get(0)
+        self.assertEqual([f.seq for f in frames], [1, 2, 4])
+        self.assertEqual(json.loads(frames[-1].data), {'kind': 'text_delta', 'chunk': 'bc'})
+        self.assertEqual(queue.coalesced, 1)
+
+        # 마지막 프레임과 합칠 수 없으면 큐 안의 연속 델타를 압축하여 공간 확보
+        self.assertTrue(queue.put(_delta('x', 5)))
+        self.assertTrue(queue.put(_delta('y', 6)))
+        self.assertTrue(queue.put(SSEFrame('system', '{}', 7)))
+        self.assertTrue(queue.put(SSEFrame('result', '{}', 8)))
+        self.assertEqual([f.seq for f in queue.get(0)], [6, 7, 8])
+
+        # 합칠 수 있는 프레임이 없으면 클라이언트를 끊는다
+        for seq in range(3):
+            queue.put(SSEFrame('result', '{}', seq))
+        self.assertFalse(queue.put(SSEFrame('result', '{}', 99)))
+        self.assertIsNone(queue.get(0))
+
+    def test_03_drop_policy(self) -> None:
+        """drop 정책은 오버플로 클라이언트를 끊고 지표에 기록한다."""
+        registry = SSEClientRegistry(capacity=2, policy='drop')
+        wfile = io.BytesIO()
+        registry.add(wfile)
+        for seq in range(3):
+            registry.publish(_delta('a', seq))
+        self.assertEqual(len(registry), 0)
+        registry.pump(wfile, 0.01)  # 미등록 → 즉시 반환
+        stats = registry.stats()
+        self.assertEqual(stats['dropped_clients'], 1)
+        self.assertEqual(stats['clients'], 0)
+
+    def test_04_terminal_channel_seq_order(self) -> None:
+        """TerminalSSEChannel 은 seq 순서대로 적재한다."""
+        channel = TerminalSSEChannel()
+        wfile = io.BytesIO()
+        channel.add(wfile)
+        for i in range(3):
+            channel.broadcast({
+                'type': 'stream_event',
+                'event': {'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': str(i)}},
+            })
+        pump = threading.Thread(target=channel.pump, args=(wfile, 0.05), daemon=True)
+        pump.start()
+        time.sleep(0.1)
+        channel.remove(wfile)
+        pump.join(1.0)
+        body = wfile.getvalue().decode('utf-8')
+        self.assertLess(body.index('id: 0\n'), body.index('id: 1\n'))
+        self.assertLess(body.index('id: 1\n'), body.index('id: 2\n'))
+        self.assertEqual(channel.client_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""TicketIndex 버전 인덱스 / parse_ticket_xml 테스트.
+
+  TC1: parse_ticket_xml 이 브라우저 parseTicket 과 같은 필드를 만든다 (레거시 submit 포함)
+  TC2: since(version) 은 추가/수정/이동/삭제분만, 오래된/미래 커서는 전체
+  TC3: FileWatcher 이벤트 refresh(files) 로 제자리 수정 반영, tombstone 밀림 시 전체
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+
+_WORKTREE_ROOT = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', '..'),
+)
+_BOARD_ROOT = os.path.normpath(os.path.join(_WORKTREE_ROOT, '.claude-organic', 'board'))
+for _p in (_WORKTREE_ROOT, _BOARD_ROOT):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+from server.ticket_index import TicketIndex, parse_ticket_xml  # noqa: E402
+
+
+def _xml(number: str, title: str, status: str = 'Open') -> str:
+    return (
+        f'<ticket><metadata><number>{number}</number><title>{title}</title>'
+        f'<status>{status}</status><command>implement</command></metadata></ticket>\n'
+    )
+
+
+class TestParseTicketXml(unittest.TestCase):
+    """XML → 티켓 객체 변환 검증."""
+
+    def test_01_fields(self) -> None:
+        """metadata / prompt / result / relations / 레거시 폴백."""
+        ticket = parse_ticket_xml(
+            '<ticket><metadata><number>T-001</number><title> 제목 </title>'
+            '<datetime>2026-01-01 09:00:00</datetime><status>In Progress</status>'
+            '<command>research</command></metadata>'
+            '<prompt><goal>\n  첫 줄\n\n  둘째 줄\n</goal><empty/></prompt>'
+            '<result><Summary>요약</Summary></result>'
+            '<relations><relation type="depends" ticket="T-000"/><relation type=""/></relations>'
+            '</ticket>'
+        )
+        self.assertEqual(ticket, {
+            'number': 'T-001', 'title': '제목',
+            'created': '2026-01-01 09:00:00', 'updated': '2026-01-01 09:00:00',
+            'status': 'In Progress', 'command': 'research',
+            'prompt': {'goal': '첫 줄\n둘째 줄'}, 'result': {'summary': '요약'},
+            'relations': [{'type': 'depends', 'ticket': 'T-000'}],
+        })
+
+        legacy = parse_ticket_xml(
+            '<ticket><metadata><number>T-002</number></metadata><submit>'
+            '<subnumber active="false"><command>old</command></subnumber>'
+            '<subnumber active="true"><command> review </command><prompt><goal>g</goal></prompt>'
+            '<result><Status>ok</Status></result></subnumber></submit></ticket>'
+        )
+        self.assertEqual(legacy['command'], 'review')
+        self.assertEqual(legacy['prompt'], {'goal': 'g'})
+        self.assertEqual(legacy['result'], {'status': 'ok'})
+        self.assertEqual(legacy['status'], 'Open')
+
+        self.assertIsNone(parse_ticket_xml('<ticket><metadata>'))
+        self.assertIsNone(parse_ticket_xml('<other/>'))
+
+
+class TestTicketIndex(unittest.TestCase):
+    """버전 커서 변경분 검증."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self.tickets = os.path.join(self.root, '.claude-organic', 'tickets')
+        for col in ('open', 'progress', 'done'):
+            os.makedirs(os.path.join(self.tickets, col))
+        self._write('open', 'T-001', '첫 티켓')
+        self._write('progress', 'T-002', '진행 중', 'In Progress')
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write(self, col: str, number: str, title: str, status: str = 'Open') -> str:
+        path = os.path.join(self.tickets, col, f'{number}.xml')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(_xml(number, title, status))
+        return path
+
+    def test_02_since(self) -> None:
+        """변경분만 반환하고 커서가 유효하지 않으면 전체."""
+        index = TicketIndex()
+        full = index.since(self.root, 0)
+        self.assertTrue(full['full'])
+        self.assertEqual(list(full['tickets']), ['T-001.xml', 'T-002.xml'])
+        v1 = full['version']
+
+        unchanged = index.since(self.root, v1)
+        self.assertEqual((unchanged['version'], unchanged['tickets'], unchanged['deleted']), (v1, {}, []))
+
+        # 이동 (progress → done) + 추가 + 삭제
+        os.remove(os.path.join(self.tickets, 'progress', 'T-002.xml'))
+        self._write('done', 'T-002', '진행 중', 'Done')
+        self._write('open', 'T-003', '새 티켓')
+        os.remove(os.path.join(self.tickets, 'open', 'T-001.xml'))
+        delta = index.since(self.root, v1)
+        self.assertFalse(delta['full'])
+        self.assertEqual(delta['tickets']['T-002.xml']['status'], 'Done')
+        self.assertEqual(list(delta['tickets']), ['T-003.xml', 'T-002.xml'])
+        self.assertEqual(delta['deleted'], ['T-001.xml'])
+        self.assertGreater(delta['version'], v1)
+
+        self.assertTrue(index.since(self.root, delta['version'] + 1)['full'])
+        self.assertTrue(index.since(self.root, -1)['full'])
+
+    def test_03_refresh_files_and_floor(self) -> None:
+        """watcher 파일 목록으로 제자리 수정 반영, tombstone 밀림 이전 커서는 전체."""
+        index = TicketIndex(tombstone_capacity=1)
+        v1 = index.since(self.root, 0)['version']
+
+        path = os.path.join(self.tickets, 'open', 'T-001.xml')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(_xml('T-001', '수정된 제목 (길이 변경)'))
+        v2 = index.refresh(self.root, ['T-001.xml', 'ignored.txt'])
+        self.assertGreater(v2, v1)
+        self.assertEqual(index.since(self.root, v1)['tickets']['T-001.xml']['title'], '수정된 제목 (길이 변경)')
+
+        os.remove(path)
+        index.refresh(self.root, ['T-001.xml'])
+        v3 = index.since(self.root, v2)
+        self.assertEqual(v3['deleted'], ['T-001.xml'])
+        os.remove(os.path.join(self.tickets, 'progress', 'T-002.xml'))
+        index.refresh(self.root, ['T-002.xml'])
+        # T-001 tombstone 이 밀려났으므로 v2 커서는 전체 재동기화
+        self.assertTrue(index.since(self.root, v2)['full'])
+        self.assertEqual(index.since(self.root, v3['version'])['deleted'], ['T-002.xml'])
+
+
+if __name__ == '__main__':
+    unittest.main()
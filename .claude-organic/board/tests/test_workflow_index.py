@@ -0,0 +1,117 @@
+"""WorkflowIndex 엔트리/상세 캐시 테스트.
+
+  TC1: 커서 페이지(before/limit) 와 detail=full|summary, 기존 함수와 같은 결과
+  TC2: 진행 중 엔트리는 status.json 변경을 반영하고, 변경이 없으면 다시 읽지 않는다
+  TC3: FileWatcher workflow 이벤트 invalidate(files) 로 .history 엔트리 제자리 수정 반영
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+_WORKTREE_ROOT = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', '..'),
+)
+_BOARD_ROOT = os.path.normpath(os.path.join(_WORKTREE_ROOT, '.claude-organic', 'board'))
+for _p in (_WORKTREE_ROOT, _BOARD_ROOT):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+from board_data import _list_workflow_entries, _workflow_detail  # noqa: E402
+from server import workflow_index as wi_mod  # noqa: E402
+from server.workflow_index import WorkflowIndex  # noqa: E402
+
+_RUNS = os.path.join('.claude-organic', 'runs')
+_HISTORY = os.path.join(_RUNS, '.history')
+
+
+class TestWorkflowIndex(unittest.TestCase):
+    """임시 runs/ 트리에서 캐시 동작 검증."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = self._tmp.name
+        self.index = WorkflowIndex()
+
+    def _write(self, rel: str, name: str, step: str = 'PLAN', task: str = 'task', cmd: str = 'implement') -> str:
+        cmd_dir = os.path.join(self.root, rel, name, task, cmd)
+        os.makedirs(cmd_dir, exist_ok=True)
+        with open(os.path.join(cmd_dir, 'status.json'), 'w', encoding='utf-8') as f:
+            json.dump({'step': step, 'created_at': name, 'updated_at': name}, f)
+        return cmd_dir
+
+    def test_01_page(self) -> None:
+        """최신순 페이지, next 커서, 상세 포함 모드가 기존 함수 결과와 같다."""
+        names = [f'2026010{d}-120000' for d in range(1, 6)]
+        for i, name in enumerate(names):
+            cmd_dir = self._write(_HISTORY if i < 3 else _RUNS, name)
+            if i == 0:
+                open(os.path.join(cmd_dir, 'plan.md'), 'w').close()
+
+        self.assertEqual(self.index.entries(self.root), _list_workflow_entries(self.root))
+
+        first = self.index.page(self.root, limit=2)
+        self.assertEqual([e.rstrip('/').rsplit('/', 1)[-1] for e in first['entries']], [names[4], names[3]])
+        self.assertEqual((first['next'], first['total']), (names[3], 5))
+        self.assertNotIn('items', first)
+
+        last = self.index.page(self.root, before=first['next'], limit=10, detail='full')
+        self.assertEqual(last['entries'], _list_workflow_entries(self.root)[2:])
+        self.assertIsNone(last['next'])
+        expected = [item for rel in last['entries'] for item in _workflow_detail(self.root, rel)]
+        self.assertEqual(last['items'], expected)
+        self.assertTrue(last['items'][-1]['fileMap']['plan']['exists'])
+
+        summary = self.index.page(self.root, before=names[1], detail='summary')
+        self.assertEqual([item['entry'] for item in summary['items']], [names[0]])
+        self.assertNotIn('fileMap', summary['items'][0])
+        # 요약으로 채운 캐시는 전체 상세 요청 시 fileMap 을 다시 만든다
+        rel = summary['entries'][0]
+        self.assertEqual(self.index.detail(self.root, rel), _workflow_detail(self.root, rel))
+
+    def test_02_active_entry_signature(self) -> None:
+        """status.json 이 바뀌면 다시 만들고, 그대로면 _workflow_detail 을 호출하지 않는다."""
+        cmd_dir = self._write(_RUNS, '20260101-120000')
+        rel = _RUNS + '/20260101-120000/'
+        self.assertEqual(self.index.detail(self.root, rel)[0]['step'], 'PLAN')
+
+        with mock.patch.object(wi_mod, '_workflow_detail', side_effect=AssertionError('cache miss')):
+            self.assertEqual(self.index.detail(self.root, rel)[0]['step'], 'PLAN')
+
+        with open(os.path.join(cmd_dir, 'status.json'), 'w', encoding='utf-8') as f:
+            json.dump({'step': 'WORK-DONE', 'updated_at': 'x'}, f)
+        self.assertEqual(self.index.detail(self.root, rel)[0]['step'], 'WORK-DONE')
+
+        self._write(_RUNS, '20260101-120000', cmd='review')
+        self.assertEqual([i['command'] for i in self.index.detail(self.root, rel)], ['implement', 'review'])
+
+        # .history 로 옮겨진 엔트리는 빈 목록, 목록 캐시는 디렉터리 mtime 으로 갱신
+        os.makedirs(os.path.join(self.root, _HISTORY))
+        os.rename(os.path.join(self.root, rel), os.path.join(self.root, _HISTORY, '20260101-120000'))
+        self.assertEqual(self.index.detail(self.root, rel), [])
+        self.assertEqual(self.index.entries(self.root), [_HISTORY + '/20260101-120000/'])
+
+    def test_03_invalidate_history(self) -> None:
+        """.history 엔트리는 엔트리 mtime 만 보므로 이벤트로 무효화해야 제자리 수정이 보인다."""
+        cmd_dir = self._write(_HISTORY, '20260101-120000')
+        rel = _HISTORY + '/20260101-120000/'
+        self.assertEqual(self.index.detail(self.root, rel)[0]['step'], 'PLAN')
+
+        with open(os.path.join(cmd_dir, 'status.json'), 'w', encoding='utf-8') as f:
+            json.dump({'step': 'DONE'}, f)
+        self.assertEqual(self.index.detail(self.root, rel)[0]['step'], 'PLAN')
+
+        self.index.invalidate(self.root, ['20260101-999999'])
+        self.assertEqual(self.index.detail(self.root, rel)[0]['step'], 'PLAN')
+        self.index.invalidate(self.root, ['20260101-120000'])
+        self.assertEqual(self.index.detail(self.root, rel)[0]['step'], 'DONE')
+
+
+if __name__ == '__main__':
+    unittest.main()
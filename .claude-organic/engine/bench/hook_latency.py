@@ -0,0 +1,136 @@
+#!/usr/bin/env -S python3 -u
+"""hook_latency.py - pre-tool-use 디스패처 호출 지연 벤치마크.
+
+대표 PreToolUse 페이로드를 hooks/pre-tool-use.py에 반복 투입하여
+호출 1회당 wall-clock 지연을 측정한다. 가드 실행 방식별로 비교한다:
+
+    subprocess: HOOK_GUARD_INPROCESS=false (가드마다 python 프로세스 1개, 이전 방식)
+    inprocess:  HOOK_GUARD_INPROCESS=true  (가드 모듈 import 후 evaluate() 호출)
+
+두 모드의 판정 JSON이 다르면 mismatch로 보고한다.
+
+사용법:
+    python3 .claude-organic/engine/bench/hook_latency.py [-n 반복횟수] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_HOOKS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "hooks"))
+_PRE_TOOL_USE = os.path.join(_HOOKS_DIR, "pre-tool-use.py")
+
+# 벤치마크 페이로드 (이름, PreToolUse stdin JSON)
+SAMPLE_PAYLOADS: list[tuple[str, dict]] = [
+    ("bash-ls", {"tool_name": "Bash", "tool_input": {"command": "ls -la"}}),
+    ("bash-git-status", {"tool_name": "Bash", "tool_input": {"command": "git status"}}),
+    ("bash-kanban-show", {"tool_name": "Bash", "tool_input": {"command": "flow-kanban show T-001"}}),
+    ("bash-git-commit", {"tool_name": "Bash", "tool_input": {"command": "git commit -m 'wip'"}}),
+    ("bash-rm-root", {"tool_name": "Bash", "tool_input": {"command": "rm -rf /"}}),
+    ("edit-src", {"tool_name": "Edit", "tool_input": {"file_path": "src/app.py", "old_string": "a", "new_string": "b"}}),
+    ("read", {"tool_name": "Read", "tool_input": {"file_path": "README.md"}}),
+]
+
+MODES: tuple[str, ...] = ("subprocess", "inprocess")
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """정렬된 표본에서 nearest-rank 백분위 값을 반환한다."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[idx]
+
+
+def _run_once(payload: bytes, env: dict[str, str]) -> tuple[float, bytes]:
+    """pre-tool-use.py를 1회 실행하고 (경과 ms, stdout)을 반환한다."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, _PRE_TOOL_USE],
+        input=payload,
+        capture_output=True,
+        env=env,
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    return elapsed_ms, proc.stdout
+
+
+def run_benchmark(iterations: int) -> dict:
+    """모든 페이로드 × 모드 조합을 측정하여 결과 dict를 반환한다.
+
+    Args:
+        iterations: 조합별 반복 횟수.
+
+    Returns:
+        {"iterations", "results": [{payload, mode, mean_ms, p50_ms, p95_ms}], "mismatches": [...]}
+    """
+    results: list[dict] = []
+    mismatches: list[str] = []
+    for name, payload in SAMPLE_PAYLOADS:
+        raw = json.dumps(payload).encode("utf-8")
+        outputs: dict[str, bytes] = {}
+        for mode in MODES:
+            env = dict(os.environ)
+            env["HOOK_GUARD_INPROCESS"] = "true" if mode == "inprocess" else "false"
+            samples: list[float] = []
+            for _ in range(iterations):
+                elapsed_ms, stdout = _run_once(raw, env)
+                samples.append(elapsed_ms)
+                outputs[mode] = stdout
+            results.append({
+                "payload": name,
+                "mode": mode,
+                "mean_ms": round(statistics.fmean(samples), 1),
+                "p50_ms": round(_percentile(samples, 50), 1),
+                "p95_ms": round(_percentile(samples, 95), 1),
+            })
+        if len(set(outputs.values())) > 1:
+            mismatches.append(name)
+    return {"iterations": iterations, "results": results, "mismatches": mismatches}
+
+
+def _print_table(report: dict) -> None:
+    """벤치마크 결과를 표로 출력한다."""
+    print(f"pre-tool-use latency ({report['iterations']} runs each)")
+    print(f"{'payload':<20} {'mode':<11} {'mean':>8} {'p50':>8} {'p95':>8}")
+    by_payload: dict[str, dict[str, dict]] = {}
+    for row in report["results"]:
+        by_payload.setdefault(row["payload"], {})[row["mode"]] = row
+        print(
+            f"{row['payload']:<20} {row['mode']:<11} "
+            f"{row['mean_ms']:>6.1f}ms {row['p50_ms']:>6.1f}ms {row['p95_ms']:>6.1f}ms"
+        )
+    print()
+    for name, modes in by_payload.items():
+        before = modes.get("subprocess", {}).get("mean_ms", 0.0)
+        after = modes.get("inprocess", {}).get("mean_ms", 0.0)
+        if before and after:
+            print(f"{name:<20} {before:>6.1f}ms -> {after:>6.1f}ms  (x{before / after:.1f})")
+    if report["mismatches"]:
+        print(f"\n[WARN] decision mismatch: {', '.join(report['mismatches'])}")
+
+
+def main() -> None:
+    """CLI 진입점."""
+    parser = argparse.ArgumentParser(description="pre-tool-use 디스패처 호출 지연 벤치마크")
+    parser.add_argument("-n", "--iterations", type=int, default=10, help="조합별 반복 횟수 (기본 10)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    report = run_benchmark(max(1, args.iterations))
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        _print_table(report)
+    sys.exit(1 if report["mismatches"] else 0)
+
+
+if __name__ == "__main__":
+    main()
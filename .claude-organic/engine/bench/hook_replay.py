@@ -0,0 +1,254 @@
+#!/usr/bin/env -S python3 -u
+"""hook_replay.py - 기록된 훅 페이로드 재생 벤치마크.
+
+payload_corpus.py 가 수집한 익명화 코퍼스(HOOK_PAYLOAD_CORPUS=true 로 기록)를
+hooks/pre-tool-use.py / post-tool-use.py 에 지정한 동시성으로 다시 투입하여
+처리량, 훅별 지연 분위수(p50/p95/p99), 기준선 대비 판정 동일성을 보고한다.
+훅 경로 최적화가 allow/deny 결과를 바꾸지 않는지, 가드 추가로 지연이 늘지 않았는지 확인하는 용도다.
+
+판정 비교 키:
+    pre-tool-use: (exit code, permissionDecision, permissionDecisionReason)
+    그 외:        (exit code, stdout)
+
+재생 환경:
+    - 기록 당시의 맥락 환경변수(_WF_SESSION_TYPE 등)만 주입하고, 세션 종료/metrics 기록 등
+      부수효과를 일으키는 변수(_WF_SESSION_ID, TMUX_PANE, WORKFLOW_WORK_DIR ...)는 제거한다.
+    - HOOK_SPANS / HOOK_PAYLOAD_CORPUS 는 끈다 (재생이 스풀/코퍼스를 오염시키지 않도록).
+    - HOOK_DAEMON 은 --daemon 을 줄 때만 켠다.
+
+사용법:
+    python3 .claude-organic/engine/bench/hook_replay.py [--corpus PATH] [-c 동시성] [-n 반복]
+        [--save-baseline FILE] [--baseline FILE] [--json]
+
+기준선과 판정이 다르면 exit 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+_BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+_ENGINE_DIR = os.path.normpath(os.path.join(_BENCH_DIR, ".."))
+_HOOKS_DIR = os.path.normpath(os.path.join(_ENGINE_DIR, "..", "hooks"))
+_ROOT = os.path.normpath(os.path.join(_ENGINE_DIR, "..", ".."))
+if _ENGINE_DIR not in sys.path:
+    sys.path.insert(0, _ENGINE_DIR)
+
+from bench.payload_corpus import corpus_path, load_corpus, record_id, restore  # noqa: E402
+
+HOOK_SCRIPTS: dict[str, str] = {
+    "pre-tool-use": os.path.join(_HOOKS_DIR, "pre-tool-use.py"),
+    "post-tool-use": os.path.join(_HOOKS_DIR, "post-tool-use.py"),
+}
+
+# 재생 중 부수효과(세션 종료 요청, tmux 조작, metrics 기록)를 일으키는 환경변수
+_STRIP_ENV: tuple[str, ...] = (
+    "_WF_SESSION_ID", "_WF_SERVER_PORT", "TMUX", "TMUX_PANE",
+    "WORKFLOW_WORK_DIR", "_WF_WORK_DIR", "_WF_SESSION_TYPE",
+    "WORKFLOW_COMMAND", "WORKFLOW_WORKTREE_PATH", "HOOKS_EDIT_ALLOWED",
+)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """nearest-rank 백분위 값을 반환한다."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = max(0, min(len(ordered) - 1, -(-len(ordered) * pct // 100) - 1))
+    return ordered[int(idx)]
+
+
+def _decision_of(hook: str, code: int, stdout: bytes) -> list[Any]:
+    """훅 출력에서 비교용 판정을 추출한다."""
+    text = stdout.decode("utf-8", errors="replace").strip()
+    if hook == "pre-tool-use":
+        try:
+            out = json.loads(text.splitlines()[-1]) if text else {}
+            spec = out.get("hookSpecificOutput") or {}
+            return [code, spec.get("permissionDecision", ""), spec.get("permissionDecisionReason", "")]
+        except (ValueError, AttributeError):
+            pass
+    return [code, text]
+
+
+def _base_env(daemon: bool) -> dict[str, str]:
+    """재생 공통 환경변수를 만든다."""
+    env = {k: v for k, v in os.environ.items() if k not in _STRIP_ENV}
+    env["HOOK_SPANS"] = "false"
+    env["HOOK_PAYLOAD_CORPUS"] = "false"
+    env["HOOK_DAEMON"] = "true" if daemon else "false"
+    return env
+
+
+def _replay_one(record: dict[str, Any], project_root: str, base_env: dict[str, str]) -> tuple[float, list[Any]]:
+    """레코드 1개를 디스패처에 투입하고 (경과 ms, 판정)을 반환한다."""
+    hook = record["hook"]
+    payload, cwd, ctx_env = restore(record, project_root)
+    env = dict(base_env)
+    env.update(ctx_env)
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, HOOK_SCRIPTS[hook]],
+        input=json.dumps(payload).encode("utf-8"),
+        capture_output=True,
+        cwd=cwd,
+        env=env,
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    return elapsed_ms, _decision_of(hook, proc.returncode, proc.stdout)
+
+
+def run_replay(
+    records: list[dict[str, Any]],
+    concurrency: int = 4,
+    repeat: int = 1,
+    daemon: bool = False,
+    project_root: str = _ROOT,
+) -> dict[str, Any]:
+    """코퍼스를 재생하여 처리량/지연/판정을 수집한다.
+
+    Args:
+        records: load_corpus() 결과 (재생 가능한 훅만 사용).
+        concurrency: 동시 실행 수.
+        repeat: 코퍼스 반복 횟수.
+        daemon: True 이면 HOOK_DAEMON=true 로 재생.
+        project_root: 재생 대상 프로젝트 루트.
+
+    Returns:
+        {"events", "wall_s", "throughput", "hooks": {hook: {count, p50_ms, p95_ms, p99_ms, max_ms}},
+         "decisions": {record_id: 판정}, "unstable": [반복 간 판정이 달라진 record_id]}
+    """
+    records = [r for r in records if r.get("hook") in HOOK_SCRIPTS]
+    jobs = [r for _ in range(max(1, repeat)) for r in records]
+    base_env = _base_env(daemon)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        results = list(pool.map(lambda r: _replay_one(r, project_root, base_env), jobs))
+    wall_s = time.perf_counter() - started
+
+    samples: dict[str, list[float]] = {}
+    decisions: dict[str, list[Any]] = {}
+    unstable: list[str] = []
+    for record, (elapsed_ms, decision) in zip(jobs, results):
+        samples.setdefault(record["hook"], []).append(elapsed_ms)
+        rid = record_id(record)
+        if rid in decisions and decisions[rid] != decision and rid not in unstable:
+            unstable.append(rid)
+        decisions.setdefault(rid, decision)
+
+    return {
+        "events": len(jobs),
+        "concurrency": max(1, concurrency),
+        "wall_s": round(wall_s, 3),
+        "throughput": round(len(jobs) / wall_s, 1) if wall_s > 0 else 0.0,
+        "hooks": {
+            hook: {
+                "count": len(values),
+                "p50_ms": round(_percentile(values, 50), 1),
+                "p95_ms": round(_percentile(values, 95), 1),
+                "p99_ms": round(_percentile(values, 99), 1),
+                "max_ms": round(max(values), 1),
+            }
+            for hook, values in sorted(samples.items())
+        },
+        "decisions": decisions,
+        "unstable": unstable,
+    }
+
+
+def corpus_digest(records: list[dict[str, Any]]) -> str:
+    """코퍼스 레코드 id 집합의 sha1 (기준선과 같은 코퍼스인지 확인용)."""
+    ids = sorted({record_id(r) for r in records})
+    return hashlib.sha1("\n".join(ids).encode("utf-8")).hexdigest()
+
+
+def compare_baseline(decisions: dict[str, list[Any]], baseline: dict[str, Any]) -> list[dict[str, Any]]:
+    """기준선 판정과 비교하여 불일치 목록을 반환한다 (기준선에 없는 레코드는 건너뛴다).
+
+    Args:
+        decisions: run_replay() 의 decisions.
+        baseline: --save-baseline 으로 저장한 dict.
+
+    Returns:
+        [{"id", "baseline", "current"}] 목록.
+    """
+    expected = baseline.get("decisions") or {}
+    return [
+        {"id": rid, "baseline": expected[rid], "current": current}
+        for rid, current in sorted(decisions.items())
+        if rid in expected and expected[rid] != current
+    ]
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    """재생 결과를 표로 출력한다."""
+    print(
+        f"hook replay: {report['events']} events, concurrency {report['concurrency']}, "
+        f"{report['wall_s']:.2f}s wall, {report['throughput']:.1f} events/s"
+    )
+    print(f"{'hook':<16} {'count':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for hook, row in report["hooks"].items():
+        print(
+            f"{hook:<16} {row['count']:>6} {row['p50_ms']:>7.1f}ms {row['p95_ms']:>7.1f}ms "
+            f"{row['p99_ms']:>7.1f}ms {row['max_ms']:>7.1f}ms"
+        )
+    if report.get("unstable"):
+        print(f"\n[WARN] decision differs between repeats: {', '.join(report['unstable'])}")
+    if "mismatches" in report:
+        mismatches = report["mismatches"]
+        if mismatches:
+            print(f"\n[FAIL] {len(mismatches)} decision(s) differ from baseline:")
+            for m in mismatches:
+                print(f"  {m['id']}: {m['baseline']} -> {m['current']}")
+        else:
+            print(f"\nbaseline: all {report['compared']} decisions match")
+        if report.get("baseline_corpus_changed"):
+            print("[WARN] corpus differs from the one the baseline was recorded with")
+
+
+def main() -> None:
+    """CLI 진입점."""
+    parser = argparse.ArgumentParser(description="기록된 훅 페이로드 재생 벤치마크")
+    parser.add_argument("--corpus", default=corpus_path(_ROOT), help="코퍼스 jsonl 경로")
+    parser.add_argument("-c", "--concurrency", type=int, default=4, help="동시 실행 수 (기본 4)")
+    parser.add_argument("-n", "--repeat", type=int, default=1, help="코퍼스 반복 횟수 (기본 1)")
+    parser.add_argument("--daemon", action="store_true", help="HOOK_DAEMON=true 로 재생")
+    parser.add_argument("--save-baseline", metavar="FILE", help="판정을 기준선 파일로 저장")
+    parser.add_argument("--baseline", metavar="FILE", help="기준선 파일과 판정 비교")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    records = load_corpus(args.corpus)
+    if not records:
+        print(f"[hook-replay] empty corpus: {args.corpus} (HOOK_PAYLOAD_CORPUS=true 로 기록)", file=sys.stderr)
+        sys.exit(2)
+
+    report = run_replay(records, args.concurrency, args.repeat, args.daemon)
+    digest = corpus_digest(records)
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        report["mismatches"] = compare_baseline(report["decisions"], baseline)
+        report["compared"] = sum(1 for rid in report["decisions"] if rid in (baseline.get("decisions") or {}))
+        report["baseline_corpus_changed"] = baseline.get("corpus") != digest
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({"corpus": digest, "decisions": report["decisions"]}, f, ensure_ascii=False, indent=1)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        _print_report(report)
+    sys.exit(1 if report.get("mismatches") else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""payload_corpus.py - 훅 stdin 페이로드 익명화 코퍼스.
+
+HOOK_PAYLOAD_CORPUS=true 이면 pre-tool-use / post-tool-use 디스패처가 실제 stdin 페이로드를
+익명화하여 ``<project_root>/.claude-organic/logs/hook-corpus/corpus.jsonl`` 에 누적한다.
+hook_replay.py 가 이 코퍼스를 디스패처에 다시 투입하여 지연과 판정 동일성을 측정한다.
+
+익명화 규칙:
+    - 프로젝트 루트 / 홈 디렉터리 경로는 ``{PROJECT_ROOT}`` / ``{HOME}`` 자리표시자로 치환
+      (재생 시 재생 환경의 경로로 되돌린다)
+    - session_id / transcript_path / tool_use_id 는 고정 자리표시자로 치환
+    - 파일 본문(content, old_string, new_string, new_source)과 tool_response 는
+      ``{"$redacted": <길이>}`` 로 대체 (재생 시 같은 길이의 더미 문자열로 복원 — 크기 의존 경로 유지)
+    - 토큰/키로 보이는 문자열(sk-, ghp_, xox*, AKIA, 긴 hex)은 ``<redacted>`` 로 마스킹
+
+레코드 형식 (한 줄 = JSON 객체 1개):
+    {"hook": "pre-tool-use", "cwd": "{PROJECT_ROOT}/...", "env": {...}, "payload": {...}}
+
+주요 함수:
+    anonymize: payload → 익명화 레코드
+    restore: 익명화 레코드 → 재생용 (payload, cwd, env)
+    append_record: 코퍼스 파일에 레코드 1개 추가 (크기 상한 적용)
+    load_corpus: 코퍼스 레코드 목록
+    record_id: 레코드 식별자 (기준선 비교 키)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from typing import Any
+
+CORPUS_DIRNAME: str = 'hook-corpus'
+CORPUS_FILENAME: str = 'corpus.jsonl'
+
+# 코퍼스 파일 크기 상한 (초과 시 더 기록하지 않는다)
+MAX_CORPUS_BYTES: int = 8 * 1024 * 1024
+
+ROOT_TOKEN: str = '{PROJECT_ROOT}'
+HOME_TOKEN: str = '{HOME}'
+REDACTED_KEY: str = '$redacted'
+
+# 본문 필드 (길이만 보존)
+_BODY_KEYS: frozenset[str] = frozenset({'content', 'old_string', 'new_string', 'new_source'})
+
+# 고정 자리표시자로 치환하는 식별 필드
+_ID_FIELDS: dict[str, str] = {
+    'session_id': '00000000-0000-0000-0000-000000000000',
+    'transcript_path': HOME_TOKEN + '/.claude/projects/replay/transcript.jsonl',
+    'tool_use_id': 'toolu_replay',
+}
+
+# 가드 판정에 영향을 주는 실행 맥락 환경변수 (재생 시 그대로 주입)
+CONTEXT_ENV: tuple[str, ...] = (
+    '_WF_SESSION_TYPE',
+    'WORKFLOW_COMMAND',
+    'WORKFLOW_WORKTREE_PATH',
+    'HOOKS_EDIT_ALLOWED',
+)
+
+_SECRET_RE = re.compile(
+    r'\b(?:sk-[A-Za-z0-9_-]{16,}|gh[pousr]_[A-Za-z0-9]{20,}|xox[abprs]-[A-Za-z0-9-]{10,}'
+    r'|AKIA[0-9A-Z]{16}|[0-9a-f]{48,})\b'
+)
+
+
+def corpus_path(project_root: str) -> str:
+    """코퍼스 파일 경로를 반환한다."""
+    return os.path.join(project_root, '.claude-organic', 'logs', CORPUS_DIRNAME, CORPUS_FILENAME)
+
+
+def _scrub(text: str, project_root: str, home: str) -> str:
+    """경로를 자리표시자로 치환하고 비밀값을 마스킹한다."""
+    if project_root and project_root != os.sep:
+        text = text.replace(project_root, ROOT_TOKEN)
+    if home and home != os.sep:
+        text = text.replace(home, HOME_TOKEN)
+    return _SECRET_RE.sub('<redacted>', text)
+
+
+def _anonymize_value(value: Any, project_root: str, home: str, key: str = '') -> Any:
+    """값을 재귀적으로 익명화한다."""
+    if key in _BODY_KEYS and isinstance(value, str):
+        return {REDACTED_KEY: len(value)}
+    if isinstance(value, str):
+        return _scrub(value, project_root, home)
+    if isinstance(value, dict):
+        return {k: _anonymize_value(v, project_root, home, k) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_anonymize_value(v, project_root, home, key) for v in value]
+    return value
+
+
+def anonymize(
+    hook: str,
+    payload: dict[str, Any],
+    project_root: str,
+    cwd: str | None = None,
+    environ: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """훅 페이로드를 익명화 레코드로 변환한다.
+
+    Args:
+        hook: 훅 이름 (pre-tool-use / post-tool-use).
+        payload: stdin JSON dict.
+        project_root: 메인 리포 루트 (자리표시자 치환 기준).
+        cwd: 실행 디렉터리 (None 이면 os.getcwd()).
+        environ: 환경변수 (None 이면 os.environ).
+
+    Returns:
+        코퍼스 레코드 dict.
+    """
+    home = os.path.expanduser('~')
+    environ = os.environ if environ is None else environ
+    body: dict[str, Any] = {}
+    for k, v in payload.items():
+        if k in _ID_FIELDS:
+            body[k] = _ID_FIELDS[k]
+        elif k == 'tool_response':
+            raw = v if isinstance(v, str) else json.dumps(v, ensure_ascii=False)
+            body[k] = {REDACTED_KEY: len(raw)}
+        else:
+            body[k] = _anonymize_value(v, project_root, home, k)
+    return {
+        'hook': hook,
+        'cwd': _scrub(cwd or os.getcwd(), project_root, home),
+        'env': {
+            name: _scrub(environ[name], project_root, home)
+            for name in CONTEXT_ENV
+            if environ.get(name)
+        },
+        'payload': body,
+    }
+
+
+def _restore_value(value: Any, project_root: str, home: str) -> Any:
+    """익명화 값을 재생용 값으로 되돌린다."""
+    if isinstance(value, dict):
+        if set(value) == {REDACTED_KEY}:
+            return 'x' * int(value[REDACTED_KEY] or 0)
+        return {k: _restore_value(v, project_root, home) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_restore_value(v, project_root, home) for v in value]
+    if isinstance(value, str):
+        return value.replace(ROOT_TOKEN, project_root).replace(HOME_TOKEN, home)
+    return value
+
+
+def restore(record: dict[str, Any], project_root: str) -> tuple[dict[str, Any], str, dict[str, str]]:
+    """레코드를 재생 환경 기준의 (payload, cwd, env) 로 복원한다.
+
+    Args:
+        record: anonymize() 결과.
+        project_root: 재생할 프로젝트 루트.
+
+    Returns:
+        (stdin payload dict, 실행 디렉터리, 주입할 맥락 환경변수).
+        기록 당시 cwd 가 재생 환경에 없으면 project_root 를 쓴다.
+    """
+    home = os.path.expanduser('~')
+    payload = _restore_value(record.get('payload') or {}, project_root, home)
+    cwd = _restore_value(record.get('cwd') or ROOT_TOKEN, project_root, home)
+    if not os.path.isdir(cwd):
+        cwd = project_root
+    env = {k: str(_restore_value(v, project_root, home)) for k, v in (record.get('env') or {}).items()}
+    return payload, cwd, env
+
+
+def record_id(record: dict[str, Any]) -> str:
+    """레코드 내용의 sha1 앞 16자 (기준선 판정 비교 키)."""
+    raw = json.dumps(record, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def append_record(project_root: str, hook: str, payload: dict[str, Any]) -> bool:
+    """페이로드를 익명화하여 코퍼스에 추가한다. 실패는 무시한다.
+
+    Args:
+        project_root: 메인 리포 루트.
+        hook: 훅 이름.
+        payload: stdin JSON dict.
+
+    Returns:
+        기록했으면 True (크기 상한 초과/쓰기 실패 시 False).
+    """
+    path = corpus_path(project_root)
+    try:
+        if os.path.getsize(path) >= MAX_CORPUS_BYTES:
+            return False
+    except OSError:
+        pass
+    line = json.dumps(anonymize(hook, payload, project_root), ensure_ascii=False) + '\n'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        try:
+            os.write(fd, line.encode('utf-8'))
+        finally:
+            os.close(fd)
+    except OSError:
+        return False
+    return True
+
+
+def load_corpus(path: str) -> list[dict[str, Any]]:
+    """코퍼스 파일을 읽어 레코드 목록을 반환한다 (깨진 줄은 건너뛴다)."""
+    records: list[dict[str, Any]] = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and isinstance(record.get('payload'), dict):
+                    records.append(record)
+    except OSError:
+        pass
+    return records
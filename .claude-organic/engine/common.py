@@ -10,7 +10,7 @@ common.py - 프로젝트 공통 유틸리티.
     resolve_project_root: 프로젝트 루트 절대 경로 해석
     load_json_file: JSON 파일 로드 (실패 시 None 반환)
     atomic_write_json: JSON 원자적 쓰기
-    scan_active_workflows: 활성 워크플로우 디렉터리 스캔
+    scan_active_workflows: 활성 워크플로우 조회 (workflow_registry)
     resolve_active_workflow: 현재 활성 워크플로우 컨텍스트 반환
     resolve_work_dir: 단축 키로 workDir 경로 조회
     resolve_abs_work_dir: workDir 절대 경로 변환
@@ -22,7 +22,6 @@ import json
 import os
 import re
 import shutil
-import subprocess
 import sys
 import tempfile
 import time
@@ -52,14 +51,15 @@ from constants import (  # noqa: E402
     PHASE_COLORS,  # 하위 호환 re-export
     TS_PATTERN,
 )
+from root_cache import main_repo_root, settings_values  # noqa: E402
 
 
 def _detect_worktree_main_root(base: str) -> str:
     """워크트리 내부인지 판별하여 메인 프로젝트 루트 반환.
 
-    git rev-parse --git-common-dir로 .git 공통 디렉터리를 얻고,
-    그 부모 디렉터리가 base와 다르면 워크트리 내부로 판정하여
-    메인 리포 루트를 반환합니다.
+    git-common-dir의 부모 디렉터리가 base와 다르면 워크트리 내부로 판정하여
+    메인 리포 루트를 반환합니다. git-common-dir 해석은 root_cache가 캐시하므로
+    캐시가 유효하면 git을 호출하지 않습니다.
 
     Args:
         base: 후보 프로젝트 루트 경로 (절대 경로).
@@ -67,29 +67,7 @@ def _detect_worktree_main_root(base: str) -> str:
     Returns:
         메인 프로젝트 루트 절대 경로. git 실패 또는 워크트리 아니면 base 반환.
     """
-    # .claude-organic/.settings가 있으면 이미 메인 리포 루트 — git 호출 불필요
-    cw_dir = os.path.join(base, ".claude-organic")
-    if os.path.exists(os.path.join(cw_dir, ".settings")):
-        return base
-
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--path-format=absolute", "--git-common-dir"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            cwd=base,
-        )
-        if result.returncode == 0:
-            git_common = result.stdout.strip()
-            # git-common-dir은 메인 리포의 .git 디렉터리를 가리킴
-            main_root = os.path.dirname(git_common)
-            if main_root != base:
-                return main_root
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        pass
-
-    return base
+    return main_repo_root(base, require_settings=False)
 
 
 def resolve_project_root(start_path: str | None = None) -> str:
@@ -193,10 +171,11 @@ def scan_active_workflows(
     project_root: str | None = None,
     include_terminal: bool = False,
 ) -> dict[str, dict[str, str]]:
-    """.claude-organic/runs/ 디렉터리를 스캔하여 워크플로우 목록을 반환.
+    """활성 워크플로우 목록을 반환.
 
-    .claude-organic/runs/<YYYYMMDD-HHMMSS>/<workName>/<command>/ 구조를 순회하며
-    각 워크플로우의 status.json과 .context.json을 읽어 dict 형태로 반환.
+    활성 워크플로우는 workflow_registry 레지스트리에서 읽는다 (필요 시 자가 치유 재스캔).
+    include_terminal=True이면 .claude-organic/runs/<YYYYMMDD-HHMMSS>/<workName>/<command>/
+    구조를 모두 순회하며 각 워크플로우의 status.json과 .context.json을 읽는다.
     동일 entry에 복수 워크플로우가 있을 경우 updated_at 최신순으로 결정적 선택.
 
     Args:
@@ -211,64 +190,28 @@ def scan_active_workflows(
     if project_root is None:
         project_root = resolve_project_root()
 
-    from constants import TERMINAL_PHASES
-
-    workflow_root = os.path.join(project_root, ".claude-organic", "runs")
-    if not os.path.isdir(workflow_root):
-        return {}
-
-    result: dict[str, dict[str, str]] = {}
-    for entry in os.listdir(workflow_root):
-        if not TS_PATTERN.match(entry):
-            continue
-        entry_path = os.path.join(workflow_root, entry)
-        if not os.path.isdir(entry_path):
-            continue
-
-        # 중첩 구조: .claude-organic/runs/<YYYYMMDD-HHMMSS>/<workName>/<command>/
-        # 동일 entry에 복수 워크플로우가 있을 경우 updated_at 최신순으로 결정적 선택
-        candidates: list[dict[str, str]] = []
-        for work_name in sorted(os.listdir(entry_path)):
-            wn_path = os.path.join(entry_path, work_name)
-            if not os.path.isdir(wn_path) or work_name.startswith("."):
-                continue
-            for cmd_name in sorted(os.listdir(wn_path)):
-                cmd_path = os.path.join(wn_path, cmd_name)
-                if not os.path.isdir(cmd_path):
-                    continue
-
-                status_file = os.path.join(cmd_path, "status.json")
-                context_file = os.path.join(cmd_path, ".context.json")
+    import workflow_registry
 
-                status = load_json_file(status_file)
-                phase = (status.get("step") or status.get("phase", "NONE")) if isinstance(status, dict) else "NONE"
+    # 활성 워크플로우는 레지스트리에서 조회 (runs/ 전체 순회 없음), 터미널 포함 시에만 전체 스캔
+    if include_terminal:
+        items = workflow_registry.scan_runs(project_root, include_terminal=True)
+    else:
+        items = workflow_registry.entries(project_root)
 
-                if not include_terminal and phase in TERMINAL_PHASES:
-                    continue
+    # 동일 entry에 복수 워크플로우가 있을 경우 updated_at 최신순으로 결정적 선택
+    candidates: dict[str, list[dict[str, Any]]] = {}
+    for item in items:
+        candidates.setdefault(item["registry_key"], []).append(item)
 
-                ctx = load_json_file(context_file)
-                title = ctx.get("title", "") if isinstance(ctx, dict) else ""
-                command = ctx.get("command", "") if isinstance(ctx, dict) else ""
-                updated_at = status.get("updated_at", "") if isinstance(status, dict) else ""
-
-                rel_work_dir = os.path.join(".claude-organic", "runs", entry, work_name, cmd_name)
-                candidates.append({
-                    "title": title,
-                    "step": phase,
-                    "workDir": rel_work_dir,
-                    "command": command,
-                    "updated_at": updated_at,
-                })
-
-        if candidates:
-            # updated_at 기준 최신 항목 선택 (결정적 동작 보장)
-            best = max(candidates, key=lambda c: c["updated_at"])
-            result[entry] = {
-                "title": best["title"],
-                "step": best["step"],
-                "workDir": best["workDir"],
-                "command": best["command"],
-            }
+    result: dict[str, dict[str, str]] = {}
+    for entry, group in candidates.items():
+        best = max(group, key=lambda c: c["updated_at"])
+        result[entry] = {
+            "title": best["title"],
+            "step": best["step"],
+            "workDir": best["workDir"],
+            "command": best["command"],
+        }
 
     return result
 
@@ -511,6 +454,7 @@ def read_env(key: str, default: str = "", env_file: str | None = None) -> str:
     """.claude-organic/.settings에서 환경변수 읽기.
 
     중복 키 방어(첫 번째 매칭), 따옴표 제거, $HOME/~ 확장 포함.
+    파일 파싱 결과는 root_cache가 mtime 기준으로 캐시합니다.
 
     Args:
         key: 환경변수 키 이름.
@@ -521,30 +465,21 @@ def read_env(key: str, default: str = "", env_file: str | None = None) -> str:
         환경변수 값. 파일이 없거나 키가 없으면 default 반환.
     """
     resolved = _resolve_env_file(env_file)
-    if not resolved or not os.path.isfile(resolved):
+    values = settings_values(resolved) if resolved else None
+    if values is None or key not in values:
         return default
 
-    prefix = f"{key}="
-    try:
-        with open(resolved, "r", encoding="utf-8") as f:
-            for line in f:
-                stripped = line.strip()
-                if stripped.startswith(prefix):
-                    value = stripped[len(prefix):]
-                    if len(value) >= 2:
-                        if (value[0] == '"' and value[-1] == '"') or \
-                           (value[0] == "'" and value[-1] == "'"):
-                            value = value[1:-1]
-                    home = os.environ.get("HOME", "")
-                    if home:
-                        value = value.replace("$HOME", home)
-                        if value.startswith("~"):
-                            value = home + value[1:]
-                    return value
-    except (IOError, OSError):
-        pass
-
-    return default
+    value = values[key]
+    if len(value) >= 2:
+        if (value[0] == '"' and value[-1] == '"') or \
+           (value[0] == "'" and value[-1] == "'"):
+            value = value[1:-1]
+    home = os.environ.get("HOME", "")
+    if home:
+        value = value.replace("$HOME", home)
+        if value.startswith("~"):
+            value = home + value[1:]
+    return value
 
 
 # =============================================================================
@@ -400,11 +400,15 @@ def _tmux_kill_window(window_name: str) -> bool:
 
 
 def _tmux_create_window(window_name: str) -> bool:
-    """새 tmux 윈도우를 생성하고 claude를 실행한다. (폴백 전용)"""
-    from flow.session_identifier import MAIN_WINDOW_DEFAULT
+    """새 tmux 윈도우를 생성하고 claude를 실행한다. (폴백 전용)
+
+    생성된 pane id 와 서버 pid 를 받아 윈도우명을 session_identifier 캐시에 기록하므로,
+    새 pane 의 훅은 첫 세션 유형 조회부터 tmux 를 호출하지 않는다.
+    """
+    from flow.session_identifier import MAIN_WINDOW_DEFAULT, publish_window
 
     worktree_path = _get_worktree_path()
-    tmux_args = ["new-window", "-d", "-n", window_name]
+    tmux_args = ["new-window", "-d", "-P", "-F", "#{pane_id}\t#{pid}", "-n", window_name]
     if worktree_path:
         tmux_args.extend(["-c", worktree_path])
     tmux_args.extend(["-e", f"_WF_MAIN_WINDOW={os.environ.get('_WF_MAIN_WINDOW', MAIN_WINDOW_DEFAULT)}"])
@@ -416,10 +420,15 @@ def _tmux_create_window(window_name: str) -> bool:
 
     try:
         result = _run_tmux(*tmux_args)
-        return result.returncode == 0
     except Exception as e:
         _log("ERROR", f"tmux create_window failed: {e}")
         return False
+    if result.returncode != 0:
+        return False
+    pane_id, _, server_pid = result.stdout.strip().partition("\t")
+    if pane_id:
+        publish_window(pane_id, window_name, server_pid or None)
+    return True
 
 
 def _tmux_poll_for_prompt(window_name: str) -> bool:
@@ -32,7 +32,6 @@ from __future__ import annotations
 import json
 import os
 import re
-import subprocess
 import sys
 from datetime import datetime, timedelta, timezone
 from typing import Optional
@@ -129,7 +128,7 @@ def _resolve_project_root() -> str:
     이 파일 위치(flow/) -> scripts -> .claude -> project root 순으로
     상위 디렉터리를 탐색합니다. 서브에이전트 워크트리(.claude/worktrees/agent-*)
     에서 실행될 경우 __file__ 기반 4단계 탐색이 워크트리 내부 경로를 반환하므로,
-    git-common-dir 기반으로 메인 리포 루트를 재해석합니다.
+    git-common-dir 기반으로 메인 리포 루트를 재해석합니다 (root_cache가 캐시).
 
     Returns:
         프로젝트 루트 절대 경로.
@@ -143,34 +142,11 @@ def _resolve_project_root() -> str:
     claude_dir = os.path.dirname(scripts_dir)      # .claude-organic/
     candidate = os.path.dirname(claude_dir)        # <candidate>/
 
-    # .claude-organic/.settings가 있으면 메인 리포 루트 — 즉시 반환
-    cw_dir = os.path.join(candidate, ".claude-organic")
-    if os.path.exists(os.path.join(cw_dir, ".settings")):
-        return candidate
-
-    # 워크트리 내부일 수 있음 — git-common-dir로 메인 리포 탐색
-    # (dispatcher.py _find_project_root() 와 동일한 패턴)
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--path-format=absolute", "--git-common-dir"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            cwd=candidate,
-        )
-        if result.returncode == 0:
-            git_common = result.stdout.strip()
-            # git-common-dir은 메인 리포의 .git 디렉터리를 가리킴
-            main_root = os.path.dirname(git_common)
-            main_cw_dir = os.path.join(main_root, ".claude-organic")
-            if main_root != candidate and (
-                os.path.exists(os.path.join(main_cw_dir, ".settings"))
-            ):
-                return main_root
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        pass
-
-    return candidate
+    # .settings가 있으면 candidate, 워크트리면 git-common-dir 기반 메인 리포 (root_cache 캐시)
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    from root_cache import main_repo_root  # noqa: PLC0415
+    return main_repo_root(candidate)
 
 
 def _resolve_work_dir_from_key(
@@ -209,8 +185,8 @@ def _resolve_work_dir_from_key(
 def _resolve_from_active_workflows(project_root: str) -> Optional[str]:
     """활성 워크플로우를 스캔하여 abs_work_dir을 자동 선택한다.
 
-    .workflow/ 디렉터리에서 터미널 상태(DONE/FAILED/STALE/CANCELLED)가 아닌
-    워크플로우를 수집합니다. 단일 활성 워크플로우면 즉시 반환합니다.
+    활성 워크플로우 레지스트리(workflow_registry)에서 터미널 상태(DONE/FAILED/STALE/CANCELLED)가
+    아닌 워크플로우를 수집합니다. 단일 활성 워크플로우면 즉시 반환합니다.
     복수이면 CLAUDE_SESSION_ID 환경변수로 세션 소유 워크플로우를 먼저 식별하고,
     매칭 실패 시에만 updated_at 기준 최신 항목을 반환합니다.
 
@@ -220,54 +196,18 @@ def _resolve_from_active_workflows(project_root: str) -> Optional[str]:
     Returns:
         abs_work_dir 절대 경로. 활성 워크플로우가 없으면 None.
     """
-    workflow_root = os.path.join(project_root, ".claude-organic", "runs")
-    if not os.path.isdir(workflow_root):
-        return None
+    scripts_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    import workflow_registry  # noqa: PLC0415
 
-    _TERMINAL_PHASES = {"DONE", "FAILED", "STALE", "CANCELLED"}
-
-    # (abs_work_dir, updated_at, linked_sessions)
+    # (abs_work_dir, updated_at, linked_sessions) - 레지스트리에는 비터미널 워크플로우만 있다
     candidates: list[tuple[str, str, list]] = []
-
-    for entry in sorted(os.listdir(workflow_root)):
-        if not _TS_PATTERN.match(entry):
-            continue
-        entry_path = os.path.join(workflow_root, entry)
-        if not os.path.isdir(entry_path):
+    for item in workflow_registry.entries(project_root):
+        cmd_path = os.path.join(project_root, item["workDir"])
+        if not os.path.exists(os.path.join(cmd_path, "status.json")):
             continue
-
-        for work_name in sorted(os.listdir(entry_path)):
-            wn_path = os.path.join(entry_path, work_name)
-            if not os.path.isdir(wn_path) or work_name.startswith("."):
-                continue
-            for cmd_name in sorted(os.listdir(wn_path)):
-                cmd_path = os.path.join(wn_path, cmd_name)
-                if not os.path.isdir(cmd_path):
-                    continue
-
-                status_file = os.path.join(cmd_path, "status.json")
-                if not os.path.exists(status_file):
-                    continue
-
-                # status.json에서 phase, updated_at, linked_sessions 읽기
-                try:
-                    with open(status_file, "r", encoding="utf-8") as f:
-                        status = json.load(f)
-                except Exception:
-                    continue
-
-                if not isinstance(status, dict):
-                    continue
-
-                phase = status.get("step") or status.get("phase", "NONE")
-                if phase in _TERMINAL_PHASES:
-                    continue
-
-                updated_at = status.get("updated_at", "")
-                linked_sessions = status.get("linked_sessions", [])
-                if not isinstance(linked_sessions, list):
-                    linked_sessions = []
-                candidates.append((cmd_path, updated_at, linked_sessions))
+        candidates.append((cmd_path, item["updated_at"], item["linked_sessions"]))
 
     if not candidates:
         return None
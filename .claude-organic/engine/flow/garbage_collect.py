@@ -29,6 +29,7 @@ if _SCRIPTS_DIR not in sys.path:
 from constants import KST, ZOMBIE_TTL_HOURS, TERMINAL_STEPS, TERMINAL_PHASES
 from flow.cli_utils import build_common_epilog
 from flow.flow_logger import append_log, resolve_work_dir_for_logging
+import workflow_registry
 
 _KST = KST
 _TTL_HOURS = ZOMBIE_TTL_HOURS
@@ -97,6 +98,7 @@ def _process_status_file(status_file: str, status_dir: str, now: datetime) -> bo
                 "at": transition_time,
             })
             _atomic_write_json(status_file, data)
+            workflow_registry.record(status_dir)
             return True
 
         return False
@@ -0,0 +1,240 @@
+"""hook_spans.py - 훅/가드 지연 span 스풀.
+
+hooks/dispatcher.py 의 dispatch / dispatch_async / run_inline 과 evaluate_guard(s) 가
+남기는 타이밍 span 을 프로세스 내 버퍼에 모았다가, 훅 1회가 끝날 때
+일자별 스풀 파일에 한 번의 O_APPEND write 로 기록한다.
+워크플로우별 metrics.jsonl 과 달리 워크플로우 밖의 훅 호출도 모두 남는다.
+
+스풀 위치:
+    <project_root>/.claude-organic/logs/hook-spans/YYYYMMDD.jsonl
+    (``_WF_STATE_DIR`` 환경변수가 있으면 ``$_WF_STATE_DIR/logs/hook-spans/``)
+    새 날의 파일을 만들 때 최근 MAX_SCAN_DAYS 개를 넘는 오래된 파일은 지운다.
+
+span 필드 (한 줄 = JSON 객체 1개):
+    ts: 기록 시각 (epoch 초)
+    hook: 훅 이름 (pre-tool-use / post-tool-use / subagent-stop)
+    inv: 훅 호출 id (같은 호출의 span 을 묶는다)
+    tool: tool_name (없으면 빈 문자열)
+    kind: 'hook' | 'dispatch' | 'dispatch_async' | 'inline' | 'guard'
+    name: 대상 이름 (훅 이름, 스크립트/가드 이름)
+    total_ms: 전체 wall time
+    spawn_ms: (subprocess 만) Popen 반환까지의 시간
+    run_ms: (subprocess 만) spawn 이후 종료/stdin 전달까지의 시간
+    outcome: 가드 판정 또는 exit code 문자열
+    decided: 최종 판정을 낸 가드이면 True
+    cached: 판정 캐시에서 재사용된 가드이면 True
+
+집계는 engine/flow/metrics_cli.py 의 hook_latency_report() 가 담당한다.
+
+이 모듈은 상태 디렉터리 해석용 root_cache 외에 engine 의 다른 모듈을 import 하지 않는다.
+
+주요 함수:
+    begin: 훅 호출 시작 (버퍼 초기화)
+    set_tool: 현재 호출의 tool_name 지정
+    record: span 1개를 버퍼에 추가
+    flush: 버퍼를 스풀 파일에 기록
+    load_spans: 최근 스풀에서 span 을 읽는다
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Any
+
+import root_cache
+
+SPOOL_DIRNAME: str = 'hook-spans'
+
+# load_spans() 가 최근 호출을 찾기 위해 거슬러 읽는 최대 일수 (스풀 파일 보존 개수)
+MAX_SCAN_DAYS: int = 14
+
+_LOCK = threading.Lock()
+_BUFFER: list[dict[str, Any]] = []
+_CONTEXT: dict[str, str] = {'hook': '', 'inv': '', 'tool': ''}
+
+
+def spool_dir(project_root: str) -> str:
+    """스풀 디렉터리 경로를 반환한다.
+
+    Args:
+        project_root: 메인 리포 루트.
+
+    Returns:
+        ``<state_dir>/logs/hook-spans`` (기본 ``<project_root>/.claude-organic/logs/hook-spans``)
+    """
+    base = root_cache.state_dir(os.path.join(project_root, '.claude-organic'))
+    return os.path.join(base, 'logs', SPOOL_DIRNAME)
+
+
+def spool_path(project_root: str, ts: float | None = None) -> str:
+    """ts (기본 현재 시각) 가 속한 날의 스풀 파일 경로를 반환한다."""
+    day = time.strftime('%Y%m%d', time.localtime(time.time() if ts is None else ts))
+    return os.path.join(spool_dir(project_root), f'{day}.jsonl')
+
+
+def begin(hook: str) -> None:
+    """훅 호출 1회를 시작한다. 이전 호출의 미기록 span 은 버린다.
+
+    Args:
+        hook: 훅 이름 (예: pre-tool-use).
+    """
+    with _LOCK:
+        _BUFFER.clear()
+        _CONTEXT.update(hook=hook, inv=uuid.uuid4().hex[:12], tool='')
+
+
+def set_tool(tool_name: str) -> None:
+    """현재 호출의 tool_name 을 지정한다 (이후 record() 되는 span 에 붙는다)."""
+    _CONTEXT['tool'] = tool_name or ''
+
+
+def record(
+    kind: str,
+    name: str,
+    total_ms: float,
+    *,
+    spawn_ms: float | None = None,
+    run_ms: float | None = None,
+    outcome: str = '',
+    decided: bool = False,
+    cached: bool = False,
+) -> None:
+    """span 1개를 버퍼에 추가한다. begin() 전이면 무시한다.
+
+    Args:
+        kind: 'hook' | 'dispatch' | 'dispatch_async' | 'inline' | 'guard'.
+        name: 대상 이름.
+        total_ms: 전체 wall time (밀리초).
+        spawn_ms: subprocess 생성 시간 (밀리초).
+        run_ms: subprocess 실행 시간 (밀리초).
+        outcome: 판정/exit code 문자열.
+        decided: 최종 판정을 낸 가드이면 True.
+        cached: 판정 캐시 재사용이면 True.
+    """
+    if not _CONTEXT['inv']:
+        return
+    span: dict[str, Any] = {
+        'ts': round(time.time(), 3),
+        'hook': _CONTEXT['hook'],
+        'inv': _CONTEXT['inv'],
+        'tool': _CONTEXT['tool'],
+        'kind': kind,
+        'name': name,
+        'total_ms': round(total_ms, 2),
+    }
+    if spawn_ms is not None:
+        span['spawn_ms'] = round(spawn_ms, 2)
+    if run_ms is not None:
+        span['run_ms'] = round(run_ms, 2)
+    if outcome:
+        span['outcome'] = outcome
+    if decided:
+        span['decided'] = True
+    if cached:
+        span['cached'] = True
+    with _LOCK:
+        _BUFFER.append(span)
+
+
+def flush(project_root: str) -> int:
+    """버퍼의 span 을 오늘 스풀 파일에 한 번의 append 로 기록한다. 실패는 무시한다.
+
+    Args:
+        project_root: 메인 리포 루트.
+
+    Returns:
+        기록한 span 수.
+    """
+    with _LOCK:
+        spans = list(_BUFFER)
+        _BUFFER.clear()
+        _CONTEXT.update(hook='', inv='', tool='')
+    if not spans:
+        return 0
+    data = ''.join(json.dumps(s, ensure_ascii=False, separators=(',', ':')) + '\n' for s in spans)
+    path = spool_path(project_root)
+    is_new = not os.path.exists(path)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, data.encode('utf-8'))
+        finally:
+            os.close(fd)
+    except OSError:
+        return 0
+    if is_new:
+        _prune_spools(os.path.dirname(path))
+    return len(spans)
+
+
+def _prune_spools(directory: str) -> None:
+    """최근 MAX_SCAN_DAYS 개를 넘는 오래된 일자별 스풀 파일을 지운다."""
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith('.jsonl'))
+    except OSError:
+        return
+    for name in names[:-MAX_SCAN_DAYS]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            pass
+
+
+def _read_spool(path: str) -> list[dict[str, Any]]:
+    """스풀 파일 1개를 읽는다 (깨진 줄은 건너뛴다)."""
+    spans: list[dict[str, Any]] = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    span = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(span, dict):
+                    spans.append(span)
+    except OSError:
+        pass
+    return spans
+
+
+def load_spans(project_root: str, last: int) -> list[dict[str, Any]]:
+    """최근 last 번의 훅 호출에 속한 span 을 시간순으로 반환한다.
+
+    최신 스풀 파일부터 거슬러 읽으며 (최대 MAX_SCAN_DAYS 개), 호출 수가 채워지면 멈춘다.
+
+    Args:
+        project_root: 메인 리포 루트.
+        last: 최근 훅 호출 수 (0 이하이면 빈 목록).
+
+    Returns:
+        span dict 목록.
+    """
+    if last <= 0:
+        return []
+    try:
+        files = sorted(
+            (name for name in os.listdir(spool_dir(project_root)) if name.endswith('.jsonl')),
+            reverse=True,
+        )[:MAX_SCAN_DAYS]
+    except OSError:
+        return []
+    chunks: list[list[dict[str, Any]]] = []
+    invocations: list[str] = []
+    seen: set[str] = set()
+    for name in files:
+        spans = _read_spool(os.path.join(spool_dir(project_root), name))
+        chunks.append(spans)
+        for span in reversed(spans):
+            inv = span.get('inv')
+            if span.get('kind') == 'hook' and inv and inv not in seen:
+                seen.add(inv)
+                invocations.append(inv)
+        if len(invocations) >= last:
+            break
+    keep = set(invocations[:last])
+    return [s for spans in reversed(chunks) for s in spans if s.get('inv') in keep]
@@ -64,6 +64,7 @@ _PROJECT_ROOT: str = resolve_project_root()
 
 from constants import KST, KEEP_COUNT, VALID_COMMANDS, VALID_MODES, WORK_NAME_MAX_LEN, parse_chain_command, CHAIN_SEPARATOR
 from flow.flow_logger import append_log as _append_log
+import workflow_registry
 
 
 # ─── 유틸리티 ────────────────────────────────────────────────────────────────
@@ -761,6 +762,7 @@ def init_workflow(
         original_branch=original_branch,
     )
     _write_status(abs_work_dir, mode, ts)
+    workflow_registry.record(abs_work_dir)
 
     # 좀비 워크플로우 정리
     _run_optional_script(
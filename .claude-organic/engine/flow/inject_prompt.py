@@ -7,7 +7,8 @@ tmux 윈도우 이름(P:T-* 여부)으로 워크플로우 세션 여부를 판
 (메인 세션 정책은 CLAUDE.md + .claude/rules/workflow.md 가 담당한다.)
 
 동작:
-  - TMUX_PANE 환경변수가 있으면 tmux display-message로 현재 윈도우 이름을 조회한다.
+  - TMUX_PANE 환경변수가 있으면 session_identifier 가 현재 윈도우 이름을 조회한다
+    (pane 별 윈도우명 캐시 적중 시 tmux display-message 를 실행하지 않는다).
   - 윈도우 이름이 P:T- 접두사로 시작하면 .claude-organic/prompts/system-prompt-wf.xml을 출력한다.
   - 그 외(메인 세션 또는 비tmux 환경)이면 아무것도 출력하지 않고 exit 0으로 종료한다.
   - 대상 파일이 존재하지 않으면 에러 없이 exit 0으로 종료한다.
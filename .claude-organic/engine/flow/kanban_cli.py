@@ -8,6 +8,7 @@ kanban.py에서 분리되었으며, ticket_repository.py와 ticket_state.py에 
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import re
 import subprocess
@@ -39,7 +40,6 @@ from flow.ticket_repository import (
 from flow.ticket_state import (
     COLUMN_MAP,
     update_ticket_status,
-    validate_transition,
 )
 from flow.prompt_validator import validate as prompt_validate
 from constants import QUALITY_THRESHOLD
@@ -70,189 +70,24 @@ W05 테스트에서 ``from flow.kanban_cli import _CONFLICT_SIGNAL_RE`` 로 직
 """
 
 
-# ─── 세션 헬퍼 ───────────────────────────────────────────────────────────────
+# ─── 칸반 서비스 ─────────────────────────────────────────────────────────────
+# 상태 전이 / 세션 종료 / 워크트리 정리는 kanban_service 가 담당한다 (Board 서버와 공유).
 
-import json
-import urllib.request
-
-_TMUX_WINDOW_PREFIX: str = "P:"
-
-
-def _resolve_server_port() -> "int | None":
-    """서버 포트를 해석한다.
-
-    _WF_SERVER_PORT 환경변수 또는 .claude-organic/.board.url 파일에서 포트를 추출한다.
-
-    Returns:
-        포트 번호(int) 또는 None (해석 불가 시).
-    """
-    # 1) 환경변수 우선
-    port_env = os.environ.get("_WF_SERVER_PORT")
-    if port_env:
-        try:
-            return int(port_env)
-        except ValueError:
-            pass
-
-    # 2) .board.url 파일 파싱: http://127.0.0.1:PORT/board
-    board_url_path = os.path.join(_PROJECT_ROOT, ".claude-organic", ".board.url")
-    try:
-        with open(board_url_path, "r", encoding="utf-8") as f:
-            url = f.read().strip()
-        # http://127.0.0.1:PORT/... 형식에서 PORT 추출
-        if "://" in url:
-            host_part = url.split("://", 1)[1]  # 127.0.0.1:PORT/...
-            host_port = host_part.split("/")[0]  # 127.0.0.1:PORT
-            if ":" in host_port:
-                return int(host_port.split(":")[1])
-    except (OSError, ValueError):
-        pass
-
-    return None
-
-
-def _kill_ticket_session(ticket_number: str) -> None:
-    """활성 세션에서 해당 티켓의 워크플로우 세션을 종료한다.
-
-    HTTP API(서버 기동 중)를 통해 세션을 종료하고,
-    서버 미기동 시 tmux kill-window 폴백을 사용한다.
-    상태 전이 성공 후에만 호출되어야 한다.
-
-    Args:
-        ticket_number: 티켓 번호 (T-NNN 형식).
-    """
-    port = _resolve_server_port()
-
-    if port is not None:
-        # HTTP API 경로: 세션 목록 조회 후 ticket_id 매칭 세션 kill
-        try:
-            list_url = f"http://127.0.0.1:{port}/terminal/workflow/list"
-            req = urllib.request.Request(list_url, method="GET")
-            with urllib.request.urlopen(req, timeout=5) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-
-            sessions = data if isinstance(data, list) else data.get("sessions", [])
-            session_id = None
-            for session in sessions:
-                if session.get("ticket_id") == ticket_number or session.get("ticket") == ticket_number:
-                    session_id = session.get("session_id") or session.get("id")
-                    break
-
-            if session_id:
-                kill_url = f"http://127.0.0.1:{port}/terminal/workflow/kill"
-                kill_body = json.dumps({"session_id": session_id}).encode("utf-8")
-                kill_req = urllib.request.Request(
-                    kill_url,
-                    data=kill_body,
-                    headers={"Content-Type": "application/json"},
-                    method="POST",
-                )
-                with urllib.request.urlopen(kill_req, timeout=5) as kill_resp:
-                    kill_resp.read()
-                log("INFO", f"kanban.py: http kill session_id={session_id} ({ticket_number})")
-            else:
-                log("INFO", f"kanban.py: no active session found for {ticket_number}")
-            return
-        except Exception:
-            # HTTP 오류는 상태 전이와 무관하므로 무시하고 반환
-            return
-
-    # 포트 미해석 시 tmux 폴백 (하위호환)
-    if not os.environ.get("TMUX"):
-        return
-
-    window_name = f"{_TMUX_WINDOW_PREFIX}{ticket_number}"
-
-    try:
-        # 윈도우 존재 여부 확인
-        list_result = subprocess.run(
-            ["tmux", "list-windows", "-F", "#W"],
-            capture_output=True,
-            text=True,
-        )
-        if list_result.returncode != 0:
-            return
-        existing_windows = list_result.stdout.strip().splitlines()
-        if window_name not in existing_windows:
-            return
-
-        # 윈도우 인덱스 조회 (P:T-NNN의 콜론이 세션:윈도우로 오해석되는 문제 방지)
-        idx_result = subprocess.run(
-            ["tmux", "list-windows", "-F", "#{window_index}\t#{window_name}"],
-            capture_output=True,
-            text=True,
-        )
-        target = window_name  # 폴백
-        if idx_result.returncode == 0:
-            for line in idx_result.stdout.strip().splitlines():
-                parts = line.split("\t", 1)
-                if len(parts) == 2 and parts[1] == window_name:
-                    target = parts[0]
-                    break
-
-        subprocess.run(
-            ["tmux", "kill-window", "-t", target],
-            capture_output=True,
-        )
-        log("INFO", f"kanban.py: tmux kill-window {window_name}")
-    except Exception:
-        # tmux 오류는 상태 전이와 무관하므로 무시
-        pass
-
-
-def _cleanup_worktree_on_leave(ticket_number: str) -> None:
-    """In Progress에서 이탈할 때 연결된 워크트리를 자동 정리한다.
-
-    워크트리 비활성 환경이거나 해당 티켓의 워크트리가 없으면 조용히 건너뛴다.
-    미커밋 변경이 있는 경우 데이터 손실을 막기 위해 정리를 skip 하고
-    사용자에게 경로를 명시한다 (T-411: 워커 commit 누락 / finalization 실패 시
-    워크트리 자동 삭제로 인한 작업물 영구 손실 차단).
-    정리 실패 시 경고만 출력하고 예외를 전파하지 않는다 (상태 전이 차단 금지).
-
-    Args:
-        ticket_number: 티켓 번호 (T-NNN 형식).
-    """
-    try:
-        from flow.worktree_manager import (
-            is_worktree_enabled,
-            get_worktree_path,
-            has_uncommitted_changes,
-            remove_worktree,
-        )
-
-        if not is_worktree_enabled():
-            return
+from flow.kanban_service import (  # noqa: E402
+    KanbanError,
+    delete_ticket,
+    move_ticket,
+    ticket_lock,
+)
 
-        wt_path = get_worktree_path(ticket_number)
-        if not wt_path:
-            return
 
-        if has_uncommitted_changes(wt_path):
-            log(
-                "WARN",
-                f"kanban.py: worktree 정리 skip — 미커밋 변경 보존 ({ticket_number}, path={wt_path})",
-            )
-            print(
-                f"[WARN] {ticket_number} 워크트리에 미커밋 변경 있음 — 자동 정리 skip",
-                flush=True,
-            )
-            print(f"[WARN] 경로: {wt_path}", flush=True)
-            print(
-                "[WARN] 검토 후 수동으로 commit / 폐기: "
-                f"`git -C {wt_path} status`",
-                flush=True,
-            )
-            return
-
-        success = remove_worktree(ticket_number, delete_branch=True)
-        if success:
-            log("INFO", f"kanban.py: worktree 자동 정리 완료 ({ticket_number})")
-        else:
-            print(f"[WARN] {ticket_number} 워크트리 정리 실패 (계속 진행)", flush=True)
-    except ImportError:
-        pass  # worktree 모듈 미설치 시 무시 (하위 호환)
-    except Exception as e:
-        print(f"[WARN] {ticket_number} 워크트리 정리 중 오류 (계속 진행): {e}", flush=True)
+def _with_ticket_lock(func):
+    """첫 인자(티켓 번호)의 ticket_lock 안에서 서브커맨드를 실행하는 데코레이터."""
+    @functools.wraps(func)
+    def wrapper(ticket_number: str, *args, **kwargs):
+        with ticket_lock(ticket_number):
+            return func(ticket_number, *args, **kwargs)
+    return wrapper
 
 
 # ─── 서브커맨드 구현 ─────────────────────────────────────────────────────────
@@ -343,6 +178,7 @@ def cmd_move(ticket_number: str, target_key: str, force: bool = False) -> None:
 
     허용 상태 전이 규칙을 검증하고, 위반 시 에러를 출력한다.
     --force 플래그가 있으면 규칙을 무시하고 강제 이동한다.
+    구현은 kanban_service.move_ticket 에 위임한다 (Board 서버와 공유).
 
     Args:
         ticket_number: 이동할 티켓 번호 (T-NNN 형식).
@@ -352,98 +188,10 @@ def cmd_move(ticket_number: str, target_key: str, force: bool = False) -> None:
     Raises:
         SystemExit: 티켓이 없거나 전이 규칙 위반 시.
     """
-    target_section = COLUMN_MAP.get(target_key)
-    if target_section is None:
-        err(f"잘못된 대상 컬럼: '{target_key}'. 허용값: {', '.join(COLUMN_MAP.keys())}")
-
-    ticket_file = find_ticket_file(ticket_number)
-    if ticket_file is None:
-        err(f"{ticket_number} 티켓 파일을 찾을 수 없습니다")
-
-    ticket_data = parse_ticket_xml(ticket_file)
-    current_section = ticket_data["status"]
-
-    # 상태 전이 규칙 검증 (validate_transition 사용)
-    validation_error = validate_transition(current_section, target_section, force)
-    if validation_error is not None:
-        if validation_error == "":
-            # 이미 같은 상태
-            print(f"{ticket_number}은 이미 {target_section} 상태입니다.")
-            return
-        err(
-            f"{ticket_number}은 {validation_error}"
-        )
-
-    # validate_transition 통과 후, 실제 쓰기 전 파일 존재 재검증 (레이스 컨디션 방어)
-    if not os.path.isfile(ticket_file):
-        # 다른 세션이 이미 파일을 이동했을 수 있음 — 대상 디렉터리에서 재탐색
-        refreshed = find_ticket_file(ticket_number)
-        if refreshed is None:
-            err(f"{ticket_number} 티켓 파일이 이동 중 소실되었습니다 (레이스 컨디션)")
-        # 재탐색된 파일로 상태 재확인
-        refreshed_data = parse_ticket_xml(refreshed)
-        if refreshed_data["status"] == target_section:
-            print(f"{ticket_number}은 이미 {target_section} 상태입니다. (다른 세션에서 처리됨)")
-            return
-        # 다른 상태로 이동된 경우 ticket_file 갱신 후 전이 규칙 재검증
-        ticket_file = refreshed
-        current_section = refreshed_data["status"]
-        validation_error = validate_transition(current_section, target_section, force)
-        if validation_error is not None:
-            if validation_error == "":
-                print(f"{ticket_number}은 이미 {target_section} 상태입니다.")
-                return
-            err(f"{ticket_number}은 {validation_error}")
-
-    # XML <status> 갱신
-    try:
-        update_ticket_status(ticket_file, target_section)
-    except FileNotFoundError:
-        # write_ticket_xml이 파일 소실을 감지 — 재탐색 후 멱등성 확인
-        refreshed = find_ticket_file(ticket_number)
-        if refreshed is None:
-            err(f"{ticket_number} 티켓 파일이 상태 갱신 중 소실되었습니다 (레이스 컨디션)")
-        refreshed_data = parse_ticket_xml(refreshed)
-        if refreshed_data["status"] == target_section:
-            print(f"{ticket_number}은 이미 {target_section} 상태입니다. (다른 세션에서 처리됨)")
-            return
-        err(f"{ticket_number} 상태 갱신 중 파일 소실 감지. 현재 상태: {refreshed_data['status']}")
-
-    # 상태에 대응하는 디렉터리로 파일 이동
     try:
-        new_path = move_ticket_to_status_dir(ticket_file, target_section)
-        if new_path != ticket_file:
-            src_rel = os.path.relpath(ticket_file, _PROJECT_ROOT)
-            dst_rel = os.path.relpath(new_path, _PROJECT_ROOT)
-            print(f"파일 이동: {src_rel} → {dst_rel}")
-        ticket_file = new_path
-    except FileNotFoundError:
-        # 이동 중 파일 소실 — 이미 이동된 경우 정상 처리
-        refreshed = find_ticket_file(ticket_number)
-        if refreshed is not None:
-            refreshed_data = parse_ticket_xml(refreshed)
-            if refreshed_data["status"] == target_section:
-                print(f"{ticket_number}은 이미 {target_section} 상태입니다. (다른 세션에서 처리됨)")
-                return
-        err(f"{ticket_number} 파일 이동 중 소실 감지")
-    except OSError as e:
-        err(f"티켓 파일 이동 실패: {e}")
-
-    print(f"{ticket_number}: {current_section} → {target_section}")
-    log("INFO", f"kanban.py: move {ticket_number} {current_section} → {target_section}")
-
-    # In Progress에서 이탈 시 워크트리 자동 정리
-    # T-370 정합: Review 전이는 worktree 유지 (cmd_done 의 merge_to_develop 가 정리 진입점).
-    # In Progress → Open(재작업) / To Do(강등) 전이에서만 자동 정리.
-    if current_section == "In Progress" and target_section != "Review":
-        _cleanup_worktree_on_leave(ticket_number)
-
-    # Open 전이 시 세션 자동 kill:
-    # In Progress에서 Open으로 복귀하면 해당 티켓의 활성 세션을 종료한다.
-    # T-399: Submit transient 단계 제거, In Progress 만 검사한다.
-    # 상태 전이 성공 후에 실행하므로 전이 실패 시(err() 호출 후 SystemExit) 여기에 도달하지 않는다.
-    if target_section == "Open" and current_section == "In Progress":
-        _kill_ticket_session(ticket_number)
+        move_ticket(ticket_number, target_key, force=force)
+    except KanbanError as e:
+        err(str(e), e.code)
 
 
 def cmd_done(ticket_number: str) -> None:
@@ -521,12 +269,14 @@ def cmd_done(ticket_number: str) -> None:
                     print(f"{ticket_number}: {merge_result.merged_branch} -> develop 병합 완료 ({merge_result.merge_commit[:8]})", flush=True)
                     log("INFO", f"kanban.py: worktree merge {merge_result.merged_branch} -> develop ({merge_result.merge_commit[:8]})")
                     # T-905: merge_commit SHA 를 result 메타에 저장 (Done 롤백 인프라)
+                    # (XML read-modify-write 이므로 Board 서버 쓰기와 같은 티켓 잠금 안에서 수행)
                     if merge_result.merge_commit:
                         try:
-                            _ticket_file_for_result = find_ticket_file(ticket_number)
-                            if _ticket_file_for_result is not None:
-                                update_result(_ticket_file_for_result, {"merge_commit": merge_result.merge_commit})
-                                log("INFO", f"kanban.py: result.merge_commit 저장 ({merge_result.merge_commit[:8]})")
+                            with ticket_lock(ticket_number):
+                                _ticket_file_for_result = find_ticket_file(ticket_number)
+                                if _ticket_file_for_result is not None:
+                                    update_result(_ticket_file_for_result, {"merge_commit": merge_result.merge_commit})
+                                    log("INFO", f"kanban.py: result.merge_commit 저장 ({merge_result.merge_commit[:8]})")
                         except Exception as _ur_err:
                             print(f"[WARN] result.merge_commit 저장 실패 (계속 진행): {_ur_err}", flush=True)
     except ImportError:
@@ -534,26 +284,28 @@ def cmd_done(ticket_number: str) -> None:
     except Exception as _wt_err:
         print(f"[WARN] worktree 병합 처리 중 오류 (계속 진행): {_wt_err}", flush=True)
 
-    ticket_file = find_ticket_file(ticket_number)
-    if ticket_file is None:
-        err(f"{ticket_number} 티켓 파일을 찾을 수 없습니다")
+    # 상태 갱신 + 파일 이동은 Board 서버의 카드 이동과 같은 티켓 잠금으로 직렬화
+    with ticket_lock(ticket_number):
+        ticket_file = find_ticket_file(ticket_number)
+        if ticket_file is None:
+            err(f"{ticket_number} 티켓 파일을 찾을 수 없습니다")
 
-    ticket_data = parse_ticket_xml(ticket_file)
-    current_section = ticket_data["status"]
-
-    # XML <status> Done으로 갱신
-    update_ticket_status(ticket_file, "Done")
-
-    # 파일을 kanban/done/T-NNN.xml로 이동
-    if os.path.isfile(ticket_file):
-        try:
-            new_path = move_ticket_to_status_dir(ticket_file, "Done")
-            if new_path != ticket_file:
-                src_rel = os.path.relpath(ticket_file, _PROJECT_ROOT)
-                dst_rel = os.path.relpath(new_path, _PROJECT_ROOT)
-                print(f"파일 이동: {src_rel} → {dst_rel}")
-        except OSError as e:
-            err(f"티켓 파일 이동 실패: {e}")
+        ticket_data = parse_ticket_xml(ticket_file)
+        current_section = ticket_data["status"]
+
+        # XML <status> Done으로 갱신
+        update_ticket_status(ticket_file, "Done")
+
+        # 파일을 kanban/done/T-NNN.xml로 이동
+        if os.path.isfile(ticket_file):
+            try:
+                new_path = move_ticket_to_status_dir(ticket_file, "Done")
+                if new_path != ticket_file:
+                    src_rel = os.path.relpath(ticket_file, _PROJECT_ROOT)
+                    dst_rel = os.path.relpath(new_path, _PROJECT_ROOT)
+                    print(f"파일 이동: {src_rel} → {dst_rel}")
+            except OSError as e:
+                err(f"티켓 파일 이동 실패: {e}")
 
     print(f"{ticket_number}: {current_section} → Done")
     log("INFO", f"kanban.py: done {ticket_number} {current_section} → Done")
@@ -563,6 +315,7 @@ def cmd_delete(ticket_number: str) -> None:
     """티켓 XML 파일을 삭제한다.
 
     Done과 달리 히스토리를 보존하지 않고 파일을 삭제한다.
+    구현은 kanban_service.delete_ticket 에 위임한다.
 
     Args:
         ticket_number: 삭제할 티켓 번호 (T-NNN 형식).
@@ -570,18 +323,13 @@ def cmd_delete(ticket_number: str) -> None:
     Raises:
         SystemExit: 티켓을 찾을 수 없는 경우.
     """
-    ticket_file = find_ticket_file(ticket_number)
-    if ticket_file is None:
-        err(f"{ticket_number} 티켓을 찾을 수 없습니다")
-
     try:
-        os.remove(ticket_file)
-    except OSError as e:
-        err(f"티켓 파일 삭제 실패: {e}")
-
-    print(f"{ticket_number}: 삭제됨")
+        delete_ticket(ticket_number)
+    except KanbanError as e:
+        err(str(e), e.code)
 
 
+@_with_ticket_lock
 def cmd_update_title(ticket_number: str, title: str) -> None:
     """티켓 XML의 <title> 요소를 갱신한다.
 
@@ -622,6 +370,7 @@ def cmd_update_title(ticket_number: str, title: str) -> None:
     print(f"{ticket_number}: 제목 → {title}")
 
 
+@_with_ticket_lock
 def cmd_set_editing(ticket_number: str, value: bool) -> None:
     """티켓 XML의 <metadata> 내부에 <editing> 요소를 생성(없으면) 또는 갱신한다.
 
@@ -657,6 +406,7 @@ def cmd_set_editing(ticket_number: str, value: bool) -> None:
     print(f"{ticket_number}: editing → {editing_elem.text} ({flag_str})")
 
 
+@_with_ticket_lock
 def cmd_update_prompt(
     ticket_number: str,
     command: str = "",
@@ -751,6 +501,7 @@ def cmd_update_prompt(
         _sys.exit(1)
 
 
+@_with_ticket_lock
 def cmd_update_result(
     ticket_number: str,
     registrykey: str = "",
@@ -932,6 +683,7 @@ def _apply_relation(
     fn(target_file, reverse_type, source_ticket)
 
 
+@_with_ticket_lock
 def cmd_link(
     ticket_number: str,
     depends_on: str = "",
@@ -973,6 +725,7 @@ def cmd_link(
     log("INFO", f"kanban.py: link {ticket_number} {', '.join(applied)}")
 
 
+@_with_ticket_lock
 def cmd_unlink(
     ticket_number: str,
     depends_on: str = "",
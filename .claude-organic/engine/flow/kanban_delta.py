@@ -0,0 +1,242 @@
+"""kanban_delta.py - UserPromptSubmit 칸반 컨텍스트 변경분 주입 상태.
+
+inject_kanban_context.py 가 매 turn 전체 스냅샷을 주입하는 대신, 세션별로 직전에 주입한
+보드 뷰를 기억해 두고 이후 turn 에는 변경분(티켓 추가/이동/완료/제목 변경, 세션 시작/종료)이나
+"변경 없음" 한 줄만 주입하도록 한다.
+
+상태 파일:
+    <project_root>/.claude-organic/logs/kanban-context/<session_id>.json
+    {"version", "digest", "since_full", "view": {"counts", "tickets", "sessions"}}
+
+전체 스냅샷 재주입 조건:
+    - 세션의 첫 turn (상태 파일 없음)
+    - 직전 전체 주입 이후 full_every turn 경과
+    - 컨텍스트 압축/초기화 (session-start 훅이 source=compact/clear 에서 reset() 호출)
+    - 변경 항목이 MAX_DELTA_ITEMS 를 넘을 때
+
+주요 함수:
+    make_view: 스냅샷 → 비교용 뷰
+    diff_views: 두 뷰의 변경분
+    advance: 이번 turn 의 주입 모드 결정 + 상태 기록
+    reset: 세션 상태 삭제
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Any
+
+STATE_DIRNAME: str = "kanban-context"
+
+# 상태 포맷 버전 (뷰 필드 변경 시 증가 → 다음 turn 전체 재주입)
+STATE_VERSION: int = 1
+
+# 기본 전체 재주입 주기 (turn)
+DEFAULT_FULL_EVERY: int = 10
+
+# 변경 항목이 이보다 많으면 변경분 대신 전체 스냅샷을 주입한다
+MAX_DELTA_ITEMS: int = 20
+
+# 이 시간(초) 동안 갱신되지 않은 세션 상태 파일은 새 세션 상태 기록 시 정리한다
+STATE_TTL_SECONDS: int = 7 * 24 * 3600
+
+MODE_FULL: str = "full"
+MODE_DELTA: str = "delta"
+MODE_UNCHANGED: str = "unchanged"
+
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def state_dir(project_root: str) -> str:
+    """세션 상태 디렉터리 경로를 반환한다."""
+    return os.path.join(project_root, ".claude-organic", "logs", STATE_DIRNAME)
+
+
+def state_path(project_root: str, session_id: str) -> str:
+    """세션 상태 파일 경로를 반환한다 (session_id 는 파일명 안전 문자로 치환)."""
+    name = _UNSAFE_RE.sub("_", session_id)[:100] or "_"
+    return os.path.join(state_dir(project_root), f"{name}.json")
+
+
+# ── 뷰 / 변경분 ──────────────────────────────────────────────────────────────
+
+def make_view(snapshot: dict[str, Any]) -> dict[str, Any]:
+    """kanban_snapshot 스냅샷에서 변경분 비교용 뷰를 만든다.
+
+    Args:
+        snapshot: kanban_snapshot.load() 결과.
+
+    Returns:
+        {"counts": {col: N},
+         "tickets": {"T-NNN": [column, title]},
+         "sessions": {key: {"ticket", "command", "started_at"}}}
+    """
+    kanban = snapshot.get("kanban") or {}
+    titles = {d.get("number", ""): d.get("title", "") for d in kanban.get("details") or []}
+    tickets = {
+        number: [col, titles.get(number, "")]
+        for number, col in sorted((kanban.get("columns") or {}).items())
+    }
+    sessions: dict[str, dict[str, str]] = {}
+    for s in snapshot.get("sessions") or []:
+        key = s.get("file") or f"{s.get('ticket', '')}:{s.get('command', '')}:{s.get('started_at', '')}"
+        sessions[key] = {
+            "ticket": s.get("ticket", ""),
+            "command": s.get("command", ""),
+            "started_at": s.get("started_at", ""),
+        }
+    return {"counts": dict(kanban.get("counts") or {}), "tickets": tickets, "sessions": sessions}
+
+
+def view_digest(view: dict[str, Any]) -> str:
+    """뷰의 sha1 digest."""
+    raw = json.dumps(view, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def diff_views(prev: dict[str, Any], cur: dict[str, Any]) -> dict[str, list[Any]]:
+    """두 뷰의 변경분을 계산한다.
+
+    Args:
+        prev: 직전에 주입한 뷰.
+        cur: 현재 뷰.
+
+    Returns:
+        {"added": [(number, column, title)],
+         "moved": [(number, from_column, to_column, title)],
+         "renamed": [(number, old_title, new_title)],
+         "removed": [number],
+         "sessions_started": [session], "sessions_stopped": [session]}
+    """
+    before: dict[str, list[str]] = prev.get("tickets") or {}
+    after: dict[str, list[str]] = cur.get("tickets") or {}
+    added = [(n, col, title) for n, (col, title) in after.items() if n not in before]
+    moved = [
+        (n, before[n][0], col, title or before[n][1])
+        for n, (col, title) in after.items()
+        if n in before and before[n][0] != col
+    ]
+    # 같은 컬럼에 남은 티켓의 제목 변경 (제목도 digest 에 들어가므로 변경분에 보고한다)
+    renamed = [
+        (n, before[n][1], title)
+        for n, (col, title) in after.items()
+        if n in before and before[n][0] == col and before[n][1] != title
+    ]
+    removed = [n for n in before if n not in after]
+
+    prev_sessions: dict[str, dict[str, str]] = prev.get("sessions") or {}
+    cur_sessions: dict[str, dict[str, str]] = cur.get("sessions") or {}
+    return {
+        "added": added,
+        "moved": moved,
+        "renamed": renamed,
+        "removed": removed,
+        "sessions_started": [s for k, s in cur_sessions.items() if k not in prev_sessions],
+        "sessions_stopped": [s for k, s in prev_sessions.items() if k not in cur_sessions],
+    }
+
+
+# ── 세션 상태 ────────────────────────────────────────────────────────────────
+
+def _load_state(path: str) -> dict[str, Any] | None:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        return None
+    return state
+
+
+def _prune(directory: str, keep: str) -> None:
+    """STATE_TTL_SECONDS 동안 갱신되지 않은 다른 세션 상태 파일을 지운다."""
+    cutoff = time.time() - STATE_TTL_SECONDS
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+    for name in names:
+        path = os.path.join(directory, name)
+        if path == keep or not name.endswith(".json"):
+            continue
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def _save_state(path: str, state: dict[str, Any], is_new: bool) -> None:
+    """상태를 원자적으로 기록한다. 실패는 무시한다."""
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".kanban-context-", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        return
+    if is_new:
+        _prune(directory, path)
+
+
+def advance(
+    project_root: str,
+    session_id: str,
+    view: dict[str, Any],
+    full_every: int = DEFAULT_FULL_EVERY,
+) -> tuple[str, dict[str, list[Any]] | None]:
+    """이번 turn 의 주입 모드를 정하고 세션 상태를 갱신한다.
+
+    Args:
+        project_root: 메인 리포 루트.
+        session_id: UserPromptSubmit 페이로드의 session_id.
+        view: make_view() 결과.
+        full_every: 직전 전체 주입 이후 이 turn 수가 지나면 다시 전체 주입.
+
+    Returns:
+        (MODE_FULL | MODE_DELTA | MODE_UNCHANGED, MODE_DELTA 일 때 diff_views() 결과).
+    """
+    path = state_path(project_root, session_id)
+    state = _load_state(path)
+    digest = view_digest(view)
+    since_full = int(state.get("since_full", 0)) + 1 if state else 0
+
+    mode = MODE_FULL
+    changes: dict[str, list[Any]] | None = None
+    if state is not None and since_full < max(1, full_every):
+        if state.get("digest") == digest:
+            mode = MODE_UNCHANGED
+        else:
+            changes = diff_views(state.get("view") or {}, view)
+            if sum(len(v) for v in changes.values()) <= MAX_DELTA_ITEMS:
+                mode = MODE_DELTA
+            else:
+                changes = None
+
+    _save_state(
+        path,
+        {
+            "version": STATE_VERSION,
+            "digest": digest,
+            "since_full": 0 if mode == MODE_FULL else since_full,
+            "view": view,
+        },
+        is_new=state is None,
+    )
+    return mode, changes
+
+
+def reset(project_root: str, session_id: str) -> None:
+    """세션 상태를 지워 다음 turn 에 전체 스냅샷을 주입하게 한다."""
+    try:
+        os.remove(state_path(project_root, session_id))
+    except OSError:
+        pass
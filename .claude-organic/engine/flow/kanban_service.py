@@ -0,0 +1,506 @@
+"""kanban_service.py - 칸반 티켓 상태 전이 서비스 계층.
+
+flow-kanban CLI(kanban_cli.cmd_*)와 Board 서버 핸들러가 공통으로 사용하는 in-process
+서비스이다. 카드 이동마다 인터프리터를 새로 띄우지 않도록 Board 프로세스 안에서 직접
+호출할 수 있게 만들었으며, CLI 는 이 서비스를 감싸는 얇은 front-end 이다.
+
+- 실패는 ``sys.exit`` 대신 :class:`KanbanError` 로 알린다 (CLI 는 ``err()`` 로 변환).
+- 사용자 메시지는 ``emit`` 콜백으로 내보낸다 (CLI 는 stdout, Board 는 응답 본문).
+- 티켓 XML read-modify-write 는 :func:`ticket_lock` 으로 직렬화한다. 같은 프로세스의
+  스레드 간에는 티켓별 RLock, 프로세스 간(CLI ↔ Board)에는
+  ``.claude-organic/.kanban-locks/T-NNN.lock`` 파일 잠금(flock)을 사용한다
+  (``_WF_STATE_DIR`` 환경변수가 있으면 그 아래 ``.kanban-locks/``).
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import subprocess
+import threading
+import urllib.request
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from flow import ticket_repository
+from flow.ticket_repository import (
+    find_ticket_file,
+    move_ticket_to_status_dir,
+    parse_ticket_xml,
+    log,
+)
+from flow.ticket_state import (
+    COLUMN_MAP,
+    update_ticket_status,
+    validate_transition,
+)
+from common import resolve_project_root
+import root_cache
+
+# ─── 경로 상수 ───────────────────────────────────────────────────────────────
+
+_PROJECT_ROOT: str = resolve_project_root()
+
+# 티켓별 잠금 파일 디렉터리 이름 (.claude-organic/ 하위, 티켓 디렉터리 mtime 을 건드리지 않도록 밖에 둔다)
+LOCK_DIR_NAME: str = ".kanban-locks"
+
+_TMUX_WINDOW_PREFIX: str = "P:"
+
+Emit = Callable[[str], None]
+SessionKiller = Callable[[str], bool]
+
+# Board 서버처럼 세션 레지스트리를 가진 프로세스가 등록하는 in-process 세션 종료 함수
+_session_killer: SessionKiller | None = None
+
+
+def _print(message: str) -> None:
+    """기본 emit: stdout 즉시 출력."""
+    print(message, flush=True)
+
+
+# ─── 예외 ────────────────────────────────────────────────────────────────────
+
+
+class KanbanError(Exception):
+    """칸반 서비스 오류.
+
+    Attributes:
+        code: CLI 종료 코드 (기본 1)
+    """
+
+    def __init__(self, message: str, code: int = 1) -> None:
+        super().__init__(message)
+        self.code: int = code
+
+
+# ─── 티켓 잠금 ───────────────────────────────────────────────────────────────
+
+_locks_guard: threading.Lock = threading.Lock()
+_thread_locks: dict[str, threading.RLock] = {}
+_held: threading.local = threading.local()
+
+
+def lock_dir() -> str:
+    """티켓 잠금 파일 디렉터리 경로 (.claude-organic/.kanban-locks, _WF_STATE_DIR 로 대체 가능)."""
+    return os.path.join(root_cache.state_dir(os.path.dirname(ticket_repository.KANBAN_DIR)), LOCK_DIR_NAME)
+
+
+@contextmanager
+def ticket_lock(ticket_number: str) -> Iterator[None]:
+    """티켓 1건의 XML read-modify-write 구간을 직렬화한다.
+
+    같은 스레드에서는 재진입할 수 있다 (바깥 잠금만 파일 잠금을 잡는다).
+    잠금 파일을 만들 수 없는 환경이면 프로세스 내부 잠금만 적용한다.
+
+    Args:
+        ticket_number: 티켓 번호 (T-NNN 형식).
+    """
+    with _locks_guard:
+        rlock = _thread_locks.setdefault(ticket_number, threading.RLock())
+    with rlock:
+        depth: dict[str, int] = _held.__dict__.setdefault("depth", {})
+        if depth.get(ticket_number):
+            depth[ticket_number] += 1
+            try:
+                yield
+            finally:
+                depth[ticket_number] -= 1
+            return
+
+        fd: int | None = None
+        try:
+            os.makedirs(lock_dir(), exist_ok=True)
+            fd = os.open(os.path.join(lock_dir(), f"{ticket_number}.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        except OSError:
+            if fd is not None:
+                os.close(fd)
+            fd = None
+        depth[ticket_number] = 1
+        try:
+            yield
+        finally:
+            depth[ticket_number] = 0
+            if fd is not None:
+                os.close(fd)
+
+
+# ─── 세션 / 워크트리 헬퍼 ─────────────────────────────────────────────────────
+
+
+def set_session_killer(killer: SessionKiller | None) -> None:
+    """in-process 세션 종료 함수를 등록한다.
+
+    Board 서버는 자신의 워크플로우 세션 레지스트리를 직접 조회/종료하는 함수를 등록한다.
+    등록되어 있으면 :func:`_kill_ticket_session` 이 HTTP 로 자기 자신을 호출하지 않는다.
+
+    Args:
+        killer: 티켓 번호를 받아 세션을 종료하고 종료 여부를 반환하는 함수. None 이면 해제.
+    """
+    global _session_killer
+    _session_killer = killer
+
+
+def _resolve_server_port() -> "int | None":
+    """서버 포트를 해석한다.
+
+    _WF_SERVER_PORT 환경변수 또는 .claude-organic/.board.url 파일에서 포트를 추출한다.
+
+    Returns:
+        포트 번호(int) 또는 None (해석 불가 시).
+    """
+    # 1) 환경변수 우선
+    port_env = os.environ.get("_WF_SERVER_PORT")
+    if port_env:
+        try:
+            return int(port_env)
+        except ValueError:
+            pass
+
+    # 2) .board.url 파일 파싱: http://127.0.0.1:PORT/board
+    board_url_path = os.path.join(_PROJECT_ROOT, ".claude-organic", ".board.url")
+    try:
+        with open(board_url_path, "r", encoding="utf-8") as f:
+            url = f.read().strip()
+        # http://127.0.0.1:PORT/... 형식에서 PORT 추출
+        if "://" in url:
+            host_part = url.split("://", 1)[1]  # 127.0.0.1:PORT/...
+            host_port = host_part.split("/")[0]  # 127.0.0.1:PORT
+            if ":" in host_port:
+                return int(host_port.split(":")[1])
+    except (OSError, ValueError):
+        pass
+
+    return None
+
+
+def _kill_ticket_session(ticket_number: str) -> None:
+    """활성 세션에서 해당 티켓의 워크플로우 세션을 종료한다.
+
+    HTTP API(서버 기동 중)를 통해 세션을 종료하고,
+    서버 미기동 시 tmux kill-window 폴백을 사용한다.
+    상태 전이 성공 후에만 호출되어야 한다.
+
+    in-process 세션 종료 함수가 등록되어 있으면(Board 서버 안에서 호출) 그것을 사용한다.
+
+    Args:
+        ticket_number: 티켓 번호 (T-NNN 형식).
+    """
+    if _session_killer is not None:
+        try:
+            if _session_killer(ticket_number):
+                log("INFO", f"kanban.py: in-process kill session ({ticket_number})")
+            else:
+                log("INFO", f"kanban.py: no active session found for {ticket_number}")
+        except Exception:
+            # 세션 종료 오류는 상태 전이와 무관하므로 무시
+            pass
+        return
+
+    port = _resolve_server_port()
+
+    if port is not None:
+        # HTTP API 경로: 세션 목록 조회 후 ticket_id 매칭 세션 kill
+        try:
+            list_url = f"http://127.0.0.1:{port}/terminal/workflow/list"
+            req = urllib.request.Request(list_url, method="GET")
+            with urllib.request.urlopen(req, timeout=5) as resp:
+                data = json.loads(resp.read().decode("utf-8"))
+
+            sessions = data if isinstance(data, list) else data.get("sessions", [])
+            session_id = None
+            for session in sessions:
+                if session.get("ticket_id") == ticket_number or session.get("ticket") == ticket_number:
+                    session_id = session.get("session_id") or session.get("id")
+                    break
+
+            if session_id:
+                kill_url = f"http://127.0.0.1:{port}/terminal/workflow/kill"
+                kill_body = json.dumps({"session_id": session_id}).encode("utf-8")
+                kill_req = urllib.request.Request(
+                    kill_url,
+                    data=kill_body,
+                    headers={"Content-Type": "application/json"},
+                    method="POST",
+                )
+                with urllib.request.urlopen(kill_req, timeout=5) as kill_resp:
+                    kill_resp.read()
+                log("INFO", f"kanban.py: http kill session_id={session_id} ({ticket_number})")
+            else:
+                log("INFO", f"kanban.py: no active session found for {ticket_number}")
+            return
+        except Exception:
+            # HTTP 오류는 상태 전이와 무관하므로 무시하고 반환
+            return
+
+    # 포트 미해석 시 tmux 폴백 (하위호환)
+    if not os.environ.get("TMUX"):
+        return
+
+    window_name = f"{_TMUX_WINDOW_PREFIX}{ticket_number}"
+
+    try:
+        # 윈도우 존재 여부 확인
+        list_result = subprocess.run(
+            ["tmux", "list-windows", "-F", "#W"],
+            capture_output=True,
+            text=True,
+        )
+        if list_result.returncode != 0:
+            return
+        existing_windows = list_result.stdout.strip().splitlines()
+        if window_name not in existing_windows:
+            return
+
+        # 윈도우 인덱스 조회 (P:T-NNN의 콜론이 세션:윈도우로 오해석되는 문제 방지)
+        idx_result = subprocess.run(
+            ["tmux", "list-windows", "-F", "#{window_index}\t#{window_name}"],
+            capture_output=True,
+            text=True,
+        )
+        target = window_name  # 폴백
+        if idx_result.returncode == 0:
+            for line in idx_result.stdout.strip().splitlines():
+                parts = line.split("\t", 1)
+                if len(parts) == 2 and parts[1] == window_name:
+                    target = parts[0]
+                    break
+
+        subprocess.run(
+            ["tmux", "kill-window", "-t", target],
+            capture_output=True,
+        )
+        log("INFO", f"kanban.py: tmux kill-window {window_name}")
+    except Exception:
+        # tmux 오류는 상태 전이와 무관하므로 무시
+        pass
+
+
+def _cleanup_worktree_on_leave(ticket_number: str, emit: Emit = _print) -> None:
+    """In Progress에서 이탈할 때 연결된 워크트리를 자동 정리한다.
+
+    워크트리 비활성 환경이거나 해당 티켓의 워크트리가 없으면 조용히 건너뛴다.
+    미커밋 변경이 있는 경우 데이터 손실을 막기 위해 정리를 skip 하고
+    사용자에게 경로를 명시한다 (T-411: 워커 commit 누락 / finalization 실패 시
+    워크트리 자동 삭제로 인한 작업물 영구 손실 차단).
+    정리 실패 시 경고만 출력하고 예외를 전파하지 않는다 (상태 전이 차단 금지).
+
+    Args:
+        ticket_number: 티켓 번호 (T-NNN 형식).
+        emit: 사용자 메시지 출력 콜백.
+    """
+    try:
+        from flow.worktree_manager import (
+            is_worktree_enabled,
+            get_worktree_path,
+            has_uncommitted_changes,
+            remove_worktree,
+        )
+
+        if not is_worktree_enabled():
+            return
+
+        wt_path = get_worktree_path(ticket_number)
+        if not wt_path:
+            return
+
+        if has_uncommitted_changes(wt_path):
+            log(
+                "WARN",
+                f"kanban.py: worktree 정리 skip — 미커밋 변경 보존 ({ticket_number}, path={wt_path})",
+            )
+            emit(f"[WARN] {ticket_number} 워크트리에 미커밋 변경 있음 — 자동 정리 skip")
+            emit(f"[WARN] 경로: {wt_path}")
+            emit(
+                "[WARN] 검토 후 수동으로 commit / 폐기: "
+                f"`git -C {wt_path} status`"
+            )
+            return
+
+        success = remove_worktree(ticket_number, delete_branch=True)
+        if success:
+            log("INFO", f"kanban.py: worktree 자동 정리 완료 ({ticket_number})")
+        else:
+            emit(f"[WARN] {ticket_number} 워크트리 정리 실패 (계속 진행)")
+    except ImportError:
+        pass  # worktree 모듈 미설치 시 무시 (하위 호환)
+    except Exception as e:
+        emit(f"[WARN] {ticket_number} 워크트리 정리 중 오류 (계속 진행): {e}")
+
+
+# ─── 서비스 ──────────────────────────────────────────────────────────────────
+
+
+def _already(ticket_number: str, target_section: str, emit: Emit, suffix: str = "") -> dict[str, Any]:
+    emit(f"{ticket_number}은 이미 {target_section} 상태입니다.{suffix}")
+    return {"ticket": ticket_number, "from": target_section, "to": target_section, "changed": False}
+
+
+def _read_ticket(ticket_number: str, ticket_file: str) -> dict[str, Any]:
+    """parse_ticket_xml 의 err()(SystemExit) 를 KanbanError 로 변환한다.
+
+    Board 프로세스 안에서 호출되므로 손상된 티켓 XML 이 서버를 종료시키면 안 된다.
+    """
+    try:
+        return parse_ticket_xml(ticket_file)
+    except SystemExit as e:
+        raise KanbanError(f"{ticket_number} 티켓 파일 파싱 실패 ({ticket_file})") from e
+
+
+def _transition(ticket_number: str, target_section: str, force: bool, emit: Emit) -> dict[str, Any]:
+    """ticket_lock 보유 상태에서 상태 전이 + 파일 이동을 수행한다."""
+    ticket_file = find_ticket_file(ticket_number)
+    if ticket_file is None:
+        raise KanbanError(f"{ticket_number} 티켓 파일을 찾을 수 없습니다")
+
+    ticket_data = _read_ticket(ticket_number, ticket_file)
+    current_section = ticket_data["status"]
+
+    # 상태 전이 규칙 검증 (validate_transition 사용)
+    validation_error = validate_transition(current_section, target_section, force)
+    if validation_error is not None:
+        if validation_error == "":
+            # 이미 같은 상태
+            return _already(ticket_number, target_section, emit)
+        raise KanbanError(f"{ticket_number}은 {validation_error}")
+
+    # validate_transition 통과 후, 실제 쓰기 전 파일 존재 재검증 (다른 프로세스의 잠금 밖 쓰기 방어)
+    if not os.path.isfile(ticket_file):
+        # 다른 세션이 이미 파일을 이동했을 수 있음 — 대상 디렉터리에서 재탐색
+        refreshed = find_ticket_file(ticket_number)
+        if refreshed is None:
+            raise KanbanError(f"{ticket_number} 티켓 파일이 이동 중 소실되었습니다 (레이스 컨디션)")
+        # 재탐색된 파일로 상태 재확인
+        refreshed_data = _read_ticket(ticket_number, refreshed)
+        if refreshed_data["status"] == target_section:
+            return _already(ticket_number, target_section, emit, " (다른 세션에서 처리됨)")
+        # 다른 상태로 이동된 경우 ticket_file 갱신 후 전이 규칙 재검증
+        ticket_file = refreshed
+        current_section = refreshed_data["status"]
+        validation_error = validate_transition(current_section, target_section, force)
+        if validation_error is not None:
+            if validation_error == "":
+                return _already(ticket_number, target_section, emit)
+            raise KanbanError(f"{ticket_number}은 {validation_error}")
+
+    # XML <status> 갱신 (update_ticket_status 는 파싱 실패 시 err() 로 종료하므로 변환)
+    try:
+        update_ticket_status(ticket_file, target_section)
+    except SystemExit as e:
+        raise KanbanError(f"{ticket_number} 티켓 파일 파싱 실패 ({ticket_file})") from e
+    except FileNotFoundError:
+        # write_ticket_xml이 파일 소실을 감지 — 재탐색 후 멱등성 확인
+        refreshed = find_ticket_file(ticket_number)
+        if refreshed is None:
+            raise KanbanError(f"{ticket_number} 티켓 파일이 상태 갱신 중 소실되었습니다 (레이스 컨디션)")
+        refreshed_data = _read_ticket(ticket_number, refreshed)
+        if refreshed_data["status"] == target_section:
+            return _already(ticket_number, target_section, emit, " (다른 세션에서 처리됨)")
+        raise KanbanError(f"{ticket_number} 상태 갱신 중 파일 소실 감지. 현재 상태: {refreshed_data['status']}")
+
+    # 상태에 대응하는 디렉터리로 파일 이동
+    try:
+        new_path = move_ticket_to_status_dir(ticket_file, target_section)
+        if new_path != ticket_file:
+            src_rel = os.path.relpath(ticket_file, _PROJECT_ROOT)
+            dst_rel = os.path.relpath(new_path, _PROJECT_ROOT)
+            emit(f"파일 이동: {src_rel} → {dst_rel}")
+        ticket_file = new_path
+    except FileNotFoundError:
+        # 이동 중 파일 소실 — 이미 이동된 경우 정상 처리
+        refreshed = find_ticket_file(ticket_number)
+        if refreshed is not None:
+            refreshed_data = _read_ticket(ticket_number, refreshed)
+            if refreshed_data["status"] == target_section:
+                return _already(ticket_number, target_section, emit, " (다른 세션에서 처리됨)")
+        raise KanbanError(f"{ticket_number} 파일 이동 중 소실 감지")
+    except OSError as e:
+        raise KanbanError(f"티켓 파일 이동 실패: {e}") from e
+
+    emit(f"{ticket_number}: {current_section} → {target_section}")
+    log("INFO", f"kanban.py: move {ticket_number} {current_section} → {target_section}")
+    return {
+        "ticket": ticket_number,
+        "from": current_section,
+        "to": target_section,
+        "changed": True,
+        "path": ticket_file,
+    }
+
+
+def move_ticket(
+    ticket_number: str,
+    target_key: str,
+    force: bool = False,
+    emit: Emit = _print,
+) -> dict[str, Any]:
+    """티켓 상태를 변경한다.
+
+    허용 상태 전이 규칙을 검증하고, 위반 시 KanbanError 를 발생시킨다.
+    force 가 True 이면 규칙을 무시하고 강제 이동한다. XML 갱신과 파일 이동은
+    ticket_lock 안에서 수행하고, 워크트리 정리 / 세션 종료는 잠금 해제 후 수행한다.
+
+    Args:
+        ticket_number: 이동할 티켓 번호 (T-NNN 형식).
+        target_key: 대상 컬럼 키 (todo/open/progress/review/done).
+        force: 강제 이동 여부.
+        emit: 사용자 메시지 출력 콜백.
+
+    Returns:
+        {"ticket", "from", "to", "changed"[, "path"]} dict. 이미 대상 상태이면 changed=False.
+
+    Raises:
+        KanbanError: 대상 컬럼이 잘못됐거나, 티켓이 없거나, 전이 규칙 위반 시.
+    """
+    target_section = COLUMN_MAP.get(target_key)
+    if target_section is None:
+        raise KanbanError(f"잘못된 대상 컬럼: '{target_key}'. 허용값: {', '.join(COLUMN_MAP.keys())}")
+
+    with ticket_lock(ticket_number):
+        result = _transition(ticket_number, target_section, force, emit)
+    if not result["changed"]:
+        return result
+
+    current_section = result["from"]
+    # In Progress에서 이탈 시 워크트리 자동 정리
+    # T-370 정합: Review 전이는 worktree 유지 (cmd_done 의 merge_to_develop 가 정리 진입점).
+    # In Progress → Open(재작업) / To Do(강등) 전이에서만 자동 정리.
+    if current_section == "In Progress" and target_section != "Review":
+        _cleanup_worktree_on_leave(ticket_number, emit)
+
+    # Open 전이 시 세션 자동 kill:
+    # In Progress에서 Open으로 복귀하면 해당 티켓의 활성 세션을 종료한다.
+    # T-399: Submit transient 단계 제거, In Progress 만 검사한다.
+    # 상태 전이 성공 후에 실행하므로 전이 실패 시(KanbanError) 여기에 도달하지 않는다.
+    if target_section == "Open" and current_section == "In Progress":
+        _kill_ticket_session(ticket_number)
+    return result
+
+
+def delete_ticket(ticket_number: str, emit: Emit = _print) -> dict[str, Any]:
+    """티켓 XML 파일을 삭제한다.
+
+    Done과 달리 히스토리를 보존하지 않고 파일을 삭제한다.
+
+    Args:
+        ticket_number: 삭제할 티켓 번호 (T-NNN 형식).
+        emit: 사용자 메시지 출력 콜백.
+
+    Returns:
+        {"ticket", "path"} dict.
+
+    Raises:
+        KanbanError: 티켓을 찾을 수 없거나 삭제에 실패한 경우.
+    """
+    with ticket_lock(ticket_number):
+        ticket_file = find_ticket_file(ticket_number)
+        if ticket_file is None:
+            raise KanbanError(f"{ticket_number} 티켓을 찾을 수 없습니다")
+        try:
+            os.remove(ticket_file)
+        except OSError as e:
+            raise KanbanError(f"티켓 파일 삭제 실패: {e}") from e
+
+    emit(f"{ticket_number}: 삭제됨")
+    return {"ticket": ticket_number, "path": ticket_file}
@@ -0,0 +1,423 @@
+"""kanban_snapshot.py - UserPromptSubmit 컨텍스트용 칸반/세션 스냅샷.
+
+inject_kanban_context.py 가 사용자 turn 마다 티켓 디렉터리 전체를 glob 하고 XML 헤더를
+파싱하며 ``flow-sessions --json`` 을 spawn 하던 작업을, 미리 계산해 둔 스냅샷 파일
+하나를 읽는 것으로 대체한다.
+
+스냅샷 파일:
+    <project_root>/.claude-organic/.kanban-snapshot.json (``_WF_STATE_DIR`` 이 있으면 그 아래)
+    {"version", "validators": {"dirs": [...]},
+     "kanban": {"counts": {...}, "details": [...], "columns": {...}},
+     "sessions": [{"ticket", "command", "started_at", "status", "registry_key"}, ...],
+     "session_files": {실행 중 세션 파일명: 마지막으로 읽은 크기},
+     "ended_files": {종료된 세션 파일명: 종료 마커까지 읽은 크기}}
+
+갱신 시점:
+    - 티켓 쓰기/이동: ticket_repository.write_ticket_xml / move_ticket_to_status_dir 가
+      refresh_for_ticket() 으로 칸반 부분만 즉시 재생성한다 (세션 jsonl 은 읽지 않는다).
+    - 세션 시작/중지: flow-stop 이 마커 기록 후 refresh() 를 호출한다.
+    - 그 외 경로(보드 UI 의 티켓 이동, 보드가 띄운 세션의 생성/종료)는 load() 가 검증한다.
+      티켓 컬럼 디렉터리와 .workflow-sessions 디렉터리의 mtime 이 바뀌면 전체 재생성하고,
+      실행 중 세션의 jsonl 은 마지막으로 읽은 위치 이후에 추가된 바이트만 읽어
+      종료 마커(process_exit / stopped_by_flow_stop)를 찾는다.
+    - 재생성 시에도 이전 스냅샷의 읽은 위치를 이어 쓰고, 종료된 세션 파일(ended_files)은
+      다시 읽지 않는다. 디렉터리에서 사라진 세션 파일은 목록에서 정리된다.
+
+주요 함수:
+    snapshot_path: 스냅샷 파일 경로
+    collect_kanban_summary: 칸반 컬럼별 카운트 + Open/In Progress/Review 상세
+    build_snapshot: 스냅샷 dict 생성 (파일 기록 없음)
+    refresh: 스냅샷 재생성 + 원자적 기록
+    refresh_kanban: 칸반 부분만 재생성 + 원자적 기록
+    refresh_for_ticket: 티켓 파일 경로로 프로젝트를 찾아 refresh_kanban
+    load: 검증 후 스냅샷 반환 (필요 시 갱신)
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+from typing import Any
+
+import root_cache
+
+SNAPSHOT_FILENAME: str = ".kanban-snapshot.json"
+
+# 스냅샷 포맷 버전 (필드 변경 시 증가 → 기존 스냅샷 재생성)
+SNAPSHOT_VERSION: int = 3
+
+# 칸반 컬럼 (표시 순서)
+COLUMNS: tuple[str, ...] = ("open", "progress", "review", "todo", "done")
+
+# 상세(ID/제목/상태)를 수집하는 컬럼 — todo/done 은 카운트만
+DETAIL_COLUMNS: tuple[str, ...] = ("open", "progress", "review")
+
+# 세션 jsonl 의 종료 마커 subtype
+_EXIT_SUBTYPES: tuple[str, ...] = ("process_exit", "stopped_by_flow_stop")
+
+
+def snapshot_path(project_root: str) -> str:
+    """스냅샷 파일 경로를 반환한다."""
+    return os.path.join(root_cache.state_dir(os.path.join(project_root, ".claude-organic")), SNAPSHOT_FILENAME)
+
+
+def _tickets_dir(project_root: str) -> str:
+    return os.path.join(project_root, ".claude-organic", "tickets")
+
+
+def _sessions_dir(project_root: str) -> str:
+    return os.path.join(project_root, ".claude-organic", ".workflow-sessions")
+
+
+def _dir_validators(project_root: str) -> list[int]:
+    """티켓 컬럼 디렉터리 + 세션 디렉터리의 mtime_ns 목록 (없으면 0)."""
+    paths = [os.path.join(_tickets_dir(project_root), col) for col in COLUMNS]
+    paths.append(_sessions_dir(project_root))
+    result: list[int] = []
+    for path in paths:
+        try:
+            result.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            result.append(0)
+    return result
+
+
+# ── 칸반 요약 ────────────────────────────────────────────────────────────────
+
+def parse_ticket_header(xml_path: str) -> dict[str, str] | None:
+    """XML 파일에서 metadata 필드만 빠르게 추출한다.
+
+    ET.iterparse를 사용하여 metadata 섹션 파싱 후 조기 중단.
+    입력/출력:
+        xml_path: T-NNN.xml 절대경로
+        return: {"number": "T-NNN", "title": "...", "status": "..."} 또는 None
+    """
+    try:
+        fields: dict[str, str] = {}
+        target_tags = {"number", "title", "status"}
+        context = ET.iterparse(xml_path, events=("end",))
+        for _event, elem in context:
+            tag = elem.tag
+            if tag in target_tags:
+                text = (elem.text or "").strip()
+                if text:
+                    fields[tag] = text
+                # 세 필드 모두 모으면 조기 중단
+                if len(fields) >= 3:
+                    break
+            # metadata 닫힘 태그 이후는 불필요 — 조기 중단
+            if tag == "metadata" and len(fields) >= 1:
+                break
+        if "number" not in fields:
+            return None
+        return fields
+    except Exception:
+        return None
+
+
+def collect_kanban_summary(project_root: str) -> dict[str, Any]:
+    """칸반 컬럼별 티켓 요약을 수집한다.
+
+    open/progress/review 컬럼은 ID + 제목 + status 추출.
+    todo/done 컬럼은 카운트만 반환 (페이로드 부피 절감).
+    columns 는 전 컬럼 티켓의 위치 (파일명 기준, 변경분 주입 시 이동/완료 판별용).
+
+    입력: project_root — 메인 리포 루트 경로
+    출력: {
+        "counts": {"open": N, "progress": M, "review": K, "todo": A, "done": B},
+        "details": [{"number": "T-NNN", "title": "...", "status": "...", "column": "open"}, ...],
+        "columns": {"T-NNN": "open", ...}
+    }
+    """
+    tickets_dir = _tickets_dir(project_root)
+    counts: dict[str, int] = {}
+    details: list[dict[str, str]] = []
+    columns: dict[str, str] = {}
+
+    for col in COLUMNS:
+        col_dir = os.path.join(tickets_dir, col)
+        if not os.path.isdir(col_dir):
+            counts[col] = 0
+            continue
+
+        xml_files = glob.glob(os.path.join(col_dir, "T-*.xml"))
+        counts[col] = len(xml_files)
+        for xml_path in xml_files:
+            columns[os.path.basename(xml_path)[:-4]] = col
+
+        if col not in DETAIL_COLUMNS:
+            continue
+
+        for xml_path in sorted(xml_files):
+            header = parse_ticket_header(xml_path)
+            if header:
+                details.append({
+                    "number": header.get("number", ""),
+                    "title": header.get("title", ""),
+                    "status": header.get("status", ""),
+                    "column": col,
+                })
+
+    return {"counts": counts, "details": details, "columns": columns}
+
+
+# ── 활성 세션 ────────────────────────────────────────────────────────────────
+
+def _scan_session(path: str, offset: int) -> tuple[bool, int]:
+    """세션 jsonl 의 offset 이후 구간에서 종료 마커를 찾는다.
+
+    Returns:
+        (종료 마커 발견 여부, 읽은 뒤의 파일 크기). 읽기 실패 시 (False, offset).
+    """
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except OSError:
+        return False, offset
+    # 마지막 줄이 아직 기록 중이면 다음 번에 다시 읽도록 완결된 줄까지만 소비한다
+    end = data.rfind(b"\n") + 1
+    for line in data[:end].splitlines():
+        if b'"subtype"' not in line:
+            continue
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(event, dict) and event.get("subtype") in _EXIT_SUBTYPES:
+            return True, offset + end
+    return False, offset + end
+
+
+def _session_meta(path: str) -> dict[str, Any] | None:
+    """세션 jsonl 첫 줄의 _meta 블록을 읽는다."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            first = json.loads(f.readline() or "null")
+    except (OSError, ValueError):
+        return None
+    if not isinstance(first, dict):
+        return None
+    meta = first.get("_meta")
+    return meta if isinstance(meta, dict) else first
+
+
+def _collect_sessions(
+    project_root: str,
+    previous: dict[str, Any] | None = None,
+) -> tuple[list[dict[str, str]], dict[str, int], dict[str, int]]:
+    """실행 중 워크플로우 세션 목록과 각 jsonl 의 읽은 크기를 수집한다.
+
+    previous 스냅샷이 있으면 실행 중이던 세션은 마지막으로 읽은 위치 이후만 읽고,
+    종료된 세션 파일은 열지 않는다.
+
+    Args:
+        project_root: 메인 리포 루트.
+        previous: 이전 스냅샷 (없으면 모든 세션 파일을 처음부터 읽는다).
+
+    Returns:
+        (실행 중 세션 목록, {실행 중 파일명: 읽은 크기}, {종료된 파일명: 읽은 크기}).
+    """
+    sessions_dir = _sessions_dir(project_root)
+    try:
+        names = sorted(n for n in os.listdir(sessions_dir) if n.endswith(".jsonl"))
+    except OSError:
+        return [], {}, {}
+    previous = previous or {}
+    prev_files: dict[str, int] = previous.get("session_files") or {}
+    prev_ended: dict[str, int] = previous.get("ended_files") or {}
+    prev_sessions = {s.get("file"): s for s in previous.get("sessions") or []}
+    sessions: list[dict[str, str]] = []
+    files: dict[str, int] = {}
+    ended: dict[str, int] = {}
+    for name in names:
+        if name in prev_ended:
+            ended[name] = prev_ended[name]
+            continue
+        path = os.path.join(sessions_dir, name)
+        session = prev_sessions.get(name)
+        offset = prev_files.get(name, 0) if session else 0
+        if session is None:
+            meta = _session_meta(path)
+            if meta is None:
+                continue
+            session = {
+                "ticket": str(meta.get("ticket_id") or meta.get("ticket") or ""),
+                "command": str(meta.get("command") or ""),
+                "started_at": str(meta.get("created_at") or ""),
+                "status": "running",
+                "registry_key": str(meta.get("registry_key") or ""),
+                "file": name,
+            }
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            continue
+        stopped = False
+        if size != offset:
+            stopped, offset = _scan_session(path, offset if size > offset else 0)
+        if stopped:
+            ended[name] = offset
+            continue
+        sessions.append(session)
+        files[name] = offset
+    sessions.sort(key=lambda s: s.get("started_at", ""))
+    return sessions, files, ended
+
+
+def _advance_sessions(project_root: str, snapshot: dict[str, Any]) -> bool:
+    """실행 중 세션 jsonl 의 추가분만 읽어 종료된 세션을 제거한다.
+
+    Returns:
+        스냅샷이 바뀌었으면 True.
+    """
+    files: dict[str, int] = snapshot.get("session_files") or {}
+    ended_files: dict[str, int] = snapshot.get("ended_files") or {}
+    changed = False
+    ended: set[str] = set()
+    for name, offset in list(files.items()):
+        path = os.path.join(_sessions_dir(project_root), name)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            ended.add(name)
+            continue
+        if size == offset:
+            continue
+        stopped, new_offset = _scan_session(path, offset if size > offset else 0)
+        if stopped:
+            ended.add(name)
+            ended_files[name] = new_offset
+        elif new_offset != offset:
+            files[name] = new_offset
+            changed = True
+    if ended:
+        snapshot["sessions"] = [s for s in snapshot.get("sessions") or [] if s.get("file") not in ended]
+        for name in ended:
+            files.pop(name, None)
+        changed = True
+    snapshot["session_files"] = files
+    snapshot["ended_files"] = ended_files
+    return changed
+
+
+# ── 스냅샷 생성/기록/조회 ─────────────────────────────────────────────────────
+
+def build_snapshot(project_root: str, previous: dict[str, Any] | None = None) -> dict[str, Any]:
+    """스냅샷 dict 를 새로 만든다 (파일은 기록하지 않는다).
+
+    Args:
+        project_root: 메인 리포 루트.
+        previous: 세션 읽은 위치를 이어 쓸 이전 스냅샷 (없으면 처음부터 읽는다).
+    """
+    validators = {"dirs": _dir_validators(project_root)}
+    sessions, files, ended = _collect_sessions(project_root, previous)
+    return {
+        "version": SNAPSHOT_VERSION,
+        "validators": validators,
+        "kanban": collect_kanban_summary(project_root),
+        "sessions": sessions,
+        "session_files": files,
+        "ended_files": ended,
+    }
+
+
+def _read(project_root: str) -> dict[str, Any] | None:
+    """기록된 스냅샷을 읽는다. 없거나 포맷 버전이 다르면 None."""
+    try:
+        with open(snapshot_path(project_root), "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def _write(project_root: str, snapshot: dict[str, Any]) -> None:
+    """스냅샷을 원자적으로 기록한다. 실패는 무시한다."""
+    path = snapshot_path(project_root)
+    directory = os.path.dirname(path)
+    try:
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".kanban-snapshot-", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def refresh(project_root: str) -> dict[str, Any]:
+    """스냅샷을 재생성하여 기록하고 반환한다.
+
+    Args:
+        project_root: 메인 리포 루트.
+
+    Returns:
+        새 스냅샷 dict.
+    """
+    snapshot = build_snapshot(project_root, _read(project_root))
+    if os.path.isdir(os.path.join(project_root, ".claude-organic")):
+        _write(project_root, snapshot)
+    return snapshot
+
+
+def refresh_kanban(project_root: str) -> None:
+    """스냅샷의 칸반 부분만 재생성하여 기록한다 (세션 jsonl 은 읽지 않는다).
+
+    세션 디렉터리 validator 는 이전 값을 유지하므로, 그 사이 세션이 바뀌었으면
+    다음 load() 가 감지한다. 기록된 스냅샷이 없으면 refresh() 로 전체 생성한다.
+
+    Args:
+        project_root: 메인 리포 루트.
+    """
+    snapshot = _read(project_root)
+    dirs = _dir_validators(project_root)
+    old_dirs = (snapshot or {}).get("validators", {}).get("dirs") or []
+    if snapshot is None or len(old_dirs) != len(dirs):
+        refresh(project_root)
+        return
+    snapshot["validators"] = {"dirs": dirs[:-1] + old_dirs[-1:]}
+    snapshot["kanban"] = collect_kanban_summary(project_root)
+    _write(project_root, snapshot)
+
+
+def refresh_for_ticket(ticket_path: str) -> None:
+    """티켓 파일 경로(``<root>/.claude-organic/tickets/<col>/T-NNN.xml``)의 프로젝트 칸반 스냅샷을 갱신한다.
+
+    티켓 디렉터리 구조 밖의 경로이면 아무것도 하지 않는다. 실패는 무시한다.
+
+    Args:
+        ticket_path: 기록/이동된 티켓 파일 경로.
+    """
+    tickets_dir = os.path.dirname(os.path.dirname(os.path.abspath(ticket_path)))
+    organic_dir = os.path.dirname(tickets_dir)
+    if os.path.basename(tickets_dir) != "tickets" or os.path.basename(organic_dir) != ".claude-organic":
+        return
+    try:
+        refresh_kanban(os.path.dirname(organic_dir))
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def load(project_root: str) -> dict[str, Any]:
+    """스냅샷을 읽고 검증하여 반환한다.
+
+    디렉터리 mtime 이 바뀌었거나 파일이 없으면 재생성하고, 그렇지 않으면
+    실행 중 세션 jsonl 의 추가분만 확인한다. 바뀐 내용은 파일에 다시 기록한다.
+
+    Args:
+        project_root: 메인 리포 루트.
+
+    Returns:
+        스냅샷 dict (kanban / sessions 키 포함).
+    """
+    snapshot = _read(project_root)
+    if snapshot is None or (snapshot.get("validators") or {}).get("dirs") != _dir_validators(project_root):
+        return refresh(project_root)
+    if _advance_sessions(project_root, snapshot):
+        _write(project_root, snapshot)
+    return snapshot
@@ -45,14 +45,14 @@ _engine_dir: str = os.path.normpath(
 if _engine_dir not in sys.path:
     sys.path.insert(0, _engine_dir)
 
+import root_cache
 from common import resolve_project_root
 
 # ─── 상수 ─────────────────────────────────────────────────────────────────────
 
 _MERGE_APPROVED_ENV: str = "WORKFLOW_MERGE_APPROVED"
-_ANCHOR_FAILURE_LOG: str = os.path.join(
-    ".claude-organic", "logs", "merge-anchor-failures.log"
-)
+# 상태 디렉터리(기본 <project_root>/.claude-organic, ``_WF_STATE_DIR`` 로 재지정) 기준 상대 경로
+_ANCHOR_FAILURE_LOG: str = os.path.join("logs", "merge-anchor-failures.log")
 
 # KST (UTC+9)
 _KST = timezone(timedelta(hours=9))
@@ -252,7 +252,8 @@ def _handle_anchor_failure(
 
     현재 HEAD가 merge_commit과 일치하면 명시적 SHA 리셋(`pre_merge_develop_sha`)
     또는 fallback 으로 `HEAD^` 리셋을 수행하고,
-    .claude-organic/logs/merge-anchor-failures.log에 JSONL 형식으로 기록한다.
+    .claude-organic/logs/merge-anchor-failures.log에 JSONL 형식으로 기록한다
+    (``_WF_STATE_DIR`` 가 있으면 그 아래 logs/).
 
     Args:
         merge_commit: 병합 커밋 SHA.
@@ -318,7 +319,10 @@ def _handle_anchor_failure(
 
     # JSONL 로그 기록 — pre_merge_develop_sha / reset_target / head_before /
     # head_after 모두 명시 (T-403 사고 회복용 포렌식 데이터).
-    log_path = os.path.join(project_root, _ANCHOR_FAILURE_LOG)
+    log_path = os.path.join(
+        root_cache.state_dir(os.path.join(project_root, ".claude-organic")),
+        _ANCHOR_FAILURE_LOG,
+    )
     try:
         os.makedirs(os.path.dirname(log_path), exist_ok=True)
         ts = datetime.now(_KST).strftime("%Y-%m-%dT%H:%M:%S")
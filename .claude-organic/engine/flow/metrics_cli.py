@@ -14,6 +14,10 @@ W01 (`metrics.py`) 가 기록한 ``<workDir>/metrics.jsonl`` jsonl 파일들을
     regression [--last N]
         ``.claude-organic/runs/`` 하위 최근 N (기본 10) 개 워크플로우의
         regression.pattern 빈도와 top-3 의 signal_summary 예시를 출력.
+    hooks [--last N]
+        ``.claude-organic/logs/hook-spans/`` 스풀(hook_spans.py)에서 최근 N
+        (기본 500) 번의 훅 호출을 읽어 훅/가드/tool_name/디스패치 대상별
+        p50/p95/p99 지연 표를 출력.
 
 설계 노트:
     - 표준 라이브러리만 사용 (argparse, json, glob, pathlib, sys, ...).
@@ -21,7 +25,7 @@ W01 (`metrics.py`) 가 기록한 ``<workDir>/metrics.jsonl`` jsonl 파일들을
       재사용한다 — 스키마/이벤트 타입 카탈로그 중복 정의 금지.
     - 백엔드 API (W06) 가 import 해서 쓸 수 있도록 모듈 함수 인터페이스를
       별도로 노출 — ``aggregate_run / aggregate_recent /
-      regression_counts / diff_runs``. CLI 진입점은 이 함수들의 thin
+      regression_counts / diff_runs / hook_latency_report``. CLI 진입점은 이 함수들의 thin
       wrapper.
     - 출력은 마크다운 파이프 표 (compatible with terminal + 마크다운 렌더).
 
@@ -30,12 +34,14 @@ CLI 사용 예시::
     $ flow-metrics summarize 20260505-183053
     $ flow-metrics compare 20260504-115242 20260505-183053
     $ flow-metrics regression --last 10
+    $ flow-metrics hooks --last 500
 """
 from __future__ import annotations
 
 import argparse
 import glob
 import json
+import math
 import os
 import sys
 from collections import Counter, defaultdict
@@ -53,6 +59,7 @@ if _engine_dir not in sys.path:
 # W01 모듈 재사용 (이벤트 카탈로그/스키마 단일 진실 공급원)
 from flow.metrics import known_event_types  # noqa: E402,F401
 from flow.metrics import schema_for  # noqa: E402,F401
+from flow.hook_spans import load_spans  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # 경로 상수
@@ -390,6 +397,81 @@ def diff_runs(key1: str, key2: str) -> dict[str, Any]:
     }
 
 
+def _percentiles(values: list[float]) -> dict[str, Any]:
+    """nearest-rank 방식의 count/p50/p95/p99/max 를 계산한다."""
+    ordered = sorted(values)
+    n = len(ordered)
+
+    def rank(q: float) -> float:
+        idx = max(0, min(n - 1, math.ceil(round(q * n, 6)) - 1))
+        return round(ordered[idx], 2)
+
+    return {
+        "count": n,
+        "p50": rank(0.50),
+        "p95": rank(0.95),
+        "p99": rank(0.99),
+        "max": round(ordered[-1], 2),
+    }
+
+
+def _latency_rows(groups: dict[str, list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """그룹별 span 목록을 total_ms 분위수 행으로 변환한다 (p95 내림차순)."""
+    rows: list[dict[str, Any]] = []
+    for name, spans in groups.items():
+        row: dict[str, Any] = {"name": name}
+        row.update(_percentiles([float(s.get("total_ms", 0.0)) for s in spans]))
+        spawns = [float(s["spawn_ms"]) for s in spans if isinstance(s.get("spawn_ms"), (int, float))]
+        row["spawn_p50"] = _percentiles(spawns)["p50"] if spawns else None
+        row["decided"] = sum(1 for s in spans if s.get("decided"))
+        row["cached"] = sum(1 for s in spans if s.get("cached"))
+        rows.append(row)
+    rows.sort(key=lambda r: (-r["p95"], r["name"]))
+    return rows
+
+
+def hook_latency_report(last: int = 500, project_root: Optional[str] = None) -> dict[str, Any]:
+    """최근 N 번의 훅 호출 span 으로 지연 분위수를 집계한다.
+
+    Args:
+        last: 집계할 최근 훅 호출 수 (기본 500).
+        project_root: 스풀을 읽을 프로젝트 루트 (None 이면 본 모듈 기준 루트).
+
+    Returns:
+        다음 형식의 dict (각 행은 name/count/p50/p95/p99/max/spawn_p50/decided/cached)::
+
+            {
+              "invocations": int,
+              "hooks": [row, ...],     # 훅 전체 시간
+              "guards": [row, ...],    # 가드별 (decided = 최종 판정 횟수)
+              "tools": [row, ...],     # tool_name 별 훅 전체 시간
+              "dispatch": [row, ...],  # "<kind>:<script>" 별 (spawn_p50 포함)
+            }
+    """
+    spans = load_spans(project_root or str(_ROOT), last)
+    hooks: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    guards: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    tools: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    dispatch: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for span in spans:
+        kind = span.get("kind")
+        name = str(span.get("name", ""))
+        if kind == "hook":
+            hooks[name].append(span)
+            tools[str(span.get("tool") or "-")].append(span)
+        elif kind == "guard":
+            guards[name].append(span)
+        elif kind in ("dispatch", "dispatch_async", "inline"):
+            dispatch[f"{kind}:{name}"].append(span)
+    return {
+        "invocations": sum(len(v) for v in hooks.values()),
+        "hooks": _latency_rows(hooks),
+        "guards": _latency_rows(guards),
+        "tools": _latency_rows(tools),
+        "dispatch": _latency_rows(dispatch),
+    }
+
+
 # ---------------------------------------------------------------------------
 # 출력 포맷터 (마크다운 파이프 표)
 # ---------------------------------------------------------------------------
@@ -617,6 +699,43 @@ def format_regression(report: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def format_hooks(report: dict[str, Any]) -> str:
+    """``hook_latency_report()`` 결과를 마크다운 표로 변환한다."""
+    lines: list[str] = [f"# Hook Latency — 최근 {report.get('invocations', 0)} 회 훅 호출", ""]
+    if not report.get("invocations"):
+        lines.append("_(hook-spans 스풀에 기록된 훅 호출이 없음)_")
+        lines.append("")
+        return "\n".join(lines)
+
+    def ms(v: Any) -> str:
+        return "-" if v is None else f"{v:.1f}"
+
+    sections = (
+        ("훅별 (ms)", "hook", "hooks", False),
+        ("가드별 (ms)", "guard", "guards", True),
+        ("tool_name 별 (ms)", "tool_name", "tools", False),
+        ("디스패치 대상별 (ms)", "target", "dispatch", False),
+    )
+    for title, label, key, with_decided in sections:
+        rows = report.get(key) or []
+        if not rows:
+            continue
+        headers = [label, "count", "p50", "p95", "p99", "max", "spawn p50"]
+        if with_decided:
+            headers += ["decided", "cached"]
+        table: list[list[str]] = []
+        for r in rows:
+            cells = [r["name"], str(r["count"]), ms(r["p50"]), ms(r["p95"]),
+                     ms(r["p99"]), ms(r["max"]), ms(r.get("spawn_p50"))]
+            if with_decided:
+                cells += [str(r.get("decided", 0)), str(r.get("cached", 0))]
+            table.append(cells)
+        lines.append(f"## {title}")
+        lines.append(_md_table(headers, table))
+        lines.append("")
+    return "\n".join(lines)
+
+
 # ---------------------------------------------------------------------------
 # CLI 진입점
 # ---------------------------------------------------------------------------
@@ -663,11 +782,17 @@ def _cmd_regression(args: argparse.Namespace) -> int:
     return 0
 
 
+def _cmd_hooks(args: argparse.Namespace) -> int:
+    report = hook_latency_report(last=args.last)
+    print(format_hooks(report))
+    return 0
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="flow-metrics",
         description=(
-            "워크플로우 metrics.jsonl 집계 CLI — summarize / compare / regression "
+            "워크플로우 metrics.jsonl 집계 CLI — summarize / compare / regression / hooks "
             "(W01 metrics.py 와 카탈로그 공유)"
         ),
     )
@@ -702,6 +827,18 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_reg.set_defaults(func=_cmd_regression)
 
+    p_hooks = sub.add_parser(
+        "hooks",
+        help="최근 N 번 훅 호출의 훅/가드/tool_name 별 p50/p95/p99 지연",
+    )
+    p_hooks.add_argument(
+        "--last",
+        type=int,
+        default=500,
+        help="집계 대상 최근 훅 호출 수 (기본 500)",
+    )
+    p_hooks.set_defaults(func=_cmd_hooks)
+
     return parser
 
 
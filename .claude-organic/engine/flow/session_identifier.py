@@ -10,6 +10,16 @@ TMUX_PANE 기반 폴백 경로를 단일 API로 추상화한다.
      조회하여 P:T-* 접두사 여부로 판별한다.
   3. 둘 다 없으면 "unknown"을 반환한다.
 
+윈도우명 캐시:
+  2번 경로의 조회 결과는 (tmux 서버 pid, TMUX_PANE) 키로 프로세스 내 메모와
+  런타임 파일(``$XDG_RUNTIME_DIR/claude-organic/tmux-windows.json``, 미설정 시
+  ``<tmpdir>/claude-organic-<uid>/``)에 WINDOW_CACHE_TTL 동안 보관한다. 캐시 디렉토리가
+  현재 사용자 소유의 0700 디렉토리가 아니면(다른 사용자가 미리 만든 경우 등) 런타임 파일을
+  읽지도 쓰지도 않는다. 서버 pid 는
+  TMUX 환경변수에서 읽으므로 서버 재시작으로 pane id 가 재사용되어도 섞이지 않는다.
+  pane 을 만드는 쪽(chain_launcher 의 tmux 폴백)은 publish_window()로 윈도우명을
+  미리 기록하여 첫 조회도 tmux 호출 없이 끝나게 한다.
+
 하위호환:
   WINDOW_PREFIX_P, MAIN_WINDOW_DEFAULT 상수를 이관하여
   기존 tmux_utils.py 소비 코드가 이 모듈로 전환할 수 있다.
@@ -17,13 +27,18 @@ TMUX_PANE 기반 폴백 경로를 단일 API로 추상화한다.
 
 from __future__ import annotations
 
+import json
 import os
+import stat
 import subprocess
+import tempfile
+import time
 
 __all__ = [
     "get_session_type",
     "is_workflow_session",
     "get_session_ticket_id",
+    "publish_window",
     "WINDOW_PREFIX_P",
     "MAIN_WINDOW_DEFAULT",
 ]
@@ -56,22 +71,143 @@ SESSION_TYPE_WORKFLOW: str = "workflow"
 SESSION_TYPE_MAIN: str = "main"
 SESSION_TYPE_UNKNOWN: str = "unknown"
 
+# ---------------------------------------------------------------------------
+# 윈도우명 캐시
+# ---------------------------------------------------------------------------
+
+WINDOW_CACHE_FILENAME: str = "tmux-windows.json"
+
+WINDOW_CACHE_TTL: float = 60.0
+"""윈도우명 캐시 유효 시간(초). rename-window 반영 지연의 상한이다."""
+
+# 런타임 파일에 유지할 최대 항목 수 (만료 항목은 기록 시 정리)
+_WINDOW_CACHE_MAX_ENTRIES: int = 256
+
+# 프로세스 내 메모: "<server_pid>:<pane>" -> (기록 시각, 윈도우명)
+_WINDOW_MEMO: dict[str, tuple[float, str]] = {}
+
 # ---------------------------------------------------------------------------
 # 내부 헬퍼
 # ---------------------------------------------------------------------------
 
 
+def window_cache_path() -> str:
+    """윈도우명 런타임 캐시 파일 경로를 반환한다."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        base = os.path.join(runtime_dir, "claude-organic")
+    else:
+        base = os.path.join(tempfile.gettempdir(), f"claude-organic-{os.getuid()}")
+    return os.path.join(base, WINDOW_CACHE_FILENAME)
+
+
+def _cache_dir_is_private(path: str) -> bool:
+    """캐시 디렉토리가 현재 사용자 소유이고 group/other 권한이 없는 디렉토리인지 확인한다.
+
+    Args:
+        path: 캐시 디렉토리 경로
+
+    Returns:
+        안전하게 읽고 쓸 수 있으면 True (없거나 조회 실패 시 False)
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and (st.st_mode & 0o077) == 0
+
+
+def _tmux_server_pid() -> str:
+    """TMUX 환경변수(``<socket>,<server_pid>,<session>``)에서 tmux 서버 pid 를 읽는다."""
+    parts = os.environ.get("TMUX", "").split(",")
+    return parts[1] if len(parts) >= 3 else ""
+
+
+def _window_key(pane: str, server_pid: str | None = None) -> str:
+    """윈도우명 캐시 키."""
+    return f"{_tmux_server_pid() if server_pid is None else server_pid}:{pane}"
+
+
+def _load_windows() -> dict[str, list]:
+    """런타임 캐시 파일을 읽는다. 없거나 손상되었으면 빈 dict."""
+    path = window_cache_path()
+    if not _cache_dir_is_private(os.path.dirname(path)):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _store_window(key: str, window_name: str) -> None:
+    """윈도우명을 메모와 런타임 파일에 기록한다. 실패는 무시한다."""
+    now = time.time()
+    _WINDOW_MEMO[key] = (now, window_name)
+    data = {
+        k: v for k, v in _load_windows().items()
+        if isinstance(v, list) and len(v) == 2 and now - v[0] < WINDOW_CACHE_TTL
+    }
+    data[key] = [now, window_name]
+    if len(data) > _WINDOW_CACHE_MAX_ENTRIES:
+        data = dict(sorted(data.items(), key=lambda kv: kv[1][0])[-_WINDOW_CACHE_MAX_ENTRIES:])
+    path = window_cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        if not _cache_dir_is_private(os.path.dirname(path)):
+            return
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmux-windows-", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _cached_window_name(key: str) -> str | None:
+    """TTL 안의 캐시된 윈도우명을 반환한다 (메모 → 런타임 파일)."""
+    now = time.time()
+    memo = _WINDOW_MEMO.get(key)
+    if memo is not None and now - memo[0] < WINDOW_CACHE_TTL:
+        return memo[1]
+    entry = _load_windows().get(key)
+    if isinstance(entry, list) and len(entry) == 2 and now - entry[0] < WINDOW_CACHE_TTL:
+        _WINDOW_MEMO[key] = (entry[0], entry[1])
+        return entry[1]
+    return None
+
+
+def publish_window(pane: str, window_name: str, server_pid: str | None = None) -> None:
+    """pane 의 윈도우명을 캐시에 미리 기록한다.
+
+    pane 을 생성한 프로세스가 호출하면, 그 pane 에서 실행되는 훅의 첫 세션 유형
+    조회도 tmux 를 호출하지 않는다.
+
+    Args:
+        pane: tmux pane id (``%N``).
+        window_name: 윈도우명 (예: ``P:T-001``).
+        server_pid: tmux 서버 pid. None 이면 현재 TMUX 환경변수 기준.
+    """
+    _store_window(_window_key(pane, server_pid), window_name)
+
+
 def _get_current_window_name() -> str:
     """현재 프로세스가 속한 tmux 윈도우 이름을 반환한다.
 
     TMUX_PANE 환경변수를 사용하여 프로세스가 실제로 실행 중인 pane의
-    윈도우 이름을 조회한다. TMUX_PANE이 없으면 활성 윈도우 이름을 반환한다.
+    윈도우 이름을 조회한다 (윈도우명 캐시 적중 시 tmux 호출 없음).
+    TMUX_PANE이 없으면 활성 윈도우 이름을 반환한다.
 
     Returns:
         현재 윈도우 이름 문자열. 실패 시 빈 문자열.
     """
     tmux_pane = os.environ.get("TMUX_PANE")
     if tmux_pane:
+        key = _window_key(tmux_pane)
+        cached = _cached_window_name(key)
+        if cached is not None:
+            return cached
         result = subprocess.run(
             ["tmux", "display-message", "-t", tmux_pane, "-p", "#W"],
             capture_output=True,
@@ -83,9 +219,12 @@ def _get_current_window_name() -> str:
             capture_output=True,
             text=True,
         )
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return ""
+    if result.returncode != 0:
+        return ""
+    window_name = result.stdout.strip()
+    if tmux_pane:
+        _store_window(key, window_name)
+    return window_name
 
 
 # ---------------------------------------------------------------------------
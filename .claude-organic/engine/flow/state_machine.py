@@ -38,6 +38,7 @@ from common import (  # noqa: E402
 )
 from constants import FSM_TRANSITIONS, KST  # noqa: E402
 from flow.flow_logger import append_log as _append_log  # noqa: E402
+import workflow_registry  # noqa: E402
 
 # history_sync.py 절대 경로
 HISTORY_SYNC_PATH = os.path.join(
@@ -322,6 +323,7 @@ def update_status(
         data["transitions"].append({"from": from_step, "to": to_step, "at": now})
 
         atomic_write_json(status_file, data)
+        workflow_registry.record(abs_work_dir)
         _append_log(abs_work_dir, "INFO", f"State transition: {from_step} -> {to_step}")
 
         # Board 서버에 단계 전이 통보 (best-effort, 실패 시 워크플로우 진행 차단하지 않음)
@@ -383,6 +385,7 @@ def link_session(status_file: str, session_id: str) -> str:
 
         data["linked_sessions"].append(session_id)
         atomic_write_json(status_file, data)
+        workflow_registry.record(os.path.dirname(status_file))
         count = len(data["linked_sessions"])
         _append_log(
             os.path.dirname(status_file),
@@ -49,6 +49,7 @@ _ENGINE_DIR = os.path.normpath(os.path.join(_SCRIPT_DIR, ".."))
 if _ENGINE_DIR not in sys.path:
     sys.path.insert(0, _ENGINE_DIR)
 
+from flow.kanban_snapshot import refresh as _refresh_kanban_snapshot  # noqa: E402
 from flow.sessions import (  # noqa: E402
     _SESSIONS_DIR,
     _resolve_server_port,
@@ -472,6 +473,11 @@ def _append_process_exit_marker(
     except (IOError, OSError) as exc:
         return False, f"jsonl append failed: {exc}"
 
+    # UserPromptSubmit 컨텍스트용 스냅샷에서 중지된 세션을 즉시 제거
+    try:
+        _refresh_kanban_snapshot(_PROJECT_ROOT)
+    except Exception:  # noqa: BLE001
+        pass
     return True, None
 
 
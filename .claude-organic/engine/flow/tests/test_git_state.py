@@ -0,0 +1,95 @@
+"""test_git_state.py - git_state 디스크 직접 읽기 테스트.
+
+  TC1: 메인/워크트리/하위 디렉터리의 브랜치·common dir 이 git 결과와 일치 (git 호출 없음)
+  TC2: checkout 후 HEAD 변경 반영, detached HEAD 는 'HEAD'
+  TC3: packed-refs 만 있는 ref 도 sha 로 해석
+  TC4: HEAD 가 그대로면 재파싱하지 않는다
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_ENGINE_DIR = str(Path(__file__).resolve().parent.parent.parent)
+if _ENGINE_DIR not in sys.path:
+    sys.path.insert(0, _ENGINE_DIR)
+
+import git_state  # noqa: E402
+
+
+def _git(repo: str, *args: str) -> str:
+    result = subprocess.run(["git", "-C", repo] + list(args), capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+@unittest.skipUnless(shutil.which("git"), "git 필요")
+class TestGitState(unittest.TestCase):
+    """HEAD/commondir/packed-refs 해석 검증."""
+
+    def setUp(self) -> None:
+        self.tmp = os.path.realpath(tempfile.mkdtemp(prefix="git-state-"))
+        self.main = os.path.join(self.tmp, "main")
+        os.makedirs(os.path.join(self.main, "src", "pkg"))
+        _git(self.main, "init", "-q", "-b", "main")
+        Path(self.main, "README").write_text("x\n", encoding="utf-8")
+        _git(self.main, "add", "README")
+        _git(self.main, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init")
+        self.worktree = os.path.join(self.tmp, "wt")
+        _git(self.main, "worktree", "add", "-q", self.worktree, "-b", "feat/T-001-x")
+        env = mock.patch.dict(os.environ)
+        env.start()
+        os.environ.pop("GIT_DIR", None)
+        self.addCleanup(env.stop)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_01_matches_git(self) -> None:
+        """브랜치와 common dir 이 git rev-parse 결과와 같다."""
+        expected = {
+            path: (
+                _git(path, "rev-parse", "--abbrev-ref", "HEAD"),
+                os.path.realpath(_git(path, "rev-parse", "--path-format=absolute", "--git-common-dir")),
+            )
+            for path in (self.main, os.path.join(self.main, "src", "pkg"), self.worktree)
+        }
+        with mock.patch.object(git_state.subprocess, "run", side_effect=AssertionError("git called")):
+            for path, (branch, common) in expected.items():
+                with self.subTest(path=path):
+                    self.assertEqual(git_state.current_branch(path), branch)
+                    self.assertEqual(git_state.common_dir(path), common)
+            self.assertIsNone(git_state.current_branch(self.tmp))
+
+    def test_02_checkout_and_detached(self) -> None:
+        """checkout 은 즉시 반영되고 detached HEAD 는 'HEAD' 를 반환한다."""
+        self.assertEqual(git_state.current_branch(self.main), "main")
+        _git(self.main, "checkout", "-q", "-b", "develop")
+        self.assertEqual(git_state.current_branch(self.main), "develop")
+        _git(self.main, "checkout", "-q", "--detach")
+        self.assertEqual(git_state.current_branch(self.main), "HEAD")
+        self.assertEqual(git_state.head_commit(self.main), _git(self.main, "rev-parse", "HEAD"))
+
+    def test_03_packed_refs(self) -> None:
+        """pack-refs 후에도 브랜치 sha 를 해석한다."""
+        _git(self.main, "pack-refs", "--all")
+        sha = _git(self.main, "rev-parse", "main")
+        self.assertEqual(git_state.resolve_ref(self.main, "refs/heads/main"), sha)
+        self.assertEqual(git_state.head_commit(self.main), sha)
+        self.assertEqual(git_state.resolve_ref(self.worktree, "refs/heads/main"), sha)
+
+    def test_04_head_memo(self) -> None:
+        """HEAD (mtime, size) 가 같으면 파일을 다시 읽지 않는다."""
+        git_state.current_branch(self.worktree)
+        with mock.patch.object(git_state, "_read_text", side_effect=AssertionError("re-read")):
+            self.assertEqual(git_state.current_branch(self.worktree), "feat/T-001-x")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""bench.payload_corpus / bench.hook_replay 재생 벤치마크 테스트.
+
+  TC1: 익명화 — 경로 자리표시자, 식별자 고정, 본문 길이만 보존, 비밀값 마스킹 / 복원
+  TC2: 재생 판정 추출 + 기준선 비교
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+_ENGINE_DIR = Path(__file__).resolve().parent.parent.parent
+if str(_ENGINE_DIR) not in sys.path:
+    sys.path.insert(0, str(_ENGINE_DIR))
+
+from bench import hook_replay, payload_corpus  # noqa: E402
+
+
+class TestHookReplay(unittest.TestCase):
+    """코퍼스 익명화와 재생 판정 비교 검증."""
+
+    def test_01_anonymize_and_restore(self) -> None:
+        """기록 레코드에는 루트 경로·세션 id·본문·토큰이 남지 않고, 복원 시 재생 루트로 돌아온다."""
+        root = "/work/secret-project"
+        payload = {
+            "session_id": "real-session",
+            "tool_name": "Write",
+            "tool_input": {"file_path": f"{root}/src/app.py", "content": "print('hi')\n"},
+        }
+        record = payload_corpus.anonymize(
+            "pre-tool-use", payload, root, cwd=f"{root}/src",
+            environ={"_WF_SESSION_TYPE": "workflow", "WORKFLOW_WORKTREE_PATH": f"{root}/.wt/T-1"},
+        )
+        self.assertNotIn(root, str(record))
+        self.assertNotIn("real-session", str(record))
+        self.assertEqual(record["payload"]["tool_input"]["content"], {"$redacted": 12})
+        bash = payload_corpus.anonymize(
+            "pre-tool-use", {"tool_input": {"command": "curl -H 'x: sk-abcdefghijklmnopqrstu'"}}, root,
+        )
+        self.assertEqual(bash["payload"]["tool_input"]["command"], "curl -H 'x: <redacted>'")
+
+        with tempfile.TemporaryDirectory() as replay_root:
+            restored, cwd, env = payload_corpus.restore(record, replay_root)
+        self.assertEqual(restored["tool_input"]["file_path"], f"{replay_root}/src/app.py")
+        self.assertEqual(restored["tool_input"]["content"], "x" * 12)
+        self.assertEqual(cwd, replay_root)  # 기록 당시 cwd 가 재생 환경에 없으면 루트
+        self.assertEqual(env, {"_WF_SESSION_TYPE": "workflow", "WORKFLOW_WORKTREE_PATH": f"{replay_root}/.wt/T-1"})
+
+    def test_02_decisions_and_baseline(self) -> None:
+        """pre-tool-use 는 permissionDecision 으로, 기준선과 다른 판정만 불일치로 보고한다."""
+        out = b'{"hookSpecificOutput": {"permissionDecision": "deny", "permissionDecisionReason": "no"}}\n'
+        self.assertEqual(hook_replay._decision_of("pre-tool-use", 0, out), [0, "deny", "no"])
+        self.assertEqual(hook_replay._decision_of("post-tool-use", 0, b""), [0, ""])
+
+        records = [
+            {"hook": "pre-tool-use", "cwd": "{PROJECT_ROOT}", "env": {},
+             "payload": {"tool_name": "Bash", "tool_input": {"command": "rm -rf /"}}},
+            {"hook": "post-tool-use", "cwd": "{PROJECT_ROOT}", "env": {},
+             "payload": {"tool_name": "Read", "tool_input": {"file_path": "README.md"}}},
+        ]
+        report = hook_replay.run_replay(records, concurrency=2)
+        self.assertEqual(report["events"], 2)
+        self.assertEqual(set(report["hooks"]), {"pre-tool-use", "post-tool-use"})
+        deny_id = payload_corpus.record_id(records[0])
+        self.assertEqual(report["decisions"][deny_id][1], "deny")
+
+        baseline = {"decisions": dict(report["decisions"])}
+        self.assertEqual(hook_replay.compare_baseline(report["decisions"], baseline), [])
+        baseline["decisions"][deny_id] = [0, "allow", ""]
+        mismatches = hook_replay.compare_baseline(report["decisions"], baseline)
+        self.assertEqual([m["id"] for m in mismatches], [deny_id])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""hook_spans 지연 span 스풀 + flow-metrics hooks 집계 테스트.
+
+  TC1: hook_span() 블록의 dispatch/가드 span 이 훅 span 과 함께 1회 append 로 기록
+  TC2: HOOK_SPANS=false 이면 기록하지 않음
+  TC3: load_spans(last) 는 최근 N 번 훅 호출만, hook_latency_report 는 분위수 집계
+  TC4: 새 날의 스풀 파일을 만들 때 최근 MAX_SCAN_DAYS 개만 남김
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_ENGINE_DIR = Path(__file__).resolve().parent.parent.parent
+_HOOKS_DIR = _ENGINE_DIR.parent / "hooks"
+for _p in (_ENGINE_DIR, _ENGINE_DIR / "flow", _HOOKS_DIR):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+import dispatcher  # noqa: E402
+import metrics_cli  # noqa: E402
+
+from flow import hook_spans  # noqa: E402
+
+_GUARDS_DIR = _ENGINE_DIR / "guards"
+
+
+def _read(path: str) -> list[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestHookSpans(unittest.TestCase):
+    """스풀 기록/집계 검증."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        os.makedirs(os.path.join(self.root, ".claude-organic"))
+        patches = [
+            mock.patch.object(dispatcher, "_find_project_root", return_value=self.root),
+            mock.patch.dict(os.environ, {"HOOK_SPANS": "true", "HOOK_GUARD_INPROCESS": "true",
+                                         "HOOK_GUARD_CACHE": "false", "_WF_SESSION_TYPE": "main"}),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_01_hook_span_spools_children(self) -> None:
+        """dispatch 는 spawn/run 분리, 가드는 decided, 훅 span 은 exit code 를 남긴다."""
+        payload = {"tool_name": "Bash", "tool_input": {"command": "rm -rf /"}}
+        guards = [("HOOK_DANGEROUS_COMMAND", str(_GUARDS_DIR / "dangerous_command_guard.py"))]
+        script = os.path.join(self.root, "noop.py")
+        with open(script, "w", encoding="utf-8") as f:
+            f.write("import sys; sys.stdin.read()\n")
+
+        with self.assertRaises(SystemExit):
+            with dispatcher.hook_span("pre-tool-use"):
+                dispatcher.evaluate_guards(guards, payload, json.dumps(payload).encode(), flags={})
+                dispatcher.dispatch("HOOK_X", script, b"{}", flags={}, capture_output=True)
+                sys.exit(2)
+
+        spans = _read(hook_spans.spool_path(self.root))
+        self.assertEqual([s["kind"] for s in spans], ["guard", "dispatch", "hook"])
+        guard, dispatched, hook = spans
+        self.assertEqual((guard["name"], guard["outcome"], guard["tool"]), ("dangerous_command_guard", "deny", "Bash"))
+        self.assertTrue(guard["decided"])
+        self.assertIn("spawn_ms", dispatched)
+        self.assertIn("run_ms", dispatched)
+        self.assertEqual(dispatched["outcome"], "0")
+        self.assertEqual((hook["name"], hook["outcome"]), ("pre-tool-use", "2"))
+        self.assertEqual(len({s["inv"] for s in spans}), 1)
+
+    def test_02_disabled(self) -> None:
+        """HOOK_SPANS=false 이면 스풀 파일을 만들지 않는다."""
+        with mock.patch.dict(os.environ, {"HOOK_SPANS": "false"}):
+            with dispatcher.hook_span("post-tool-use"):
+                hook_spans.record("inline", "x", 1.0)
+        self.assertFalse(os.path.exists(hook_spans.spool_dir(self.root)))
+
+    def test_03_report(self) -> None:
+        """최근 N 번 호출만 읽고 훅/가드/tool_name 별 분위수를 낸다."""
+        for i in range(1, 101):
+            hook_spans.begin("pre-tool-use")
+            hook_spans.set_tool("Bash" if i % 2 else "Edit")
+            hook_spans.record("guard", "g", float(i), decided=i > 90)
+            hook_spans.record("hook", "pre-tool-use", float(i) * 2)
+            hook_spans.flush(self.root)
+
+        self.assertEqual(len(hook_spans.load_spans(self.root, 10)), 20)
+        report = metrics_cli.hook_latency_report(last=100, project_root=self.root)
+        self.assertEqual(report["invocations"], 100)
+        guard = report["guards"][0]
+        self.assertEqual((guard["name"], guard["p50"], guard["p95"], guard["p99"]), ("g", 50.0, 95.0, 99.0))
+        self.assertEqual(guard["decided"], 10)
+        self.assertEqual({r["name"]: r["count"] for r in report["tools"]}, {"Bash": 50, "Edit": 50})
+        self.assertEqual(report["hooks"][0]["p99"], 198.0)
+        self.assertIn("## 가드별 (ms)", metrics_cli.format_hooks(report))
+
+    def test_04_prune_old_spools(self) -> None:
+        """새 날의 파일이 생길 때만 오래된 스풀 파일을 정리한다."""
+        directory = hook_spans.spool_dir(self.root)
+        os.makedirs(directory)
+        old = [f"202001{day:02d}.jsonl" for day in range(1, 21)]
+        for name in old:
+            open(os.path.join(directory, name), "w").close()
+
+        with mock.patch.object(hook_spans, "MAX_SCAN_DAYS", 5):
+            hook_spans.begin("pre-tool-use")
+            hook_spans.record("hook", "pre-tool-use", 1.0)
+            hook_spans.flush(self.root)
+            self.assertEqual(sorted(os.listdir(directory)),
+                             old[-4:] + [os.path.basename(hook_spans.spool_path(self.root))])
+
+            open(os.path.join(directory, old[0]), "w").close()
+            hook_spans.begin("pre-tool-use")
+            hook_spans.record("hook", "pre-tool-use", 1.0)
+            hook_spans.flush(self.root)
+            self.assertIn(old[0], os.listdir(directory))
+
+
+if __name__ == "__main__":
+    unittest.main()
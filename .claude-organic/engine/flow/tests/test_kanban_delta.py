@@ -0,0 +1,119 @@
+"""kanban_delta UserPromptSubmit 변경분 주입 테스트.
+
+  TC1: 첫 turn 전체 → 변경 없음 → 변경분(이동/완료/추가/세션 종료) → N turn 뒤 전체
+  TC2: reset() 또는 변경분 비활성 시 전체 스냅샷
+  TC3: 제목만 바뀐 티켓은 제목 변경 줄로 보고
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_ENGINE_DIR = Path(__file__).resolve().parent.parent.parent
+if str(_ENGINE_DIR) not in sys.path:
+    sys.path.insert(0, str(_ENGINE_DIR))
+
+from flow import kanban_delta, kanban_snapshot  # noqa: E402
+
+_spec = importlib.util.spec_from_file_location(
+    "inject_kanban_context", _ENGINE_DIR / "hook-handlers" / "inject_kanban_context.py"
+)
+inject = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(inject)
+
+
+class TestKanbanDelta(unittest.TestCase):
+    """세션별 변경분 주입 검증."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self.organic = os.path.join(self.root, ".claude-organic")
+        for col in kanban_snapshot.COLUMNS:
+            os.makedirs(os.path.join(self.organic, "tickets", col))
+        self.sessions = os.path.join(self.organic, ".workflow-sessions")
+        os.makedirs(self.sessions)
+        self._write_ticket("open", "T-001", "첫 티켓")
+        self._write_ticket("progress", "T-002", "진행 중")
+        self.session_file = os.path.join(self.sessions, "wf-T-002.jsonl")
+        with open(self.session_file, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"_meta": {"ticket_id": "T-002", "command": "implement",
+                                          "created_at": "2026-01-01T13:30:00"}}) + "\n")
+        env = mock.patch.dict(os.environ, {inject.DIFF_FLAG: "true", inject.FULL_EVERY_KEY: "3"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write_ticket(self, col: str, number: str, title: str) -> str:
+        path = os.path.join(self.organic, "tickets", col, f"{number}.xml")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"<ticket><metadata><number>{number}</number><title>{title}</title>"
+                    f"<status>{col}</status></metadata></ticket>\n")
+        kanban_snapshot.refresh_for_ticket(path)
+        return path
+
+    def _move(self, number: str, src: str, dst: str) -> None:
+        path = os.path.join(self.organic, "tickets", dst, f"{number}.xml")
+        os.replace(os.path.join(self.organic, "tickets", src, f"{number}.xml"), path)
+        kanban_snapshot.refresh_for_ticket(path)
+
+    def test_01_full_unchanged_delta_full(self) -> None:
+        """변경이 없으면 한 줄, 변경이 있으면 변경분만, full_every turn 마다 전체."""
+        first = inject.build_context(self.root, "sess-1")
+        self.assertIn("### Open / In Progress 상세", first)
+
+        self.assertEqual(inject.build_context(self.root, "sess-1"), "## 칸반 스냅샷: 직전 주입 이후 변경 없음")
+
+        self._move("T-002", "progress", "done")
+        self._move("T-001", "open", "review")
+        self._write_ticket("open", "T-003", "새 티켓")
+        with open(self.session_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"type": "system", "subtype": "process_exit"}) + "\n")
+        delta = inject.build_context(self.root, "sess-1")
+        self.assertEqual(delta.splitlines(), [
+            "## 칸반 변경분 (직전 주입 이후, 자동 주입)",
+            "- Open: 1건, In Progress: 0건, Review: 1건 / To Do: 0건, Done: 1건",
+            "- 추가: T-003 [Open] 새 티켓",
+            "- 이동: T-001 Open → Review",
+            "- 완료: T-002 In Progress → Done",
+            "- 세션 종료: T-002 implement (13:30)",
+        ])
+
+        # 직전 전체 주입 이후 3 turn 째 → 전체 재주입
+        self.assertIn("## 칸반 스냅샷 (자동 주입", inject.build_context(self.root, "sess-1"))
+        # 다른 세션은 독립적으로 첫 turn
+        self.assertIn("## 칸반 스냅샷 (자동 주입", inject.build_context(self.root, "sess-2"))
+
+    def test_02_reset_and_disabled(self) -> None:
+        """압축 후 reset() 이면 전체, 변경분 비활성/세션 id 없음이면 항상 전체."""
+        inject.build_context(self.root, "sess-1")
+        kanban_delta.reset(self.root, "sess-1")
+        self.assertIn("## 칸반 스냅샷 (자동 주입", inject.build_context(self.root, "sess-1"))
+
+        self.assertIn("## 칸반 스냅샷 (자동 주입", inject.build_context(self.root, ""))
+        with mock.patch.dict(os.environ, {inject.DIFF_FLAG: "false"}):
+            self.assertIn("## 칸반 스냅샷 (자동 주입", inject.build_context(self.root, "sess-1"))
+        self.assertEqual(os.listdir(kanban_delta.state_dir(self.root)), ["sess-1.json"])
+
+    def test_03_title_only_change(self) -> None:
+        """제목만 바뀌면 빈 변경분 대신 제목 변경 줄을 주입한다."""
+        inject.build_context(self.root, "sess-1")
+        self._write_ticket("open", "T-001", "고친 제목")
+        delta = inject.build_context(self.root, "sess-1")
+        self.assertEqual(delta.splitlines(), [
+            "## 칸반 변경분 (직전 주입 이후, 자동 주입)",
+            "- Open: 1건, In Progress: 1건, Review: 0건 / To Do: 0건, Done: 0건",
+            "- 제목 변경: T-001 첫 티켓 → 고친 제목",
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""kanban_service in-process 칸반 서비스 테스트.
+
+  TC1: move_ticket 이 상태 갱신 + 디렉터리 이동, 같은 상태/규칙 위반/잘못된 컬럼 처리
+  TC2: 여러 스레드가 같은 티켓을 동시에 이동해도 XML 이 깨지거나 중복/유실되지 않는다
+  TC3: ticket_lock 재진입 + delete_ticket
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest import mock
+
+_ENGINE_DIR = Path(__file__).resolve().parent.parent.parent
+if str(_ENGINE_DIR) not in sys.path:
+    sys.path.insert(0, str(_ENGINE_DIR))
+
+from flow import kanban_service, ticket_repository  # noqa: E402
+from flow.kanban_service import KanbanError, delete_ticket, move_ticket, ticket_lock  # noqa: E402
+
+_COLUMNS = {"To Do": "todo", "Open": "open", "In Progress": "progress", "Review": "review", "Done": "done"}
+
+
+class TestKanbanService(unittest.TestCase):
+    """임시 티켓 디렉터리에서 서비스 동작 검증."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tickets = os.path.join(self._tmp.name, ".claude-organic", "tickets")
+        dirs = {status: os.path.join(self.tickets, col) for status, col in _COLUMNS.items()}
+        for path in dirs.values():
+            os.makedirs(path)
+        status_map = dict(ticket_repository.STATUS_DIR_MAP)
+        status_map.update(dirs)
+        status_map["Submit"] = dirs["In Progress"]
+        patches = [
+            mock.patch.object(ticket_repository, "KANBAN_DIR", self.tickets),
+            mock.patch.object(ticket_repository, "STATUS_DIR_MAP", status_map),
+            mock.patch.object(ticket_repository, "refresh_for_ticket", lambda path: None),
+            mock.patch.object(kanban_service, "_kill_ticket_session", lambda ticket: None),
+        ]
+        for status, col in _COLUMNS.items():
+            patches.append(mock.patch.object(ticket_repository, f"KANBAN_{col.upper()}_DIR", dirs[status]))
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(self._tmp.cleanup)
+        self._write("T-001", "open", "Open")
+
+    def _write(self, number: str, col: str, status: str) -> str:
+        path = os.path.join(self.tickets, col, f"{number}.xml")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(
+                '<?xml version="1.0" encoding="UTF-8"?>\n<ticket><metadata>'
+                f"<number>{number}</number><title>제목</title><created>2026-01-01 09:00:00</created>"
+                f"<updated>2026-01-01 09:00:00</updated><status>{status}</status>"
+                "<command>implement</command></metadata><prompt /><result /></ticket>\n"
+            )
+        return path
+
+    def _locations(self, number: str) -> list[str]:
+        return [col for col in _COLUMNS.values() if os.path.isfile(os.path.join(self.tickets, col, f"{number}.xml"))]
+
+    def test_01_move(self) -> None:
+        """전이 + 파일 이동, 같은 상태는 무시, 규칙 위반/잘못된 컬럼은 KanbanError."""
+        lines: list[str] = []
+        result = move_ticket("T-001", "todo", emit=lines.append)
+        self.assertEqual((result["from"], result["to"], result["changed"]), ("Open", "To Do", True))
+        self.assertEqual(self._locations("T-001"), ["todo"])
+        self.assertEqual(ticket_repository.parse_ticket_xml(result["path"])["status"], "To Do")
+        self.assertEqual(lines[-1], "T-001: Open → To Do")
+
+        self.assertFalse(move_ticket("T-001", "todo", emit=lines.append)["changed"])
+
+        with self.assertRaises(KanbanError) as ctx:
+            move_ticket("T-001", "review", emit=lines.append)
+        self.assertIn("--force", str(ctx.exception))
+        with self.assertRaises(KanbanError):
+            move_ticket("T-001", "nowhere", emit=lines.append)
+        with self.assertRaises(KanbanError):
+            move_ticket("T-404", "open", emit=lines.append)
+
+        move_ticket("T-001", "done", force=True, emit=lines.append)
+        self.assertEqual(self._locations("T-001"), ["done"])
+
+    def test_02_concurrent_moves(self) -> None:
+        """동시 이동 후에도 티켓 파일은 정확히 하나이고 상태와 디렉터리가 일치한다."""
+        errors: list[BaseException] = []
+
+        def worker(i: int) -> None:
+            try:
+                for j in range(15):
+                    move_ticket("T-001", "todo" if (i + j) % 2 else "open", emit=lambda _msg: None)
+            except BaseException as e:  # noqa: BLE001
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(30)
+
+        self.assertEqual(errors, [])
+        locations = self._locations("T-001")
+        self.assertEqual(len(locations), 1)
+        path = os.path.join(self.tickets, locations[0], "T-001.xml")
+        status = ET.parse(path).getroot().findtext("metadata/status")
+        self.assertEqual(_COLUMNS[status], locations[0])
+        leftovers = [n for col in _COLUMNS.values() for n in os.listdir(os.path.join(self.tickets, col)) if n.endswith(".tmp")]
+        self.assertEqual(leftovers, [])
+
+    def test_03_reentrant_lock_and_delete(self) -> None:
+        """같은 스레드의 중첩 잠금은 교착 없이 통과하고, 삭제 후 재삭제는 KanbanError."""
+        with ticket_lock("T-001"):
+            with ticket_lock("T-001"):
+                move_ticket("T-001", "todo", emit=lambda _msg: None)
+        self.assertTrue(os.path.isfile(os.path.join(kanban_service.lock_dir(), "T-001.lock")))
+
+        lines: list[str] = []
+        delete_ticket("T-001", emit=lines.append)
+        self.assertEqual(self._locations("T-001"), [])
+        self.assertEqual(lines, ["T-001: 삭제됨"])
+        with self.assertRaises(KanbanError):
+            delete_ticket("T-001", emit=lines.append)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""kanban_snapshot UserPromptSubmit 스냅샷 테스트.
+
+  TC1: 스냅샷 생성 후 load() 는 디렉터리가 그대로면 티켓을 다시 파싱하지 않음
+  TC2: 티켓 디렉터리 변경(보드 UI 이동 등) 시 재생성, refresh_for_ticket 경로 검증
+  TC3: 실행 중 세션 jsonl 에 종료 마커가 추가되면 추가분만 읽고 세션 제거
+  TC4: 티켓 쓰기는 세션 jsonl 을 읽지 않고, 재생성도 종료된 세션 파일을 다시 읽지 않음
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_ENGINE_DIR = Path(__file__).resolve().parent.parent.parent
+if str(_ENGINE_DIR) not in sys.path:
+    sys.path.insert(0, str(_ENGINE_DIR))
+
+from flow import kanban_snapshot  # noqa: E402
+
+
+def _ticket_xml(number: str, title: str, status: str) -> str:
+    return (
+        f"<ticket><metadata><number>{number}</number><title>{title}</title>"
+        f"<status>{status}</status></metadata></ticket>\n"
+    )
+
+
+class TestKanbanSnapshot(unittest.TestCase):
+    """스냅샷 생성/검증/증분 세션 스캔 검증."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self.organic = os.path.join(self.root, ".claude-organic")
+        for col in kanban_snapshot.COLUMNS:
+            os.makedirs(os.path.join(self.organic, "tickets", col))
+        self.sessions = os.path.join(self.organic, ".workflow-sessions")
+        os.makedirs(self.sessions)
+        self._write_ticket("open", "T-001", "첫 티켓", "Open")
+        self._write_ticket("done", "T-002", "완료", "Done")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write_ticket(self, col: str, number: str, title: str, status: str) -> str:
+        path = os.path.join(self.organic, "tickets", col, f"{number}.xml")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_ticket_xml(number, title, status))
+        return path
+
+    def _bump(self, path: str) -> None:
+        """mtime 해상도가 낮은 파일시스템에서도 디렉터리 변경이 보이도록 mtime 을 앞당긴다."""
+        future = time.time() + 5
+        os.utime(path, (future, future))
+
+    def test_01_load_reuses_snapshot(self) -> None:
+        """첫 load 는 스냅샷을 만들고, 두 번째 load 는 티켓 XML 을 다시 읽지 않는다."""
+        snapshot = kanban_snapshot.load(self.root)
+        self.assertTrue(os.path.isfile(kanban_snapshot.snapshot_path(self.root)))
+        self.assertEqual(snapshot["kanban"]["counts"]["open"], 1)
+        self.assertEqual(snapshot["kanban"]["counts"]["done"], 1)
+        self.assertEqual([d["number"] for d in snapshot["kanban"]["details"]], ["T-001"])
+
+        with mock.patch.object(kanban_snapshot, "parse_ticket_header") as parse:
+            again = kanban_snapshot.load(self.root)
+        parse.assert_not_called()
+        self.assertEqual(again["kanban"], snapshot["kanban"])
+
+    def test_02_directory_change_rebuilds(self) -> None:
+        """스냅샷 우회 경로로 티켓을 옮겨도 load 가 감지하고, 티켓 경로 밖 refresh 는 무시한다."""
+        kanban_snapshot.load(self.root)
+        src = os.path.join(self.organic, "tickets", "open", "T-001.xml")
+        dst = os.path.join(self.organic, "tickets", "progress", "T-001.xml")
+        os.replace(src, dst)
+        self._bump(os.path.dirname(src))
+        self._bump(os.path.dirname(dst))
+
+        snapshot = kanban_snapshot.load(self.root)
+        self.assertEqual(snapshot["kanban"]["counts"]["open"], 0)
+        self.assertEqual(snapshot["kanban"]["details"][0]["column"], "progress")
+
+        path = self._write_ticket("review", "T-003", "리뷰", "Review")
+        kanban_snapshot.refresh_for_ticket(path)
+        with open(kanban_snapshot.snapshot_path(self.root), "r", encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["kanban"]["counts"]["review"], 1)
+
+        with mock.patch.object(kanban_snapshot, "refresh") as refresh:
+            kanban_snapshot.refresh_for_ticket(os.path.join(self.root, "elsewhere", "open", "T-009.xml"))
+        refresh.assert_not_called()
+
+    def test_03_session_exit_is_incremental(self) -> None:
+        """종료 마커 추가 시 이전에 읽은 위치부터만 스캔하여 세션을 제거한다."""
+        path = os.path.join(self.sessions, "wf-T-001.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"_meta": {"ticket_id": "T-001", "command": "implement",
+                                          "created_at": "2026-01-01T00:00:00"}}) + "\n")
+            f.write(json.dumps({"type": "assistant", "message": "working"}) + "\n")
+
+        snapshot = kanban_snapshot.load(self.root)
+        self.assertEqual([s["ticket"] for s in snapshot["sessions"]], ["T-001"])
+        offset = snapshot["session_files"]["wf-T-001.jsonl"]
+        self.assertEqual(offset, os.path.getsize(path))
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"type": "system", "subtype": "process_exit"}) + "\n")
+
+        real_scan = kanban_snapshot._scan_session
+        with mock.patch.object(kanban_snapshot, "_scan_session", side_effect=real_scan) as scan, \
+                mock.patch.object(kanban_snapshot, "_dir_validators",
+                                  return_value=snapshot["validators"]["dirs"]):
+            snapshot = kanban_snapshot.load(self.root)
+        scan.assert_called_once_with(path, offset)
+        self.assertEqual(snapshot["sessions"], [])
+        self.assertEqual(snapshot["session_files"], {})
+
+    def test_04_ticket_write_skips_session_files(self) -> None:
+        """티켓 쓰기 갱신은 세션 파일을 열지 않고, 전체 재생성도 바뀌지 않은 세션은 다시 읽지 않는다."""
+        running = os.path.join(self.sessions, "wf-T-001.jsonl")
+        finished = os.path.join(self.sessions, "wf-T-002.jsonl")
+        for path, ticket, lines in ((running, "T-001", []),
+                                    (finished, "T-002", [{"type": "system", "subtype": "process_exit"}])):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"_meta": {"ticket_id": ticket, "created_at": "2026-01-01T00:00:00"}}) + "\n")
+                for line in lines:
+                    f.write(json.dumps(line) + "\n")
+        snapshot = kanban_snapshot.load(self.root)
+        self.assertEqual([s["ticket"] for s in snapshot["sessions"]], ["T-001"])
+        self.assertEqual(list(snapshot["ended_files"]), ["wf-T-002.jsonl"])
+
+        path = self._write_ticket("review", "T-003", "리뷰", "Review")
+        with mock.patch.object(kanban_snapshot, "_scan_session") as scan, \
+                mock.patch.object(kanban_snapshot, "_session_meta") as meta:
+            kanban_snapshot.refresh_for_ticket(path)
+            snapshot = kanban_snapshot.load(self.root)
+            scan.assert_not_called()
+            meta.assert_not_called()
+        self.assertEqual(snapshot["kanban"]["counts"]["review"], 1)
+        self.assertEqual([s["ticket"] for s in snapshot["sessions"]], ["T-001"])
+
+        # 세션 디렉터리가 바뀌어 전체 재생성해도 기존 파일은 다시 읽지 않고, 사라진 파일은 정리한다
+        os.remove(finished)
+        self._bump(self.sessions)
+        with mock.patch.object(kanban_snapshot, "_scan_session") as scan:
+            snapshot = kanban_snapshot.load(self.root)
+            scan.assert_not_called()
+        self.assertEqual(snapshot["ended_files"], {})
+        self.assertEqual(list(snapshot["session_files"]), ["wf-T-001.jsonl"])
+
+
+if __name__ == "__main__":
+    unittest.main()
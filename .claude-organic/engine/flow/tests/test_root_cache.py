@@ -0,0 +1,105 @@
+"""test_root_cache.py - root_cache 메인 루트/.settings 캐시 계층 테스트.
+
+  TC1: .settings 가 있는 메인 리포 → git 호출 없이 base 반환
+  TC2: 워크트리 → 첫 호출만 해석, 이후 영속 캐시 적중 (프로세스 메모 초기화 후에도)
+  TC3: .settings mtime 변경 → 캐시 무효화 후 디스크(git_state)로 재해석
+  TC4: settings_values 첫 매칭 우선 + 파일 변경 시 재파싱, read_env 결과 보존
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_ENGINE_DIR = str(Path(__file__).resolve().parent.parent.parent)
+if _ENGINE_DIR not in sys.path:
+    sys.path.insert(0, _ENGINE_DIR)
+
+import root_cache  # noqa: E402
+from common import read_env  # noqa: E402
+
+
+def _git(repo: str, *args: str) -> None:
+    subprocess.run(["git", "-C", repo] + list(args), capture_output=True, text=True, check=True)
+
+
+def _bump_mtime(path: str) -> None:
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@unittest.skipUnless(shutil.which("git"), "git 필요")
+class TestRootCache(unittest.TestCase):
+    """메인 루트 해석 캐시 검증."""
+
+    def setUp(self) -> None:
+        self.tmp = os.path.realpath(tempfile.mkdtemp(prefix="root-cache-"))
+        self.main = os.path.join(self.tmp, "main")
+        os.makedirs(os.path.join(self.main, ".claude-organic"))
+        self.settings = os.path.join(self.main, ".claude-organic", ".settings")
+        Path(self.settings).write_text("HOOK_X=true\n", encoding="utf-8")
+        _git(self.main, "init", "-q", "-b", "main")
+        Path(self.main, "README").write_text("x\n", encoding="utf-8")
+        _git(self.main, "add", "README")
+        _git(self.main, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init")
+        self.worktree = os.path.join(self.tmp, "wt")
+        _git(self.main, "worktree", "add", "-q", self.worktree, "-b", "feature")
+
+        env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": os.path.join(self.tmp, "cache")})
+        env.start()
+        self.addCleanup(env.stop)
+        root_cache._ROOT_MEMO.clear()
+
+    def tearDown(self) -> None:
+        root_cache._ROOT_MEMO.clear()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_01_main_repo_no_git(self) -> None:
+        """메인 리포는 stat 만으로 해석한다."""
+        with mock.patch.object(root_cache.subprocess, "run", side_effect=AssertionError("git called")):
+            self.assertEqual(root_cache.main_repo_root(self.main), self.main)
+
+    def test_02_worktree_persistent_cache(self) -> None:
+        """워크트리 해석은 영속 캐시로 재사용된다."""
+        self.assertEqual(root_cache.main_repo_root(self.worktree), self.main)
+        self.assertTrue(os.path.isfile(root_cache.cache_file_path()))
+
+        root_cache._ROOT_MEMO.clear()
+        with mock.patch.object(root_cache.subprocess, "run", side_effect=AssertionError("git called")):
+            self.assertEqual(root_cache.main_repo_root(self.worktree), self.main)
+
+    def test_03_settings_change_invalidates(self) -> None:
+        """메인 .settings mtime 이 바뀌면 git 없이 디스크에서 재해석한다."""
+        root_cache.main_repo_root(self.worktree)
+        root_cache._ROOT_MEMO.clear()
+        _bump_mtime(self.settings)
+        real_common_dir = root_cache.git_state.common_dir
+        with mock.patch.object(root_cache.git_state, "common_dir", side_effect=real_common_dir) as resolve, \
+                mock.patch.object(root_cache.subprocess, "run", side_effect=AssertionError("git called")):
+            self.assertEqual(root_cache.main_repo_root(self.worktree), self.main)
+        self.assertEqual(resolve.call_count, 1)
+
+    def test_04_settings_values(self) -> None:
+        """첫 매칭 우선, 파일 변경 시 재파싱, read_env 따옴표/공백 규칙 유지."""
+        Path(self.settings).write_text(
+            "# comment\nA=1\nA=2\nB='quoted'\nC = spaced\n", encoding="utf-8"
+        )
+        values = root_cache.settings_values(self.settings)
+        self.assertEqual(values["A"], "1")
+        self.assertEqual(read_env("B", env_file=self.settings), "quoted")
+        self.assertEqual(read_env("C", "dflt", env_file=self.settings), "dflt")
+
+        Path(self.settings).write_text("A=3\n", encoding="utf-8")
+        _bump_mtime(self.settings)
+        self.assertEqual(read_env("A", env_file=self.settings), "3")
+        self.assertIsNone(root_cache.settings_values(os.path.join(self.tmp, "missing")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""test_session_identifier.py - 세션 유형 판별 윈도우명 캐시 테스트.
+
+  TC1: 같은 pane 의 반복 조회는 tmux 를 1회만 호출 (새 프로세스도 런타임 파일 재사용)
+  TC2: TTL 만료 또는 다른 tmux 서버(pid)면 다시 조회
+  TC3: publish_window() 로 기록된 pane 은 첫 조회부터 tmux 호출 없음
+  TC4: 다른 사용자 소유이거나 0700 이 아닌 캐시 디렉토리는 읽지도 쓰지도 않음
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_ENGINE_DIR = str(Path(__file__).resolve().parent.parent.parent)
+if _ENGINE_DIR not in sys.path:
+    sys.path.insert(0, _ENGINE_DIR)
+
+from flow import session_identifier  # noqa: E402
+from flow.session_identifier import get_session_ticket_id, get_session_type, publish_window  # noqa: E402
+
+
+def _tmux_result(window_name: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=f"{window_name}\n", stderr="")
+
+
+class TestWindowCache(unittest.TestCase):
+    """(tmux 서버 pid, TMUX_PANE) 윈도우명 캐시 검증."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.mkdtemp(prefix="session-identifier-")
+        env = mock.patch.dict(os.environ, {
+            "XDG_RUNTIME_DIR": self.tmp,
+            "TMUX": "/tmp/tmux-0/default,4242,0",
+            "TMUX_PANE": "%7",
+        })
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop("_WF_SESSION_TYPE", None)
+        os.environ.pop("_WF_TICKET_ID", None)
+        session_identifier._WINDOW_MEMO.clear()
+
+    def tearDown(self) -> None:
+        session_identifier._WINDOW_MEMO.clear()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_01_repeat_lookups_hit_cache(self) -> None:
+        """반복 조회와 프로세스 재시작(메모 초기화)은 tmux 를 다시 부르지 않는다."""
+        with mock.patch.object(session_identifier.subprocess, "run", return_value=_tmux_result("P:T-042")) as run:
+            self.assertEqual(get_session_type(), "workflow")
+            self.assertEqual(get_session_ticket_id(), "T-042")
+            session_identifier._WINDOW_MEMO.clear()
+            self.assertEqual(get_session_type(), "workflow")
+        self.assertEqual(run.call_count, 1)
+        self.assertTrue(os.path.isfile(session_identifier.window_cache_path()))
+
+    def test_02_ttl_and_server_pid(self) -> None:
+        """TTL 이 지나거나 tmux 서버가 바뀌면 다시 조회한다."""
+        with mock.patch.object(session_identifier.subprocess, "run", return_value=_tmux_result("main")) as run:
+            self.assertEqual(get_session_type(), "main")
+            with mock.patch.object(session_identifier, "WINDOW_CACHE_TTL", 0.0):
+                self.assertEqual(get_session_type(), "main")
+            self.assertEqual(run.call_count, 2)
+            with mock.patch.dict(os.environ, {"TMUX": "/tmp/tmux-0/default,5353,0"}):
+                get_session_type()
+            self.assertEqual(run.call_count, 3)
+
+    def test_03_published_pane(self) -> None:
+        """pane 생성 측이 기록한 윈도우명은 첫 조회부터 사용된다."""
+        publish_window("%9", "P:T-100", "4242")
+        session_identifier._WINDOW_MEMO.clear()
+        with mock.patch.dict(os.environ, {"TMUX_PANE": "%9"}), \
+                mock.patch.object(session_identifier.subprocess, "run", side_effect=AssertionError("tmux called")):
+            self.assertEqual(get_session_type(), "workflow")
+            self.assertEqual(get_session_ticket_id(), "T-100")
+
+    def test_04_untrusted_cache_dir(self) -> None:
+        """캐시 디렉토리 소유자나 권한이 맞지 않으면 런타임 파일을 건너뛴다."""
+        cache_dir = os.path.dirname(session_identifier.window_cache_path())
+        os.makedirs(cache_dir)
+        os.chmod(cache_dir, 0o755)
+        publish_window("%9", "P:T-100", "4242")
+        self.assertFalse(os.path.exists(session_identifier.window_cache_path()))
+
+        os.chmod(cache_dir, 0o700)
+        publish_window("%9", "P:T-100", "4242")
+        session_identifier._WINDOW_MEMO.clear()
+        with mock.patch.object(session_identifier.os, "getuid", return_value=os.getuid() + 1):
+            publish_window("%8", "P:T-101", "4242")
+            self.assertIsNone(session_identifier._cached_window_name("4242:%9"))
+        self.assertNotIn("4242:%8", session_identifier._load_windows())
+        self.assertEqual(session_identifier._cached_window_name("4242:%9"), "P:T-100")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -456,8 +456,6 @@ class TestScenario5LauncherTimeoutFallback(unittest.TestCase):
             http_launcher, "_resolve_server_port", return_value=9927
         ), mock.patch.object(
             http_launcher, "_is_server_running", return_value=True
-        ), mock.patch.dict(
-            os.environ, {}, clear=False
         ), mock.patch.object(
             http_launcher, "_http_post_json", side_effect=timeout_error
         ), mock.patch.object(
@@ -0,0 +1,109 @@
+"""workflow_registry 활성 워크플로우 레지스트리 테스트.
+
+  TC1: scan_active_workflows 결과가 전체 스캔과 동일하고, record() 가 단계 변경/터미널 제거를 반영
+  TC2: 레지스트리 파일이 있으면 runs/ 를 다시 순회하지 않고, runs/ 변경 시 자가 치유
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_ENGINE_DIR = Path(__file__).resolve().parent.parent.parent
+if str(_ENGINE_DIR) not in sys.path:
+    sys.path.insert(0, str(_ENGINE_DIR))
+
+import common  # noqa: E402
+import workflow_registry  # noqa: E402
+
+
+class TestWorkflowRegistry(unittest.TestCase):
+    """레지스트리 조회/갱신/자가 치유 검증."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self.runs = os.path.join(self.root, ".claude-organic", "runs")
+        os.makedirs(self.runs)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _make(self, key: str, work: str, step: str, updated_at: str, sessions: list[str] | None = None) -> str:
+        work_dir = os.path.join(self.runs, key, work, "implement")
+        os.makedirs(work_dir, exist_ok=True)
+        self._set_step(work_dir, step, updated_at, sessions or [])
+        with open(os.path.join(work_dir, ".context.json"), "w", encoding="utf-8") as f:
+            json.dump({"title": work, "command": "implement"}, f)
+        return work_dir
+
+    def _set_step(self, work_dir: str, step: str, updated_at: str, sessions: list[str] | None = None) -> None:
+        with open(os.path.join(work_dir, "status.json"), "w", encoding="utf-8") as f:
+            json.dump({"step": step, "updated_at": updated_at, "linked_sessions": sessions or []}, f)
+
+    def _full_scan(self) -> dict[str, dict[str, str]]:
+        with mock.patch.object(workflow_registry, "entries", side_effect=lambda root: workflow_registry.scan_runs(root)):
+            return common.scan_active_workflows(self.root)
+
+    def test_01_equivalent_and_record(self) -> None:
+        """레지스트리 결과 == 전체 스캔 결과, record() 로 단계 변경과 터미널 제거 반영."""
+        a = self._make("20260101-090000", "alpha", "PLAN", "2026-01-01T09:00:00+09:00", ["s-1"])
+        self._make("20260101-090000", "beta", "WORK", "2026-01-01T09:30:00+09:00")
+        self._make("20260101-100000", "gamma", "DONE", "2026-01-01T10:00:00+09:00")
+
+        result = common.scan_active_workflows(self.root)
+        self.assertEqual(result, self._full_scan())
+        self.assertEqual(list(result), ["20260101-090000"])
+        self.assertEqual(result["20260101-090000"]["title"], "beta")
+        self.assertTrue(os.path.isfile(workflow_registry.registry_path(self.root)))
+
+        self._set_step(a, "WORK", "2026-01-01T11:00:00+09:00", ["s-1"])
+        workflow_registry.record(a)
+        self.assertEqual(common.scan_active_workflows(self.root)["20260101-090000"]["title"], "alpha")
+        self.assertEqual(
+            [e["linked_sessions"] for e in workflow_registry.entries(self.root)], [["s-1"], []]
+        )
+
+        self._set_step(a, "DONE", "2026-01-01T12:00:00+09:00")
+        workflow_registry.record(a)
+        result = common.scan_active_workflows(self.root)
+        self.assertEqual(result, self._full_scan())
+        self.assertEqual(result["20260101-090000"]["title"], "beta")
+
+        # runs/ 구조 밖 경로는 무시
+        workflow_registry.record(self.root)
+
+    def test_02_no_rescan_and_self_heal(self) -> None:
+        """레지스트리가 최신이면 순회하지 않고, runs/ mtime 변경/삭제/TTL 경과 시 재생성."""
+        self._make("20260101-090000", "alpha", "PLAN", "2026-01-01T09:00:00+09:00")
+        workflow_registry.entries(self.root)
+
+        with mock.patch.object(workflow_registry, "scan_runs", side_effect=AssertionError("rescan")):
+            self.assertEqual(len(workflow_registry.entries(self.root)), 1)
+
+        # 레지스트리를 거치지 않고 추가된 워크플로우 → runs/ mtime 변경으로 재생성
+        self._make("20260101-100000", "beta", "WORK", "2026-01-01T10:00:00+09:00")
+        self.assertEqual(list(common.scan_active_workflows(self.root)), ["20260101-090000", "20260101-100000"])
+
+        # 같은 entry 내 디렉터리 삭제 → 조회 시 제외
+        gone = self._make("20260101-100000", "gamma", "WORK", "2026-01-01T10:30:00+09:00")
+        workflow_registry.record(gone)
+        os.rename(gone, gone + "-moved")
+        self.assertNotIn(
+            os.path.relpath(gone, self.root),
+            [e["workDir"] for e in workflow_registry.entries(self.root)],
+        )
+
+        # 놓친 갱신은 RESCAN_SECONDS 경과 후 재스캔으로 보정
+        self._set_step(os.path.join(self.runs, "20260101-090000", "alpha", "implement"), "FAILED", "x")
+        self.assertEqual(len(common.scan_active_workflows(self.root)), 2)
+        with mock.patch.object(workflow_registry, "RESCAN_SECONDS", 0):
+            self.assertEqual(list(common.scan_active_workflows(self.root)), ["20260101-100000"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,7 @@ import os
 import re
 import shutil
 import sys
+import tempfile
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import Any, NoReturn
@@ -23,6 +24,7 @@ if _SCRIPTS_DIR not in sys.path:
     sys.path.insert(0, _SCRIPTS_DIR)
 
 from common import resolve_project_root
+from flow.kanban_snapshot import refresh_for_ticket
 
 _PROJECT_ROOT: str = resolve_project_root()
 KANBAN_DIR: str = os.path.join(_PROJECT_ROOT, ".claude-organic", "tickets")
@@ -249,10 +251,25 @@ def write_ticket_xml(filepath: str, root: ET.Element, allow_create: bool = False
         xml_str = re.sub(r"(<prompt[ />])", r"\n  <!-- prompt -->\n  \1", xml_str)
     if "<!-- result -->" not in xml_str:
         xml_str = re.sub(r"(<result[ />])", r"\n  <!-- result -->\n  \1", xml_str)
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-        f.write(xml_str)
-        f.write("\n")
+    # 임시 파일에 쓴 뒤 rename — Board 서버 등 동시 reader 가 잘린 XML 을 읽지 않도록 원자적 교체
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(filepath), prefix=f".{os.path.basename(filepath)}.", suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            f.write(xml_str)
+            f.write("\n")
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    # UserPromptSubmit 컨텍스트용 칸반 스냅샷 갱신 (제목/상태 변경은 디렉터리 mtime 에 드러나지 않음)
+    refresh_for_ticket(filepath)
 
 
 def parse_ticket_xml(filepath: str) -> dict[str, Any]:
@@ -849,8 +866,10 @@ def move_ticket_to_status_dir(filepath: str, target_status: str) -> str:
     # 대상 경로에 이미 동일 파일이 존재하면 원본만 삭제 (멱등성)
     if os.path.isfile(new_path) and os.path.normpath(filepath) != os.path.normpath(new_path):
         os.remove(filepath)
+        refresh_for_ticket(new_path)
         return new_path
 
     os.makedirs(target_dir, exist_ok=True)
     shutil.move(filepath, new_path)
+    refresh_for_ticket(new_path)
     return new_path
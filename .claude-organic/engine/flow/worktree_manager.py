@@ -37,6 +37,7 @@ if _engine_dir not in sys.path:
     sys.path.insert(0, _engine_dir)
 
 from common import acquire_lock, read_env, release_lock, resolve_project_root
+from git_state import current_branch
 from flow.branch_strategy import (
     create_feature_branch,
     delete_feature_branch,
@@ -157,13 +158,10 @@ def _get_current_branch(repo_path: str | None = None) -> str:
         repo_path: git 저장소 경로.
 
     Returns:
-        현재 브랜치명. detached HEAD이면 빈 문자열.
+        현재 브랜치명. detached HEAD이거나 판정 실패 시 빈 문자열.
     """
-    result = _git("rev-parse", "--abbrev-ref", "HEAD", repo_path=repo_path)
-    if result.returncode != 0:
-        return ""
-    branch = result.stdout.strip()
-    return "" if branch == "HEAD" else branch
+    branch = current_branch(_get_project_root(repo_path))
+    return "" if not branch or branch == "HEAD" else branch
 
 
 def _warn(msg: str) -> None:
@@ -0,0 +1,258 @@
+"""git_state.py - subprocess 없는 git 상태 읽기 계층.
+
+가드·statusline·보드 서버가 매 호출마다 ``git rev-parse --abbrev-ref HEAD`` 를 spawn 하던
+브랜치 조회를 디스크 직접 읽기로 대체한다.
+
+해석 순서:
+    1. 경로에서 위로 올라가며 ``.git`` 을 찾는다.
+       디렉터리면 그대로 git dir, 파일(워크트리)이면 ``gitdir: <path>`` 포인터를 따른다.
+       결과는 경로별로 프로세스 내 메모된다 (HEAD stat 실패 시 재탐색).
+    2. git dir 의 ``commondir`` 파일로 git-common-dir 을 구한다 (없으면 git dir 자신).
+    3. HEAD 는 (mtime_ns, size) 가 같으면 직전 파싱 결과를 재사용한다.
+       정상 상태의 브랜치 조회 비용은 HEAD stat 1회이다.
+    4. ref → sha 는 git dir/common dir 의 loose ref, 없으면 packed-refs (mtime 캐시) 순으로 찾는다.
+
+``GIT_DIR`` 환경변수가 설정되어 있거나 HEAD 가 refs/heads/ 밖을 가리키는 등
+흔치 않은 레이아웃에서는 git 명령으로 폴백한다.
+
+이 모듈은 engine 의 다른 모듈을 import 하지 않는 leaf 모듈이다.
+
+주요 함수:
+    find_git_dir: 경로 → git dir 절대 경로
+    common_dir: 경로 → git-common-dir 절대 경로
+    head_path: 경로 → HEAD 파일 절대 경로
+    read_head: HEAD 원문 (``ref: refs/heads/x`` 또는 sha)
+    current_branch: 현재 브랜치명 (detached 이면 ``HEAD``)
+    resolve_ref: ref 이름 → commit sha
+    head_commit: HEAD commit sha
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+
+_HEADS_PREFIX: str = 'refs/heads/'
+_SYMREF_PREFIX: str = 'ref: '
+_SHA_RE = re.compile(r'[0-9a-f]{40}(?:[0-9a-f]{24})?')
+
+# 프로세스 내 캐시
+_GIT_DIR_MEMO: dict[str, str | None] = {}
+_COMMON_DIR_MEMO: dict[str, str] = {}
+_HEAD_MEMO: dict[str, tuple[tuple[int, int], str]] = {}
+_PACKED_MEMO: dict[str, tuple[tuple[int, int], dict[str, str]]] = {}
+
+
+def _file_key(path: str) -> tuple[int, int] | None:
+    """(mtime_ns, size). 파일이 없으면 None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_text(path: str) -> str | None:
+    """파일 내용을 strip 하여 반환한다. 읽을 수 없으면 None."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _discover(path: str) -> str | None:
+    """path 에서 위로 올라가며 git dir 을 찾는다 (메모 없음)."""
+    current = os.path.abspath(path)
+    while True:
+        dot_git = os.path.join(current, '.git')
+        if os.path.isdir(dot_git):
+            return dot_git
+        if os.path.isfile(dot_git):
+            pointer = _read_text(dot_git) or ''
+            if not pointer.startswith('gitdir:'):
+                return None
+            gitdir = pointer[len('gitdir:'):].strip()
+            if not os.path.isabs(gitdir):
+                gitdir = os.path.join(current, gitdir)
+            gitdir = os.path.normpath(gitdir)
+            return gitdir if os.path.isdir(gitdir) else None
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def find_git_dir(path: str) -> str | None:
+    """path 가 속한 저장소의 git dir 절대 경로를 반환한다.
+
+    Args:
+        path: 저장소 안의 임의 경로 (워크트리 포함).
+
+    Returns:
+        git dir 절대 경로. 저장소가 아니면 None.
+    """
+    if path not in _GIT_DIR_MEMO:
+        _GIT_DIR_MEMO[path] = _discover(path)
+    return _GIT_DIR_MEMO[path]
+
+
+def common_dir(path: str) -> str | None:
+    """path 가 속한 저장소의 git-common-dir 절대 경로를 반환한다.
+
+    워크트리의 git dir(``<main>/.git/worktrees/<name>``)은 ``commondir`` 파일로
+    메인 저장소의 ``.git`` 을 가리킨다.
+
+    Args:
+        path: 저장소 안의 임의 경로.
+
+    Returns:
+        git-common-dir 절대 경로. 저장소가 아니면 None.
+    """
+    gitdir = find_git_dir(path)
+    if gitdir is None:
+        return None
+    cached = _COMMON_DIR_MEMO.get(gitdir)
+    if cached is not None:
+        return cached
+    pointer = _read_text(os.path.join(gitdir, 'commondir'))
+    resolved = gitdir
+    if pointer:
+        resolved = os.path.normpath(pointer if os.path.isabs(pointer) else os.path.join(gitdir, pointer))
+    _COMMON_DIR_MEMO[gitdir] = resolved
+    return resolved
+
+
+def head_path(path: str) -> str | None:
+    """path 가 속한 저장소(워크트리)의 HEAD 파일 절대 경로를 반환한다."""
+    gitdir = find_git_dir(path)
+    return os.path.join(gitdir, 'HEAD') if gitdir else None
+
+
+def read_head(path: str) -> str:
+    """HEAD 원문을 반환한다 ((mtime_ns, size) 캐시).
+
+    Args:
+        path: 저장소 안의 임의 경로.
+
+    Returns:
+        ``ref: refs/heads/<branch>`` 또는 sha. 저장소가 아니거나 읽기 실패 시 빈 문자열.
+    """
+    head = head_path(path)
+    if head is None:
+        return ''
+    key = _file_key(head)
+    if key is None:
+        # 워크트리 삭제/이동 등으로 git dir 이 바뀌었을 수 있으므로 1회 재탐색
+        _GIT_DIR_MEMO.pop(path, None)
+        head = head_path(path)
+        key = _file_key(head) if head else None
+        if head is None or key is None:
+            return ''
+    cached = _HEAD_MEMO.get(head)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    content = _read_text(head) or ''
+    _HEAD_MEMO[head] = (key, content)
+    return content
+
+
+def _git_fallback(path: str, *args: str) -> str | None:
+    """흔치 않은 레이아웃용 git 명령 폴백. 실패 시 None."""
+    try:
+        result = subprocess.run(
+            ['git', *args], capture_output=True, text=True, timeout=5, cwd=path,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def current_branch(path: str) -> str | None:
+    """현재 브랜치명을 반환한다 (``git rev-parse --abbrev-ref HEAD`` 와 같은 의미).
+
+    Args:
+        path: 저장소 안의 임의 경로.
+
+    Returns:
+        브랜치명. detached HEAD 이면 ``'HEAD'``. 저장소가 아니거나 판정 실패 시 None.
+    """
+    if os.environ.get('GIT_DIR'):
+        return _git_fallback(path, 'rev-parse', '--abbrev-ref', 'HEAD')
+    head = read_head(path)
+    if not head:
+        return None
+    if head.startswith(_SYMREF_PREFIX + _HEADS_PREFIX):
+        return head[len(_SYMREF_PREFIX + _HEADS_PREFIX):]
+    if _SHA_RE.fullmatch(head):
+        return 'HEAD'
+    return _git_fallback(path, 'rev-parse', '--abbrev-ref', 'HEAD')
+
+
+def _packed_refs(common: str) -> dict[str, str]:
+    """packed-refs 를 {ref: sha} 로 파싱한다 ((mtime_ns, size) 캐시)."""
+    packed = os.path.join(common, 'packed-refs')
+    key = _file_key(packed)
+    if key is None:
+        return {}
+    cached = _PACKED_MEMO.get(packed)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    refs: dict[str, str] = {}
+    try:
+        with open(packed, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith(('#', '^')):
+                    continue
+                sha, _, name = line.strip().partition(' ')
+                if name:
+                    refs[name] = sha
+    except (OSError, UnicodeDecodeError):
+        return {}
+    _PACKED_MEMO[packed] = (key, refs)
+    return refs
+
+
+def resolve_ref(path: str, ref: str) -> str | None:
+    """ref 이름(``refs/heads/main`` 등)을 commit sha 로 해석한다.
+
+    Args:
+        path: 저장소 안의 임의 경로.
+        ref: 전체 ref 이름.
+
+    Returns:
+        sha 문자열. 찾지 못하면 None.
+    """
+    gitdir = find_git_dir(path)
+    common = common_dir(path)
+    if gitdir is None or common is None:
+        return None
+    for base in dict.fromkeys((gitdir, common)):
+        loose = _read_text(os.path.join(base, ref))
+        if loose:
+            if loose.startswith(_SYMREF_PREFIX):
+                return resolve_ref(path, loose[len(_SYMREF_PREFIX):])
+            return loose
+    return _packed_refs(common).get(ref)
+
+
+def head_commit(path: str) -> str | None:
+    """HEAD 가 가리키는 commit sha 를 반환한다.
+
+    Args:
+        path: 저장소 안의 임의 경로.
+
+    Returns:
+        sha 문자열. 판정 실패(빈 저장소 포함) 시 None.
+    """
+    if os.environ.get('GIT_DIR'):
+        return _git_fallback(path, 'rev-parse', 'HEAD')
+    head = read_head(path)
+    if not head:
+        return None
+    if head.startswith(_SYMREF_PREFIX):
+        return resolve_ref(path, head[len(_SYMREF_PREFIX):])
+    return head if _SHA_RE.fullmatch(head) else None
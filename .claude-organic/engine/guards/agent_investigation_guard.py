@@ -9,6 +9,7 @@ PreToolUse(Task) 이벤트에서 subagent_type이 조사 목적(Explore, general
 허용 subagent_type: worker-opus, worker-sonnet, planner, reporter, validator
 
 주요 함수:
+    evaluate: 조사 목적 서브에이전트 판정 (가드 플러그인 API)
     main: Hook 진입점, stdin JSON 파싱 후 조사 목적 서브에이전트 차단
 
 입력: stdin으로 JSON (tool_name, tool_input)
@@ -19,7 +20,6 @@ PreToolUse(Task) 이벤트에서 subagent_type이 조사 목적(Explore, general
 
 from __future__ import annotations
 
-import json
 import os
 import sys
 
@@ -33,12 +33,14 @@ _prompt_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__fi
 if _prompt_dir not in sys.path:
     sys.path.insert(0, _prompt_dir)
 
-from common import read_env
 from flow.session_identifier import get_session_type
+from guards.guard_api import Decision, deny, run_script
 from messages import (
     AGENT_INVESTIGATION_MAIN_SESSION_DENIED,
 )
 
+HOOK_FLAG: str = "HOOK_AGENT_INVESTIGATION_GUARD"
+
 # 허용된 subagent_type 목록 (워크플로우 전용 서브에이전트)
 _ALLOWED_SUBAGENT_TYPES: frozenset[str] = frozenset({
     "worker-opus",
@@ -49,23 +51,6 @@ _ALLOWED_SUBAGENT_TYPES: frozenset[str] = frozenset({
 })
 
 
-def _deny(reason: str) -> None:
-    """차단 JSON을 stdout에 출력하고 프로세스를 종료한다.
-
-    Args:
-        reason: 차단 사유 문자열
-    """
-    result = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "deny",
-            "permissionDecisionReason": reason,
-        }
-    }
-    print(json.dumps(result, ensure_ascii=False))
-    sys.exit(0)
-
-
 def _extract_subagent_type(tool_input: dict) -> str:
     """tool_input에서 subagent_type을 추출한다.
 
@@ -98,53 +83,54 @@ def _extract_subagent_type(tool_input: dict) -> str:
     return ""
 
 
-def main() -> None:
-    """메인 세션 조사 목적 서브에이전트 차단 Hook의 진입점.
+def evaluate(data: dict) -> Decision | None:
+    """메인 세션 조사 목적 서브에이전트 차단 판정.
 
-    stdin에서 JSON을 읽어 Task 도구 사용 시 subagent_type이 조사 목적
-    (Explore, general-purpose)이거나 허용 목록에 없는 미지정값인 경우,
-    현재 세션이 워크플로우 세션인지 확인하고,
-    워크플로우 세션이 아니면 deny 응답을 출력하여 서브에이전트 호출을 차단한다.
+    Task 도구 사용 시 subagent_type이 조사 목적(Explore, general-purpose)이거나
+    허용 목록에 없는 미지정값인 경우, 현재 세션이 워크플로우 세션이 아니면
+    deny Decision을 반환하여 서브에이전트 호출을 차단한다.
     세션 유형은 session_identifier.get_session_type()으로 판별한다.
-    """
-    # .claude-organic/.settings에서 설정 로드
-    hook_flag = os.environ.get("HOOK_AGENT_INVESTIGATION_GUARD") or read_env("HOOK_AGENT_INVESTIGATION_GUARD")
-
-    # Hook disable check (false = disabled)
-    if hook_flag in ("false", "0"):
-        sys.exit(0)
 
-    # stdin에서 JSON 읽기
-    try:
-        data = json.load(sys.stdin)
-    except (json.JSONDecodeError, ValueError):
-        sys.exit(0)
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
 
+    Returns:
+        차단 시 deny Decision, 통과 시 None.
+    """
     tool_name = data.get("tool_name", "")
 
     # Task 도구가 아니면 통과
     if tool_name != "Task":
-        sys.exit(0)
+        return None
 
     tool_input = data.get("tool_input", {})
     if not isinstance(tool_input, dict):
-        sys.exit(0)
+        return None
 
     # subagent_type 추출
     subagent_type = _extract_subagent_type(tool_input)
 
     # 허용 목록에 포함된 subagent_type은 세션 무관하게 통과
     if subagent_type in _ALLOWED_SUBAGENT_TYPES:
-        sys.exit(0)
+        return None
 
     # 허용 목록 외 subagent_type (Explore, general-purpose, 빈값 등)은 차단 후보
     # 세션 유형 판별: workflow이면 통과, 그 외(main, unknown)는 차단
     session_type = get_session_type()
     if session_type == "workflow":
-        sys.exit(0)
+        return None
 
     # 워크플로우 세션이 아니면 차단
-    _deny(AGENT_INVESTIGATION_MAIN_SESSION_DENIED.format(subagent_type=repr(subagent_type)))
+    return deny(AGENT_INVESTIGATION_MAIN_SESSION_DENIED.format(subagent_type=repr(subagent_type)))
+
+
+def main() -> None:
+    """메인 세션 조사 목적 서브에이전트 차단 Hook의 진입점.
+
+    HOOK_AGENT_INVESTIGATION_GUARD 토글 확인 후 stdin JSON을 evaluate()에 전달하고,
+    차단 판정이면 deny JSON을 출력한다.
+    """
+    run_script(evaluate, HOOK_FLAG)
 
 
 if __name__ == "__main__":
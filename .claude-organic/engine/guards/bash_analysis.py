@@ -0,0 +1,496 @@
+"""bash_analysis.py - PreToolUse 가드 공용 Bash 명령 분석기.
+
+Bash 도구의 command 문자열을 한 번만 토큰화하여 구조화된 BashCommand 로 만든다.
+가드들은 각자 정규식을 다시 돌리는 대신 이 결과를 공유한다. analyze() 는
+command 문자열 단위로 캐시되므로, 같은 PreToolUse 이벤트를 평가하는 가드 체인
+(in-process 디스패처·상주 데몬) 안에서 파싱은 1회만 일어난다.
+
+분석 결과:
+    subcommands: &&, ||, |, ;, &, 개행, ( ), $( ), `` 로 나뉜 단순 명령 목록
+                 (argv 는 따옴표가 풀린 토큰, 리다이렉션은 별도 분리).
+                 bash/sh -c 문자열과 eval 인자는 재귀 분석하여 래퍼 뒤에 펼친다.
+                 argv0 판정 시 예약어(!, {, if, then, do …)와 래퍼(sudo -u X,
+                 nice -n N, timeout DUR, xargs …)는 옵션 값까지 건너뛴다.
+    redirect_targets: 파일로 향하는 출력 리다이렉션 대상 (>, >>, &>, >| 등)
+    git_invocations: git 호출의 (서브커맨드, 인자) — 전역 옵션(-C, -c 등) 제외
+    flow_invocations: flow-* 호출의 (명령, 인자)
+    quoted_spans: 원문에서 따옴표로 감싼 구간 (start, end)
+    stripped / segments: 따옴표 내부를 비운 문자열과 그 체인 분할 결과
+                         (파일 수정 패턴 검사용, 기존 가드의 정규식 분할과 동일)
+
+heredoc 본문은 명령으로 해석하지 않는다. 쉘 문법 전체가 아닌 가드 판정에 필요한
+범위의 근사 파서이며, 해석할 수 없는 입력에서도 예외를 던지지 않는다.
+
+주요 함수:
+    analyze: command 문자열 → BashCommand (캐시)
+    analyze_payload: PreToolUse payload → BashCommand | None (Bash 도구가 아니면 None)
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+# Bash 도구에서 파일을 수정할 수 있는 명령 패턴 (블랙리스트)
+# main_session_guard / readonly_session_guard / worktree_path_guard 공용.
+BASH_FILE_MODIFY_PATTERNS: list[str] = [
+    r"\bsed\s+-i",                               # sed inplace
+    r"\bawk\s+.*-i\s+inplace",                   # awk inplace
+    r"\b(echo|printf)\s+.*\s*>{1,2}\s*\S",       # echo/printf 리다이렉트
+    r"\btee\s+(-a\s+)?\S",                       # tee 쓰기
+    r"\bcat\s*<<",                               # heredoc 리다이렉트
+    r"\bcp\s+",                                  # 파일 복사
+    r"\bmv\s+",                                  # 파일 이동
+    r"\bpython3?\s+(-c\s+|.*\bopen\b.*\bwrite\b)",  # python -c open write
+    r"\bperl\s+-.*[pi]",                         # perl inplace
+    r"(?:^|[;&|]\s*)\binstall\s+",               # install 명령 (서브커맨드 제외)
+    r"\bdd\s+",                                  # dd 명령
+]
+_FILE_MODIFY_REGEXES: list[tuple[str, re.Pattern[str]]] = [
+    (pattern, re.compile(pattern)) for pattern in BASH_FILE_MODIFY_PATTERNS
+]
+
+_DOUBLE_QUOTED_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+_SINGLE_QUOTED_RE = re.compile(r"'(?:[^'\\]|\\.)*'")
+_SEGMENT_SPLIT_RE = re.compile(r'&&|\|\||(?<!\|)\|(?!\|)|;')
+
+# 연산자 (긴 것 우선)
+_SEPARATORS: tuple[str, ...] = ('&&', '||', '|&', ';;', '$(', '|', ';', '&', '\n', '(', ')', '`')
+_REDIRECT_RE = re.compile(r'&>>|&>|>>|>\||>&|>|<<<|<<-|<<|<&|<>|<')
+
+# 명령어 앞에 올 수 있는 래퍼 (argv0 판정 시 건너뜀) → 값을 별도 토큰으로 받는 옵션
+_COMMAND_WRAPPERS: dict[str, frozenset[str]] = {
+    'sudo': frozenset({'-u', '-g', '-h', '-p', '-C', '-D', '-r', '-t', '-U', '-T', '-R',
+                       '--user', '--group', '--host', '--prompt', '--close-from', '--chdir',
+                       '--role', '--type', '--other-user', '--command-timeout', '--chroot'}),
+    'doas': frozenset({'-u', '-C'}),
+    'env': frozenset({'-u', '-C', '-S', '--unset', '--chdir', '--split-string'}),
+    'time': frozenset({'-f', '-o', '--format', '--output'}),
+    'nohup': frozenset(),
+    'command': frozenset(),
+    'exec': frozenset({'-a'}),
+    'nice': frozenset({'-n', '--adjustment'}),
+    'ionice': frozenset({'-c', '-n', '-p', '-P', '-u', '--class', '--classdata'}),
+    'stdbuf': frozenset({'-i', '-o', '-e', '--input', '--output', '--error'}),
+    'setsid': frozenset(),
+    'builtin': frozenset(),
+    'timeout': frozenset({'-s', '-k', '--signal', '--kill-after'}),
+    'xargs': frozenset({'-a', '-d', '-E', '-I', '-L', '-n', '-P', '-s', '--arg-file', '--delimiter',
+                        '--max-args', '--max-procs', '--max-chars', '--max-lines'}),
+    'watch': frozenset({'-n', '--interval', '-q', '--equexit'}),
+}
+# 옵션 뒤에 명령 전에 오는 위치 인자 수 (timeout DURATION)
+_WRAPPER_OPERANDS: dict[str, int] = {'timeout': 1}
+# 명령 앞에 올 수 있는 예약어·그룹 기호 (argv0 판정 시 건너뜀)
+_RESERVED_WORDS: frozenset[str] = frozenset({
+    '!', '{', '}', 'if', 'then', 'elif', 'else', 'fi', 'do', 'done', 'while', 'until',
+})
+_ASSIGNMENT_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*=')
+
+# 문자열 인자를 다시 쉘 명령으로 실행하는 프로그램 (-c 문자열 / eval 인자를 재귀 분석)
+_SHELL_PROGRAMS: frozenset[str] = frozenset({'bash', 'sh', 'zsh', 'dash', 'ksh'})
+# 값을 별도 토큰으로 받는 쉘 옵션 (bash -o pipefail -c ...)
+_SHELL_OPTIONS_WITH_VALUE: frozenset[str] = frozenset({'-o', '+o', '-O', '+O', '--rcfile', '--init-file'})
+
+# 값을 별도 토큰으로 받는 git 전역 옵션
+_GIT_OPTIONS_WITH_VALUE: frozenset[str] = frozenset({
+    '-C', '-c', '--git-dir', '--work-tree', '--namespace', '--super-prefix', '--config-env',
+})
+
+
+@dataclass(frozen=True)
+class SubCommand:
+    """단순 명령 1개.
+
+    Attributes:
+        argv: 따옴표가 풀린 토큰 목록 (리다이렉션 제외)
+        redirects: (연산자, 대상) 목록
+    """
+
+    argv: tuple[str, ...]
+    redirects: tuple[tuple[str, str], ...] = ()
+
+    @functools.cached_property
+    def words(self) -> tuple[str, ...]:
+        """변수 할당 접두, 예약어(!, {, then, do 등), 래퍼(sudo, env 등)와 그 옵션 값을 건너뛴 실제 명령 argv."""
+        words = list(self.argv)
+        while words:
+            head = words.pop(0)
+            if _ASSIGNMENT_RE.match(head) or head in _RESERVED_WORDS:
+                continue
+            if head not in _COMMAND_WRAPPERS:
+                words.insert(0, head)
+                break
+            valued = _COMMAND_WRAPPERS[head]
+            while words and words[0].startswith('-') and words[0] != '-':
+                option = words.pop(0)
+                if option == '--':
+                    break
+                if option in valued and words:
+                    words.pop(0)
+            del words[:_WRAPPER_OPERANDS.get(head, 0)]
+        return tuple(words)
+
+    @property
+    def program(self) -> str:
+        """실행 프로그램 basename (없으면 빈 문자열)."""
+        return os.path.basename(self.words[0]) if self.words else ''
+
+    @property
+    def args(self) -> tuple[str, ...]:
+        """program 이후 인자."""
+        return self.words[1:]
+
+    @functools.cached_property
+    def shell_payload(self) -> str | None:
+        """쉘 문자열로 다시 실행되는 명령 (``bash -c '…'`` 의 문자열, ``eval …`` 의 인자).
+
+        Returns:
+            재실행되는 command 문자열. 쉘 문자열 래퍼가 아니면 None.
+        """
+        if self.program == 'eval':
+            return ' '.join(self.args) or None
+        if self.program not in _SHELL_PROGRAMS:
+            return None
+        args = list(self.args)
+        has_c = False
+        while args:
+            token = args.pop(0)
+            if token == '--':
+                break
+            if token in _SHELL_OPTIONS_WITH_VALUE:
+                if args:
+                    args.pop(0)
+            elif token.startswith('-') and not token.startswith('--') and 'c' in token[1:]:
+                has_c = True
+            elif not token.startswith(('-', '+')):
+                return token if has_c else None
+        return args[0] if has_c and args else None
+
+
+@dataclass(frozen=True)
+class Invocation:
+    """git / flow-* 호출 1건.
+
+    Attributes:
+        name: git 서브커맨드 (예: "commit") 또는 flow 명령 (예: "flow-kanban")
+        args: 이후 인자
+        options: 서브커맨드 앞의 전역 옵션 (예: ("-C", "/path"))
+    """
+
+    name: str
+    args: tuple[str, ...] = ()
+    options: tuple[str, ...] = ()
+
+    def option(self, flag: str) -> str | None:
+        """값을 받는 전역 옵션의 마지막 값을 반환한다 (예: option("-C")).
+
+        Args:
+            flag: 옵션 이름
+
+        Returns:
+            옵션 값. 없으면 None.
+        """
+        value = None
+        for idx, token in enumerate(self.options):
+            if token == flag and idx + 1 < len(self.options):
+                value = self.options[idx + 1]
+            elif token.startswith(flag + '='):
+                value = token[len(flag) + 1:]
+        return value
+
+
+@dataclass(frozen=True)
+class BashCommand:
+    """Bash command 문자열의 분석 결과.
+
+    Attributes:
+        raw: 원본 command
+        subcommands: 단순 명령 목록 (원문 순서)
+        quoted_spans: 따옴표 구간 (start, end) 목록
+        stripped: 따옴표 내부를 비운 문자열 (따옴표 기호는 유지)
+        segments: stripped 를 &&, ||, |, ; 로 분할한 세그먼트 (선행 공백 제거)
+    """
+
+    raw: str
+    subcommands: tuple[SubCommand, ...] = ()
+    quoted_spans: tuple[tuple[int, int], ...] = ()
+    stripped: str = ''
+    segments: tuple[str, ...] = field(default=())
+
+    @functools.cached_property
+    def redirect_targets(self) -> tuple[str, ...]:
+        """파일로 향하는 출력 리다이렉션 대상 (fd 복제 >&N 제외)."""
+        targets = []
+        for sub in self.subcommands:
+            for op, target in sub.redirects:
+                if '>' not in op:
+                    continue
+                if op == '>&' and (target.isdigit() or target == '-'):
+                    continue
+                targets.append(target)
+        return tuple(targets)
+
+    @functools.cached_property
+    def git_invocations(self) -> tuple[Invocation, ...]:
+        """git 호출 목록. 전역 옵션을 건너뛴 첫 비옵션 토큰이 서브커맨드이다."""
+        result = []
+        for sub in self.subcommands:
+            if sub.program != 'git':
+                continue
+            args = list(sub.args)
+            options: list[str] = []
+            while args and args[0].startswith('-'):
+                options.append(args.pop(0))
+                if options[-1] in _GIT_OPTIONS_WITH_VALUE and args:
+                    options.append(args.pop(0))
+            if args:
+                result.append(Invocation(args[0], tuple(args[1:]), tuple(options)))
+        return tuple(result)
+
+    @functools.cached_property
+    def flow_invocations(self) -> tuple[Invocation, ...]:
+        """flow-* 호출 목록."""
+        return tuple(
+            Invocation(sub.program, sub.args)
+            for sub in self.subcommands
+            if sub.program.startswith('flow-')
+        )
+
+    @functools.cached_property
+    def file_modify_pattern(self) -> str | None:
+        """segments 중 처음 매칭된 파일 수정 패턴 문자열 (없으면 None)."""
+        for segment in self.segments:
+            for pattern, regex in _FILE_MODIFY_REGEXES:
+                if regex.search(segment):
+                    return pattern
+        return None
+
+    def git(self, subcommand: str) -> list[Invocation]:
+        """지정 서브커맨드의 git 호출 목록을 반환한다.
+
+        Args:
+            subcommand: git 서브커맨드 (예: "commit", "worktree")
+
+        Returns:
+            해당 Invocation 목록 (원문 순서).
+        """
+        return [inv for inv in self.git_invocations if inv.name == subcommand]
+
+    def flow(self, name: str) -> list[Invocation]:
+        """지정 flow-* 명령의 호출 목록을 반환한다.
+
+        Args:
+            name: flow 명령 이름 (예: "flow-kanban")
+
+        Returns:
+            해당 Invocation 목록 (원문 순서).
+        """
+        return [inv for inv in self.flow_invocations if inv.name == name]
+
+    def invocations(self, program: str) -> list[SubCommand]:
+        """지정 프로그램을 실행하는 단순 명령 목록을 반환한다.
+
+        Args:
+            program: 프로그램 basename (예: "python3")
+
+        Returns:
+            해당 SubCommand 목록 (원문 순서).
+        """
+        return [sub for sub in self.subcommands if sub.program == program]
+
+
+class _Lexer:
+    """command 문자열을 SubCommand 목록과 따옴표 구간으로 분해한다."""
+
+    def __init__(self, command: str) -> None:
+        self.src = command
+        self.pos = 0
+        self.subcommands: list[SubCommand] = []
+        self.quoted_spans: list[tuple[int, int]] = []
+        self._argv: list[str] = []
+        self._redirects: list[tuple[str, str]] = []
+        self._word: list[str] = []
+        self._in_word = False
+        self._pending_op: str | None = None
+        self._heredocs: list[tuple[str, bool]] = []  # (구분자, <<- 여부)
+
+    def run(self) -> _Lexer:
+        src, n = self.src, len(self.src)
+        while self.pos < n:
+            ch = src[self.pos]
+            if ch == "'":
+                self._quoted_single()
+            elif ch == '"':
+                self._quoted_double()
+            elif ch == '\\':
+                if src.startswith('\\\n', self.pos):
+                    self.pos += 2  # 줄 이어쓰기
+                else:
+                    self._in_word = True
+                    self._word.append(src[self.pos + 1:self.pos + 2])
+                    self.pos += 2
+            elif ch in ' \t':
+                self._end_word()
+                self.pos += 1
+            elif ch == '#' and not self._in_word:
+                end = src.find('\n', self.pos)
+                self.pos = n if end < 0 else end
+            elif ch in '<>' or src.startswith('&>', self.pos):
+                self._redirect()
+            elif self._separator():
+                pass
+            else:
+                self._in_word = True
+                self._word.append(ch)
+                self.pos += 1
+        self._end_command()
+        return self
+
+    def _quoted_single(self) -> None:
+        start = self.pos
+        end = self.src.find("'", start + 1)
+        end = len(self.src) if end < 0 else end
+        self._in_word = True
+        self._word.append(self.src[start + 1:end])
+        self.pos = end + 1
+        self.quoted_spans.append((start, min(self.pos, len(self.src))))
+
+    def _quoted_double(self) -> None:
+        src, start = self.src, self.pos
+        i = start + 1
+        while i < len(src) and src[i] != '"':
+            if src[i] == '\\' and i + 1 < len(src) and src[i + 1] in '"\\$`\n':
+                if src[i + 1] != '\n':
+                    self._word.append(src[i + 1])
+                i += 2
+                continue
+            self._word.append(src[i])
+            i += 1
+        self._in_word = True
+        self.pos = i + 1
+        self.quoted_spans.append((start, min(self.pos, len(src))))
+
+    def _redirect(self) -> None:
+        # 숫자만으로 된 직전 단어는 fd 번호 (예: 2>)
+        if self._in_word and ''.join(self._word).isdigit():
+            self._word.clear()
+            self._in_word = False
+        self._end_word()
+        match = _REDIRECT_RE.match(self.src, self.pos)
+        op = match.group(0) if match else self.src[self.pos]
+        self.pos += len(op)
+        self._pending_op = op
+
+    def _separator(self) -> bool:
+        for sep in _SEPARATORS:
+            if self.src.startswith(sep, self.pos):
+                self._end_command()
+                self.pos += len(sep)
+                if sep == '\n' and self._heredocs:
+                    self._skip_heredoc_bodies()
+                return True
+        return False
+
+    def _skip_heredoc_bodies(self) -> None:
+        """개행 직후 대기 중인 heredoc 본문을 구분자 줄까지 건너뛴다."""
+        src = self.src
+        for delimiter, strip_tabs in self._heredocs:
+            while self.pos < len(src):
+                end = src.find('\n', self.pos)
+                line = src[self.pos:] if end < 0 else src[self.pos:end]
+                self.pos = len(src) if end < 0 else end + 1
+                if (line.lstrip('\t') if strip_tabs else line) == delimiter:
+                    break
+        self._heredocs.clear()
+
+    def _end_word(self) -> None:
+        if not self._in_word:
+            return
+        text = ''.join(self._word)
+        self._word.clear()
+        self._in_word = False
+        if self._pending_op is None:
+            self._argv.append(text)
+            return
+        op, self._pending_op = self._pending_op, None
+        if op in ('<<', '<<-'):
+            self._heredocs.append((text, op == '<<-'))
+        self._redirects.append((op, text))
+
+    def _end_command(self) -> None:
+        self._end_word()
+        self._pending_op = None
+        if self._argv or self._redirects:
+            self.subcommands.append(SubCommand(tuple(self._argv), tuple(self._redirects)))
+        self._argv = []
+        self._redirects = []
+
+
+def strip_quoted_args(command: str) -> str:
+    """명령 문자열에서 따옴표로 감싼 영역의 내용을 빈 문자열로 치환한다.
+
+    작은따옴표('...') 및 큰따옴표("...") 내부 텍스트를 제거하여
+    인자 값에 위험 명령어 텍스트가 포함되어도 패턴 매칭 대상에서
+    제외되도록 전처리한다. 이스케이프된 따옴표(\\", \\')는 따옴표
+    종료로 인식하지 않는다.
+
+    Args:
+        command: Bash 도구의 원본 command 문자열
+
+    Returns:
+        따옴표 내부 내용이 제거된 문자열. 따옴표 기호 자체는 유지된다.
+    """
+    command = _DOUBLE_QUOTED_RE.sub('""', command)
+    return _SINGLE_QUOTED_RE.sub("''", command)
+
+
+@functools.lru_cache(maxsize=128)
+def analyze(command: str) -> BashCommand:
+    """command 문자열을 분석한다. 같은 문자열은 캐시된 결과를 반환한다.
+
+    Args:
+        command: Bash 도구의 command 문자열
+
+    Returns:
+        BashCommand (불변).
+    """
+    lexer = _Lexer(command).run()
+    stripped = strip_quoted_args(command)
+    segments = tuple(part.lstrip() for part in _SEGMENT_SPLIT_RE.split(stripped) if part.strip())
+    # bash -c '…' / eval … 의 문자열 인자는 다시 분석하여 래퍼 바로 뒤에 펼친다
+    # (payload 는 원문보다 항상 짧으므로 재귀는 유한하다)
+    subcommands: list[SubCommand] = []
+    for sub in lexer.subcommands:
+        subcommands.append(sub)
+        payload = sub.shell_payload
+        if payload and payload != command:
+            subcommands.extend(analyze(payload).subcommands)
+    return BashCommand(
+        raw=command,
+        subcommands=tuple(subcommands),
+        quoted_spans=tuple(lexer.quoted_spans),
+        stripped=stripped,
+        segments=segments,
+    )
+
+
+def analyze_payload(data: dict[str, Any]) -> BashCommand | None:
+    """PreToolUse payload 의 Bash command 를 분석한다.
+
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
+
+    Returns:
+        Bash 도구이고 command 가 비어있지 않으면 BashCommand, 아니면 None.
+    """
+    if data.get("tool_name") != "Bash":
+        return None
+    tool_input = data.get("tool_input") or {}
+    command = tool_input.get("command", "") if isinstance(tool_input, dict) else ""
+    if not command or not isinstance(command, str):
+        return None
+    return analyze(command)
@@ -4,6 +4,7 @@
 PreToolUse(Bash) 이벤트에서 위험 명령어 패턴 매칭 후 차단.
 
 주요 함수:
+    evaluate: 위험 명령어 판정 (가드 플러그인 API)
     main: Hook 진입점, stdin JSON 파싱 후 위험 명령어 차단
 
 입력: stdin으로 JSON (tool_name, tool_input)
@@ -12,7 +13,6 @@ PreToolUse(Bash) 이벤트에서 위험 명령어 패턴 매칭 후 차단.
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import sys
@@ -22,7 +22,7 @@ _engine_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__fi
 if _engine_dir not in sys.path:
     sys.path.insert(0, _engine_dir)
 
-from common import read_env
+from guards.guard_api import Decision, deny, run_script
 
 # 위험 명령어 패턴 로드 (보안 우선: import 실패 시 전체 차단 폴백)
 try:
@@ -47,68 +47,67 @@ except ImportError:
     ]
 
 
-def _deny(blocked: str, alternative: str) -> None:
-    """차단 JSON을 stdout에 출력하고 프로세스를 종료한다.
+HOOK_FLAG: str = "HOOK_DANGEROUS_COMMAND"
+
+
+def _deny(blocked: str, alternative: str) -> Decision:
+    """차단 Decision을 생성한다.
 
     Args:
         blocked: 차단된 명령어 또는 패턴 설명
         alternative: 안전한 대안 안내 문자열
+
+    Returns:
+        permission="deny" Decision.
     """
     reason = f"위험한 명령어가 감지되었습니다: {blocked}. 안전한 대안: {alternative}"
-    result = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "deny",
-            "permissionDecisionReason": reason,
-        }
-    }
-    print(json.dumps(result, ensure_ascii=False))
-    sys.exit(0)
+    return deny(reason)
 
 
-def main() -> None:
-    """위험한 명령어 차단 Hook의 진입점.
+def evaluate(data: dict) -> Decision | None:
+    """위험한 명령어 차단 판정.
 
-    stdin에서 JSON을 읽어 Bash 도구 실행 시 위험 패턴을 검사하고,
-    매칭 시 deny 응답을 출력하여 실행을 차단한다.
+    Bash 도구 실행 시 위험 패턴을 검사하고, 매칭 시 deny Decision을 반환한다.
     화이트리스트 패턴에 매칭되면 검사를 건너뛴다.
-    """
-    # .claude-organic/.settings에서 설정 로드
-    hook_flag = os.environ.get("HOOK_DANGEROUS_COMMAND") or read_env("HOOK_DANGEROUS_COMMAND")
 
-    # Hook disable check (false = disabled)
-    if hook_flag in ("false", "0"):
-        sys.exit(0)
-
-    # stdin에서 JSON 읽기
-    try:
-        data = json.load(sys.stdin)
-    except (json.JSONDecodeError, ValueError):
-        sys.exit(0)
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
 
+    Returns:
+        차단 시 deny Decision, 통과 시 None.
+    """
     tool_name = data.get("tool_name", "")
 
     # Bash가 아니면 통과
     if tool_name != "Bash":
-        sys.exit(0)
+        return None
 
     tool_input = data.get("tool_input", {})
     command = tool_input.get("command", "")
     if not command:
-        sys.exit(0)
+        return None
 
     # 화이트리스트 검사 (안전한 패턴은 통과)
     for wl_pattern, _ in WHITELIST_PATTERNS:
         if re.search(wl_pattern, command):
-            sys.exit(0)
+            return None
 
     # 위험 패턴 검사
     for pattern, blocked, alternative in DANGER_PATTERN_LIST:
         if re.search(pattern, command):
-            _deny(blocked, alternative)
+            return _deny(blocked, alternative)
 
     # 위험 패턴 미매칭 시 통과
-    sys.exit(0)
+    return None
+
+
+def main() -> None:
+    """위험한 명령어 차단 Hook의 진입점.
+
+    HOOK_DANGEROUS_COMMAND 토글 확인 후 stdin JSON을 evaluate()에 전달하고,
+    차단 판정이면 deny JSON을 출력한다.
+    """
+    run_script(evaluate, HOOK_FLAG)
 
 
 if __name__ == "__main__":
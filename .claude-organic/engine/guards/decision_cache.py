@@ -0,0 +1,376 @@
+"""decision_cache.py - PreToolUse 가드 판정 영속 캐시.
+
+에이전트는 한 세션에서 같은 Bash 명령(``git status``, ``flow-kanban show T-NNN``,
+``ls`` 등)을 반복 실행한다. 가드 판정이 입력과 저장소 상태만의 함수인 경우
+판정 결과를 ``<project_root>/.claude-organic/.guard-cache.jsonl`` 에 저장하고
+(``_WF_STATE_DIR`` 환경변수가 있으면 그 디렉터리 아래), 같은 입력이 다시 오면
+가드를 실행하지 않고 그대로 재사용한다.
+
+캐시 파일 (append 로그):
+    1행: {"version", "validators"}
+    2행~: {"k": 캐시 키, "ts", "guards": {가드 이름: [permission, reason] 또는 null}}
+    캐시 miss 마다 파일 전체를 다시 쓰지 않고 한 줄을 O_APPEND 로 덧붙인다. 같은 키는
+    뒤 줄이 앞 줄을 대체한다. 로그가 MAX_LOG_LINES 를 넘거나 validators 가 바뀌었을
+    때만 최신 MAX_ENTRIES 항목으로 압축해 원자적으로 교체한다.
+    다른 프로세스가 덧붙인 줄은 마지막으로 읽은 위치 이후만 읽어 반영한다.
+
+캐시 키 (sha1):
+    tool_name, 정규화된 tool_input (가드가 읽는 필드만, command 는 strip),
+    세션 유형, cwd, 워크트리/워크플로우 환경변수, 현재 브랜치(HEAD), .settings 해시
+
+전체 무효화 (validators 불일치 시 캐시를 비운다):
+    - cwd 저장소의 HEAD 내용 (브랜치 전환, detached 이동)
+    - .claude-organic/.settings 내용 해시
+    - engine/guards/*.py 및 prompts/messages.py 의 (개수, 최대 mtime_ns)
+
+가드 모듈 계약 (guard_api.py 참고):
+    CACHEABLE = False: 외부 상태(git status, 티켓 XML 등)에 의존하므로 캐시하지 않는다.
+    cacheable(payload) -> bool: (선택) 이벤트별로 캐시 가능 여부를 판정한다.
+
+이 모듈은 판정을 저장/조회만 하며, 가드 실행 순서와 첫 deny 규칙은
+hooks/dispatcher.py 의 evaluate_guards() 가 그대로 유지한다.
+
+주요 함수:
+    get_cache: project_root 별 GuardDecisionCache 싱글턴
+    is_cacheable: 가드 모듈 + payload 의 캐시 가능 여부
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from types import ModuleType
+from typing import Any
+
+_engine_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+if _engine_dir not in sys.path:
+    sys.path.insert(0, _engine_dir)
+
+import root_cache
+from flow.session_identifier import get_session_type
+from git_state import read_head
+from guards.guard_api import Decision
+
+CACHE_FILENAME: str = ".guard-cache.jsonl"
+
+# 캐시 포맷 버전 (필드 변경 시 증가 → 기존 캐시 무시)
+CACHE_VERSION: int = 2
+
+# 압축 시 유지할 최대 항목 수 (오래된 항목부터 제거)
+MAX_ENTRIES: int = 512
+
+# 로그 줄 수(헤더 제외)가 이를 넘으면 압축한다. MAX_ENTRIES 보다 여유를 두어
+# 용량에 도달한 뒤에도 miss 마다 다시 압축하지 않게 한다.
+MAX_LOG_LINES: int = 2 * MAX_ENTRIES
+
+# 가드 판정에 쓰이는 tool_input 필드 (그 외 description/timeout 등은 키에서 제외)
+_INPUT_FIELDS: tuple[str, ...] = ("command", "file_path", "notebook_path", "subagent_type", "prompt")
+
+# 가드 판정에 영향을 주는 환경변수
+_CONTEXT_ENV: tuple[str, ...] = (
+    "WORKFLOW_COMMAND",
+    "WORKFLOW_WORK_DIR",
+    "WORKFLOW_WORKTREE_PATH",
+    "HOOKS_EDIT_ALLOWED",
+    "PROJECT_ROOT",
+)
+
+_GUARDS_DIR: str = os.path.dirname(os.path.abspath(__file__))
+_MESSAGES_FILE: str = os.path.normpath(os.path.join(_GUARDS_DIR, "..", "..", "prompts", "messages.py"))
+
+_CACHES: dict[tuple[str, str], GuardDecisionCache] = {}
+
+
+def is_cacheable(module: ModuleType, payload: dict[str, Any]) -> bool:
+    """가드 모듈의 판정을 이 이벤트에 대해 캐시할 수 있는지 반환한다.
+
+    Args:
+        module: 가드 모듈
+        payload: PreToolUse stdin JSON
+
+    Returns:
+        CACHEABLE 이 False 가 아니고, cacheable(payload) 가 있으면 그 결과도 True 일 때 True.
+    """
+    if not getattr(module, "CACHEABLE", True):
+        return False
+    predicate = getattr(module, "cacheable", None)
+    if callable(predicate):
+        try:
+            return bool(predicate(payload))
+        except Exception:  # noqa: BLE001
+            return False
+    return True
+
+
+def _read_head(cwd: str) -> str:
+    """cwd 저장소의 HEAD 내용 (``ref: refs/heads/x`` 또는 sha). 없으면 빈 문자열."""
+    return read_head(cwd)
+
+
+def _sources_signature() -> list[int]:
+    """가드 소스 파일의 [개수, 최대 mtime_ns]."""
+    count = 0
+    newest = 0
+    try:
+        with os.scandir(_GUARDS_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".py"):
+                    count += 1
+                    newest = max(newest, entry.stat().st_mtime_ns)
+    except OSError:
+        pass
+    try:
+        newest = max(newest, os.stat(_MESSAGES_FILE).st_mtime_ns)
+    except OSError:
+        pass
+    return [count, newest]
+
+
+def _normalize_input(tool_input: Any) -> dict[str, Any]:
+    """tool_input 에서 가드가 읽는 필드만 남긴다."""
+    if not isinstance(tool_input, dict):
+        return {}
+    normalized = {key: tool_input[key] for key in _INPUT_FIELDS if key in tool_input}
+    if isinstance(normalized.get("command"), str):
+        normalized["command"] = normalized["command"].strip()
+    return normalized
+
+
+class GuardDecisionCache:
+    """project_root 단위 가드 판정 캐시.
+
+    Attributes:
+        project_root: 메인 리포 루트
+        path: 캐시 파일 경로
+    """
+
+    def __init__(self, project_root: str, path: str | None = None) -> None:
+        """초기화한다. 캐시 파일은 첫 조회 때 읽는다.
+
+        Args:
+            project_root: 메인 리포 루트
+            path: 캐시 파일 경로 (None 이면 <state_dir>/.guard-cache.json)
+        """
+        self.project_root: str = project_root
+        organic_dir = os.path.join(project_root, ".claude-organic")
+        self.path: str = path or os.path.join(root_cache.state_dir(organic_dir), CACHE_FILENAME)
+        self._settings_path: str = os.path.join(project_root, ".claude-organic", ".settings")
+        self._settings_memo: tuple[tuple[int, int] | None, str] = (None, "")
+        self._data: dict[str, Any] | None = None
+        # 마지막으로 읽은 캐시 파일의 (inode, 읽은 바이트 수)
+        self._file_key: tuple[int, int] | None = None
+        # 캐시 파일의 항목 줄 수 (헤더 제외, 압축 판단용)
+        self._lines: int = 0
+
+    # -- 키/검증 -------------------------------------------------------------
+
+    def _settings_hash(self) -> str:
+        """.settings 내용 sha1 ((mtime_ns, size) 기준 프로세스 내 메모)."""
+        try:
+            st = os.stat(self._settings_path)
+            stat_key: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return ""
+        if self._settings_memo[0] == stat_key:
+            return self._settings_memo[1]
+        try:
+            with open(self._settings_path, "rb") as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+        except OSError:
+            digest = ""
+        self._settings_memo = (stat_key, digest)
+        return digest
+
+    def validators(self, head: str | None = None) -> dict[str, Any]:
+        """현재 무효화 기준값을 반환한다."""
+        return {
+            "head": _read_head(os.getcwd()) if head is None else head,
+            "settings": self._settings_hash(),
+            "sources": _sources_signature(),
+        }
+
+    def key(self, payload: dict[str, Any]) -> str:
+        """payload 와 현재 실행 맥락으로 캐시 키를 만든다.
+
+        Args:
+            payload: PreToolUse stdin JSON
+
+        Returns:
+            sha1 hex 문자열.
+        """
+        cwd = os.getcwd()
+        material = [
+            payload.get("tool_name", ""),
+            _normalize_input(payload.get("tool_input")),
+            get_session_type(),
+            cwd,
+            [os.environ.get(name, "") for name in _CONTEXT_ENV],
+            _read_head(cwd),
+            self._settings_hash(),
+        ]
+        raw = json.dumps(material, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    # -- 조회/저장 -----------------------------------------------------------
+
+    def _empty(self, validators: dict[str, Any] | None = None) -> dict[str, Any]:
+        """빈 캐시 dict 를 만들고 줄 수를 초기화한다."""
+        self._lines = 0
+        return {"version": CACHE_VERSION, "validators": validators, "entries": {}}
+
+    def _apply(self, data: dict[str, Any], lines: list[bytes]) -> None:
+        """항목 줄을 data 에 반영한다 (같은 키는 뒤 줄 우선). 깨진 줄은 건너뛴다."""
+        entries: dict[str, Any] = data["entries"]
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and isinstance(record.get("k"), str):
+                key = record.pop("k")
+                entries.pop(key, None)
+                entries[key] = record
+                self._lines += 1
+
+    def _load(self) -> dict[str, Any]:
+        """캐시 파일을 읽는다.
+
+        같은 파일(inode)이 그대로면 메모를 재사용하고, 커졌으면 마지막으로 읽은 위치
+        이후의 완성된 줄만 읽어 반영한다. 교체(압축)되었으면 처음부터 다시 읽는다.
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self._data = self._empty()
+            self._file_key = None
+            return self._data
+        offset = 0
+        if self._data is not None and self._file_key is not None and self._file_key[0] == st.st_ino:
+            if st.st_size == self._file_key[1]:
+                return self._data
+            if st.st_size > self._file_key[1]:
+                offset = self._file_key[1]
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                chunk = f.read()
+        except OSError:
+            self._data = self._empty()
+            self._file_key = None
+            return self._data
+        # 기록 중인 마지막 줄(개행 없음)은 다음 조회에서 읽는다
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        lines = complete.splitlines()
+        if offset == 0:
+            data = self._empty()
+            header: Any = None
+            if lines:
+                try:
+                    header = json.loads(lines[0])
+                except ValueError:
+                    header = None
+            if isinstance(header, dict) and header.get("version") == CACHE_VERSION:
+                data["validators"] = header.get("validators")
+                self._apply(data, lines[1:])
+            self._data = data
+        else:
+            self._apply(self._data, lines)
+        self._file_key = (st.st_ino, offset + len(complete))
+        return self._data
+
+    def lookup(self, key: str) -> dict[str, Decision | None]:
+        """키에 저장된 가드별 판정을 반환한다.
+
+        Args:
+            key: key() 결과
+
+        Returns:
+            {가드 이름: Decision 또는 None(의견 없음)}. 없거나 무효화되었으면 빈 dict.
+        """
+        data = self._load()
+        if data.get("validators") != self.validators():
+            return {}
+        entry = data.get("entries", {}).get(key)
+        if not isinstance(entry, dict):
+            return {}
+        result: dict[str, Decision | None] = {}
+        for name, value in (entry.get("guards") or {}).items():
+            if value is None:
+                result[name] = None
+            elif isinstance(value, list) and len(value) == 2:
+                result[name] = Decision(str(value[0]), str(value[1]))
+        return result
+
+    def store(self, key: str, decisions: dict[str, Decision | None]) -> None:
+        """가드별 판정을 키에 병합 저장한다. 실패는 무시한다.
+
+        평소에는 캐시 파일에 한 줄을 덧붙이고, validators 가 바뀌었거나 로그가
+        MAX_LOG_LINES 에 도달했을 때만 _compact() 로 파일을 다시 쓴다.
+
+        Args:
+            key: key() 결과
+            decisions: {가드 이름: Decision 또는 None}
+        """
+        if not decisions:
+            return
+        data = self._load()
+        validators = self.validators()
+        rewrite = self._file_key is None or self._lines >= MAX_LOG_LINES
+        if data.get("validators") != validators:
+            data = self._data = self._empty(validators)
+            rewrite = True
+        entries: dict[str, Any] = data["entries"]
+        entry = entries.pop(key, None)
+        guards = dict(entry.get("guards") or {}) if isinstance(entry, dict) else {}
+        for name, decision in decisions.items():
+            guards[name] = None if decision is None else [decision.permission, decision.reason]
+        entries[key] = {"ts": time.time(), "guards": guards}
+        if rewrite:
+            self._compact(data)
+            return
+        line = json.dumps({"k": key, **entries[key]}, ensure_ascii=False) + "\n"
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+            try:
+                os.write(fd, line.encode("utf-8"))
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+        # 덧붙인 줄(과 그 사이 다른 프로세스가 덧붙인 줄)은 다음 _load() 가 읽어 줄 수에 반영한다
+
+    def _compact(self, data: dict[str, Any]) -> None:
+        """최신 MAX_ENTRIES 항목만 남겨 캐시 파일을 원자적으로 다시 쓴다. 실패는 무시한다."""
+        entries: dict[str, Any] = data["entries"]
+        if len(entries) > MAX_ENTRIES:
+            newest = sorted(entries.items(), key=lambda kv: kv[1].get("ts", 0) if isinstance(kv[1], dict) else 0)
+            entries = data["entries"] = dict(newest[-MAX_ENTRIES:])
+        lines = [json.dumps({"version": CACHE_VERSION, "validators": data["validators"]}, ensure_ascii=False)]
+        lines.extend(json.dumps({"k": key, **record}, ensure_ascii=False) for key, record in entries.items())
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        directory = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".guard-cache-", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, self.path)
+            st = os.stat(self.path)
+            self._file_key = (st.st_ino, len(payload))
+        except OSError:
+            self._file_key = None
+        self._lines = len(entries)
+        self._data = data
+
+
+def get_cache(project_root: str) -> GuardDecisionCache:
+    """project_root (+ 상태 디렉터리) 별 GuardDecisionCache 싱글턴을 반환한다."""
+    key = (project_root, os.environ.get(root_cache.STATE_DIR_ENV, ""))
+    cache = _CACHES.get(key)
+    if cache is None:
+        cache = _CACHES[key] = GuardDecisionCache(project_root)
+    return cache
@@ -5,6 +5,7 @@ PreToolUse(Bash) 이벤트에서 python3 .claude-organic/engine/ 패턴의 직
 감지하여 flow-* alias 사용을 안내하는 가드 스크립트.
 
 주요 함수:
+    evaluate: 직접 경로 호출 판정 (가드 플러그인 API)
     main: Hook 진입점, stdin JSON 파싱 후 직접 경로 호출 차단
 
 입력: stdin으로 JSON (tool_name, tool_input)
@@ -15,9 +16,7 @@ PreToolUse(Bash) 이벤트에서 python3 .claude-organic/engine/ 패턴의 직
 
 from __future__ import annotations
 
-import json
 import os
-import re
 import sys
 
 # utils 패키지 import 경로 설정
@@ -30,31 +29,24 @@ _prompt_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__fi
 if _prompt_dir not in sys.path:
     sys.path.insert(0, _prompt_dir)
 
-from common import read_env
+from guards.bash_analysis import BashCommand, analyze_payload
+from guards.guard_api import Decision, deny, run_script
 from messages import DIRECT_PATH_CALL_DENIED
 
-# 직접 경로 호출 감지 패턴 (상대경로 + 절대경로 모두 감지)
-_DIRECT_PATH_PATTERN = re.compile(
-    r"python3\s+(?:\.claude\.workflow/scripts/|/[^\s]*\.claude\.workflow/scripts/)"
-)
+HOOK_FLAG: str = "HOOK_DIRECT_PATH_GUARD"
+# 이 가드는 플래그가 명시적으로 설정된 경우에만 활성 (미설정 = 비활성)
+FLAG_REQUIRED: bool = True
+
+# 직접 경로 호출 감지 대상: .claude.workflow/ 이후 경로 접두 (상대경로 + 절대경로 모두 감지)
+_SCRIPTS_PREFIX: str = "scripts/"
 
-# 허용 예외 패턴 (settings.json hooks/statusLine 등에서 고정 호출하는 경로)
-_ALLOWED_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"python3\s+\.claude\.workflow/hooks/"),              # hook 디스패처 호출 (상대경로)
-    re.compile(r"python3\s+\.claude\.workflow/scripts/statusline\.py"),  # statusLine command (상대경로)
-    re.compile(r"python3\s+\.claude\.workflow/board/server\.py"),    # SessionStart board server (상대경로)
-    re.compile(r"python3\s+/[^\s]*\.claude\.workflow/hooks/"),       # hook 디스패처 호출 (절대경로)
-    re.compile(r"python3\s+/[^\s]*\.claude\.workflow/scripts/statusline\.py"),  # statusLine command (절대경로)
-    re.compile(r"python3\s+/[^\s]*\.claude\.workflow/board/server\.py"),  # SessionStart board server (절대경로)
-    re.compile(r"python3\s+(?:\.|/[^\s]*)\.claude\.workflow/scripts/claude_edit\.py"),  # .claude 간접 편집 유틸리티
-]
-
-# && 체인에서 hook 디스패처 뒤에 이어지는 history_sync.py 호출 허용 패턴
-# 예(상대경로): python3 .claude-organic/hooks/... && python3 .claude-organic/engine/sync/history_sync.py ...
-# 예(절대경로): python3 /path/.claude-organic/hooks/... && python3 /path/.claude-organic/engine/sync/history_sync.py ...
-_CHAINED_HISTORY_SYNC_PATTERN = re.compile(
-    r"python3\s+(?:\.claude\.workflow/hooks/|/[^\s]*\.claude\.workflow/hooks/)\S*\s*&&\s*"
-    r"python3\s+(?:\.claude\.workflow/scripts/sync/|/[^\s]*\.claude\.workflow/scripts/sync/)history_sync\.py"
+# 허용 예외 스크립트 경로 (settings.json hooks/statusLine 등에서 고정 호출하는 경로)
+# 경로 접두 ".claude.workflow/" 이후 부분과 비교한다. 끝이 "/" 이면 디렉터리 접두 매칭.
+_ALLOWED_SCRIPTS: tuple[str, ...] = (
+    "hooks/",                  # hook 디스패처 호출
+    "scripts/statusline.py",   # statusLine command
+    "board/server.py",         # SessionStart board server
+    "scripts/claude_edit.py",  # .claude 간접 편집 유틸리티
 )
 
 # 스크립트 파일명 -> alias 매핑
@@ -77,124 +69,121 @@ ALIAS_MAP: dict[str, str] = {
     "project_skill_detector.py": "flow-detect",
 }
 
-# 스크립트 파일명에서 파일명만 추출하는 패턴 (상대경로 + 절대경로 모두 지원)
-_SCRIPT_NAME_PATTERN = re.compile(
-    r"python3\s+(?:\.claude\.workflow/scripts/|/[^\s]*\.claude\.workflow/scripts/)(?:\S+/)?(\S+\.py)"
-)
 
+def _workflow_relpath(script: str) -> str | None:
+    """python3 스크립트 인자에서 ``.claude.workflow/`` 이후 상대 경로를 반환한다.
 
-def _deny(reason: str) -> None:
-    """차단 JSON을 stdout에 출력하고 프로세스를 종료한다.
+    상대경로(``.claude.workflow/...``)와 절대경로(``/.../.claude.workflow/...``)만
+    인정한다.
 
     Args:
-        reason: 차단 사유 문자열
+        script: python3 의 첫 인자
+
+    Returns:
+        ``.claude.workflow/`` 이후 경로. 해당하지 않으면 None.
     """
-    result = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "deny",
-            "permissionDecisionReason": reason,
-        }
-    }
-    print(json.dumps(result, ensure_ascii=False))
-    sys.exit(0)
+    marker = ".claude.workflow/"
+    if script.startswith(marker):
+        return script[len(marker):]
+    if script.startswith("/") and marker in script:
+        return script[script.index(marker) + len(marker):]
+    return None
 
 
-def _extract_script_name(command: str) -> str | None:
-    """명령어에서 .claude-organic/engine/ 하위 스크립트 파일명을 추출한다.
+def _python_scripts(command: BashCommand) -> list[str]:
+    """python3 호출의 ``.claude.workflow/`` 이후 스크립트 경로 목록을 반환한다.
 
     Args:
-        command: Bash 명령어 문자열
+        command: 공용 분석기의 Bash 명령 분석 결과
 
     Returns:
-        스크립트 파일명 (예: "kanban.py") 또는 None
+        원문 순서의 상대 경로 목록.
     """
-    match = _SCRIPT_NAME_PATTERN.search(command)
-    if match:
-        return match.group(1)
-    return None
+    scripts = []
+    for sub in command.invocations("python3"):
+        if not sub.args:
+            continue
+        relpath = _workflow_relpath(sub.args[0])
+        if relpath is not None:
+            scripts.append(relpath)
+    return scripts
 
 
-def _is_allowed(command: str) -> bool:
-    """명령어가 허용 예외 패턴에 해당하는지 확인한다.
+def _is_allowed(scripts: list[str]) -> bool:
+    """python3 호출 중 허용 예외 경로가 있는지 확인한다.
+
+    hook 디스패처 호출이 있는 명령은 (&& 체인의 history_sync.py 등 포함) 통과시키는
+    기존 정책을 유지한다.
 
     Args:
-        command: Bash 명령어 문자열
+        scripts: _python_scripts() 결과
 
     Returns:
         허용 예외이면 True, 차단 대상이면 False
     """
-    # 허용 예외 패턴 검사
-    for pattern in _ALLOWED_PATTERNS:
-        if pattern.search(command):
-            return True
-
-    # && 체인에서 hook 디스패처 뒤 history_sync.py 호출 허용
-    if _CHAINED_HISTORY_SYNC_PATTERN.search(command):
-        return True
-
+    for relpath in scripts:
+        for allowed in _ALLOWED_SCRIPTS:
+            if relpath == allowed or (allowed.endswith("/") and relpath.startswith(allowed)):
+                return True
     return False
 
 
-def main() -> None:
-    """직접 경로 호출 차단 가드 Hook의 진입점.
+def evaluate(data: dict) -> Decision | None:
+    """직접 경로 호출 차단 판정.
 
-    stdin에서 JSON을 읽어 Bash 도구의 python3 .claude-organic/engine/ 직접 호출을 감지하고,
-    flow-* alias 사용을 안내하는 deny 응답을 출력하여 차단한다.
+    공용 분석기가 추출한 python3 .claude-organic/engine/ 직접 호출을 감지하고,
+    flow-* alias 사용을 안내하는 deny Decision을 반환한다.
     settings.json에서 고정 호출하는 경로는 예외로 허용한다.
-    """
-    # .claude-organic/.settings에서 설정 로드
-    hook_flag = os.environ.get("HOOK_DIRECT_PATH_GUARD") or read_env("HOOK_DIRECT_PATH_GUARD")
 
-    # Hook disable check (미설정 또는 false = disabled)
-    if not hook_flag or hook_flag in ("false", "0"):
-        sys.exit(0)
-
-    # stdin에서 JSON 읽기
-    try:
-        data = json.load(sys.stdin)
-    except (json.JSONDecodeError, ValueError):
-        sys.exit(0)
-
-    tool_name = data.get("tool_name", "")
-
-    # Bash가 아니면 통과
-    if tool_name != "Bash":
-        sys.exit(0)
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
 
-    tool_input = data.get("tool_input", {})
-    command = tool_input.get("command", "")
-    if not command:
-        sys.exit(0)
+    Returns:
+        차단 시 deny Decision, 통과 시 None.
+    """
+    command = analyze_payload(data)
+    if command is None:
+        return None
 
-    # 직접 경로 호출 패턴이 없으면 통과
-    if not _DIRECT_PATH_PATTERN.search(command):
-        sys.exit(0)
+    # 직접 경로 호출이 없으면 통과
+    scripts = _python_scripts(command)
+    direct = [relpath for relpath in scripts if relpath.startswith(_SCRIPTS_PREFIX)]
+    if not direct:
+        return None
 
     # 허용 예외 검사
-    if _is_allowed(command):
-        sys.exit(0)
+    if _is_allowed(scripts):
+        return None
 
     # 스크립트 파일명 추출 및 alias 매핑
-    script_name = _extract_script_name(command)
+    basename = os.path.basename(direct[0])
+    script_name = basename if basename.endswith(".py") else None
     if script_name and script_name in ALIAS_MAP:
         alias_name = ALIAS_MAP[script_name]
-        _deny(DIRECT_PATH_CALL_DENIED.format(
+        return deny(DIRECT_PATH_CALL_DENIED.format(
             script_name=script_name,
             alias_name=alias_name,
         ))
-    elif script_name:
+    if script_name:
         # ALIAS_MAP에 없는 스크립트 (hook 전용 등) - 일반 차단 메시지
-        _deny(DIRECT_PATH_CALL_DENIED.format(
+        return deny(DIRECT_PATH_CALL_DENIED.format(
             script_name=script_name,
             alias_name="(해당 alias 없음 - hook/내부 전용 스크립트일 수 있습니다)",
         ))
-    else:
-        # 스크립트명 추출 실패 시 일반 차단
-        _deny(DIRECT_PATH_CALL_DENIED.format(
-            script_name=".claude-organic/engine/...",
-            alias_name="flow-*",
-        ))
+    # 스크립트명 추출 실패 시 일반 차단
+    return deny(DIRECT_PATH_CALL_DENIED.format(
+        script_name=".claude-organic/engine/...",
+        alias_name="flow-*",
+    ))
+
+
+def main() -> None:
+    """직접 경로 호출 차단 가드 Hook의 진입점.
+
+    HOOK_DIRECT_PATH_GUARD 토글(미설정 시 비활성) 확인 후
+    stdin JSON을 evaluate()에 전달하고, 차단 판정이면 deny JSON을 출력한다.
+    """
+    run_script(evaluate, HOOK_FLAG, required=FLAG_REQUIRED)
 
 
 if __name__ == "__main__":
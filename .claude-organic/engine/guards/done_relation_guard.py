@@ -9,7 +9,6 @@ PreToolUse(Bash) 이벤트에서 flow-kanban done 명령을 감지하고,
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import sys
@@ -24,25 +23,19 @@ _prompt_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__fi
 if _prompt_dir not in sys.path:
     sys.path.insert(0, _prompt_dir)
 
-from common import read_env
+from guards.bash_analysis import analyze_payload
+from guards.guard_api import Decision, deny, run_script
 
-# flow-kanban done T-NNN 패턴
-_DONE_PATTERN = re.compile(r"\bflow-kanban\s+done\s+(T-\d{3})\b")
+HOOK_FLAG: str = "HOOK_DONE_RELATION_GUARD"
 
-# 칸반 디렉터리
-KANBAN_DIRS = ["todo", "open", "progress", "review"]
+# 판정이 파생 티켓 XML 상태에 의존하므로 판정 캐시 대상에서 제외
+CACHEABLE: bool = False
 
+# flow-kanban done T-NNN 의 티켓 번호 인자 패턴
+_TICKET_PATTERN = re.compile(r"T-\d{3}")
 
-def _deny(reason: str) -> None:
-    result = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "deny",
-            "permissionDecisionReason": reason,
-        }
-    }
-    print(json.dumps(result, ensure_ascii=False))
-    sys.exit(0)
+# 칸반 디렉터리
+KANBAN_DIRS = ["todo", "open", "progress", "review"]
 
 
 def _find_ticket_xml(kanban_base: str, ticket_num: str) -> str | None:
@@ -93,40 +86,40 @@ def _find_derived_tickets(kanban_base: str, source_ticket: str) -> list[str]:
     return derived
 
 
-def main() -> None:
-    hook_flag = os.environ.get("HOOK_DONE_RELATION_GUARD") or read_env("HOOK_DONE_RELATION_GUARD")
-    if hook_flag in ("false", "0"):
-        sys.exit(0)
-
-    try:
-        data = json.load(sys.stdin)
-    except (json.JSONDecodeError, ValueError):
-        sys.exit(0)
-
-    if data.get("tool_name") != "Bash":
-        sys.exit(0)
+def evaluate(data: dict) -> Decision | None:
+    """flow-kanban done 대상 티켓의 파생 티켓 완료 여부 판정.
 
-    command = data.get("tool_input", {}).get("command", "")
-    if not command:
-        sys.exit(0)
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
 
-    match = _DONE_PATTERN.search(command)
-    if not match:
-        sys.exit(0)
+    Returns:
+        미완료 파생 티켓이 있으면 deny Decision, 통과 시 None.
+    """
+    command = analyze_payload(data)
+    if command is None:
+        return None
 
-    ticket_num = match.group(1)
+    ticket_num = next(
+        (
+            inv.args[1] for inv in command.flow("flow-kanban")
+            if len(inv.args) >= 2 and inv.args[0] == "done" and _TICKET_PATTERN.fullmatch(inv.args[1])
+        ),
+        None,
+    )
+    if ticket_num is None:
+        return None
 
     # 프로젝트 루트 추정
     project_root = os.environ.get("PROJECT_ROOT", os.getcwd())
     kanban_base = os.path.join(project_root, ".claude-organic", "tickets")
 
     if not os.path.isdir(kanban_base):
-        sys.exit(0)
+        return None
 
     # 이 티켓을 derived-from으로 참조하는 파생 티켓 찾기
     derived = _find_derived_tickets(kanban_base, ticket_num)
     if not derived:
-        sys.exit(0)
+        return None
 
     # 파생 티켓 중 Done이 아닌 것 확인
     not_done = []
@@ -136,10 +129,15 @@ def main() -> None:
             not_done.append(f"{dt}({st or '?'})")
 
     if not_done:
-        _deny(
+        return deny(
             f"{ticket_num} Done 차단: 파생 티켓 {', '.join(not_done)}이 "
             f"아직 완료되지 않았습니다. 파생 티켓 완료 후 진행하세요."
         )
+    return None
+
+
+def main() -> None:
+    run_script(evaluate, HOOK_FLAG)
 
 
 if __name__ == "__main__":
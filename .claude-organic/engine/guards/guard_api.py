@@ -0,0 +1,176 @@
+"""guard_api.py - PreToolUse 가드 플러그인 API.
+
+각 가드 모듈은 다음 계약을 따른다:
+    HOOK_FLAG: 가드를 제어하는 HOOK_* 플래그 이름
+    FLAG_REQUIRED: (선택) True이면 플래그가 명시적으로 설정된 경우에만 활성
+    CACHEABLE: (선택, 기본 True) False이면 판정을 decision_cache에 저장하지 않는다.
+        git status, 티켓 XML처럼 입력·HEAD·.settings 밖의 상태에 의존하는 가드가 선언한다.
+    cacheable(payload) -> bool: (선택) 이벤트별 캐시 가능 여부. False이면 이번 판정은 캐시하지 않는다.
+    NEEDS_CONTENT: (선택, 기본 False) True이면 대용량 Write/Edit 에서도 파일 본문이 포함된 전체
+        페이로드를 받는다. 그 외 가드는 본문 필드가 빠진 페이로드(guards/payload_scan.py)를 받을 수 있다.
+    evaluate(payload) -> Decision | None:
+        PreToolUse stdin JSON(dict)을 받아 판정을 반환하는 순수 함수.
+        None은 "의견 없음(통과)"을 의미한다. stdin/stdout/sys.exit를 사용하지 않는다.
+
+hooks/dispatcher.py는 가드 모듈을 import하여 단일 프로세스에서 evaluate()를 호출하고,
+스크립트 단독 실행 경로(python3 <guard>.py)는 run_script()가 동일한 evaluate()를 감싼다.
+
+주요 함수:
+    deny: 차단 Decision 생성
+    allow: 승인 Decision 생성
+    flag_disabled: 가드 자체 HOOK_* 토글 판정 (os.environ > .settings)
+    decision_from_output: 가드 stdout(JSON)을 Decision으로 복원
+    run_script: 스크립트 진입점 (stdin JSON → evaluate → stdout JSON)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable
+
+_engine_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+if _engine_dir not in sys.path:
+    sys.path.insert(0, _engine_dir)
+
+from common import read_env
+
+PERMISSION_ALLOW: str = "allow"
+PERMISSION_DENY: str = "deny"
+
+
+@dataclass(frozen=True)
+class Decision:
+    """가드 판정 결과.
+
+    Attributes:
+        permission: "allow" 또는 "deny".
+        reason: permissionDecisionReason 문자열.
+    """
+
+    permission: str
+    reason: str
+
+    @property
+    def is_deny(self) -> bool:
+        """차단 판정 여부."""
+        return self.permission == PERMISSION_DENY
+
+    @property
+    def is_allow(self) -> bool:
+        """승인 판정 여부."""
+        return self.permission == PERMISSION_ALLOW
+
+    def to_hook_output(self) -> dict[str, Any]:
+        """Claude Code PreToolUse hookSpecificOutput 형식 dict를 반환한다."""
+        return {
+            "hookSpecificOutput": {
+                "hookEventName": "PreToolUse",
+                "permissionDecision": self.permission,
+                "permissionDecisionReason": self.reason,
+            }
+        }
+
+    def to_json(self) -> str:
+        """가드 스크립트가 stdout에 출력하던 JSON 문자열과 동일한 형식으로 직렬화한다."""
+        return json.dumps(self.to_hook_output(), ensure_ascii=False)
+
+
+def deny(reason: str) -> Decision:
+    """차단 Decision을 생성한다.
+
+    Args:
+        reason: 차단 사유 문자열
+
+    Returns:
+        permission="deny" Decision.
+    """
+    return Decision(PERMISSION_DENY, reason)
+
+
+def allow(reason: str) -> Decision:
+    """승인 Decision을 생성한다.
+
+    Args:
+        reason: 승인 사유 문자열
+
+    Returns:
+        permission="allow" Decision.
+    """
+    return Decision(PERMISSION_ALLOW, reason)
+
+
+def flag_disabled(hook_flag: str, required: bool = False) -> bool:
+    """가드 자체 HOOK_* 토글로 비활성 여부를 판정한다.
+
+    기존 가드 스크립트의 ``os.environ.get(FLAG) or read_env(FLAG)`` 판정을 그대로 옮긴 것으로,
+    디스패처의 load_env_flags() 게이트와 별개로 가드 진입 시 추가 적용된다.
+
+    Args:
+        hook_flag: HOOK_* 플래그 이름.
+        required: True이면 미설정도 비활성으로 판정한다 (예: HOOK_DIRECT_PATH_GUARD).
+
+    Returns:
+        비활성이면 True.
+    """
+    value = os.environ.get(hook_flag) or read_env(hook_flag)
+    if required and not value:
+        return True
+    return value in ("false", "0")
+
+
+def decision_from_output(stdout: bytes | str | None) -> Decision | None:
+    """가드 스크립트 stdout(JSON)을 Decision으로 복원한다.
+
+    subprocess 폴백 경로에서 사용한다. 출력이 없거나 파싱할 수 없으면 None.
+
+    Args:
+        stdout: 가드 스크립트의 stdout.
+
+    Returns:
+        Decision 또는 None.
+    """
+    if not stdout:
+        return None
+    try:
+        data = json.loads(stdout)
+        hook_out = data.get("hookSpecificOutput", {})
+        permission = hook_out.get("permissionDecision", "")
+    except (json.JSONDecodeError, ValueError, AttributeError):
+        return None
+    if permission not in (PERMISSION_ALLOW, PERMISSION_DENY):
+        return None
+    return Decision(permission, hook_out.get("permissionDecisionReason", ""))
+
+
+def run_script(
+    evaluate: Callable[[dict[str, Any]], Decision | None],
+    hook_flag: str,
+    required: bool = False,
+) -> None:
+    """가드 스크립트 단독 실행 진입점.
+
+    토글 확인 → stdin JSON 파싱 → evaluate() → 판정이 있으면 JSON 출력 후 exit 0.
+
+    Args:
+        evaluate: 가드 모듈의 evaluate 함수.
+        hook_flag: 가드를 제어하는 HOOK_* 플래그 이름.
+        required: flag_disabled()의 required 인자.
+    """
+    if flag_disabled(hook_flag, required):
+        sys.exit(0)
+
+    try:
+        data = json.load(sys.stdin)
+    except (json.JSONDecodeError, ValueError):
+        sys.exit(0)
+
+    if not isinstance(data, dict):
+        sys.exit(0)
+
+    decision = evaluate(data)
+    if decision is not None:
+        print(decision.to_json())
+    sys.exit(0)
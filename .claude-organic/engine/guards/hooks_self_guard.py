@@ -4,6 +4,7 @@
 PreToolUse(Write|Edit|Bash) 이벤트에서 .claude-organic/hooks/ 경로 파일 수정을 차단.
 
 주요 함수:
+    evaluate: 보호 경로 수정 판정 (가드 플러그인 API)
     main: Hook 진입점, stdin JSON 파싱 후 보호 경로 수정 차단
 
 입력: stdin으로 JSON (tool_name, tool_input)
@@ -15,7 +16,6 @@ PreToolUse(Write|Edit|Bash) 이벤트에서 .claude-organic/hooks/ 경로 파일
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import sys
@@ -31,12 +31,15 @@ if _prompt_dir not in sys.path:
     sys.path.insert(0, _prompt_dir)
 
 from common import read_env
+from guards.guard_api import Decision, deny, run_script
 from messages import (
     HOOKS_BYPASS_FILE_DENIED,
     HOOKS_BASH_MODIFY_DENIED,
     HOOKS_WRITE_EDIT_DENIED,
 )
 
+HOOK_FLAG: str = "HOOK_HOOKS_SELF_PROTECT"
+
 # 가드 패턴 로드 (보안 우선: import 실패 시 보수적 폴백)
 try:
     from constants import (
@@ -57,23 +60,6 @@ except ImportError:
     INLINE_WRITE_PATTERNS: list[str] = [r"."]
 
 
-def _deny(reason: str) -> None:
-    """차단 JSON을 stdout에 출력하고 프로세스를 종료한다.
-
-    Args:
-        reason: 차단 사유 문자열
-    """
-    result = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "deny",
-            "permissionDecisionReason": reason,
-        }
-    }
-    print(json.dumps(result, ensure_ascii=False))
-    sys.exit(0)
-
-
 def _refs_protected(text: str) -> bool:
     """텍스트가 보호 대상 경로를 참조하는지 확인한다.
 
@@ -163,79 +149,80 @@ def _classify_bash_command(bash_cmd: str) -> str | None:
     return "READONLY"
 
 
-def main() -> None:
-    """hooks 디렉토리 자기 보호 가드 Hook의 진입점.
+def evaluate(data: dict) -> Decision | None:
+    """hooks 디렉토리 자기 보호 판정.
 
-    stdin에서 JSON을 읽어 Write/Edit/Bash 도구 실행 시 보호 경로 수정을 차단한다.
+    Write/Edit/Bash 도구 실행 시 보호 경로 수정에 대해 deny Decision을 반환한다.
     HOOKS_EDIT_ALLOWED 환경변수가 설정된 경우 차단을 우회할 수 있다.
     .claude-organic/runs/bypass 경로는 환경변수 우회 없이 항상 차단된다.
-    """
-    # .claude-organic/.settings에서 설정 로드
-    hook_flag = os.environ.get("HOOK_HOOKS_SELF_PROTECT") or read_env("HOOK_HOOKS_SELF_PROTECT")
-    hook_edit_allowed = os.environ.get("HOOKS_EDIT_ALLOWED") or read_env("HOOKS_EDIT_ALLOWED")
-
-    # Hook disable check (false = disabled)
-    if hook_flag in ("false", "0"):
-        sys.exit(0)
 
-    # stdin에서 JSON 읽기
-    try:
-        data = json.load(sys.stdin)
-    except (json.JSONDecodeError, ValueError):
-        sys.exit(0)
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
 
+    Returns:
+        차단 시 deny Decision, 통과 시 None.
+    """
     tool_name = data.get("tool_name", "")
 
     # Write, Edit, Bash가 아니면 통과
     if tool_name not in ("Write", "Edit", "Bash"):
-        sys.exit(0)
+        return None
 
     tool_input = data.get("tool_input", {})
+    hook_edit_allowed = os.environ.get("HOOKS_EDIT_ALLOWED") or read_env("HOOKS_EDIT_ALLOWED")
 
     # --- Bash 도구 분기 ---
     if tool_name == "Bash":
         bash_cmd = tool_input.get("command", "")
         if not bash_cmd:
-            sys.exit(0)
+            return None
 
         # command에 보호 대상 경로가 없으면 통과
         if not _refs_protected(bash_cmd):
-            sys.exit(0)
+            return None
 
         # 환경변수 우회 검사
         if hook_edit_allowed in ("true", "1"):
-            sys.exit(0)
+            return None
 
         classification = _classify_bash_command(bash_cmd)
         if classification == "READONLY":
-            sys.exit(0)
+            return None
 
         # .claude-organic/runs/bypass 참조 여부에 따라 차단 메시지 분기
         if re.search(r"\.claude\.workflow/workflow/bypass", bash_cmd):
-            _deny(HOOKS_BYPASS_FILE_DENIED)
-        else:
-            _deny(HOOKS_BASH_MODIFY_DENIED)
+            return deny(HOOKS_BYPASS_FILE_DENIED)
+        return deny(HOOKS_BASH_MODIFY_DENIED)
 
     # --- Write / Edit 도구 분기 ---
     file_path = tool_input.get("file_path", "")
     if not file_path:
-        sys.exit(0)
+        return None
 
     # .claude-organic/runs/bypass 경로 포함 여부 검사
     if ".claude-organic/runs/bypass" in file_path:
         # bypass 파일은 환경변수 우회 불가 (무조건 차단)
-        _deny(HOOKS_BYPASS_FILE_DENIED)
+        return deny(HOOKS_BYPASS_FILE_DENIED)
 
     # .claude-organic/hooks/ 경로 포함 여부 검사
     if ".claude-organic/hooks/" in file_path:
         # 환경변수 우회 검사
         if hook_edit_allowed in ("true", "1"):
-            sys.exit(0)
+            return None
 
-        _deny(HOOKS_WRITE_EDIT_DENIED)
+        return deny(HOOKS_WRITE_EDIT_DENIED)
 
     # .claude-organic/hooks/ 경로 미매칭 시 통과
-    sys.exit(0)
+    return None
+
+
+def main() -> None:
+    """hooks 디렉토리 자기 보호 가드 Hook의 진입점.
+
+    HOOK_HOOKS_SELF_PROTECT 토글 확인 후 stdin JSON을 evaluate()에 전달하고,
+    차단 판정이면 deny JSON을 출력한다.
+    """
+    run_script(evaluate, HOOK_FLAG)
 
 
 if __name__ == "__main__":
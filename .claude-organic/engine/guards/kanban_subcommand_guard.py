@@ -5,6 +5,7 @@ PreToolUse(Bash) 이벤트에서 flow-kanban 명령의 서브커맨드를 파싱
 유효하지 않은 서브커맨드 사용을 차단한다.
 
 주요 함수:
+    evaluate: 서브커맨드 유효성 판정 (가드 플러그인 API)
     main: Hook 진입점, stdin JSON 파싱 후 유효하지 않은 서브커맨드 차단
 
 입력: stdin으로 JSON (tool_name, tool_input)
@@ -15,7 +16,6 @@ PreToolUse(Bash) 이벤트에서 flow-kanban 명령의 서브커맨드를 파싱
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import sys
@@ -30,9 +30,12 @@ _prompt_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__fi
 if _prompt_dir not in sys.path:
     sys.path.insert(0, _prompt_dir)
 
-from common import read_env
+from guards.bash_analysis import analyze_payload
+from guards.guard_api import Decision, deny, run_script
 from messages import KANBAN_INVALID_SUBCOMMAND, KANBAN_SUBMIT_REMOVED
 
+HOOK_FLAG: str = "HOOK_KANBAN_SUBCOMMAND_GUARD"
+
 # flow-kanban 유효 서브커맨드 집합
 VALID_SUBCOMMANDS: frozenset[str] = frozenset({
     "create",
@@ -50,84 +53,60 @@ VALID_SUBCOMMANDS: frozenset[str] = frozenset({
     "show",   # 특정 티켓 상세 조회
 })
 
-# flow-kanban 명령 감지 및 서브커맨드 추출 패턴
-# flow-kanban 뒤의 첫 번째 인자를 서브커맨드로 파싱
-_FLOW_KANBAN_PATTERN = re.compile(r"\bflow-kanban\s+([a-zA-Z][\w-]*)")
+# flow-kanban 첫 인자에서 서브커맨드 추출 패턴 (옵션 인자 등은 서브커맨드로 보지 않음)
+_SUBCOMMAND_PATTERN = re.compile(r"[a-zA-Z][\w-]*")
 
 # T-399: flow-kanban move T-NNN submit 인자 차단 패턴
 # Submit transient 단계가 제거되어 move 의 target 인자로 submit 사용 불가.
-_FLOW_KANBAN_MOVE_SUBMIT_PATTERN = re.compile(r"\bflow-kanban\s+move\s+T-\d+\s+submit\b")
+_TICKET_PATTERN = re.compile(r"T-\d+")
+
 
+def evaluate(data: dict) -> Decision | None:
+    """flow-kanban 서브커맨드 유효성 판정.
 
-def _deny(reason: str) -> None:
-    """차단 JSON을 stdout에 출력하고 프로세스를 종료한다.
+    공용 분석기가 추출한 flow-kanban 호출의 서브커맨드가
+    유효 집합에 없으면 deny Decision을 반환한다.
 
     Args:
-        reason: 차단 사유 문자열
+        data: PreToolUse stdin JSON (tool_name, tool_input)
+
+    Returns:
+        차단 시 deny Decision, 통과 시 None.
     """
-    result = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "deny",
-            "permissionDecisionReason": reason,
-        }
-    }
-    print(json.dumps(result, ensure_ascii=False))
-    sys.exit(0)
+    command = analyze_payload(data)
+    if command is None:
+        return None
+
+    # flow-kanban 호출마다 첫 인자를 서브커맨드로 검사 (따옴표 안 텍스트는 호출이 아님)
+    for invocation in command.flow("flow-kanban"):
+        if not invocation.args:
+            # flow-kanban만 있고 서브커맨드가 없는 경우 (도움말 등) 통과
+            continue
+        match = _SUBCOMMAND_PATTERN.match(invocation.args[0])
+        if not match:
+            continue
+        subcommand = match.group(0)
+
+        # 유효하지 않은 서브커맨드 차단
+        if subcommand not in VALID_SUBCOMMANDS:
+            valid_list = ", ".join(sorted(VALID_SUBCOMMANDS))
+            return deny(KANBAN_INVALID_SUBCOMMAND.format(subcommand=subcommand, valid_list=valid_list))
+
+        # T-399: move T-NNN submit 인자 패턴 차단 (Submit 단계 제거 후)
+        args = invocation.args
+        if (subcommand == "move" and len(args) >= 3
+                and _TICKET_PATTERN.fullmatch(args[1]) and args[2] == "submit"):
+            return deny(KANBAN_SUBMIT_REMOVED)
+    return None
 
 
 def main() -> None:
     """flow-kanban 서브커맨드 유효성 검증 Hook의 진입점.
 
-    stdin에서 JSON을 읽어 Bash 도구의 flow-kanban 명령을 감지하고,
-    서브커맨드가 유효 집합에 없으면 deny 응답을 출력하여 차단한다.
+    HOOK_KANBAN_SUBCOMMAND_GUARD 토글 확인 후 stdin JSON을 evaluate()에 전달하고,
+    차단 판정이면 deny JSON을 출력한다.
     """
-    # .claude-organic/.settings에서 설정 로드
-    hook_flag = os.environ.get("HOOK_KANBAN_SUBCOMMAND_GUARD") or read_env("HOOK_KANBAN_SUBCOMMAND_GUARD")
-
-    # Hook disable check (false = disabled)
-    if hook_flag in ("false", "0"):
-        sys.exit(0)
-
-    # stdin에서 JSON 읽기
-    try:
-        data = json.load(sys.stdin)
-    except (json.JSONDecodeError, ValueError):
-        sys.exit(0)
-
-    tool_name = data.get("tool_name", "")
-
-    # Bash가 아니면 통과
-    if tool_name != "Bash":
-        sys.exit(0)
-
-    tool_input = data.get("tool_input", {})
-    command = tool_input.get("command", "")
-    if not command:
-        sys.exit(0)
-
-    # flow-kanban 명령이 포함되어 있지 않으면 통과
-    if "flow-kanban" not in command:
-        sys.exit(0)
-
-    # 서브커맨드 추출
-    match = _FLOW_KANBAN_PATTERN.search(command)
-    if not match:
-        # flow-kanban만 있고 서브커맨드가 없는 경우 (도움말 등) 통과
-        sys.exit(0)
-
-    subcommand = match.group(1)
-
-    # 유효 서브커맨드 검사
-    if subcommand in VALID_SUBCOMMANDS:
-        # T-399: move T-NNN submit 인자 패턴 차단 (Submit 단계 제거 후)
-        if subcommand == "move" and _FLOW_KANBAN_MOVE_SUBMIT_PATTERN.search(command):
-            _deny(KANBAN_SUBMIT_REMOVED)
-        sys.exit(0)
-
-    # 유효하지 않은 서브커맨드 차단
-    valid_list = ", ".join(sorted(VALID_SUBCOMMANDS))
-    _deny(KANBAN_INVALID_SUBCOMMAND.format(subcommand=subcommand, valid_list=valid_list))
+    run_script(evaluate, HOOK_FLAG)
 
 
 if __name__ == "__main__":
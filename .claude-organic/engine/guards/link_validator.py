@@ -45,12 +45,17 @@ def _find_project_root() -> Path:
     """프로젝트 루트 디렉터리를 찾아 반환한다.
 
     이 스크립트는 .claude-organic/engine/guards/ 하위에 위치하므로,
-    3단계 상위 디렉터리가 프로젝트 루트이다.
+    3단계 상위 디렉터리가 프로젝트 루트이다. 워크트리에서 실행되면
+    .claude-organic/runs/ 가 있는 메인 리포 루트로 해석한다 (root_cache 캐시).
 
     Returns:
         프로젝트 루트 Path 객체.
     """
-    return Path(__file__).resolve().parent.parent.parent.parent
+    engine_dir = Path(__file__).resolve().parent.parent
+    if str(engine_dir) not in sys.path:
+        sys.path.insert(0, str(engine_dir))
+    from root_cache import main_repo_root  # noqa: PLC0415
+    return Path(main_repo_root(str(engine_dir.parent.parent)))
 
 
 def scan_markdown_files(
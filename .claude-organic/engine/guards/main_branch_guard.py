@@ -5,6 +5,8 @@ PreToolUse(Bash) 이벤트에서 git commit 명령 감지 시 현재 브랜치
 main 또는 master이면 차단한다.
 
 주요 함수:
+    cacheable: 판정 캐시 가능 여부 (decision_cache 계약)
+    evaluate: main/master 브랜치 커밋 판정 (가드 플러그인 API)
     main: Hook 진입점, stdin JSON 파싱 후 main/master 브랜치 커밋 차단
 
 입력: stdin으로 JSON (tool_name, tool_input)
@@ -15,10 +17,7 @@ main 또는 master이면 차단한다.
 
 from __future__ import annotations
 
-import json
 import os
-import re
-import subprocess
 import sys
 
 # utils 패키지 import 경로 설정
@@ -31,100 +30,89 @@ _prompt_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__fi
 if _prompt_dir not in sys.path:
     sys.path.insert(0, _prompt_dir)
 
-from common import read_env
+from git_state import current_branch
+from guards.bash_analysis import analyze_payload
+from guards.guard_api import Decision, deny, run_script
 from messages import MAIN_BRANCH_COMMIT_DENIED
 
-# main/master 브랜치에서 차단할 git commit 패턴
-_GIT_COMMIT_PATTERN = re.compile(r"\bgit\s+commit\b")
+HOOK_FLAG: str = "HOOK_MAIN_BRANCH_GUARD"
 
 # 보호 대상 브랜치 집합
 _PROTECTED_BRANCHES: frozenset[str] = frozenset({"main", "master"})
 
 
-def _deny(reason: str) -> None:
-    """차단 JSON을 stdout에 출력하고 프로세스를 종료한다.
+def _get_current_branch(cwd: str | None = None) -> str | None:
+    """현재 git 브랜치명을 반환한다.
+
+    git_state 가 HEAD 를 디스크에서 직접 읽는다 (git 프로세스 없음).
 
     Args:
-        reason: 차단 사유 문자열
+        cwd: 확인할 디렉터리 (``git -C <dir> commit`` 대상). None 이면 현재 디렉터리.
+
+    Returns:
+        현재 브랜치명 문자열. 판정 실패 시 None.
     """
-    result = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "deny",
-            "permissionDecisionReason": reason,
-        }
-    }
-    print(json.dumps(result, ensure_ascii=False))
-    sys.exit(0)
-
-
-def _get_current_branch() -> str | None:
-    """현재 git 브랜치명을 반환한다.
+    if cwd is not None and not os.path.isabs(cwd):
+        cwd = os.path.join(os.getcwd(), cwd)
+    return current_branch(cwd or os.getcwd())
+
+
+def cacheable(data: dict) -> bool:
+    """판정 캐시 가능 여부.
+
+    ``git -C <dir> commit`` 은 캐시 키(cwd 의 HEAD)에 포함되지 않는 저장소의 브랜치를
+    확인하므로 캐시하지 않는다.
+
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
+
+    Returns:
+        -C 로 다른 디렉터리를 지정한 git commit 이 없으면 True.
+    """
+    command = analyze_payload(data)
+    if command is None:
+        return True
+    return all(invocation.option("-C") is None for invocation in command.git("commit"))
+
+
+def evaluate(data: dict) -> Decision | None:
+    """main/master 브랜치 커밋 차단 판정.
+
+    공용 분석기가 추출한 git commit 호출을 감지하고, 현재 브랜치가 main 또는 master이면
+    deny Decision을 반환한다. 브랜치 판정 실패 시 안전 통과로 처리한다.
+
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
 
     Returns:
-        현재 브랜치명 문자열. git 실행 실패 시 None.
+        차단 시 deny Decision, 통과 시 None.
     """
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        pass
+    command = analyze_payload(data)
+    if command is None:
+        return None
+
+    # git commit 호출마다 대상 디렉터리(-C)의 브랜치를 확인한다
+    for invocation in command.git("commit"):
+        branch = _get_current_branch(invocation.option("-C"))
+        if branch is None:
+            # 브랜치 판정 실패 시 안전 통과
+            continue
+
+        # main/master 브랜치이면 차단
+        if branch in _PROTECTED_BRANCHES:
+            return deny(MAIN_BRANCH_COMMIT_DENIED.format(branch=branch))
+
+    # git commit 이 없거나 보호 대상 브랜치가 아니면 통과
     return None
 
 
 def main() -> None:
     """main/master 브랜치 커밋 차단 Hook의 진입점.
 
-    stdin에서 JSON을 읽어 Bash 도구의 git commit 명령을 감지하고,
-    현재 브랜치가 main 또는 master이면 deny 응답을 출력하여 차단한다.
-    git 실행 실패 시 안전 통과(exit 0)로 처리한다.
+    HOOK_MAIN_BRANCH_GUARD 토글 확인 후 stdin JSON을 evaluate()에 전달하고,
+    차단 판정이면 deny JSON을 출력한다.
     """
-    # .claude-organic/.settings에서 설정 로드
-    hook_flag = os.environ.get("HOOK_MAIN_BRANCH_GUARD") or read_env("HOOK_MAIN_BRANCH_GUARD")
-
-    # Hook disable check (false = disabled)
-    if hook_flag in ("false", "0"):
-        sys.exit(0)
-
-    # stdin에서 JSON 읽기
-    try:
-        data = json.load(sys.stdin)
-    except (json.JSONDecodeError, ValueError):
-        sys.exit(0)
-
-    tool_name = data.get("tool_name", "")
-
-    # Bash가 아니면 통과
-    if tool_name != "Bash":
-        sys.exit(0)
-
-    tool_input = data.get("tool_input", {})
-    command = tool_input.get("command", "")
-    if not command:
-        sys.exit(0)
-
-    # git commit 패턴 매칭
-    if not _GIT_COMMIT_PATTERN.search(command):
-        sys.exit(0)
-
-    # 현재 브랜치 조회
-    branch = _get_current_branch()
-    if branch is None:
-        # git 실행 실패 시 안전 통과
-        sys.exit(0)
-
-    # main/master 브랜치이면 차단
-    if branch in _PROTECTED_BRANCHES:
-        _deny(MAIN_BRANCH_COMMIT_DENIED.format(branch=branch))
-
-    # 보호 대상 브랜치가 아니면 통과
-    sys.exit(0)
+    run_script(evaluate, HOOK_FLAG)
 
 
 if __name__ == "__main__":
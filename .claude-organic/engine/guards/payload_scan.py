@@ -0,0 +1,177 @@
+"""payload_scan.py - 대용량 Write/Edit PreToolUse 페이로드 부분 스캔.
+
+Write/Edit/MultiEdit/NotebookEdit 의 tool_input 은 파일 본문(수 MB)을 담을 수 있지만
+가드는 라우팅 필드(tool_name, file_path, notebook_path, command)만 읽는다.
+FAST_PATH_BYTES 이상인 페이로드는 전체를 json.loads 하지 않고, 앞부분 HEAD_SCAN_BYTES 안에서
+본문 필드(content/old_string/new_string/new_source/edits)가 시작되기 전까지만 구조적으로 읽고,
+본문 뒤에 오는 최상위 스칼라 필드(tool_use_id 등)는 끝부분 TAIL_SCAN_BYTES 에서 찾는다.
+본문을 읽는 비용이 없으므로 대용량 쓰기에서도 스캔 시간이 일정하다.
+
+본문이 필요한 가드는 모듈에 ``NEEDS_CONTENT = True`` 를 선언하고, 디스패처는 그 가드에만
+full_payload() 로 지연 디코드한 전체 페이로드를 넘긴다.
+
+부분 스캔 조건 (하나라도 어긋나면 기존처럼 전체 json.loads):
+    - 페이로드 크기 >= FAST_PATH_BYTES
+    - tool_name 이 WRITE_TOOLS 중 하나
+    - 본문 필드 이전에 file_path (NotebookEdit 은 notebook_path) 가 나타남
+
+주요 함수:
+    parse_tool_payload: stdin bytes → dict (대용량 쓰기는 PartialPayload)
+    full_payload: PartialPayload 이면 전체 페이로드, 아니면 그대로
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from json.decoder import scanstring
+from typing import Any
+
+# 부분 스캔을 적용하는 최소 페이로드 크기 (bytes)
+FAST_PATH_BYTES: int = 64 * 1024
+
+# 라우팅 필드를 찾는 앞부분 스캔 상한 (bytes)
+HEAD_SCAN_BYTES: int = 64 * 1024
+
+# 본문 뒤 최상위 스칼라 필드를 찾는 끝부분 스캔 크기 (bytes)
+TAIL_SCAN_BYTES: int = 4 * 1024
+
+WRITE_TOOLS: tuple[str, ...] = ("Write", "Edit", "MultiEdit", "NotebookEdit")
+
+# 본문 필드 (부분 스캔에서 읽지 않는다)
+BODY_FIELDS: frozenset[str] = frozenset({"content", "old_string", "new_string", "new_source", "edits"})
+
+# 본문 뒤에 올 수 있는 최상위 스칼라 필드
+_TAIL_FIELDS: tuple[str, ...] = (
+    "session_id", "transcript_path", "cwd", "permission_mode",
+    "hook_event_name", "tool_name", "tool_use_id",
+)
+
+_WS_RE = re.compile(r"[ \t\n\r]*")
+# 구조상 키는 '{' 또는 ',' 뒤에만 오고, 문자열 안의 따옴표는 이스케이프되어 있으므로 본문과 혼동되지 않는다
+_TAIL_RE = re.compile(
+    r'[{,][ \t\n\r]*"(' + "|".join(_TAIL_FIELDS) + r')"[ \t\n\r]*:[ \t\n\r]*"((?:[^"\\]|\\.)*)"'
+)
+_DECODER = json.JSONDecoder()
+
+
+class PartialPayload(dict):
+    """본문 필드를 제외한 PreToolUse 페이로드.
+
+    dict 로서 라우팅 필드를 담고, full() 은 원본 bytes 를 처음 호출될 때 한 번 디코드한다.
+
+    Attributes:
+        raw: 원본 stdin bytes.
+        omitted: tool_input 에서 제외된 본문 필드 이름 (스캔이 멈춘 첫 필드).
+    """
+
+    def __init__(self, fields: dict[str, Any], raw: bytes, omitted: str) -> None:
+        super().__init__(fields)
+        self.raw = raw
+        self.omitted = omitted
+        self._full: dict[str, Any] | None = None
+
+    def full(self) -> dict[str, Any]:
+        """원본 전체 페이로드를 반환한다 (지연 디코드, 결과 캐시)."""
+        if self._full is None:
+            self._full = json.loads(self.raw)
+        return self._full
+
+
+def full_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """PartialPayload 이면 전체 페이로드를, 아니면 payload 를 그대로 반환한다."""
+    return payload.full() if isinstance(payload, PartialPayload) else payload
+
+
+def _skip_ws(text: str, idx: int) -> int:
+    return _WS_RE.match(text, idx).end()
+
+
+def _scan_object(text: str, idx: int, out: dict[str, Any], nested: str | None) -> tuple[int, str | None]:
+    """text[idx] 의 '{' 부터 객체를 읽어 out 에 채운다.
+
+    nested 키의 값 객체는 재귀로 읽고, 그 안에서 본문 필드를 만나면 멈춘다.
+
+    Returns:
+        (객체 다음 위치, 멈춘 본문 필드 이름 또는 None). 앞부분 밖으로 넘어가면 ValueError.
+    """
+    if text[idx] != "{":
+        raise ValueError("object expected")
+    idx = _skip_ws(text, idx + 1)
+    if text[idx] == "}":
+        return idx + 1, None
+    while True:
+        if text[idx] != '"':
+            raise ValueError("key expected")
+        key, idx = scanstring(text, idx + 1)
+        idx = _skip_ws(text, idx)
+        if text[idx] != ":":
+            raise ValueError("colon expected")
+        idx = _skip_ws(text, idx + 1)
+        if nested is None and key in BODY_FIELDS:
+            return idx, key
+        if key == nested and text[idx] == "{":
+            inner: dict[str, Any] = {}
+            idx, stopped = _scan_object(text, idx, inner, None)
+            out[key] = inner
+            if stopped is not None:
+                return idx, stopped
+        else:
+            out[key], idx = _DECODER.raw_decode(text, idx)
+        idx = _skip_ws(text, idx)
+        if text[idx] == "}":
+            return idx + 1, None
+        if text[idx] != ",":
+            raise ValueError("comma expected")
+        idx = _skip_ws(text, idx + 1)
+
+
+def _scan_partial(stdin_data: bytes) -> PartialPayload | None:
+    """대용량 쓰기 페이로드의 라우팅 필드만 읽는다. 조건이 맞지 않으면 None."""
+    head = stdin_data[:HEAD_SCAN_BYTES].decode("utf-8", errors="ignore")
+    fields: dict[str, Any] = {}
+    try:
+        _idx, stopped = _scan_object(head, _skip_ws(head, 0), fields, "tool_input")
+    except (ValueError, IndexError):
+        return None
+    if stopped is None:
+        return None
+
+    tail = stdin_data[-TAIL_SCAN_BYTES:].decode("utf-8", errors="ignore")
+    for match in _TAIL_RE.finditer(tail):
+        if match.group(1) not in fields:
+            try:
+                fields[match.group(1)] = json.loads(f'"{match.group(2)}"')
+            except ValueError:
+                return None
+
+    tool_name = fields.get("tool_name")
+    tool_input = fields.get("tool_input")
+    if tool_name not in WRITE_TOOLS or not isinstance(tool_input, dict):
+        return None
+    routing = "notebook_path" if tool_name == "NotebookEdit" else "file_path"
+    if not isinstance(tool_input.get(routing), str):
+        return None
+    return PartialPayload(fields, stdin_data, stopped)
+
+
+def parse_tool_payload(stdin_data: bytes) -> dict[str, Any]:
+    """PreToolUse stdin 을 파싱한다.
+
+    FAST_PATH_BYTES 이상인 Write/Edit 계열 페이로드는 본문을 읽지 않은 PartialPayload 를,
+    그 외에는 json.loads 결과를 반환한다.
+
+    Args:
+        stdin_data: 훅 stdin bytes.
+
+    Returns:
+        페이로드 dict.
+
+    Raises:
+        ValueError: JSON 으로 파싱할 수 없을 때 (json.loads 와 동일).
+    """
+    if len(stdin_data) >= FAST_PATH_BYTES:
+        partial = _scan_partial(stdin_data)
+        if partial is not None:
+            return partial
+    return json.loads(stdin_data)
@@ -5,6 +5,8 @@ PreToolUse(Write|Edit|Bash) 이벤트에서 현재 세션이 워크플로우 세
 활성 워크플로우의 command가 research 또는 review이면 코드 수정을 차단한다.
 
 주요 함수:
+    cacheable: 판정 캐시 가능 여부 (decision_cache 계약)
+    evaluate: research/review 세션 Write/Edit/Bash 판정 (가드 플러그인 API)
     main: Hook 진입점, stdin JSON 파싱 후 research/review 세션 Write/Edit/Bash 차단
 
 입력: stdin으로 JSON (tool_name, tool_input)
@@ -15,7 +17,6 @@ PreToolUse(Write|Edit|Bash) 이벤트에서 현재 세션이 워크플로우 세
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import sys
@@ -30,31 +31,20 @@ _prompt_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__fi
 if _prompt_dir not in sys.path:
     sys.path.insert(0, _prompt_dir)
 
-from common import load_json_file, read_env, resolve_project_root, scan_active_workflows
+from common import load_json_file, resolve_project_root, scan_active_workflows
 from flow.session_identifier import get_session_type
+from guards.bash_analysis import analyze
+from guards.guard_api import Decision, deny, run_script
 from messages import (
     READONLY_SESSION_BASH_MODIFY_DENIED,
     READONLY_SESSION_WRITE_EDIT_DENIED,
 )
 
+HOOK_FLAG: str = "HOOK_READONLY_SESSION_GUARD"
+
 # 읽기 전용 command 목록 (이 command에서는 코드 수정이 금지됨)
 _READONLY_COMMANDS = ("research", "review")
 
-# Bash 도구에서 파일을 수정할 수 있는 명령 패턴 (main_session_guard.py와 동일)
-_BASH_FILE_MODIFY_PATTERNS: list[str] = [
-    r"\bsed\s+-i",                               # sed inplace
-    r"\bawk\s+.*-i\s+inplace",                   # awk inplace
-    r"\b(echo|printf)\s+.*\s*>{1,2}\s*\S",       # echo/printf 리다이렉트
-    r"\btee\s+(-a\s+)?\S",                       # tee 쓰기
-    r"\bcat\s*<<",                               # heredoc 리다이렉트
-    r"\bcp\s+",                                  # 파일 복사
-    r"\bmv\s+",                                  # 파일 이동
-    r"\bpython3?\s+(-c\s+|.*\bopen\b.*\bwrite\b)",  # python -c open write
-    r"\bperl\s+-.*[pi]",                         # perl inplace
-    r"(?:^|[;&|]\s*)\binstall\s+",               # install 명령 (서브커맨드 제외)
-    r"\bdd\s+",                                  # dd 명령
-]
-
 # .claude-organic/ 하위 경로 패턴 (보고서/작업 내역 Write/Edit 허용)
 _WORKFLOW_PATH_PATTERN = re.compile(r"[/\\]?\.claude\.workflow[/\\]")
 
@@ -65,23 +55,6 @@ _MEMORY_DIR_PATTERN: re.Pattern[str] = re.compile(
 )
 
 
-def _deny(reason: str) -> None:
-    """차단 JSON을 stdout에 출력하고 프로세스를 종료한다.
-
-    Args:
-        reason: 차단 사유 문자열
-    """
-    result = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "deny",
-            "permissionDecisionReason": reason,
-        }
-    }
-    print(json.dumps(result, ensure_ascii=False))
-    sys.exit(0)
-
-
 def _get_workflow_command() -> str | None:
     """활성 워크플로우의 command 필드를 반환한다.
 
@@ -137,39 +110,10 @@ def _get_workflow_command() -> str | None:
     return None
 
 
-def _strip_quoted_args(command: str) -> str:
-    """명령 문자열에서 따옴표로 감싼 영역의 내용을 빈 문자열로 치환한다.
-
-    Args:
-        command: Bash 도구의 원본 command 문자열
-
-    Returns:
-        따옴표 내부 내용이 제거된 문자열.
-    """
-    command = re.sub(r'"(?:[^"\\]|\\.)*"', '""', command)
-    command = re.sub(r"'(?:[^'\\]|\\.)*'", "''", command)
-    return command
-
-
-def _extract_command_positions(command: str) -> list[str]:
-    """명령 문자열을 파이프/체인 구분자로 분할하여 세그먼트 목록을 반환한다.
-
-    Args:
-        command: 따옴표 strip이 완료된 명령 문자열
-
-    Returns:
-        각 세그먼트의 선행 공백이 제거된 문자열 목록.
-    """
-    parts = re.split(r'&&|\|\||(?<!\|)\|(?!\|)|;', command)
-    return [part.lstrip() for part in parts if part.strip()]
-
-
 def _is_bash_file_modify(command: str) -> bool:
     """Bash 명령에서 파일 수정 패턴 포함 여부를 검사한다.
 
-    따옴표로 감싼 인자 영역을 먼저 제거한 뒤,
-    파이프/체인 구분자로 세그먼트를 분할하여
-    각 세그먼트에서 _BASH_FILE_MODIFY_PATTERNS 패턴을 검사한다.
+    공용 분석기(bash_analysis.analyze)의 file_modify_pattern 을 사용한다.
 
     Args:
         command: Bash 도구의 command 문자열
@@ -177,13 +121,7 @@ def _is_bash_file_modify(command: str) -> bool:
     Returns:
         파일 수정 패턴이 매칭되면 True, 아니면 False.
     """
-    stripped = _strip_quoted_args(command)
-    segments = _extract_command_positions(stripped)
-    for segment in segments:
-        for pattern in _BASH_FILE_MODIFY_PATTERNS:
-            if re.search(pattern, segment):
-                return True
-    return False
+    return analyze(command).file_modify_pattern is not None
 
 
 def _is_workflow_path(file_path: str) -> bool:
@@ -216,39 +154,48 @@ def _is_memory_path(path: str) -> bool:
     return bool(_MEMORY_DIR_PATTERN.search(expanded))
 
 
-def main() -> None:
-    """research/review 세션 Write/Edit/Bash 차단 Hook의 진입점.
+def cacheable(data: dict) -> bool:
+    """판정 캐시 가능 여부.
 
-    stdin에서 JSON을 읽어 Write/Edit/Bash 도구 사용 시 현재 세션이
-    워크플로우 세션이고 command가 research/review이면
-    deny 응답을 출력하여 코드 수정을 차단한다.
+    워크플로우 세션에서 WORKFLOW_WORK_DIR 없이 .workflow/ 스캔으로 command 를 찾는 경우는
+    활성 워크플로우 상태에 의존하므로 캐시하지 않는다.
 
-    비워크플로우 세션에서는 무조건 통과한다.
-    .workflow/ 하위 파일 Write/Edit는 허용한다.
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
+
+    Returns:
+        캐시 가능하면 True.
     """
-    # .claude-organic/.settings에서 설정 로드
-    hook_flag = os.environ.get("HOOK_READONLY_SESSION_GUARD") or read_env("HOOK_READONLY_SESSION_GUARD")
+    if get_session_type() != "workflow":
+        return True
+    return bool(os.environ.get("WORKFLOW_WORK_DIR", "").strip())
 
-    # Hook disable check (false/0 = disabled)
-    if hook_flag in ("false", "0"):
-        sys.exit(0)
 
-    # stdin에서 JSON 읽기
-    try:
-        data = json.load(sys.stdin)
-    except (json.JSONDecodeError, ValueError):
-        sys.exit(0)
+def evaluate(data: dict) -> Decision | None:
+    """research/review 세션 Write/Edit/Bash 차단 판정.
+
+    Write/Edit/Bash 도구 사용 시 현재 세션이 워크플로우 세션이고
+    command가 research/review이면 deny Decision을 반환하여 코드 수정을 차단한다.
+
+    비워크플로우 세션에서는 무조건 통과한다.
+    .workflow/ 하위 파일 Write/Edit는 허용한다.
+
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
 
+    Returns:
+        차단 시 deny Decision, 통과 시 None.
+    """
     tool_name = data.get("tool_name", "")
 
     # Write, Edit, Bash가 아니면 통과
     if tool_name not in ("Write", "Edit", "Bash"):
-        sys.exit(0)
+        return None
 
     # 세션 유형 판별 -- 워크플로우 세션이 아니면 통과 (이 가드의 관심사 아님)
     session_type = get_session_type()
     if session_type != "workflow":
-        sys.exit(0)
+        return None
 
     # --- 워크플로우 세션 확인됨, command 판별 ---
 
@@ -256,14 +203,14 @@ def main() -> None:
 
     # command 조회 실패 시 통과 (false positive 방지)
     if command is None:
-        sys.exit(0)
+        return None
 
     # command 첫 세그먼트 추출 (체인 command 지원: "research>implement" -> "research")
     first_segment = command.split(">")[0].strip()
 
     # implement command이면 통과
     if first_segment not in _READONLY_COMMANDS:
-        sys.exit(0)
+        return None
 
     # --- research/review command 확인됨, 차단 판별 ---
 
@@ -273,18 +220,23 @@ def main() -> None:
     if tool_name in ("Write", "Edit"):
         file_path = tool_input.get("file_path", "")
         if _is_workflow_path(file_path) or _is_memory_path(file_path):
-            sys.exit(0)
-        _deny(READONLY_SESSION_WRITE_EDIT_DENIED)
+            return None
+        return deny(READONLY_SESSION_WRITE_EDIT_DENIED)
 
     # Bash 도구: 파일 수정 패턴만 차단
-    if tool_name == "Bash":
-        command_str = tool_input.get("command", "")
-        if _is_bash_file_modify(command_str):
-            _deny(READONLY_SESSION_BASH_MODIFY_DENIED)
-        sys.exit(0)
-
-    # 알 수 없는 도구: 통과
-    sys.exit(0)
+    command_str = tool_input.get("command", "")
+    if _is_bash_file_modify(command_str):
+        return deny(READONLY_SESSION_BASH_MODIFY_DENIED)
+    return None
+
+
+def main() -> None:
+    """research/review 세션 Write/Edit/Bash 차단 Hook의 진입점.
+
+    HOOK_READONLY_SESSION_GUARD 토글 확인 후 stdin JSON을 evaluate()에 전달하고,
+    차단 판정이면 deny JSON을 출력한다.
+    """
+    run_script(evaluate, HOOK_FLAG)
 
 
 if __name__ == "__main__":
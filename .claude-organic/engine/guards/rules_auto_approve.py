@@ -10,6 +10,7 @@ PreToolUse(Write|Edit) 이벤트에서 `.claude/rules/` 하위 파일 대상 요
     워커 에이전트가 자유롭게 수정할 수 있어야 한다.
 
 주요 함수:
+    evaluate: `.claude/rules/` 경로 승인 판정 (가드 플러그인 API)
     main: Hook 진입점, stdin JSON 파싱 후 조건 충족 시 allow 반환
 
 입력: stdin으로 JSON (tool_name, tool_input)
@@ -27,7 +28,6 @@ PreToolUse(Write|Edit) 이벤트에서 `.claude/rules/` 하위 파일 대상 요
 
 from __future__ import annotations
 
-import json
 import os
 import sys
 
@@ -36,68 +36,53 @@ _engine_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__fi
 if _engine_dir not in sys.path:
     sys.path.insert(0, _engine_dir)
 
-from common import read_env
+from guards.guard_api import Decision, allow, run_script
+
+HOOK_FLAG: str = "HOOK_RULES_AUTO_APPROVE"
 
 # `.claude/rules/` 하위만 허용하는 경로 키워드
 _RULES_PATH_KEYWORD = ".claude/rules/"
 
 
-def _allow(reason: str) -> None:
-    """자동 승인 JSON을 stdout에 출력하고 프로세스를 종료한다.
-
-    Args:
-        reason: 승인 사유 문자열
-    """
-    result = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "allow",
-            "permissionDecisionReason": reason,
-        }
-    }
-    print(json.dumps(result, ensure_ascii=False))
-    sys.exit(0)
+def evaluate(data: dict) -> Decision | None:
+    """`rules/` 경로 자동 승인 판정.
 
+    Write/Edit 도구가 `.claude/rules/` 하위 파일을 대상으로 할 때 allow Decision을 반환한다.
 
-def main() -> None:
-    """`rules/` 경로 자동 승인 가드 Hook의 진입점.
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
 
-    stdin에서 JSON을 읽어 Write/Edit 도구가 `.claude/rules/` 하위 파일을
-    대상으로 할 때 즉시 allow를 반환한다.
-    HOOK_RULES_AUTO_APPROVE=false 설정 시 비활성화된다.
+    Returns:
+        조건 충족 시 allow Decision, 미충족 시 None.
     """
-    # .claude-organic/.settings에서 설정 로드
-    hook_flag = os.environ.get("HOOK_RULES_AUTO_APPROVE") or read_env("HOOK_RULES_AUTO_APPROVE")
-
-    # Hook disable check (false = disabled)
-    if hook_flag in ("false", "0"):
-        sys.exit(0)
-
-    # stdin에서 JSON 읽기
-    try:
-        data = json.load(sys.stdin)
-    except (json.JSONDecodeError, ValueError):
-        sys.exit(0)
-
     tool_name = data.get("tool_name", "")
 
     # Write, Edit이 아니면 통과
     if tool_name not in ("Write", "Edit"):
-        sys.exit(0)
+        return None
 
     tool_input = data.get("tool_input", {})
     file_path = tool_input.get("file_path", "")
 
     if not file_path:
-        sys.exit(0)
+        return None
 
     # `.claude/rules/` 하위 경로인지 확인
     # 보안: 정확히 `.claude/rules/` 하위만 허용, 다른 `.claude/` 경로는 불허
     if _RULES_PATH_KEYWORD in file_path:
-        _allow("auto-approve .claude/rules/ path")
+        return allow("auto-approve .claude/rules/ path")
+
+    # 조건 미충족 시 판정 없음 (기존 동작 유지)
+    return None
+
 
-    # 조건 미충족 시 빈 출력으로 통과 (기존 동작 유지)
-    sys.exit(0)
+def main() -> None:
+    """`rules/` 경로 자동 승인 가드 Hook의 진입점.
+
+    HOOK_RULES_AUTO_APPROVE 토글 확인 후 stdin JSON을 evaluate()에 전달하고,
+    승인 판정이면 allow JSON을 출력한다.
+    """
+    run_script(evaluate, HOOK_FLAG)
 
 
 if __name__ == "__main__":
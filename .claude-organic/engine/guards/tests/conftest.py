@@ -0,0 +1,16 @@
+"""pytest 공통 fixture.
+
+칸반 스냅샷·잠금·워크플로우 레지스트리·판정 캐시·훅 span 스풀·로그 등 런타임 상태 파일을
+리포 대신 테스트별 임시 디렉터리에 쓴다 (환경변수이므로 subprocess 도 상속한다).
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_state_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """``_WF_STATE_DIR`` 를 tmp_path 로 지정한다 (root_cache.state_dir 참고)."""
+    monkeypatch.setenv("_WF_STATE_DIR", str(tmp_path))
@@ -0,0 +1,150 @@
+"""bash_analysis 공용 Bash 명령 분석기 테스트.
+
+  TC1: 체인/파이프/치환 분할, 따옴표 해제, 리다이렉션 대상, heredoc 본문 무시
+  TC2: git 전역 옵션을 건너뛴 서브커맨드, flow-* 호출 추출 (따옴표 안 텍스트 제외)
+  TC3: file_modify_pattern — 기존 가드의 따옴표 strip + 세그먼트 분할 판정과 동일
+  TC4: 분석 결과 캐시 공유 및 가드 판정 (git -C, 따옴표 안 flow-kanban)
+  TC5: bash/sh -c 문자열과 eval 인자 재귀 분석 — main 브랜치 커밋 가드가 래퍼 안 커밋도 차단
+"""
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_ENGINE_DIR = Path(__file__).resolve().parent.parent.parent
+if str(_ENGINE_DIR) not in sys.path:
+    sys.path.insert(0, str(_ENGINE_DIR))
+
+from guards import kanban_subcommand_guard, main_branch_guard, worktree_remove_guard  # noqa: E402
+from guards.bash_analysis import analyze, analyze_payload  # noqa: E402
+
+
+def _bash(command: str) -> dict:
+    return {"tool_name": "Bash", "tool_input": {"command": command}}
+
+
+class TestBashAnalysis(unittest.TestCase):
+    """공용 분석기 구조화 결과 검증."""
+
+    def test_01_subcommands_and_redirects(self) -> None:
+        """구분자 분할, 따옴표 해제, 리다이렉션, heredoc 처리."""
+        cmd = analyze(
+            "cd /repo && FOO=1 echo \"a; b\" 'c' > out.txt 2>&1 | tee -a log.txt; "
+            "echo $(date)\ncat <<EOF > f.md\ngit commit\nEOF\nls"
+        )
+        self.assertEqual(
+            [sub.argv for sub in cmd.subcommands],
+            [
+                ("cd", "/repo"),
+                ("FOO=1", "echo", "a; b", "c"),
+                ("tee", "-a", "log.txt"),
+                ("echo",),
+                ("date",),
+                ("cat",),
+                ("ls",),
+            ],
+        )
+        self.assertEqual(cmd.subcommands[1].program, "echo")
+        self.assertEqual(cmd.redirect_targets, ("out.txt", "f.md"))
+        self.assertEqual(cmd.git_invocations, ())
+        self.assertEqual(len(cmd.quoted_spans), 2)
+
+    def test_02_git_and_flow_invocations(self) -> None:
+        """git 전역 옵션과 flow-* 호출, 따옴표 안 텍스트 제외."""
+        cmd = analyze(
+            "git -C /wt -c core.pager=cat commit -m 'flow-kanban bogus' && "
+            "sudo flow-kanban move T-001 open"
+        )
+        commit = cmd.git("commit")
+        self.assertEqual(len(commit), 1)
+        self.assertEqual(commit[0].option("-C"), "/wt")
+        self.assertEqual(commit[0].args, ("-m", "flow-kanban bogus"))
+        self.assertEqual(
+            [(inv.name, inv.args) for inv in cmd.flow_invocations],
+            [("flow-kanban", ("move", "T-001", "open"))],
+        )
+
+    def test_03_file_modify_pattern(self) -> None:
+        """따옴표 안 패턴은 무시하고 세그먼트 단위로 검사한다."""
+        self.assertIsNone(analyze("git commit -m \"sed -i 수정\"").file_modify_pattern)
+        self.assertEqual(analyze("ls && sed -i 's/a/b/' f").file_modify_pattern, r"\bsed\s+-i")
+        self.assertEqual(analyze("cat <<EOF\nx\nEOF").file_modify_pattern, r"\bcat\s*<<")
+        self.assertIsNone(analyze("git status").file_modify_pattern)
+
+    def test_04_shared_cache_and_guards(self) -> None:
+        """같은 command 는 같은 분석 결과를 공유하고 가드가 구조화 결과를 쓴다."""
+        payload = _bash("git status && flow-kanban show T-001")
+        self.assertIs(analyze_payload(payload), analyze("git status && flow-kanban show T-001"))
+        self.assertIsNone(analyze_payload({"tool_name": "Write", "tool_input": {}}))
+
+        self.assertIsNone(kanban_subcommand_guard.evaluate(_bash("echo 'flow-kanban bogus'")))
+        self.assertIsNotNone(kanban_subcommand_guard.evaluate(_bash("ls; flow-kanban bogus")))
+        self.assertEqual(
+            worktree_remove_guard._extract_worktree_path(analyze("git -C /repo worktree remove --force wt")),
+            "/repo/wt",
+        )
+
+    def test_05_shell_string_wrappers(self) -> None:
+        """-c 문자열 / eval 인자 안의 명령을 래퍼 뒤에 펼치고, 가드가 이를 본다."""
+        cmd = analyze("bash -lc 'cd /wt && git -C /wt commit -m x' && echo done")
+        self.assertEqual(
+            [sub.program for sub in cmd.subcommands],
+            ["bash", "cd", "git", "echo"],
+        )
+        self.assertEqual(cmd.git("commit")[0].option("-C"), "/wt")
+        self.assertEqual(analyze("sh -o pipefail -c \"git status\"").git_invocations[0].name, "status")
+        self.assertEqual(analyze("bash script.sh -c x").git_invocations, ())
+        self.assertEqual(analyze("echo 'bash -c \"git commit\"'").git_invocations, ())
+
+        denied = [
+            "bash -c \"git commit -m x\"",
+            "sh -c 'git commit -m x'",
+            "sudo bash -e -c 'ls; git commit -am x'",
+            "eval git commit -m x",
+            "eval \"git commit -m x\"",
+            "bash -c \"eval 'git commit -m x'\"",
+        ]
+        with mock.patch.object(main_branch_guard, "_get_current_branch", return_value="main"):
+            for command in denied:
+                with self.subTest(command=command):
+                    self.assertIsNotNone(main_branch_guard.evaluate(_bash(command)))
+            self.assertIsNone(main_branch_guard.evaluate(_bash("bash -c 'git status'")))
+            self.assertIsNone(main_branch_guard.evaluate(_bash("echo \"bash -c 'git commit'\"")))
+
+    def test_06_keywords_and_wrapper_options(self) -> None:
+        """예약어·그룹 기호와 래퍼 옵션 값 뒤의 실제 명령을 찾고, 가드가 이를 본다."""
+        for command in (
+            "sudo -u root git commit -m x",
+            "timeout 5 git commit -m x",
+            "timeout -s KILL 5s git commit -m x",
+            "env -u FOO git commit -m x",
+            "echo x | xargs -n 1 git commit -m",
+            "watch -n 1 git commit -m x",
+            "for i in 1 2; do git commit -m x; done",
+            "while true; do git commit -m x; done",
+        ):
+            with self.subTest(command=command):
+                self.assertEqual([inv.name for inv in analyze(command).git_invocations], ["commit"])
+
+        with mock.patch.object(main_branch_guard, "_get_current_branch", return_value="main"):
+            for command in (
+                "{ git commit -m x; }",
+                "if true; then git commit -m x; fi",
+                "! git commit -m x",
+            ):
+                with self.subTest(command=command):
+                    self.assertIsNotNone(main_branch_guard.evaluate(_bash(command)))
+
+        with tempfile.TemporaryDirectory() as wt, \
+                mock.patch.object(worktree_remove_guard, "has_uncommitted_changes", return_value=True), \
+                mock.patch.object(worktree_remove_guard, "_get_status_output", return_value=" M a.py"):
+            for command in (f"nice -n 5 git worktree remove {wt}", f"! git worktree remove {wt}"):
+                with self.subTest(command=command):
+                    self.assertIsNotNone(worktree_remove_guard.evaluate(_bash(command)))
+
+
+if __name__ == "__main__":
+    unittest.main()
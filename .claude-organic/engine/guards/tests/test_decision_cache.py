@@ -0,0 +1,155 @@
+"""decision_cache 가드 판정 캐시 회귀 테스트.
+
+  TC1: 같은 입력 재실행 시 캐시 가능한 가드는 evaluate() 를 건너뛰고 판정이 동일
+  TC2: CACHEABLE=False / cacheable() False 가드는 매번 실행
+  TC3: .settings·HEAD·가드 소스 변경 시 캐시 전체 무효화
+  TC4: miss 는 캐시 파일에 덧붙이고, 로그가 MAX_LOG_LINES 를 넘을 때만 압축
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_ENGINE_DIR = Path(__file__).resolve().parent.parent.parent
+_HOOKS_DIR = _ENGINE_DIR.parent / "hooks"
+for _p in (_ENGINE_DIR, _HOOKS_DIR):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+import dispatcher  # noqa: E402
+import root_cache  # noqa: E402
+
+from guards import (  # noqa: E402
+    dangerous_command_guard,
+    decision_cache,
+    main_branch_guard,
+    worktree_remove_guard,
+)
+from guards.decision_cache import GuardDecisionCache, is_cacheable  # noqa: E402
+from guards.guard_api import deny  # noqa: E402
+
+_GUARDS_DIR = _ENGINE_DIR / "guards"
+_TABLE = [
+    ("HOOK_DANGEROUS_COMMAND", str(_GUARDS_DIR / "dangerous_command_guard.py")),
+    ("HOOK_WORKTREE_REMOVE_GUARD", str(_GUARDS_DIR / "worktree_remove_guard.py")),
+]
+
+
+def _bash(command: str) -> dict:
+    return {"tool_name": "Bash", "tool_input": {"command": command}}
+
+
+class TestDecisionCache(unittest.TestCase):
+    """판정 재사용/무효화 검증."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        os.makedirs(os.path.join(self.root, ".claude-organic"))
+        self.settings = os.path.join(self.root, ".claude-organic", ".settings")
+        with open(self.settings, "w", encoding="utf-8") as f:
+            f.write("HOOK_DANGEROUS_COMMAND=true\n")
+        decision_cache._CACHES.clear()
+        patches = [
+            mock.patch.object(dispatcher, "_find_project_root", return_value=self.root),
+            mock.patch.dict(os.environ, {"HOOK_GUARD_INPROCESS": "true", "HOOK_GUARD_PARALLEL": "false",
+                                         "HOOK_GUARD_CACHE": "true", "_WF_SESSION_TYPE": "main"}),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self) -> None:
+        decision_cache._CACHES.clear()
+        self._tmp.cleanup()
+
+    def _evaluate(self, payload: dict):
+        return dispatcher.evaluate_guards(_TABLE, payload, json.dumps(payload).encode("utf-8"), flags={})
+
+    def test_01_repeat_reuses_decision(self) -> None:
+        """두 번째 실행은 캐시 판정을 쓰고, 비캐시 가드만 다시 실행한다."""
+        with mock.patch.object(dangerous_command_guard, "evaluate", wraps=dangerous_command_guard.evaluate) as dc, \
+                mock.patch.object(worktree_remove_guard, "evaluate", return_value=None) as wr:
+            first, _ = self._evaluate(_bash("ls -la"))
+            second, timings = self._evaluate(_bash("  ls -la  "))
+            self.assertEqual(dc.call_count, 1)
+            self.assertEqual(wr.call_count, 2)
+        self.assertIsNone(first)
+        self.assertIsNone(second)
+        self.assertEqual([(t.guard, t.cached) for t in timings],
+                         [("dangerous_command_guard", True), ("worktree_remove_guard", False)])
+        state_dir = root_cache.state_dir(os.path.join(self.root, ".claude-organic"))
+        self.assertTrue(os.path.isfile(os.path.join(state_dir, decision_cache.CACHE_FILENAME)))
+
+        # deny 도 재사용되며, 새 인스턴스(프로세스 재시작)도 파일에서 읽는다
+        self._evaluate(_bash("rm -rf /"))
+        decision_cache._CACHES.clear()
+        with mock.patch.object(dangerous_command_guard, "evaluate") as dc:
+            decision, _ = self._evaluate(_bash("rm -rf /"))
+            dc.assert_not_called()
+        self.assertTrue(decision.is_deny)
+
+    def test_02_cacheable_contract(self) -> None:
+        """CACHEABLE 선언과 cacheable() 판정을 따른다."""
+        self.assertFalse(is_cacheable(worktree_remove_guard, _bash("git worktree remove x")))
+        self.assertTrue(is_cacheable(main_branch_guard, _bash("git commit -m x")))
+        self.assertFalse(is_cacheable(main_branch_guard, _bash("git -C ../other commit -m x")))
+
+    def test_03_invalidation(self) -> None:
+        """.settings, HEAD, 가드 소스가 바뀌면 저장된 판정을 버린다."""
+        cache = GuardDecisionCache(self.root)
+        key = cache.key(_bash("echo hi"))
+        decisions = {"dangerous_command_guard": deny("x"), "kanban_subcommand_guard": None}
+
+        cache.store(key, decisions)
+        self.assertEqual(cache.lookup(key), decisions)
+        with open(self.settings, "a", encoding="utf-8") as f:
+            f.write("HOOK_GUARD_CACHE=true\n")
+        self.assertEqual(cache.lookup(key), {})
+
+        cache.store(key, decisions)
+        with mock.patch.object(decision_cache, "_read_head", return_value="ref: refs/heads/other"):
+            self.assertEqual(cache.lookup(key), {})
+
+        self.assertEqual(cache.lookup(key), decisions)
+        with mock.patch.object(decision_cache, "_sources_signature", return_value=[0, 0]):
+            self.assertEqual(cache.lookup(key), {})
+
+    def test_04_append_and_compact(self) -> None:
+        """store 는 같은 파일에 줄을 덧붙이고, 상한을 넘으면 최신 항목만 남겨 다시 쓴다."""
+        cache = GuardDecisionCache(self.root)
+        keys = [cache.key(_bash(f"echo {i}")) for i in range(7)]
+        with mock.patch.object(decision_cache, "MAX_ENTRIES", 3), \
+                mock.patch.object(decision_cache, "MAX_LOG_LINES", 7):
+            cache.store(keys[0], {"dangerous_command_guard": None})
+            inode = os.stat(cache.path).st_ino
+            for key in keys[1:6]:
+                cache.store(key, {"dangerous_command_guard": None})
+            cache.store(keys[5], {"main_branch_guard": deny("x")})
+            with open(cache.path, encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 8)  # 헤더 + 7줄 (덧붙이기만 함)
+            self.assertEqual(os.stat(cache.path).st_ino, inode)
+
+            # 다른 프로세스에 해당하는 새 인스턴스도 같은 키의 마지막 줄을 읽는다
+            other = GuardDecisionCache(self.root)
+            self.assertEqual(other.lookup(keys[5]),
+                             {"dangerous_command_guard": None, "main_branch_guard": deny("x")})
+            self.assertEqual(other.lookup(keys[0]), {"dangerous_command_guard": None})
+
+            # 상한 도달 후 다음 store 는 최신 MAX_ENTRIES 항목으로 압축
+            cache.store(keys[6], {"dangerous_command_guard": None})
+            with open(cache.path, encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 4)
+            self.assertEqual(cache.lookup(keys[0]), {})
+            self.assertEqual(cache.lookup(keys[6]), {"dangerous_command_guard": None})
+            self.assertEqual(other.lookup(keys[4]), {"dangerous_command_guard": None})
+            self.assertEqual(other.lookup(keys[1]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
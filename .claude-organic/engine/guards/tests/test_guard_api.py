@@ -0,0 +1,165 @@
+"""guard_api 플러그인 계약 + pre-tool-use in-process 디스패치 회귀 테스트.
+
+  TC1-3: evaluate() 직접 호출 — deny/None/allow Decision 반환
+  TC4:   Decision.to_json() — 기존 가드 stdout 형식(ensure_ascii=False)과 동일
+  TC5:   decision_from_output() — subprocess stdout 복원
+  TC6:   pre-tool-use.py — in-process / subprocess 모드 판정 JSON 동일성
+  TC7:   evaluate_guards() — 병렬/직렬 실행 판정 동일, timings 테이블 순서
+  TC8:   evaluate_guards() — 선순위 deny 시 실행 중인 후순위 subprocess 가드 kill
+  TC9:   deny 한 in-process 가드는 아직 시작하지 않은 후순위 in-process 가드를 건너뛰게 한다
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_ENGINE_DIR = Path(__file__).resolve().parent.parent.parent
+_PRE_TOOL_USE = _ENGINE_DIR.parent / "hooks" / "pre-tool-use.py"
+if str(_ENGINE_DIR) not in sys.path:
+    sys.path.insert(0, str(_ENGINE_DIR))
+if str(_PRE_TOOL_USE.parent) not in sys.path:
+    sys.path.insert(0, str(_PRE_TOOL_USE.parent))
+
+import dispatcher  # noqa: E402
+
+from guards import dangerous_command_guard, kanban_subcommand_guard, rules_auto_approve  # noqa: E402
+from guards.guard_api import Decision, decision_from_output, deny  # noqa: E402
+
+
+def _run_pre_tool_use(payload: dict, inprocess: bool) -> str:
+    """pre-tool-use.py 를 지정 모드로 실행하고 stdout 을 반환."""
+    env = {k: v for k, v in os.environ.items() if k not in ("_WF_SESSION_TYPE", "TMUX_PANE")}
+    env["HOOK_GUARD_INPROCESS"] = "true" if inprocess else "false"
+    proc = subprocess.run(
+        [sys.executable, str(_PRE_TOOL_USE)],
+        input=json.dumps(payload),
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    return proc.stdout
+
+
+class TestGuardApi(unittest.TestCase):
+    """가드 모듈 evaluate() 계약 검증."""
+
+    def test_01_evaluate_deny(self) -> None:
+        """위험 명령어 → deny Decision."""
+        decision = dangerous_command_guard.evaluate(
+            {"tool_name": "Bash", "tool_input": {"command": "git reset --hard"}}
+        )
+        self.assertIsNotNone(decision)
+        self.assertTrue(decision.is_deny)
+
+    def test_02_evaluate_pass(self) -> None:
+        """유효 서브커맨드 / 비대상 도구 → None."""
+        self.assertIsNone(kanban_subcommand_guard.evaluate(
+            {"tool_name": "Bash", "tool_input": {"command": "flow-kanban show T-001"}}
+        ))
+        self.assertIsNone(dangerous_command_guard.evaluate(
+            {"tool_name": "Read", "tool_input": {"file_path": "a.py"}}
+        ))
+
+    def test_03_evaluate_allow(self) -> None:
+        """.claude/rules/ 경로 Write → allow Decision."""
+        decision = rules_auto_approve.evaluate(
+            {"tool_name": "Write", "tool_input": {"file_path": "/p/.claude/rules/a.md"}}
+        )
+        self.assertIsNotNone(decision)
+        self.assertTrue(decision.is_allow)
+
+    def test_04_to_json_format(self) -> None:
+        """to_json() 은 비ASCII 문자를 이스케이프하지 않는다."""
+        out = deny("차단").to_json()
+        self.assertIn("차단", out)
+        self.assertEqual(json.loads(out)["hookSpecificOutput"]["permissionDecision"], "deny")
+
+    def test_05_decision_from_output(self) -> None:
+        """가드 stdout → Decision 복원, 빈 출력/비JSON → None."""
+        original = deny("reason")
+        self.assertEqual(decision_from_output(original.to_json().encode("utf-8") + b"\n"), original)
+        self.assertIsNone(decision_from_output(b""))
+        self.assertIsNone(decision_from_output(b"not json"))
+        self.assertIsInstance(original, Decision)
+
+    def test_06_pre_tool_use_modes_equal(self) -> None:
+        """in-process / subprocess 모드의 최종 판정 JSON 이 동일하다."""
+        payloads = [
+            {"tool_name": "Bash", "tool_input": {"command": "rm -rf /"}},
+            {"tool_name": "Bash", "tool_input": {"command": "ls -la"}},
+            {"tool_name": "Bash", "tool_input": {"command": "flow-kanban bogus"}},
+            {"tool_name": "Write", "tool_input": {"file_path": "/p/.claude/rules/a.md", "content": ""}},
+            {"tool_name": "Edit", "tool_input": {"file_path": "src/a.py", "old_string": "a", "new_string": "b"}},
+        ]
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                self.assertEqual(
+                    _run_pre_tool_use(payload, inprocess=True),
+                    _run_pre_tool_use(payload, inprocess=False),
+                )
+
+    def test_07_evaluate_guards_parallel_equals_serial(self) -> None:
+        """병렬/직렬 실행의 판정이 같고 timings 는 테이블 순서를 따른다."""
+        guards_dir = _ENGINE_DIR / "guards"
+        table = [
+            ("HOOK_HOOKS_SELF_PROTECT", str(guards_dir / "hooks_self_guard.py")),
+            ("HOOK_DANGEROUS_COMMAND", str(guards_dir / "dangerous_command_guard.py")),
+            ("HOOK_KANBAN_SUBCOMMAND_GUARD", str(guards_dir / "kanban_subcommand_guard.py")),
+        ]
+        names = [Path(p).stem for _, p in table]
+        for command in ("ls -la", "rm -rf /", "flow-kanban bogus"):
+            payload = {"tool_name": "Bash", "tool_input": {"command": command}}
+            results = {}
+            for parallel in ("true", "false"):
+                with mock.patch.dict(os.environ, {"HOOK_GUARD_PARALLEL": parallel}):
+                    decision, timings = dispatcher.evaluate_guards(
+                        table, payload, json.dumps(payload).encode("utf-8"), flags={},
+                    )
+                results[parallel] = decision
+                self.assertEqual([t.guard for t in timings], names[:len(timings)])
+            with self.subTest(command=command):
+                self.assertEqual(results["true"], results["false"])
+
+    def test_08_cancel_slow_subprocess_guard(self) -> None:
+        """선순위 deny 가 나오면 느린 후순위 subprocess 가드를 기다리지 않는다."""
+        with tempfile.TemporaryDirectory() as tmp:
+            deny_script = Path(tmp) / "deny_guard.py"
+            deny_script.write_text(f"print({deny('blocked').to_json()!r})\n", encoding="utf-8")
+            slow_script = Path(tmp) / "slow_guard.py"
+            slow_script.write_text("import time\ntime.sleep(10)\n", encoding="utf-8")
+            table = [("HOOK_TEST_DENY", str(deny_script)), ("HOOK_TEST_SLOW", str(slow_script))]
+            with mock.patch.dict(os.environ, {"HOOK_GUARD_INPROCESS": "false", "HOOK_GUARD_PARALLEL": "true"}):
+                start = time.monotonic()
+                decision, timings = dispatcher.evaluate_guards(table, {}, b"{}", flags={})
+                elapsed = time.monotonic() - start
+            dispatcher.wait_pending_guards()
+        self.assertEqual(decision, deny("blocked"))
+        self.assertLess(elapsed, 5.0)
+        self.assertEqual([(t.guard, t.outcome) for t in timings],
+                         [("deny_guard", "deny"), ("slow_guard", "cancelled")])
+
+    def test_09_deny_skips_unstarted_inprocess_guards(self) -> None:
+        """deny 직후 후순위 in-process 가드는 evaluate() 없이 cancelled 로 끝난다."""
+        denier = mock.Mock(evaluate=mock.Mock(return_value=deny("blocked")), spec=["evaluate"])
+        follower = mock.Mock(evaluate=mock.Mock(return_value=None), spec=["evaluate"])
+        first = dispatcher._GuardRun("/g/deny_guard.py", denier)
+        second = dispatcher._GuardRun("/g/side_effect_guard.py", follower)
+        first.followers = [second]
+
+        first.run({}, b"{}")
+        second.run({}, b"{}")
+
+        follower.evaluate.assert_not_called()
+        self.assertTrue(second.done.is_set())
+        self.assertEqual((first.timing().outcome, second.timing().outcome), ("deny", "cancelled"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""hook_daemon.py / hook_client.py 상주 데몬 경로 회귀 테스트.
+
+  TC1: 데몬 경유 pre-tool-use 출력/exit code 가 기존 경로와 동일
+  TC2: post-tool-use / subagent-stop 데몬 경유 exit code 0
+  TC3: 데몬 미기동 + HOOK_DAEMON=true → 기존 경로로 폴백 (동일 출력)
+  TC4: SIGTERM 시 소켓/pid 파일 정리
+"""
+from __future__ import annotations
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import unittest
+from pathlib import Path
+
+_HOOKS_DIR = Path(__file__).resolve().parent.parent.parent.parent / "hooks"
+_CW_DIR = _HOOKS_DIR.parent
+_SOCKET = _CW_DIR / ".hook-daemon.sock"
+_PID = _CW_DIR / ".hook-daemon.pid"
+if str(_HOOKS_DIR) not in sys.path:
+    sys.path.insert(0, str(_HOOKS_DIR))
+
+from hook_client import daemon_down  # noqa: E402
+
+_PAYLOADS = [
+    {"tool_name": "Bash", "tool_input": {"command": "rm -rf /"}},
+    {"tool_name": "Bash", "tool_input": {"command": "ls -la"}},
+    {"tool_name": "Bash", "tool_input": {"command": "flow-kanban bogus"}},
+    {"tool_name": "Edit", "tool_input": {"file_path": "src/a.py", "old_string": "a", "new_string": "b"}},
+]
+
+
+def _run_hook(script: str, payload: dict, daemon: bool) -> subprocess.CompletedProcess:
+    """디스패처 스크립트를 HOOK_DAEMON 모드로 실행한다."""
+    env = {k: v for k, v in os.environ.items() if k not in ("_WF_SESSION_TYPE", "TMUX_PANE")}
+    env["HOOK_DAEMON"] = "true" if daemon else "false"
+    return subprocess.run(
+        [sys.executable, str(_HOOKS_DIR / script)],
+        input=json.dumps(payload).encode("utf-8"),
+        capture_output=True,
+        env=env,
+    )
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return predicate()
+
+
+@unittest.skipIf(sys.platform == "win32", "Unix 소켓 필요")
+@unittest.skipUnless(daemon_down(), "이미 실행 중인 훅 데몬이 있음")
+class TestHookDaemon(unittest.TestCase):
+    """상주 데몬 경유/폴백 동작 검증."""
+
+    def setUp(self) -> None:
+        env = dict(os.environ, HOOK_DAEMON_IDLE_SECONDS="30")
+        self.proc = subprocess.Popen(
+            [sys.executable, str(_HOOKS_DIR / "hook_daemon.py")],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self.assertTrue(_wait_for(lambda: not daemon_down()), "daemon socket not created")
+
+    def tearDown(self) -> None:
+        if self.proc.poll() is None:
+            self.proc.send_signal(signal.SIGTERM)
+            self.proc.wait(timeout=5)
+
+    def test_01_pre_tool_use_equal(self) -> None:
+        """데몬 경유 결과가 기존 경로와 바이트 단위로 동일하다."""
+        for payload in _PAYLOADS:
+            with self.subTest(payload=payload):
+                via_daemon = _run_hook("pre-tool-use.py", payload, daemon=True)
+                local = _run_hook("pre-tool-use.py", payload, daemon=False)
+                self.assertEqual(via_daemon.stdout, local.stdout)
+                self.assertEqual(via_daemon.returncode, local.returncode)
+
+    def test_02_async_dispatchers(self) -> None:
+        """post-tool-use / subagent-stop 도 데몬 경유로 exit 0."""
+        payload = {"tool_name": "Read", "tool_input": {"file_path": "README.md"}}
+        self.assertEqual(_run_hook("post-tool-use.py", payload, daemon=True).returncode, 0)
+        self.assertEqual(_run_hook("subagent-stop.py", {}, daemon=True).returncode, 0)
+
+    def test_03_fallback_when_down(self) -> None:
+        """데몬 종료 후에도 HOOK_DAEMON=true 호출은 기존 경로로 동일 판정을 낸다."""
+        self.proc.send_signal(signal.SIGTERM)
+        self.proc.wait(timeout=5)
+        payload = _PAYLOADS[0]
+        result = _run_hook("pre-tool-use.py", payload, daemon=True)
+        self.assertEqual(result.stdout, _run_hook("pre-tool-use.py", payload, daemon=False).stdout)
+        # 폴백 호출이 다음 이벤트를 위해 데몬을 재기동한다 → 정리
+        if _wait_for(lambda: not daemon_down(), timeout=3.0):
+            os.kill(int(_PID.read_text().strip()), signal.SIGTERM)
+            _wait_for(lambda: not _SOCKET.exists())
+
+    def test_04_sigterm_cleanup(self) -> None:
+        """SIGTERM 시 소켓과 pid 파일을 삭제한다."""
+        self.proc.send_signal(signal.SIGTERM)
+        self.proc.wait(timeout=5)
+        self.assertFalse(_SOCKET.exists())
+        self.assertFalse(_PID.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""payload_scan 대용량 Write/Edit 부분 스캔 테스트.
+
+  TC1: 본문 앞 라우팅 필드 + 본문 뒤 최상위 필드만 읽고, full() 은 원본과 동일
+  TC2: 작은 페이로드 / Bash / 본문 뒤 file_path 는 전체 json.loads 로 폴백
+  TC3: NEEDS_CONTENT 가드에만 전체 페이로드 전달
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_ENGINE_DIR = Path(__file__).resolve().parent.parent.parent
+_HOOKS_DIR = _ENGINE_DIR.parent / "hooks"
+for _p in (_ENGINE_DIR, _HOOKS_DIR):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+import dispatcher  # noqa: E402
+
+from guards import payload_scan  # noqa: E402
+from guards.payload_scan import PartialPayload, full_payload, parse_tool_payload  # noqa: E402
+
+_BODY = 'print("a, \\"b\\"")\n# "tool_use_id": "fake", 한글\n' * 4000
+
+
+def _raw(tool_input: dict, tool_name: str = "Edit") -> bytes:
+    payload = {
+        "session_id": "s-1",
+        "hook_event_name": "PreToolUse",
+        "tool_name": tool_name,
+        "tool_input": tool_input,
+        "tool_use_id": "toolu_01",
+    }
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+class TestPayloadScan(unittest.TestCase):
+    """부분 스캔 결과와 폴백 검증."""
+
+    def test_01_partial_scan(self) -> None:
+        """본문을 디코드하지 않고 라우팅 필드와 본문 뒤 tool_use_id 를 얻는다."""
+        raw = _raw({"file_path": "/repo/a.py", "old_string": _BODY, "new_string": _BODY, "replace_all": False})
+        self.assertGreater(len(raw), payload_scan.FAST_PATH_BYTES)
+        payload = parse_tool_payload(raw)
+        self.assertIsInstance(payload, PartialPayload)
+        self.assertEqual(payload.omitted, "old_string")
+        self.assertEqual(
+            dict(payload),
+            {"session_id": "s-1", "hook_event_name": "PreToolUse", "tool_name": "Edit",
+             "tool_input": {"file_path": "/repo/a.py"}, "tool_use_id": "toolu_01"},
+        )
+        self.assertEqual(full_payload(payload), json.loads(raw))
+
+    def test_02_fallbacks(self) -> None:
+        """조건이 맞지 않으면 전체 파싱 결과(일반 dict)를 반환한다."""
+        cases = [
+            _raw({"file_path": "/repo/a.py", "content": "x"}, "Write"),
+            _raw({"command": "echo " + _BODY}, "Bash"),
+            _raw({"content": _BODY, "file_path": "/repo/a.py"}, "Write"),
+        ]
+        for raw in cases:
+            with self.subTest(raw=raw[:60]):
+                payload = parse_tool_payload(raw)
+                self.assertNotIsInstance(payload, PartialPayload)
+                self.assertEqual(payload, json.loads(raw))
+        with self.assertRaises(ValueError):
+            parse_tool_payload(b"{" + b" " * payload_scan.FAST_PATH_BYTES)
+
+    def test_03_needs_content(self) -> None:
+        """NEEDS_CONTENT 를 선언한 가드만 본문이 포함된 페이로드를 받는다."""
+        raw = _raw({"file_path": "/repo/a.py", "content": _BODY}, "Write")
+        payload = parse_tool_payload(raw)
+        seen: dict[str, dict] = {}
+
+        def _guard(name: str, needs: bool) -> types.ModuleType:
+            module = types.ModuleType(name)
+            module.HOOK_FLAG = "HOOK_TEST"
+            module.NEEDS_CONTENT = needs
+            module.evaluate = lambda data: seen.__setitem__(name, data)
+            return module
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [os.path.join(tmp, "plain.py"), os.path.join(tmp, "body.py")]
+            for path in paths:
+                Path(path).touch()
+            modules = {paths[0]: _guard("plain", False), paths[1]: _guard("body", True)}
+            with mock.patch.object(dispatcher, "_load_guard_module", side_effect=modules.get), \
+                    mock.patch.dict(os.environ, {"HOOK_GUARD_CACHE": "false", "HOOK_SPANS": "false",
+                                                 "HOOK_TEST": "true"}):
+                dispatcher.evaluate_guards([("HOOK_TEST", p) for p in paths], payload, raw, flags={})
+        self.assertNotIn("content", seen["plain"]["tool_input"])
+        self.assertEqual(seen["body"]["tool_input"]["content"], _BODY)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,8 @@ Claude Code가 세션 시작 시 프로젝트 루트(메인 리포)를 cwd로 
 PreToolUse 훅 레이어에서 차단하는 방어 계층(Defense-in-depth)이다.
 
 주요 함수:
+    cacheable: 판정 캐시 가능 여부 (decision_cache 계약)
+    evaluate: 메인 리포 경로 수정 판정 (가드 플러그인 API)
     main: Hook 진입점, stdin JSON 파싱 후 메인 리포 경로 수정 차단
 
 입력: stdin으로 JSON (tool_name, tool_input)
@@ -20,7 +22,6 @@ PreToolUse 훅 레이어에서 차단하는 방어 계층(Defense-in-depth)이
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import sys
@@ -35,31 +36,20 @@ _prompt_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__fi
 if _prompt_dir not in sys.path:
     sys.path.insert(0, _prompt_dir)
 
-from common import load_json_file, read_env, resolve_project_root, scan_active_workflows
+from common import load_json_file, resolve_project_root, scan_active_workflows
 from flow.session_identifier import get_session_type
+from guards.bash_analysis import analyze
+from guards.guard_api import Decision, deny, run_script
 from messages import (
     WORKTREE_PATH_BASH_MODIFY_DENIED,
     WORKTREE_PATH_WRITE_EDIT_DENIED,
 )
 
+HOOK_FLAG: str = "HOOK_WORKTREE_PATH_GUARD"
+
 # implement command: 워크트리 격리가 적용되는 command
 _IMPLEMENT_COMMAND = "implement"
 
-# Bash 도구에서 파일을 수정할 수 있는 명령 패턴 (readonly_session_guard.py와 동일)
-_BASH_FILE_MODIFY_PATTERNS: list[str] = [
-    r"\bsed\s+-i",                               # sed inplace
-    r"\bawk\s+.*-i\s+inplace",                   # awk inplace
-    r"\b(echo|printf)\s+.*\s*>{1,2}\s*\S",       # echo/printf 리다이렉트
-    r"\btee\s+(-a\s+)?\S",                       # tee 쓰기
-    r"\bcat\s*<<",                               # heredoc 리다이렉트
-    r"\bcp\s+",                                  # 파일 복사
-    r"\bmv\s+",                                  # 파일 이동
-    r"\bpython3?\s+(-c\s+|.*\bopen\b.*\bwrite\b)",  # python -c open write
-    r"\bperl\s+-.*[pi]",                         # perl inplace
-    r"(?:^|[;&|]\s*)\binstall\s+",               # install 명령 (서브커맨드 제외)
-    r"\bdd\s+",                                  # dd 명령
-]
-
 # 항상 허용하는 경로 패턴 (메인 리포 산출물·sidecar 디렉터리)
 # 주의: 보수적으로 좁게 정의 — `.claude-organic/board/server/`, `.claude-organic/engine/` 같은
 # 소스 코드 경로는 의도적으로 제외 (T-403 회귀 차단 대상).
@@ -70,23 +60,6 @@ _ALWAYS_ALLOWED_PATTERNS: list[re.Pattern[str]] = [
 ]
 
 
-def _deny(reason: str) -> None:
-    """차단 JSON을 stdout에 출력하고 프로세스를 종료한다.
-
-    Args:
-        reason: 차단 사유 문자열
-    """
-    result = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "deny",
-            "permissionDecisionReason": reason,
-        }
-    }
-    print(json.dumps(result, ensure_ascii=False))
-    sys.exit(0)
-
-
 def _get_workflow_command() -> str | None:
     """활성 워크플로우의 command 필드를 반환한다.
 
@@ -295,39 +268,10 @@ def _get_suggested_path(file_path: str, project_root: str, worktree_path: str) -
     return os.path.join(worktree_path, file_path.lstrip("/"))
 
 
-def _strip_quoted_args(command: str) -> str:
-    """명령 문자열에서 따옴표로 감싼 영역의 내용을 빈 문자열로 치환한다.
-
-    Args:
-        command: Bash 도구의 원본 command 문자열
-
-    Returns:
-        따옴표 내부 내용이 제거된 문자열.
-    """
-    command = re.sub(r'"(?:[^"\\]|\\.)*"', '""', command)
-    command = re.sub(r"'(?:[^'\\]|\\.)*'", "''", command)
-    return command
-
-
-def _extract_command_positions(command: str) -> list[str]:
-    """명령 문자열을 파이프/체인 구분자로 분할하여 세그먼트 목록을 반환한다.
-
-    Args:
-        command: 따옴표 strip이 완료된 명령 문자열
-
-    Returns:
-        각 세그먼트의 선행 공백이 제거된 문자열 목록.
-    """
-    parts = re.split(r'&&|\|\||(?<!\|)\|(?!\|)|;', command)
-    return [part.lstrip() for part in parts if part.strip()]
-
-
 def _is_bash_file_modify(command: str) -> bool:
     """Bash 명령에서 파일 수정 패턴 포함 여부를 검사한다.
 
-    따옴표로 감싼 인자 영역을 먼저 제거한 뒤,
-    파이프/체인 구분자로 세그먼트를 분할하여
-    각 세그먼트에서 _BASH_FILE_MODIFY_PATTERNS 패턴을 검사한다.
+    공용 분석기(bash_analysis.analyze)의 file_modify_pattern 을 사용한다.
 
     Args:
         command: Bash 도구의 command 문자열
@@ -335,13 +279,7 @@ def _is_bash_file_modify(command: str) -> bool:
     Returns:
         파일 수정 패턴이 매칭되면 True, 아니면 False.
     """
-    stripped = _strip_quoted_args(command)
-    segments = _extract_command_positions(stripped)
-    for segment in segments:
-        for pattern in _BASH_FILE_MODIFY_PATTERNS:
-            if re.search(pattern, segment):
-                return True
-    return False
+    return analyze(command).file_modify_pattern is not None
 
 
 def _bash_targets_main_repo(command: str, project_root: str, worktree_path: str) -> bool:
@@ -378,39 +316,54 @@ def _bash_targets_main_repo(command: str, project_root: str, worktree_path: str)
     return False
 
 
-def main() -> None:
-    """워크트리 경로 격리 가드 Hook의 진입점.
+def cacheable(data: dict) -> bool:
+    """판정 캐시 가능 여부.
 
-    stdin에서 JSON을 읽어 Write/Edit/MultiEdit/NotebookEdit/Bash 도구 사용 시
-    현재 세션이 워크플로우 implement 세션이고 워크트리가 설정된 경우,
-    메인 리포 경로 파일 수정을 차단하고 워크트리 경로를 안내한다.
+    워크플로우 세션에서 command/워크트리 경로를 .workflow/ 스캔으로 찾아야 하는 경우는
+    활성 워크플로우 상태에 의존하므로 캐시하지 않는다.
 
-    비tmux 환경, 메인 세션, research/review 세션, 워크트리 없는 세션에서는 통과한다.
-    `_ALWAYS_ALLOWED_PATTERNS` 와 일치하는 산출물·sidecar 경로는 항상 허용한다.
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
+
+    Returns:
+        캐시 가능하면 True.
     """
-    # .claude-organic/.settings에서 설정 로드
-    hook_flag = os.environ.get("HOOK_WORKTREE_PATH_GUARD") or read_env("HOOK_WORKTREE_PATH_GUARD")
+    if get_session_type() != "workflow":
+        return True
+    if os.environ.get("WORKFLOW_WORK_DIR", "").strip():
+        return True
+    return bool(
+        os.environ.get("WORKFLOW_COMMAND", "").strip()
+        and os.environ.get("WORKFLOW_WORKTREE_PATH", "").strip()
+    )
 
-    # Hook disable check (false/0 = disabled)
-    if hook_flag in ("false", "0"):
-        sys.exit(0)
 
-    # stdin에서 JSON 읽기
-    try:
-        data = json.load(sys.stdin)
-    except (json.JSONDecodeError, ValueError):
-        sys.exit(0)
+def evaluate(data: dict) -> Decision | None:
+    """워크트리 경로 격리 판정.
 
+    Write/Edit/MultiEdit/NotebookEdit/Bash 도구 사용 시 현재 세션이 워크플로우
+    implement 세션이고 워크트리가 설정된 경우, 메인 리포 경로 파일 수정에 대해
+    워크트리 경로를 안내하는 deny Decision을 반환한다.
+
+    비tmux 환경, 메인 세션, research/review 세션, 워크트리 없는 세션에서는 통과한다.
+    `_ALWAYS_ALLOWED_PATTERNS` 와 일치하는 산출물·sidecar 경로는 항상 허용한다.
+
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
+
+    Returns:
+        차단 시 deny Decision, 통과 시 None.
+    """
     tool_name = data.get("tool_name", "")
 
     # 검사 대상 도구가 아니면 통과
     if tool_name not in ("Write", "Edit", "MultiEdit", "NotebookEdit", "Bash"):
-        sys.exit(0)
+        return None
 
     # 세션 유형 확인 -- 워크플로우 세션이 아니면 통과 (이 가드의 관심사 아님)
     session_type = get_session_type()
     if session_type != "workflow":
-        sys.exit(0)
+        return None
 
     # --- 워크플로우 세션 확인됨, command 판별 ---
 
@@ -422,14 +375,14 @@ def main() -> None:
         if os.environ.get("WORKFLOW_WORKTREE_PATH", "").strip():
             command = _IMPLEMENT_COMMAND
         else:
-            sys.exit(0)
+            return None
 
     # command 첫 세그먼트 추출 (체인 command 지원: "research>implement" -> "research")
     first_segment = command.split(">")[0].strip()
 
     # implement command가 아니면 통과 (research/review는 readonly_session_guard가 담당)
     if first_segment != _IMPLEMENT_COMMAND:
-        sys.exit(0)
+        return None
 
     # --- implement command 확인됨, 워크트리 경로 조회 ---
 
@@ -437,7 +390,7 @@ def main() -> None:
 
     # 워크트리 경로가 없으면 통과 (비워크트리 implement 세션)
     if not worktree_path:
-        sys.exit(0)
+        return None
 
     # --- 워크트리 경로 확인됨, 파일 경로 검사 ---
 
@@ -450,20 +403,20 @@ def main() -> None:
         else:
             file_path = tool_input.get("file_path", "")
         if not file_path:
-            sys.exit(0)
+            return None
 
         # 항상 허용 경로(메인 산출물·sidecar)는 통과
         if _is_always_allowed_path(file_path, project_root):
-            sys.exit(0)
+            return None
 
         # 워크트리 하위 경로이면 통과
         if _is_under_worktree(file_path, worktree_path, project_root):
-            sys.exit(0)
+            return None
 
         # 상대 경로인 경우: 메인 리포 루트 기준 상대 경로는 통과 불가
         # (Claude Code가 메인 리포 루트를 cwd로 사용하므로 상대 경로 = 메인 리포 경로)
         suggested_path = _get_suggested_path(file_path, project_root, worktree_path)
-        _deny(
+        return deny(
             WORKTREE_PATH_WRITE_EDIT_DENIED.format(
                 worktree_path=worktree_path,
                 file_path=file_path,
@@ -471,26 +424,32 @@ def main() -> None:
             )
         )
 
-    if tool_name == "Bash":
-        bash_cmd = tool_input.get("command", "")
-        if not bash_cmd:
-            sys.exit(0)
-
-        # 파일 수정 패턴이 없으면 통과
-        if not _is_bash_file_modify(bash_cmd):
-            sys.exit(0)
-
-        # 메인 리포 절대경로를 대상으로 하는 수정이면 차단
-        if _bash_targets_main_repo(bash_cmd, project_root, worktree_path):
-            _deny(
-                WORKTREE_PATH_BASH_MODIFY_DENIED.format(
-                    worktree_path=worktree_path,
-                )
+    # Bash 도구
+    bash_cmd = tool_input.get("command", "")
+    if not bash_cmd:
+        return None
+
+    # 파일 수정 패턴이 없으면 통과
+    if not _is_bash_file_modify(bash_cmd):
+        return None
+
+    # 메인 리포 절대경로를 대상으로 하는 수정이면 차단
+    if _bash_targets_main_repo(bash_cmd, project_root, worktree_path):
+        return deny(
+            WORKTREE_PATH_BASH_MODIFY_DENIED.format(
+                worktree_path=worktree_path,
             )
-        sys.exit(0)
+        )
+    return None
+
+
+def main() -> None:
+    """워크트리 경로 격리 가드 Hook의 진입점.
 
-    # 알 수 없는 도구: 통과
-    sys.exit(0)
+    HOOK_WORKTREE_PATH_GUARD 토글 확인 후 stdin JSON을 evaluate()에 전달하고,
+    차단 판정이면 deny JSON을 출력한다.
+    """
+    run_script(evaluate, HOOK_FLAG)
 
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ PreToolUse(Bash) 이벤트에서 ``git worktree remove`` 명령을 감지하고,
 미커밋 변경이 없으면 통과.
 
 주요 함수:
+    evaluate: 워크트리 미커밋 변경 판정 (가드 플러그인 API)
     main: Hook 진입점, stdin JSON 파싱 후 워크트리 미커밋 변경 차단
 
 입력: stdin으로 JSON (tool_name, tool_input)
@@ -18,9 +19,7 @@ PreToolUse(Bash) 이벤트에서 ``git worktree remove`` 명령을 감지하고,
 
 from __future__ import annotations
 
-import json
 import os
-import re
 import subprocess
 import sys
 
@@ -29,67 +28,59 @@ _engine_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__fi
 if _engine_dir not in sys.path:
     sys.path.insert(0, _engine_dir)
 
-from common import read_env
 from flow.worktree_manager import has_uncommitted_changes
+from guards.bash_analysis import BashCommand, analyze_payload
+from guards.guard_api import Decision, deny, run_script
 
-# ``git worktree remove [--force] <path>`` 명령 패턴
-_WORKTREE_REMOVE_PATTERN: str = r"\bgit\s+worktree\s+remove\b"
+HOOK_FLAG: str = "HOOK_WORKTREE_REMOVE_GUARD"
 
+# 판정이 대상 워크트리의 git status 에 의존하므로 판정 캐시 대상에서 제외
+CACHEABLE: bool = False
 
-def _deny(worktree_path: str, status_output: str) -> None:
-    """차단 JSON을 stdout에 출력하고 프로세스를 종료한다.
+
+def _deny(worktree_path: str, status_output: str) -> Decision:
+    """차단 Decision을 생성한다.
 
     Args:
         worktree_path: 미커밋 변경이 감지된 워크트리 경로.
         status_output: ``git status --porcelain`` 출력 (미커밋 파일 목록).
+
+    Returns:
+        permission="deny" Decision.
     """
     reason = (
         f"[워크트리 삭제 차단] 미커밋 변경이 있는 워크트리입니다: {worktree_path}\n"
         f"미커밋 파일 목록:\n{status_output}\n"
         "flow-merge를 사용하여 정상 경로로 완료하세요."
     )
-    result = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "deny",
-            "permissionDecisionReason": reason,
-        }
-    }
-    print(json.dumps(result, ensure_ascii=False))
-    sys.exit(0)
+    return deny(reason)
 
 
-def _extract_worktree_path(command: str) -> str | None:
-    """``git worktree remove [--force] <path>`` 명령에서 경로 인자를 추출한다.
+def _extract_worktree_path(command: BashCommand) -> str | None:
+    """``git worktree remove [--force] <path>`` 호출에서 경로 인자를 추출한다.
 
     ``--force`` 플래그를 건너뛰고 첫 번째 비옵션 인자를 경로로 반환한다.
+    ``git -C <dir>`` 로 호출된 상대 경로는 <dir> 기준으로 해석한다.
     추출에 실패하거나 인자가 없으면 None을 반환한다.
 
     Args:
-        command: Bash 도구의 command 문자열.
+        command: 공용 분석기의 Bash 명령 분석 결과.
 
     Returns:
         워크트리 경로 문자열. 추출 실패 시 None.
     """
-    # ``git worktree remove`` 이후 인자만 파싱
-    match = re.search(_WORKTREE_REMOVE_PATTERN, command)
-    if not match:
-        return None
-
-    # 매칭 종료 위치 이후의 나머지 문자열 추출
-    remainder = command[match.end():].strip()
-    if not remainder:
-        return None
-
-    # 토큰 분리 (간단한 공백 기반 분리; 따옴표 포함 경로는 처리 범위 밖)
-    tokens = remainder.split()
-    for token in tokens:
-        # ``--force`` 또는 ``-f`` 플래그는 건너뜀
-        if token in ("--force", "-f"):
+    for invocation in command.git("worktree"):
+        if not invocation.args or invocation.args[0] != "remove":
             continue
-        # 첫 번째 비옵션 인자를 경로로 반환
-        return token
-
+        for token in invocation.args[1:]:
+            # ``--force`` 또는 ``-f`` 플래그는 건너뜀
+            if token in ("--force", "-f"):
+                continue
+            # 첫 번째 비옵션 인자를 경로로 반환
+            base_dir = invocation.option("-C")
+            if base_dir and not os.path.isabs(token):
+                return os.path.join(base_dir, token)
+            return token
     return None
 
 
@@ -118,58 +109,48 @@ def _get_status_output(worktree_path: str) -> str:
     return ""
 
 
-def main() -> None:
-    """워크트리 삭제 전 미커밋 변경 방어 가드 Hook의 진입점.
-
-    stdin에서 JSON을 읽어 Bash 도구의 ``git worktree remove`` 명령을 감지하고,
-    대상 워크트리에 미커밋 변경이 있으면 deny 응답을 출력하여 삭제를 차단한다.
+def evaluate(data: dict) -> Decision | None:
+    """워크트리 삭제 전 미커밋 변경 판정.
 
+    Bash 도구의 ``git worktree remove`` 명령을 감지하고,
+    대상 워크트리에 미커밋 변경이 있으면 deny Decision을 반환한다.
     경로 추출 실패, 디렉터리 부재, 미커밋 없음 시에는 통과한다.
-    """
-    # .claude-organic/.settings에서 설정 로드
-    hook_flag = os.environ.get("HOOK_WORKTREE_REMOVE_GUARD") or read_env("HOOK_WORKTREE_REMOVE_GUARD")
-
-    # Hook disable check (false/0 = disabled)
-    if hook_flag in ("false", "0"):
-        sys.exit(0)
-
-    # stdin에서 JSON 읽기
-    try:
-        data = json.load(sys.stdin)
-    except (json.JSONDecodeError, ValueError):
-        sys.exit(0)
 
-    tool_name = data.get("tool_name", "")
-
-    # Bash가 아니면 통과
-    if tool_name != "Bash":
-        sys.exit(0)
-
-    tool_input = data.get("tool_input", {})
-    command = tool_input.get("command", "")
-    if not command:
-        sys.exit(0)
+    Args:
+        data: PreToolUse stdin JSON (tool_name, tool_input)
 
-    # ``git worktree remove`` 패턴이 없으면 통과
-    if not re.search(_WORKTREE_REMOVE_PATTERN, command):
-        sys.exit(0)
+    Returns:
+        차단 시 deny Decision, 통과 시 None.
+    """
+    command = analyze_payload(data)
+    if command is None:
+        return None
 
-    # 명령에서 워크트리 경로 추출 (실패 시 통과 — false positive 방지)
+    # ``git worktree remove`` 호출에서 워크트리 경로 추출 (호출 없음/실패 시 통과 — false positive 방지)
     worktree_path = _extract_worktree_path(command)
     if not worktree_path:
-        sys.exit(0)
+        return None
 
     # 디렉터리가 아니면 통과 (이미 삭제된 경로 등)
     if not os.path.isdir(worktree_path):
-        sys.exit(0)
+        return None
 
     # 미커밋 변경 검사 (실패 시 False 반환 → 통과)
     if not has_uncommitted_changes(worktree_path):
-        sys.exit(0)
+        return None
 
     # 미커밋 변경 있음 → 차단
     status_output = _get_status_output(worktree_path)
-    _deny(worktree_path, status_output)
+    return _deny(worktree_path, status_output)
+
+
+def main() -> None:
+    """워크트리 삭제 전 미커밋 변경 방어 가드 Hook의 진입점.
+
+    HOOK_WORKTREE_REMOVE_GUARD 토글 확인 후 stdin JSON을 evaluate()에 전달하고,
+    차단 판정이면 deny JSON을 출력한다.
+    """
+    run_script(evaluate, HOOK_FLAG)
 
 
 if __name__ == "__main__":
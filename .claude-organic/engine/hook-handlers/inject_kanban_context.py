@@ -1,6 +1,6 @@
 """inject_kanban_context.py — UserPromptSubmit hook: 칸반/세션 스냅샷 컨텍스트 빌더.
 
-입력: stdin JSON (UserPromptSubmit 페이로드, 내용 무시 가능)
+입력: stdin JSON (UserPromptSubmit 페이로드, session_id 만 사용)
 출력: stdout JSON
   {"hookSpecificOutput": {"hookEventName": "UserPromptSubmit", "additionalContext": "<text>"}}
 
@@ -9,6 +9,18 @@
   additionalContext로 주입한다. 워크플로우 세션에서는 W03 디스패처가 호출을 생략하므로
   이 모듈은 메인 세션 식별 로직을 포함하지 않는다.
 
+데이터 소스:
+  engine/flow/kanban_snapshot.py 가 유지하는 .claude-organic/.kanban-snapshot.json 한 파일만 읽는다.
+  티켓 쓰기/이동과 세션 시작/중지 시 스냅샷이 갱신되므로 turn 마다 티켓 디렉터리를 glob 하거나
+  flow-sessions 를 spawn 하지 않는다.
+
+변경분 주입 (HOOK_USER_PROMPT_KANBAN_DIFF, 기본 활성):
+  engine/flow/kanban_delta.py 가 세션(session_id)별로 직전에 주입한 보드 뷰를 기억한다.
+  이후 turn 에는 변경분(티켓 추가/이동/완료, 세션 시작/종료) 또는 "변경 없음" 한 줄만 주입하고,
+  HOOK_USER_PROMPT_KANBAN_FULL_EVERY turn(기본 10)마다, 그리고 컨텍스트 압축 뒤
+  (session-start 훅이 상태 초기화)에는 전체 스냅샷을 다시 주입한다.
+  환경변수가 .settings 보다 우선한다.
+
 출력 제한:
   - 페이로드 4096 chars 초과 시 Open/In Progress 상세는 상위 10건만 표기
   - 0.8s soft deadline: 초과 시 partial 페이로드 출력 후 종료
@@ -19,23 +31,30 @@
 
 from __future__ import annotations
 
-import glob
 import json
 import os
 import signal
-import subprocess
 import sys
 import time
-import xml.etree.ElementTree as ET
 from typing import Any
 
+_engine_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+if _engine_dir not in sys.path:
+    sys.path.insert(0, _engine_dir)
+
+from flow import kanban_delta, kanban_snapshot  # noqa: E402
+from flow.kanban_snapshot import collect_kanban_summary as _collect_kanban_summary  # noqa: E402,F401
+from flow.kanban_snapshot import parse_ticket_header as _parse_ticket_header  # noqa: E402,F401
+
 # ── 상수 ─────────────────────────────────────────────────────────────────────
 
 MAX_PAYLOAD_CHARS = 4096
 MAX_DETAIL_ITEMS = 10
-SESSIONS_TIMEOUT = 0.7   # flow-sessions subprocess timeout (초)
 SOFT_DEADLINE = 0.8      # 전체 soft deadline (초)
 
+DIFF_FLAG = "HOOK_USER_PROMPT_KANBAN_DIFF"
+FULL_EVERY_KEY = "HOOK_USER_PROMPT_KANBAN_FULL_EVERY"
+
 # 컬럼 디렉터리명 → 표시 레이블
 COLUMN_LABELS: dict[str, str] = {
     "open": "Open",
@@ -48,213 +67,33 @@ COLUMN_LABELS: dict[str, str] = {
 # ── 프로젝트 루트 탐색 ────────────────────────────────────────────────────────
 
 def _find_project_root() -> str:
-    """dispatcher.py 와 동일 로직: git-common-dir 로 메인 리포 루트 탐색."""
+    """dispatcher.py 와 동일 로직: git-common-dir 로 메인 리포 루트 탐색 (root_cache 캐시)."""
     d = os.path.dirname(os.path.abspath(__file__))
     # .claude-organic/engine/hook-handlers/ → project root = ../../..
     root = os.path.normpath(os.path.join(d, '..', '..', '..'))
 
-    # 메인 리포이면 그대로 반환 (.settings 존재 확인)
-    if os.path.exists(os.path.join(root, '.claude-organic', '.settings')):
-        return root
-
-    # 워크트리일 수 있음 — git-common-dir로 메인 리포 탐색
-    try:
-        result = subprocess.run(
-            ['git', 'rev-parse', '--path-format=absolute', '--git-common-dir'],
-            capture_output=True, text=True, timeout=5, cwd=root,
-        )
-        if result.returncode == 0:
-            git_common = result.stdout.strip()
-            main_root = os.path.dirname(git_common)
-            main_cw_dir = os.path.join(main_root, '.claude-organic')
-            if os.path.exists(os.path.join(main_cw_dir, '.settings')):
-                return main_root
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        pass
-
-    return root
+    from root_cache import main_repo_root  # noqa: PLC0415
+    return main_repo_root(root)
 
 
-# ── 칸반 요약 수집 ─────────────────────────────────────────────────────────────
+def _setting(project_root: str, key: str) -> str:
+    """환경변수 → .claude-organic/.settings 순으로 값을 읽는다 (없으면 빈 문자열)."""
+    value = os.environ.get(key, "").strip()
+    if value:
+        return value
+    from root_cache import settings_values  # noqa: PLC0415
+    values = settings_values(os.path.join(project_root, ".claude-organic", ".settings")) or {}
+    return values.get(key, "").strip().strip("'\"")
 
-def _parse_ticket_header(xml_path: str) -> dict[str, str] | None:
-    """XML 파일에서 metadata 필드만 빠르게 추출한다.
 
-    ET.iterparse를 사용하여 metadata 섹션 파싱 후 조기 중단.
-    입력/출력:
-        xml_path: T-NNN.xml 절대경로
-        return: {"number": "T-NNN", "title": "...", "status": "..."} 또는 None
-    """
+def _diff_full_every(project_root: str) -> int:
+    """변경분 주입의 전체 재주입 주기(turn)를 반환한다. 비활성이면 0."""
+    if _setting(project_root, DIFF_FLAG).lower() in ("false", "0", "no", "off"):
+        return 0
     try:
-        fields: dict[str, str] = {}
-        target_tags = {"number", "title", "status"}
-        context = ET.iterparse(xml_path, events=("end",))
-        for _event, elem in context:
-            tag = elem.tag
-            if tag in target_tags:
-                text = (elem.text or "").strip()
-                if text:
-                    fields[tag] = text
-                # 세 필드 모두 모으면 조기 중단
-                if len(fields) >= 3:
-                    break
-            # metadata 닫힘 태그 이후는 불필요 — 조기 중단
-            if tag == "metadata" and len(fields) >= 1:
-                break
-        if "number" not in fields:
-            return None
-        return fields
-    except Exception:
-        return None
-
-
-def _collect_kanban_summary(project_root: str) -> dict[str, Any]:
-    """칸반 컬럼별 티켓 요약을 수집한다.
-
-    open/progress/review 컬럼은 ID + 제목 + status 추출.
-    todo/done 컬럼은 카운트만 반환 (페이로드 부피 절감).
-
-    입력: project_root — 메인 리포 루트 경로
-    출력: {
-        "counts": {"open": N, "progress": M, "review": K, "todo": A, "done": B},
-        "details": [{"number": "T-NNN", "title": "...", "status": "...", "column": "open"}, ...]
-    }
-    """
-    tickets_dir = os.path.join(project_root, '.claude-organic', 'tickets')
-    counts: dict[str, int] = {}
-    details: list[dict[str, str]] = []
-
-    for col in ("open", "progress", "review", "todo", "done"):
-        col_dir = os.path.join(tickets_dir, col)
-        if not os.path.isdir(col_dir):
-            counts[col] = 0
-            continue
-
-        xml_files = glob.glob(os.path.join(col_dir, "T-*.xml"))
-        counts[col] = len(xml_files)
-
-        # todo/done 은 카운트만 (상세 불필요)
-        if col in ("todo", "done"):
-            continue
-
-        for xml_path in sorted(xml_files):
-            header = _parse_ticket_header(xml_path)
-            if header:
-                details.append({
-                    "number": header.get("number", ""),
-                    "title": header.get("title", ""),
-                    "status": header.get("status", ""),
-                    "column": col,
-                })
-
-    return {"counts": counts, "details": details}
-
-
-# ── 활성 세션 수집 ─────────────────────────────────────────────────────────────
-
-def _parse_sessions_json(raw: str) -> list[dict[str, str]]:
-    """flow-sessions --json 출력을 dict 리스트로 정규화한다.
-
-    flow-sessions --json 은 세션 배열 JSON 또는 빈 배열을 반환한다.
-    출력 형식: [{"ticket": "T-NNN", "command": "implement", "started_at": "HHMMSS", "status": "running"}, ...]
-    """
-    try:
-        data = json.loads(raw)
-        if not isinstance(data, list):
-            return []
-        sessions: list[dict[str, str]] = []
-        for item in data:
-            if not isinstance(item, dict):
-                continue
-            sessions.append({
-                "ticket": str(item.get("ticket_id") or item.get("ticket") or ""),
-                "command": str(item.get("command") or ""),
-                "started_at": str(item.get("started_at") or item.get("start_time") or ""),
-                "status": str(item.get("status") or "running"),
-                "registry_key": str(item.get("registry_key") or ""),
-            })
-        return sessions
-    except Exception:
-        return []
-
-
-def _fallback_sessions(project_root: str) -> list[dict[str, str]]:
-    """.claude-organic/runs/ 하위 context.json mtime stat fallback.
-
-    Board 서버 미기동 + flow-sessions 실패 시 runs/ 디렉터리 직접 스캔.
-    가장 최근 mtime 기준 상위 5개만 반환.
-    """
-    runs_dir = os.path.join(project_root, '.claude-organic', 'runs')
-    if not os.path.isdir(runs_dir):
-        return []
-
-    sessions: list[dict[str, str]] = []
-    # runs/{registryKey}/{slug}/implement/.context.json 패턴
-    pattern = os.path.join(runs_dir, '*', '*', 'implement', '.context.json')
-    ctx_files = glob.glob(pattern)
-
-    for ctx_path in ctx_files:
-        try:
-            mtime = os.path.getmtime(ctx_path)
-            with open(ctx_path, 'r', encoding='utf-8') as f:
-                ctx = json.load(f)
-            if not isinstance(ctx, dict):
-                continue
-            ticket = str(ctx.get("ticket_id") or ctx.get("ticketNumber") or "")
-            command = str(ctx.get("command") or "")
-            registry_key = str(ctx.get("registry_key") or ctx.get("registryKey") or "")
-            started_at = ""
-            if registry_key and len(registry_key) >= 15:
-                # registryKey = YYYYMMDD-HHMMSS → HHMMSS 추출
-                started_at = registry_key[9:15] if "-" in registry_key else registry_key[-6:]
-            sessions.append({
-                "ticket": ticket,
-                "command": command,
-                "started_at": started_at,
-                "status": "running",
-                "registry_key": registry_key,
-                "_mtime": mtime,  # 정렬용
-            })
-        except Exception:
-            continue
-
-    # mtime 내림차순 정렬 후 상위 5개만
-    sessions.sort(key=lambda x: float(x.get("_mtime", 0)), reverse=True)
-    for s in sessions:
-        s.pop("_mtime", None)
-
-    return sessions[:5]
-
-
-def _collect_active_sessions(project_root: str) -> list[dict[str, str]]:
-    """활성 워크플로우 세션 목록을 수집한다.
-
-    1차: flow-sessions --json subprocess 호출 (timeout=0.7s)
-    2차 fallback: .claude-organic/runs/ 직접 stat
-
-    출력: [{"ticket": "T-NNN", "command": "implement", "started_at": "HHMMSS", "status": "running"}, ...]
-    """
-    bin_dir = os.path.join(project_root, '.claude-organic', 'bin')
-    flow_sessions = os.path.join(bin_dir, 'flow-sessions')
-
-    if os.path.isfile(flow_sessions):
-        try:
-            result = subprocess.run(
-                [flow_sessions, '--json'],
-                capture_output=True,
-                text=True,
-                timeout=SESSIONS_TIMEOUT,
-                cwd=project_root,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                parsed = _parse_sessions_json(result.stdout)
-                if parsed is not None:  # 빈 리스트도 유효한 결과
-                    return parsed
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError, Exception):
-            pass
-
-    # fallback: runs/ 직접 스캔
-    return _fallback_sessions(project_root)
+        return max(1, int(_setting(project_root, FULL_EVERY_KEY)))
+    except ValueError:
+        return kanban_delta.DEFAULT_FULL_EVERY
 
 
 # ── 컨텍스트 포맷팅 ────────────────────────────────────────────────────────────
@@ -339,15 +178,59 @@ def _format_context(
     return "\n".join(lines)
 
 
+def _format_counts(counts: dict[str, int]) -> str:
+    return (
+        f"- Open: {counts.get('open', 0)}건, In Progress: {counts.get('progress', 0)}건, "
+        f"Review: {counts.get('review', 0)}건 / To Do: {counts.get('todo', 0)}건, Done: {counts.get('done', 0)}건"
+    )
+
+
+def _format_session(session: dict[str, str]) -> str:
+    started = _format_hhmm(session.get("started_at", ""))
+    time_str = f" ({started})" if started else ""
+    return f"{session.get('ticket', '')} {session.get('command', '')}{time_str}"
+
+
+def _format_delta(counts: dict[str, int], changes: dict[str, list[Any]]) -> str:
+    """직전 주입 이후 변경분을 markdown 으로 합성한다.
+
+    출력 예시:
+        ## 칸반 변경분 (직전 주입 이후, 자동 주입)
+        - Open: 1건, In Progress: 1건, Review: 7건 / To Do: 41건, Done: 358건
+        - 추가: T-416 [Open] 새 티켓
+        - 이동: T-414 In Progress → Review
+        - 제목 변경: T-415 옛 제목 → 새 제목
+        - 세션 종료: T-414 implement (13:30)
+    """
+    lines = ["## 칸반 변경분 (직전 주입 이후, 자동 주입)", _format_counts(counts)]
+    for number, col, title in changes.get("added", []):
+        label = COLUMN_LABELS.get(col, col)
+        lines.append(f"- 추가: {number} [{label}] {title}".rstrip())
+    for number, src, dst, _title in changes.get("moved", []):
+        verb = "완료" if dst == "done" else "이동"
+        lines.append(f"- {verb}: {number} {COLUMN_LABELS.get(src, src)} → {COLUMN_LABELS.get(dst, dst)}")
+    for number, old_title, new_title in changes.get("renamed", []):
+        lines.append(f"- 제목 변경: {number} {old_title} → {new_title}")
+    for number in changes.get("removed", []):
+        lines.append(f"- 삭제: {number}")
+    for session in changes.get("sessions_started", []):
+        lines.append(f"- 세션 시작: {_format_session(session)}")
+    for session in changes.get("sessions_stopped", []):
+        lines.append(f"- 세션 종료: {_format_session(session)}")
+    return "\n".join(lines)
+
+
 # ── 메인 ──────────────────────────────────────────────────────────────────────
 
-def build_context(project_root: str | None = None) -> str:
+def build_context(project_root: str | None = None, session_id: str = "") -> str:
     """칸반 + 세션 스냅샷 컨텍스트 텍스트를 빌드한다.
 
     외부에서 직접 호출 가능한 진입점 (W03 디스패처에서 import 가능).
+    session_id 가 주어지고 변경분 주입이 활성이면 직전 주입 이후의 변경분만 반환한다.
 
     Args:
         project_root: 메인 리포 루트 경로. None이면 자동 탐색.
+        session_id: UserPromptSubmit 페이로드의 session_id. 빈 값이면 항상 전체 스냅샷.
 
     Returns:
         markdown 형식의 컨텍스트 텍스트. 실패 시 빈 문자열.
@@ -355,15 +238,27 @@ def build_context(project_root: str | None = None) -> str:
     if project_root is None:
         project_root = _find_project_root()
 
-    kanban = _collect_kanban_summary(project_root)
-    sessions = _collect_active_sessions(project_root)
-    return _format_context(kanban, sessions)
+    snapshot = kanban_snapshot.load(project_root)
+    kanban = snapshot.get("kanban") or {}
+    full_text = _format_context(kanban, snapshot.get("sessions") or [])
+
+    full_every = _diff_full_every(project_root) if session_id else 0
+    if not full_every:
+        return full_text
+    mode, changes = kanban_delta.advance(
+        project_root, session_id, kanban_delta.make_view(snapshot), full_every
+    )
+    if mode == kanban_delta.MODE_UNCHANGED:
+        return "## 칸반 스냅샷: 직전 주입 이후 변경 없음"
+    if mode == kanban_delta.MODE_DELTA and changes is not None:
+        return _format_delta(kanban.get("counts") or {}, changes)
+    return full_text
 
 
 def main() -> None:
     """UserPromptSubmit hook 컨텍스트 빌더 메인 함수.
 
-    stdin: UserPromptSubmit JSON 페이로드 (내용 무시)
+    stdin: UserPromptSubmit JSON 페이로드 (session_id 만 사용)
     stdout: {"hookSpecificOutput": {"hookEventName": "UserPromptSubmit", "additionalContext": "<text>"}}
     exit code: 항상 0 (사용자 turn 차단 금지)
 
@@ -388,8 +283,13 @@ def main() -> None:
         pass
 
     try:
-        # stdin 읽기 (내용 무시 가능, 단 block 없이 빠르게)
-        _stdin_raw = sys.stdin.buffer.read()
+        # stdin 읽기 (session_id 외 내용 무시, 단 block 없이 빠르게)
+        stdin_raw = sys.stdin.buffer.read()
+        try:
+            payload = json.loads(stdin_raw) if stdin_raw else {}
+        except ValueError:
+            payload = {}
+        session_id = str(payload.get("session_id") or "") if isinstance(payload, dict) else ""
 
         if deadline_hit[0]:
             sys.exit(0)
@@ -399,7 +299,7 @@ def main() -> None:
         if deadline_hit[0]:
             sys.exit(0)
 
-        context_text = build_context(project_root)
+        context_text = build_context(project_root, session_id)
 
         if deadline_hit[0] and not context_text:
             sys.exit(0)
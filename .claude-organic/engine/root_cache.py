@@ -0,0 +1,258 @@
+"""root_cache.py - 메인 리포 루트 / .settings 해석 캐시 계층.
+
+hooks 디스패처와 flow-* 스크립트가 공통으로 사용하는 두 가지 해석을 캐시한다.
+
+1. 메인 리포 루트 (워크트리 → 메인 리포)
+   .claude-organic/.settings 가 있는 체크아웃은 그 자체가 메인 루트이므로 stat 1회로 끝난다.
+   워크트리에서는 git_state 가 ``.git`` 포인터와 ``commondir`` 을 디스크에서 직접 읽어
+   git-common-dir 을 구하고, 흔치 않은 레이아웃에서만 ``git rev-parse --git-common-dir`` 을
+   실행한다. 결과는 캐시 파일
+   (``$XDG_CACHE_HOME/claude-organic/roots.json``, 기본 ``~/.cache/...``)에 저장하고,
+   다음 호출부터는 아래 mtime 이 모두 같으면 다시 해석하지 않는다.
+       - <base>/.git            (워크트리 gitdir 포인터 파일)
+       - <git-common-dir>/worktrees (워크트리 등록/삭제 시 변경)
+       - <main>/.claude-organic/.settings
+   git-common-dir 자체의 mtime 은 index.lock 생성/삭제마다 바뀌므로 키로 쓰지 않는다.
+
+2. .settings 파싱
+   파일의 (mtime_ns, size) 가 같으면 프로세스 내에서 파싱 결과를 재사용한다.
+
+이 모듈은 leaf 모듈인 git_state 외에 engine 의 다른 모듈을 import 하지 않는다.
+
+주요 함수:
+    main_repo_root: 후보 루트 → 메인 리포 루트 (캐시)
+    git_common_dir: 후보 루트의 git-common-dir 절대 경로 (캐시)
+    settings_lines: .settings 의 strip 된 줄 목록 (mtime 캐시)
+    settings_values: .settings KEY → 원시 VALUE (첫 매칭 우선)
+    state_dir: 런타임 상태 파일 디렉터리 (``_WF_STATE_DIR`` 로 대체 가능)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+_ENGINE_DIR: str = os.path.dirname(os.path.abspath(__file__))
+if _ENGINE_DIR not in sys.path:
+    sys.path.insert(0, _ENGINE_DIR)
+
+import git_state  # noqa: E402
+
+CACHE_FILENAME: str = 'roots.json'
+
+# 캐시 파일에 유지할 최대 항목 수 (오래된 항목부터 제거)
+MAX_ENTRIES: int = 64
+
+# 런타임 상태 파일(.guard-cache.json, .kanban-snapshot.json, .kanban-locks/, logs/hook-spans 등)
+# 디렉터리를 대체하는 환경변수. 테스트가 임시 디렉터리를 가리켜 리포를 더럽히지 않게 한다.
+STATE_DIR_ENV: str = '_WF_STATE_DIR'
+
+# 프로세스 내 캐시
+_ROOT_MEMO: dict[str, str | None] = {}
+_LINES_MEMO: dict[str, tuple[tuple[int, int], tuple[str, ...]]] = {}
+_VALUES_MEMO: dict[str, tuple[tuple[int, int], dict[str, str]]] = {}
+
+
+def cache_file_path() -> str:
+    """영속 캐시 파일 경로를 반환한다.
+
+    Returns:
+        ``$XDG_CACHE_HOME/claude-organic/roots.json`` (미설정 시 ``~/.cache`` 기준).
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'claude-organic', CACHE_FILENAME)
+
+
+def state_dir(default: str) -> str:
+    """런타임 상태 파일 디렉터리를 반환한다.
+
+    Args:
+        default: 환경변수가 없을 때 쓸 디렉터리 (보통 ``<project_root>/.claude-organic``).
+
+    Returns:
+        ``_WF_STATE_DIR`` 환경변수가 설정돼 있으면 그 경로, 아니면 default.
+    """
+    return os.environ.get(STATE_DIR_ENV) or default
+
+
+def _mtime_ns(path: str) -> int:
+    """파일 mtime_ns. 없으면 -1."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _validators(base: str, common_dir: str) -> list[int]:
+    """캐시 항목 유효성 판정용 mtime 목록을 반환한다."""
+    worktrees = os.path.join(common_dir, 'worktrees')
+    registry = worktrees if os.path.isdir(worktrees) else common_dir
+    settings = os.path.join(os.path.dirname(common_dir), '.claude-organic', '.settings')
+    return [
+        _mtime_ns(os.path.join(base, '.git')),
+        _mtime_ns(registry),
+        _mtime_ns(settings),
+    ]
+
+
+def _load_cache() -> dict[str, dict]:
+    """영속 캐시를 읽는다. 없거나 손상되었으면 빈 dict."""
+    try:
+        with open(cache_file_path(), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _store_cache(base: str, common_dir: str) -> None:
+    """캐시 항목을 갱신하여 원자적으로 기록한다. 실패는 무시한다."""
+    path = cache_file_path()
+    data = _load_cache()
+    data[base] = {
+        'git_common_dir': common_dir,
+        'validators': _validators(base, common_dir),
+        'ts': time.time(),
+    }
+    if len(data) > MAX_ENTRIES:
+        newest = sorted(data.items(), key=lambda kv: kv[1].get('ts', 0) if isinstance(kv[1], dict) else 0)
+        data = dict(newest[-MAX_ENTRIES:])
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.roots-', suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def git_common_dir(base: str) -> str | None:
+    """base 디렉터리의 git-common-dir 절대 경로를 반환한다.
+
+    프로세스 내 메모 → 영속 캐시(mtime 검증) → git_state 디스크 읽기 → ``git rev-parse`` 순으로 해석한다.
+
+    Args:
+        base: git 명령을 실행할 디렉터리 (절대 경로).
+
+    Returns:
+        git-common-dir 절대 경로. git 저장소가 아니거나 git 실패 시 None.
+    """
+    if base in _ROOT_MEMO:
+        return _ROOT_MEMO[base]
+
+    entry = _load_cache().get(base)
+    if isinstance(entry, dict):
+        common_dir = entry.get('git_common_dir')
+        if isinstance(common_dir, str) and entry.get('validators') == _validators(base, common_dir):
+            _ROOT_MEMO[base] = common_dir
+            return common_dir
+
+    # GIT_DIR 이 지정된 환경은 디스크 탐색 결과와 다를 수 있으므로 git 에 맡긴다
+    common_dir = None if os.environ.get('GIT_DIR') else git_state.common_dir(base)
+    if common_dir is None:
+        try:
+            result = subprocess.run(
+                ['git', 'rev-parse', '--path-format=absolute', '--git-common-dir'],
+                capture_output=True, text=True, timeout=5, cwd=base,
+            )
+            if result.returncode == 0:
+                common_dir = result.stdout.strip() or None
+        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+            pass
+
+    if common_dir is not None:
+        _store_cache(base, common_dir)
+    _ROOT_MEMO[base] = common_dir
+    return common_dir
+
+
+def main_repo_root(base: str, require_settings: bool = True) -> str:
+    """후보 루트(base)에 대응하는 메인 리포 루트를 반환한다.
+
+    base 에 .claude-organic/.settings 가 있으면 base 가 메인 루트이다 (git 호출 없음).
+    없으면 워크트리일 수 있으므로 git-common-dir 의 부모를 메인 루트로 본다.
+
+    Args:
+        base: 후보 프로젝트 루트 (절대 경로).
+        require_settings: True 이면 메인 루트에 .settings 가 있을 때만 메인 루트를 채택한다.
+
+    Returns:
+        메인 리포 루트 절대 경로. 판정 불가 시 base.
+    """
+    if os.path.exists(os.path.join(base, '.claude-organic', '.settings')):
+        return base
+
+    common_dir = git_common_dir(base)
+    if not common_dir:
+        return base
+    main_root = os.path.dirname(common_dir)
+    if main_root == base:
+        return base
+    if require_settings and not os.path.exists(os.path.join(main_root, '.claude-organic', '.settings')):
+        return base
+    return main_root
+
+
+def _file_key(path: str) -> tuple[int, int] | None:
+    """(mtime_ns, size). 파일이 없으면 None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def settings_lines(path: str) -> tuple[str, ...] | None:
+    """.settings 파일의 strip 된 줄 목록을 반환한다 (mtime/size 캐시).
+
+    Args:
+        path: .settings 파일 경로.
+
+    Returns:
+        줄 튜플. 파일이 없거나 읽을 수 없으면 None.
+    """
+    key = _file_key(path)
+    if key is None:
+        return None
+    cached = _LINES_MEMO.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = tuple(line.strip() for line in f)
+    except (IOError, OSError):
+        return None
+    _LINES_MEMO[path] = (key, lines)
+    return lines
+
+
+def settings_values(path: str) -> dict[str, str] | None:
+    """.settings 의 KEY → 원시 VALUE 매핑을 반환한다 (첫 번째 매칭 우선, mtime 캐시).
+
+    ``KEY=`` 로 시작하는 줄만 대상으로 하며, 따옴표 제거/변수 확장은 호출자가 수행한다.
+
+    Args:
+        path: .settings 파일 경로.
+
+    Returns:
+        매핑 dict (호출자가 수정하면 안 된다). 파일이 없으면 None.
+    """
+    lines = settings_lines(path)
+    if lines is None:
+        return None
+    key = _file_key(path)
+    cached = _VALUES_MEMO.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    values: dict[str, str] = {}
+    for line in lines:
+        name, sep, value = line.partition('=')
+        if sep and name not in values:
+            values[name] = value
+    _VALUES_MEMO[path] = (key, values)
+    return values
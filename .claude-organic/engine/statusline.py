@@ -17,7 +17,6 @@ from __future__ import annotations
 import json
 import os
 import re
-import subprocess
 import sys
 from pathlib import Path
 
@@ -27,6 +26,7 @@ if _engine_dir not in sys.path:
     sys.path.insert(0, _engine_dir)
 
 from constants import STEP_COLORS, PHASE_COLORS, C_RESET  # noqa: E402
+from git_state import current_branch  # noqa: E402
 
 # -- RESET alias (기존 코드 하위 호환) --
 RESET = C_RESET
@@ -126,27 +126,20 @@ def get_context_usage(data: dict) -> tuple[float, int, int]:
 def get_git_branch(cwd: str) -> str:
     """Get current git branch name.
 
+    Reads HEAD from disk via git_state (no git subprocess per redraw).
+
     Args:
-        cwd: Current working directory for git command.
+        cwd: Current working directory inside the repository.
 
     Returns:
-        Branch name or empty string.
+        Branch name or empty string (detached HEAD included).
     """
-    try:
-        result = subprocess.run(
-            ["git", "-C", cwd, "branch", "--show-current"],
-            capture_output=True,
-            text=True,
-            timeout=2,
-        )
-        if result.returncode == 0:
-            branch = result.stdout.strip()
-            if len(branch) > 60:
-                branch = branch[:60] + "..."
-            return branch
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        pass
-    return ""
+    branch = current_branch(cwd)
+    if not branch or branch == "HEAD":
+        return ""
+    if len(branch) > 60:
+        branch = branch[:60] + "..."
+    return branch
 
 
 def get_active_workflow(cwd: str) -> dict | None:
@@ -0,0 +1,240 @@
+"""workflow_registry.py - 활성 워크플로우 레지스트리.
+
+common.scan_active_workflows() 가 호출될 때마다 .claude-organic/runs/<key>/<work>/<cmd>/ 전체를
+순회하며 status.json / .context.json 을 읽던 작업을, 활성 워크플로우만 담은 작은 파일
+하나를 읽는 것으로 대체한다. 조회 비용이 디스크의 runs 개수와 무관해진다.
+
+레지스트리 파일:
+    <project_root>/.claude-organic/.active-workflows.json (``_WF_STATE_DIR`` 이 있으면 그 아래)
+    {"version", "scanned_at", "runs_mtime",
+     "workflows": {workDir(상대): {"registry_key", "workDir", "step", "title", "command",
+                                  "updated_at", "linked_sessions"}}}
+
+갱신:
+    - state_machine.update_status / link_session, initialization.init_workflow,
+      garbage_collect(STALE 전환)가 record() 로 해당 워크플로우 항목만 갱신한다
+      (터미널 단계이면 제거). 파일 잠금 + 원자적 교체.
+    - 자가 치유: 파일이 없거나, runs/ 디렉터리 mtime 이 바뀌었거나(워크플로우 추가/삭제),
+      마지막 전체 스캔 후 RESCAN_SECONDS 가 지나면 entries() 가 전체 스캔으로 재생성한다.
+      workDir 이 사라진 항목은 조회 시 제외한다.
+
+주요 함수:
+    scan_runs: runs/ 전체 스캔 (기존 scan_active_workflows 순회 로직)
+    entries: 활성 워크플로우 항목 (필요 시 재생성)
+    record: 워크플로우 1개 항목 갱신
+    rebuild: 전체 스캔으로 레지스트리 재생성
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import root_cache
+from constants import TERMINAL_PHASES, TS_PATTERN
+
+REGISTRY_FILENAME: str = ".active-workflows.json"
+
+# 레지스트리 포맷 버전 (필드 변경 시 증가 → 재생성)
+REGISTRY_VERSION: int = 1
+
+# 마지막 전체 스캔 후 이 시간(초)이 지나면 다시 전체 스캔한다 (놓친 갱신 보정)
+RESCAN_SECONDS: int = 600
+
+
+def registry_path(project_root: str) -> str:
+    """레지스트리 파일 경로를 반환한다 (_WF_STATE_DIR 이 있으면 그 아래)."""
+    return os.path.join(root_cache.state_dir(os.path.join(project_root, ".claude-organic")), REGISTRY_FILENAME)
+
+
+def _runs_dir(project_root: str) -> str:
+    return os.path.join(project_root, ".claude-organic", "runs")
+
+
+def _runs_mtime(project_root: str) -> int:
+    try:
+        return os.stat(_runs_dir(project_root)).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _load_json(path: str) -> Any:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _entry(project_root: str, rel_work_dir: str) -> dict[str, Any]:
+    """workDir 의 status.json / .context.json 으로 레지스트리 항목을 만든다."""
+    abs_work_dir = os.path.join(project_root, rel_work_dir)
+    status = _load_json(os.path.join(abs_work_dir, "status.json"))
+    ctx = _load_json(os.path.join(abs_work_dir, ".context.json"))
+    status = status if isinstance(status, dict) else {}
+    ctx = ctx if isinstance(ctx, dict) else {}
+    sessions = status.get("linked_sessions")
+    return {
+        "registry_key": rel_work_dir.split(os.sep)[2] if rel_work_dir.count(os.sep) >= 2 else "",
+        "workDir": rel_work_dir,
+        "step": status.get("step") or status.get("phase", "NONE"),
+        "title": ctx.get("title", ""),
+        "command": ctx.get("command", ""),
+        "updated_at": status.get("updated_at", ""),
+        "linked_sessions": sessions if isinstance(sessions, list) else [],
+    }
+
+
+def scan_runs(project_root: str, include_terminal: bool = False) -> list[dict[str, Any]]:
+    """.claude-organic/runs/<YYYYMMDD-HHMMSS>/<workName>/<command>/ 를 모두 순회한다.
+
+    Args:
+        project_root: 프로젝트 루트 경로.
+        include_terminal: True이면 DONE/FAILED/STALE/CANCELLED도 포함.
+
+    Returns:
+        레지스트리 항목 목록 (registry_key, workName, command 디렉터리 이름순).
+    """
+    workflow_root = _runs_dir(project_root)
+    if not os.path.isdir(workflow_root):
+        return []
+
+    result: list[dict[str, Any]] = []
+    for entry in sorted(os.listdir(workflow_root)):
+        if not TS_PATTERN.match(entry):
+            continue
+        entry_path = os.path.join(workflow_root, entry)
+        if not os.path.isdir(entry_path):
+            continue
+        for work_name in sorted(os.listdir(entry_path)):
+            wn_path = os.path.join(entry_path, work_name)
+            if not os.path.isdir(wn_path) or work_name.startswith("."):
+                continue
+            for cmd_name in sorted(os.listdir(wn_path)):
+                if not os.path.isdir(os.path.join(wn_path, cmd_name)):
+                    continue
+                item = _entry(project_root, os.path.join(".claude-organic", "runs", entry, work_name, cmd_name))
+                if include_terminal or item["step"] not in TERMINAL_PHASES:
+                    result.append(item)
+    return result
+
+
+@contextmanager
+def _locked(project_root: str) -> Iterator[None]:
+    """레지스트리 read-modify-write 구간을 파일 잠금으로 직렬화한다."""
+    lock_path = registry_path(project_root) + ".lock"
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _write(project_root: str, registry: dict[str, Any]) -> None:
+    """레지스트리를 원자적으로 기록한다. 실패는 무시한다."""
+    path = registry_path(project_root)
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".active-workflows-", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(registry, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _load(project_root: str) -> dict[str, Any] | None:
+    registry = _load_json(registry_path(project_root))
+    if not isinstance(registry, dict) or registry.get("version") != REGISTRY_VERSION:
+        return None
+    if not isinstance(registry.get("workflows"), dict):
+        return None
+    return registry
+
+
+def _is_fresh(project_root: str, registry: dict[str, Any]) -> bool:
+    return (
+        registry.get("runs_mtime") == _runs_mtime(project_root)
+        and time.time() - float(registry.get("scanned_at") or 0) < RESCAN_SECONDS
+    )
+
+
+def rebuild(project_root: str) -> dict[str, Any]:
+    """전체 스캔으로 레지스트리를 재생성하여 기록하고 반환한다."""
+    runs_mtime = _runs_mtime(project_root)
+    registry = {
+        "version": REGISTRY_VERSION,
+        "scanned_at": time.time(),
+        "runs_mtime": runs_mtime,
+        "workflows": {item["workDir"]: item for item in scan_runs(project_root)},
+    }
+    if os.path.isdir(os.path.join(project_root, ".claude-organic")):
+        _write(project_root, registry)
+    return registry
+
+
+def entries(project_root: str) -> list[dict[str, Any]]:
+    """활성(비터미널) 워크플로우 항목 목록을 반환한다.
+
+    레지스트리가 없거나 runs/ 디렉터리가 바뀌었거나 RESCAN_SECONDS 가 지났으면 재생성한다.
+
+    Args:
+        project_root: 프로젝트 루트 경로.
+
+    Returns:
+        레지스트리 항목 목록 (workDir 이름순). workDir 이 사라진 항목은 제외한다.
+    """
+    registry = _load(project_root)
+    if registry is None or not _is_fresh(project_root, registry):
+        registry = rebuild(project_root)
+    return [
+        item
+        for _, item in sorted(registry["workflows"].items())
+        if os.path.isdir(os.path.join(project_root, item.get("workDir", "")))
+    ]
+
+
+def _project_root_of(abs_work_dir: str) -> str | None:
+    """<root>/.claude-organic/runs/<key>/<work>/<cmd> 에서 <root> 를 얻는다. 형식이 다르면 None."""
+    runs_dir = os.path.dirname(os.path.dirname(os.path.dirname(abs_work_dir)))
+    organic_dir = os.path.dirname(runs_dir)
+    if os.path.basename(runs_dir) != "runs" or os.path.basename(organic_dir) != ".claude-organic":
+        return None
+    if not TS_PATTERN.match(os.path.basename(os.path.dirname(os.path.dirname(abs_work_dir)))):
+        return None
+    return os.path.dirname(organic_dir)
+
+
+def record(abs_work_dir: str) -> None:
+    """워크플로우 1개의 항목을 status.json / .context.json 기준으로 갱신한다.
+
+    터미널 단계이거나 workDir 이 없으면 항목을 제거한다. runs/ 구조 밖의 경로는 무시하고,
+    실패는 호출자(상태 전이)를 막지 않도록 조용히 무시한다.
+
+    Args:
+        abs_work_dir: 워크플로우 디렉터리 절대 경로 (<root>/.claude-organic/runs/<key>/<work>/<cmd>).
+    """
+    abs_work_dir = os.path.normpath(os.path.abspath(abs_work_dir))
+    project_root = _project_root_of(abs_work_dir)
+    if project_root is None:
+        return
+    rel_work_dir = os.path.relpath(abs_work_dir, project_root)
+    try:
+        with _locked(project_root):
+            registry = _load(project_root)
+            if registry is None:
+                rebuild(project_root)
+                return
+            item = _entry(project_root, rel_work_dir)
+            if item["step"] in TERMINAL_PHASES or not os.path.isdir(abs_work_dir):
+                registry["workflows"].pop(rel_work_dir, None)
+            else:
+                registry["workflows"][rel_work_dir] = item
+            _write(project_root, registry)
+    except OSError:
+        pass
@@ -2,19 +2,56 @@
 
 Provides shared functions for loading .claude-organic/.settings
 flags and dispatching hook scripts based on HOOK_* environment variable toggles.
+Guard scripts exposing the evaluate() plugin API (engine/guards/guard_api.py)
+are evaluated in-process by evaluate_guard(); evaluate_guards() runs a guard
+table concurrently and cancels lower-priority guards on the first deny.
+dispatch()/dispatch_async()/run_inline() and guard evaluation record timing spans
+(engine/flow/hook_spans.py) that hook_span() flushes to a per-day spool file.
+capture_payload() appends anonymized stdin payloads to the replay corpus
+(engine/bench/payload_corpus.py) when HOOK_PAYLOAD_CORPUS is enabled.
 
 현재 등록된 디스패처:
   pre-tool-use.py    - PreToolUse 이벤트
   post-tool-use.py   - PostToolUse 이벤트
   subagent-stop.py   - SubagentStop 이벤트
+
+세 디스패처는 HOOK_DAEMON=true 이면 hook_client.py 를 통해 상주 데몬(hook_daemon.py)에
+처리를 위임한다. 프로젝트 루트와 .settings 파싱 결과는 engine/root_cache.py가 캐시한다.
 """
 
 from __future__ import annotations
 
+import importlib
 import os
 import subprocess
 import sys
-from typing import Callable
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+if TYPE_CHECKING:
+    from guards.guard_api import Decision
+
+_ENGINE_DIR: str = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'engine')
+)
+if _ENGINE_DIR not in sys.path:
+    sys.path.insert(0, _ENGINE_DIR)
+
+from flow import hook_spans  # noqa: E402
+from root_cache import main_repo_root, settings_lines  # noqa: E402
+
+# import 완료된 가드 모듈 캐시 (script_path -> module, 로드 실패 시 None)
+_GUARD_MODULES: dict[str, ModuleType | None] = {}
+
+# 프로세스 내 캐시: 해석된 프로젝트 루트 (워크트리 → 메인 해석은 engine/root_cache.py가 영속 캐시)
+_PROJECT_ROOT: str | None = None
+
+# evaluate_guards()가 시작한 가드 스레드 (조기 deny 후에도 실행 중일 수 있음)
+_PENDING_GUARD_THREADS: list[threading.Thread] = []
 
 
 def _find_project_root() -> str:
@@ -24,35 +61,25 @@ def _find_project_root() -> str:
     .claude-organic/.settings는 메인 리포에만 존재하므로,
     git-common-dir로 메인 리포를 탐색한다.
 
+    결과는 프로세스 내에서 캐시된다 (스크립트 위치로만 결정되므로 불변).
+
     Returns:
         Absolute path to the project root directory.
     """
+    global _PROJECT_ROOT
+    if _PROJECT_ROOT is None:
+        _PROJECT_ROOT = _resolve_project_root()
+    return _PROJECT_ROOT
+
+
+def _resolve_project_root() -> str:
+    """_find_project_root()의 실제 탐색 로직 (root_cache 영속 캐시 경유)."""
     d = os.path.dirname(os.path.abspath(__file__))
     # .claude-organic/hooks/dispatcher.py -> project root is ../..
     root = os.path.normpath(os.path.join(d, '..', '..'))
 
-    # 메인 리포이면 그대로 반환 (.settings 존재 확인)
-    cw_dir = os.path.join(root, '.claude-organic')
-    if os.path.exists(os.path.join(cw_dir, '.settings')):
-        return root
-
-    # 워크트리일 수 있음 — git-common-dir로 메인 리포 탐색
-    try:
-        result = subprocess.run(
-            ['git', 'rev-parse', '--path-format=absolute', '--git-common-dir'],
-            capture_output=True, text=True, timeout=5, cwd=root,
-        )
-        if result.returncode == 0:
-            git_common = result.stdout.strip()
-            # git-common-dir은 메인 리포의 .git 디렉터리를 가리킴
-            main_root = os.path.dirname(git_common)
-            main_cw_dir = os.path.join(main_root, '.claude-organic')
-            if os.path.exists(os.path.join(main_cw_dir, '.settings')):
-                return main_root
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        pass
-
-    return root
+    # 메인 리포이면 그대로, 워크트리면 git-common-dir로 메인 리포 탐색 (캐시)
+    return main_repo_root(root)
 
 
 def _env_path() -> str:
@@ -67,6 +94,8 @@ def _env_path() -> str:
 def load_env_flags(prefix: str = 'HOOK_') -> dict[str, bool]:
     """Parse .claude-organic/.settings and return HOOK_* flags as a dict.
 
+    .settings 줄 목록은 engine/root_cache.py가 mtime 기준으로 캐시한다.
+
     Args:
         prefix: Variable name prefix to filter (default: 'HOOK_').
 
@@ -75,29 +104,27 @@ def load_env_flags(prefix: str = 'HOOK_') -> dict[str, bool]:
         e.g. {'HOOK_DANGEROUS_COMMAND': False, 'HOOK_SLACK_ASK': True}
     """
     flags: dict[str, bool] = {}
-    env_file = _env_path()
-    if not os.path.exists(env_file):
+    lines = settings_lines(_env_path())
+    if lines is None:
         return flags
 
-    with open(env_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            if '=' not in line:
-                continue
-            key, _, value = line.partition('=')
-            key = key.strip()
-            value = value.strip()
-            if not key.startswith(prefix):
-                continue
-            # Support both true/false strings and legacy 0/1, plus yes/no, on/off
-            if value.lower() in ('true', '1', 'yes', 'on'):
-                flags[key] = True
-            elif value.lower() in ('false', '0', 'no', 'off'):
-                flags[key] = False
-            else:
-                flags[key] = bool(value)
+    for line in lines:
+        if not line or line.startswith('#'):
+            continue
+        if '=' not in line:
+            continue
+        key, _, value = line.partition('=')
+        key = key.strip()
+        value = value.strip()
+        if not key.startswith(prefix):
+            continue
+        # Support both true/false strings and legacy 0/1, plus yes/no, on/off
+        if value.lower() in ('true', '1', 'yes', 'on'):
+            flags[key] = True
+        elif value.lower() in ('false', '0', 'no', 'off'):
+            flags[key] = False
+        else:
+            flags[key] = bool(value)
     return flags
 
 
@@ -145,12 +172,538 @@ def dispatch(
     if not os.path.exists(script_path):
         return None
 
-    result = subprocess.run(
+    pipe = subprocess.PIPE if capture_output else None
+    started = time.perf_counter()
+    with subprocess.Popen(
         [sys.executable, script_path],
-        input=stdin_data,
-        capture_output=capture_output,
+        stdin=subprocess.PIPE,
+        stdout=pipe,
+        stderr=pipe,
+    ) as proc:
+        spawned = time.perf_counter()
+        try:
+            stdout, stderr = proc.communicate(stdin_data)
+        except BaseException:
+            proc.kill()
+            raise
+    finished = time.perf_counter()
+    hook_spans.record(
+        'dispatch',
+        _script_name(script_path),
+        (finished - started) * 1000.0,
+        spawn_ms=(spawned - started) * 1000.0,
+        run_ms=(finished - spawned) * 1000.0,
+        outcome=str(proc.returncode),
+    )
+    return subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+
+
+def _script_name(script_path: str) -> str:
+    """스크립트 경로에서 span 이름(확장자 제외 파일명)을 만든다."""
+    return os.path.splitext(os.path.basename(script_path))[0]
+
+
+def _spans_enabled(flags: dict[str, bool]) -> bool:
+    """훅 지연 span 을 스풀(engine/flow/hook_spans.py)에 기록할지 여부를 반환한다.
+
+    HOOK_SPANS 환경변수가 있으면 우선 적용하고, 없으면 .settings 플래그를 따른다.
+    기본값은 활성.
+
+    Args:
+        flags: Dict from load_env_flags().
+
+    Returns:
+        True if timing spans should be spooled.
+    """
+    env_val = os.environ.get('HOOK_SPANS', '').strip().lower()
+    if env_val:
+        return env_val not in ('false', '0', 'no', 'off')
+    return is_enabled(flags, 'HOOK_SPANS')
+
+
+def capture_payload(hook_name: str, payload: dict[str, Any], flags: dict[str, bool] | None = None) -> None:
+    """HOOK_PAYLOAD_CORPUS 활성 시 stdin 페이로드를 익명화하여 재생 코퍼스에 추가한다.
+
+    engine/bench/hook_replay.py 가 이 코퍼스를 재생한다. 기본값은 비활성이며
+    (다른 HOOK_* 플래그와 달리 명시적으로 켜야 한다) 환경변수가 .settings 보다 우선한다.
+    실패는 훅 동작에 영향을 주지 않도록 조용히 무시한다.
+
+    Args:
+        hook_name: 훅 이름 (예: 'pre-tool-use').
+        payload: Parsed stdin JSON dict.
+        flags: Pre-loaded flags dict (loads from env if None).
+    """
+    env_val = os.environ.get('HOOK_PAYLOAD_CORPUS', '').strip().lower()
+    if env_val:
+        enabled = env_val not in ('false', '0', 'no', 'off')
+    else:
+        enabled = (load_env_flags() if flags is None else flags).get('HOOK_PAYLOAD_CORPUS', False)
+    if not enabled:
+        return
+    try:
+        from bench.payload_corpus import append_record  # noqa: PLC0415
+        from guards.payload_scan import full_payload  # noqa: PLC0415
+        append_record(_find_project_root(), hook_name, full_payload(payload))
+    except Exception:  # noqa: BLE001
+        pass
+
+
+@contextmanager
+def hook_span(hook_name: str) -> Iterator[None]:
+    """디스패처 main() 1회를 감싸 전체 시간을 span 으로 남기고 스풀에 기록한다.
+
+    블록 안에서 기록된 dispatch/가드 span 도 함께 한 번의 append 로 기록된다.
+    SystemExit 는 그대로 전파하며 exit code 를 outcome 으로 남긴다.
+
+    Args:
+        hook_name: 훅 이름 (예: 'pre-tool-use').
+    """
+    if not _spans_enabled(load_env_flags()):
+        yield
+        return
+    hook_spans.begin(hook_name)
+    started = time.perf_counter()
+    outcome = '0'
+    try:
+        yield
+    except SystemExit as exc:
+        code = exc.code
+        outcome = str(code if isinstance(code, int) else (0 if code is None else 1))
+        raise
+    except BaseException:
+        outcome = 'error'
+        raise
+    finally:
+        hook_spans.record('hook', hook_name, (time.perf_counter() - started) * 1000.0, outcome=outcome)
+        hook_spans.flush(_find_project_root())
+
+
+def _inprocess_guards_enabled(flags: dict[str, bool]) -> bool:
+    """가드를 단일 프로세스(in-process)로 실행할지 여부를 반환한다.
+
+    HOOK_GUARD_INPROCESS 환경변수가 있으면 우선 적용하고(벤치마크/비교용),
+    없으면 .settings 플래그를 따른다. 기본값은 활성.
+
+    Args:
+        flags: Dict from load_env_flags().
+
+    Returns:
+        True if guards should be evaluated in-process.
+    """
+    env_val = os.environ.get('HOOK_GUARD_INPROCESS', '').strip().lower()
+    if env_val:
+        return env_val not in ('false', '0', 'no', 'off')
+    return is_enabled(flags, 'HOOK_GUARD_INPROCESS')
+
+
+def _load_guard_module(script_path: str) -> ModuleType | None:
+    """가드 스크립트 경로에 해당하는 모듈을 import하여 반환한다.
+
+    <engine>/guards/<name>.py 는 <engine>을 sys.path에 두고 ``guards.<name>`` 으로 import한다.
+    evaluate()를 노출하지 않거나 import에 실패하면 None을 반환하여
+    호출자가 subprocess 경로로 폴백하도록 한다. 결과는 프로세스 내에서 캐시된다.
+
+    Args:
+        script_path: Absolute path to the guard script.
+
+    Returns:
+        가드 모듈 또는 None.
+    """
+    if script_path in _GUARD_MODULES:
+        return _GUARD_MODULES[script_path]
+
+    module: ModuleType | None = None
+    guards_dir = os.path.dirname(os.path.abspath(script_path))
+    if os.path.basename(guards_dir) == 'guards':
+        engine_dir = os.path.dirname(guards_dir)
+        if engine_dir not in sys.path:
+            sys.path.insert(0, engine_dir)
+        name = os.path.splitext(os.path.basename(script_path))[0]
+        try:
+            module = importlib.import_module(f'guards.{name}')
+        except Exception as exc:  # noqa: BLE001
+            sys.stderr.write(f"[WARN] guard import failed ({name}): {exc}\n")
+            module = None
+        if module is not None and not callable(getattr(module, 'evaluate', None)):
+            module = None
+
+    _GUARD_MODULES[script_path] = module
+    return module
+
+
+def evaluate_guard(
+    hook_flag_name: str,
+    script_path: str,
+    payload: dict[str, Any],
+    stdin_data: bytes,
+    flags: dict[str, bool] | None = None,
+) -> Decision | None:
+    """Evaluate a guard and return its Decision if the hook is enabled.
+
+    가드 모듈을 import하여 evaluate(payload)를 같은 프로세스에서 호출한다.
+    가드 자체 토글(HOOK_FLAG/FLAG_REQUIRED)도 스크립트 실행 시와 동일하게 적용한다.
+    HOOK_GUARD_INPROCESS=false 이거나 모듈 로드에 실패하면 기존처럼
+    subprocess로 실행하고 stdout JSON을 Decision으로 복원한다.
+
+    Args:
+        hook_flag_name: HOOK_* flag name controlling this hook.
+        script_path: Absolute path to the guard script.
+        payload: Parsed stdin JSON dict.
+        stdin_data: Raw stdin bytes (used by the subprocess fallback).
+        flags: Pre-loaded flags dict (loads from env if None).
+
+    Returns:
+        guards.guard_api.Decision, or None if disabled/missing/no opinion.
+    """
+    if flags is None:
+        flags = load_env_flags()
+
+    if not is_enabled(flags, hook_flag_name):
+        return None
+
+    if not os.path.exists(script_path):
+        return None
+
+    if _ENGINE_DIR not in sys.path:
+        sys.path.insert(0, _ENGINE_DIR)
+
+    hook_spans.set_tool(payload.get('tool_name', ''))
+    started = time.perf_counter()
+    module = _load_guard_module(script_path) if _inprocess_guards_enabled(flags) else None
+    if module is None:
+        r = dispatch(hook_flag_name, script_path, stdin_data, flags=flags, capture_output=True)
+        if r is None:
+            return None
+        from guards.guard_api import decision_from_output  # noqa: PLC0415
+        decision = decision_from_output(r.stdout)
+        _record_guard_span(script_path, started, decision)
+        return decision
+
+    from guards.guard_api import flag_disabled  # noqa: PLC0415
+    guard_flag = getattr(module, 'HOOK_FLAG', hook_flag_name)
+    if flag_disabled(guard_flag, getattr(module, 'FLAG_REQUIRED', False)):
+        return None
+
+    try:
+        decision = module.evaluate(_guard_payload(module, payload))
+    except Exception as exc:  # noqa: BLE001
+        # 스크립트 실행 시 비정상 종료(빈 stdout)와 동일하게 통과 처리
+        sys.stderr.write(f"[WARN] guard evaluate failed ({os.path.basename(script_path)}): {exc}\n")
+        _record_guard_span(script_path, started, None, 'error')
+        return None
+    _record_guard_span(script_path, started, decision)
+    return decision
+
+
+def _guard_payload(module: ModuleType, payload: dict[str, Any]) -> dict[str, Any]:
+    """가드에 넘길 페이로드를 반환한다.
+
+    대용량 Write/Edit 페이로드는 본문을 뺀 PartialPayload(guards/payload_scan.py)로 파싱되며,
+    NEEDS_CONTENT = True 를 선언한 가드에만 전체 페이로드를 디코드하여 넘긴다.
+    """
+    if getattr(module, 'NEEDS_CONTENT', False):
+        from guards.payload_scan import full_payload  # noqa: PLC0415
+        return full_payload(payload)
+    return payload
+
+
+def _record_guard_span(
+    script_path: str,
+    started: float,
+    decision: Decision | None,
+    outcome: str | None = None,
+) -> None:
+    """evaluate_guard() 1회의 guard span 을 기록한다 (판정을 냈으면 decided)."""
+    hook_spans.record(
+        'guard',
+        _script_name(script_path),
+        (time.perf_counter() - started) * 1000.0,
+        outcome=outcome or (decision.permission if decision is not None else 'pass'),
+        decided=decision is not None,
     )
-    return result
+
+
+def _parallel_guards_enabled(flags: dict[str, bool]) -> bool:
+    """evaluate_guards()가 가드를 동시에 실행할지 여부를 반환한다.
+
+    HOOK_GUARD_PARALLEL 환경변수가 있으면 우선 적용하고, 없으면 .settings 플래그를 따른다.
+    기본값은 활성.
+
+    Args:
+        flags: Dict from load_env_flags().
+
+    Returns:
+        True if guards should run concurrently.
+    """
+    env_val = os.environ.get('HOOK_GUARD_PARALLEL', '').strip().lower()
+    if env_val:
+        return env_val not in ('false', '0', 'no', 'off')
+    return is_enabled(flags, 'HOOK_GUARD_PARALLEL')
+
+
+def _decision_cache_enabled(flags: dict[str, bool]) -> bool:
+    """evaluate_guards()가 가드 판정 캐시(engine/guards/decision_cache.py)를 쓸지 여부를 반환한다.
+
+    HOOK_GUARD_CACHE 환경변수가 있으면 우선 적용하고, 없으면 .settings 플래그를 따른다.
+    기본값은 활성. in-process 경로에서만 적용된다.
+
+    Args:
+        flags: Dict from load_env_flags().
+
+    Returns:
+        True if cached guard decisions may be reused.
+    """
+    env_val = os.environ.get('HOOK_GUARD_CACHE', '').strip().lower()
+    if env_val:
+        return env_val not in ('false', '0', 'no', 'off')
+    return is_enabled(flags, 'HOOK_GUARD_CACHE')
+
+
+@dataclass
+class GuardTiming:
+    """가드 1개의 실행 결과 요약.
+
+    Attributes:
+        guard: 가드 스크립트 이름 (확장자 제외).
+        ms: wall time (밀리초). 취소된 가드는 취소 시점까지의 경과 시간.
+        outcome: 'deny' | 'allow' | 'pass' | 'error' | 'cancelled'.
+        cached: 판정 캐시에서 재사용되어 가드를 실행하지 않았으면 True.
+    """
+
+    guard: str
+    ms: float
+    outcome: str
+    cached: bool = False
+
+
+@dataclass
+class _GuardRun:
+    """evaluate_guards() 내부 실행 단위 (in-process 모듈 또는 subprocess)."""
+
+    script_path: str
+    module: ModuleType | None
+    decision: Decision | None = None
+    outcome: str = 'pass'
+    started: float = 0.0
+    elapsed_ms: float = 0.0
+    spawn_ms: float | None = None
+    cancelled: bool = False
+    cacheable: bool = False
+    cached: bool = False
+    proc: subprocess.Popen | None = None
+    followers: list[_GuardRun] = field(default_factory=list)
+    done: threading.Event = field(default_factory=threading.Event)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @property
+    def name(self) -> str:
+        return os.path.splitext(os.path.basename(self.script_path))[0]
+
+    def use_cached(self, decision: Decision | None) -> None:
+        """판정 캐시의 결과로 실행을 대신한다."""
+        self.decision = decision
+        self.outcome = decision.permission if decision is not None else 'pass'
+        self.cached = True
+        self.done.set()
+
+    def run(self, payload: dict[str, Any], stdin_data: bytes) -> None:
+        """가드를 실행하여 decision/outcome/elapsed_ms를 채운다.
+
+        이미 취소된 가드는 실행하지 않는다. deny 이면 후순위 가드(followers)를 바로 취소한다.
+        """
+        from guards.guard_api import decision_from_output  # noqa: PLC0415
+
+        self.started = time.perf_counter()
+        try:
+            if self.module is not None:
+                if self.cancelled:
+                    return
+                self.decision = self.module.evaluate(_guard_payload(self.module, payload))
+            else:
+                with self.lock:
+                    if self.cancelled:
+                        return
+                    self.proc = subprocess.Popen(
+                        [sys.executable, self.script_path],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                    )
+                    self.spawn_ms = (time.perf_counter() - self.started) * 1000.0
+                out, _ = self.proc.communicate(stdin_data)
+                if not self.cancelled:
+                    self.decision = decision_from_output(out)
+            if self.decision is not None:
+                self.outcome = self.decision.permission
+        except Exception as exc:  # noqa: BLE001
+            # 스크립트 실행 시 비정상 종료(빈 stdout)와 동일하게 통과 처리
+            self.decision = None
+            self.outcome = 'error'
+            sys.stderr.write(f"[WARN] guard evaluate failed ({self.name}): {exc}\n")
+        finally:
+            self.elapsed_ms = (time.perf_counter() - self.started) * 1000.0
+            if self.decision is not None and self.decision.is_deny and not self.cancelled:
+                for rest in self.followers:
+                    rest.cancel()
+            self.done.set()
+
+    def cancel(self) -> None:
+        """결과를 무시하도록 표시하고, 실행 중인 subprocess가 있으면 종료한다.
+
+        in-process 가드는 evaluate() 를 아직 시작하지 않았을 때만 건너뛴다. 이미 실행 중인
+        evaluate() 는 중단할 수 없으므로 끝까지 실행되고(부수 효과 포함) 결과만 버려진다.
+        """
+        with self.lock:
+            self.cancelled = True
+            if self.proc is not None and self.proc.poll() is None:
+                try:
+                    self.proc.kill()
+                except OSError:
+                    pass
+
+    def timing(self) -> GuardTiming:
+        """현재 상태를 GuardTiming으로 변환한다."""
+        if self.cancelled and not self.done.is_set():
+            elapsed = (time.perf_counter() - self.started) * 1000.0 if self.started else 0.0
+            return GuardTiming(self.name, elapsed, 'cancelled')
+        if self.cancelled:
+            return GuardTiming(self.name, self.elapsed_ms, 'cancelled')
+        return GuardTiming(self.name, self.elapsed_ms, self.outcome, self.cached)
+
+    def record_span(self, timing: GuardTiming, decided: bool) -> None:
+        """timing() 결과를 guard span 으로 기록한다 (subprocess 면 spawn/run 분리)."""
+        spawn_ms = self.spawn_ms if timing.outcome != 'cancelled' else None
+        hook_spans.record(
+            'guard',
+            timing.guard,
+            timing.ms,
+            spawn_ms=spawn_ms,
+            run_ms=None if spawn_ms is None else max(0.0, timing.ms - spawn_ms),
+            outcome=timing.outcome,
+            decided=decided,
+            cached=timing.cached,
+        )
+
+
+def evaluate_guards(
+    guards: list[tuple[str, str]],
+    payload: dict[str, Any],
+    stdin_data: bytes,
+    flags: dict[str, bool] | None = None,
+) -> tuple[Decision | None, list[GuardTiming]]:
+    """가드 테이블을 동시에 실행하고 우선순위 순서의 첫 deny를 반환한다.
+
+    활성 가드를 모두 한 번에 시작한 뒤(in-process는 스레드, subprocess 폴백은 프로세스)
+    선언 순서대로 결과를 수집한다. deny가 나오면 후순위 가드를 취소하고 즉시 반환하므로,
+    최종 판정은 직렬 실행과 동일하게 "테이블 순서상 첫 deny"로 결정적이다.
+    취소는 subprocess 가드를 kill 하고, 아직 evaluate() 를 시작하지 않은 in-process 가드를
+    건너뛴다. 이미 실행 중인 in-process 가드는 끝까지 실행되며 결과만 버려진다.
+    HOOK_GUARD_PARALLEL=false 이면 직렬로 실행한다.
+
+    in-process 경로에서는 가드 판정 캐시(engine/guards/decision_cache.py)를 먼저 조회하여
+    캐시 가능한 가드의 저장된 판정을 재사용하고, 새로 실행한 판정은 반환 전에 저장한다.
+    HOOK_GUARD_CACHE=false 이면 캐시를 쓰지 않는다.
+
+    Args:
+        guards: (HOOK_* 플래그 이름, 가드 스크립트 절대 경로) 목록 (우선순위 순).
+        payload: Parsed stdin JSON dict.
+        stdin_data: Raw stdin bytes (used by the subprocess fallback).
+        flags: Pre-loaded flags dict (loads from env if None).
+
+    Returns:
+        (첫 deny Decision 또는 None, 실행된 가드별 GuardTiming 목록).
+    """
+    if flags is None:
+        flags = load_env_flags()
+
+    if _ENGINE_DIR not in sys.path:
+        sys.path.insert(0, _ENGINE_DIR)
+    from guards.guard_api import flag_disabled  # noqa: PLC0415
+
+    inprocess = _inprocess_guards_enabled(flags)
+    runs: list[_GuardRun] = []
+    for hook_flag_name, script_path in guards:
+        if not is_enabled(flags, hook_flag_name) or not os.path.exists(script_path):
+            continue
+        module = _load_guard_module(script_path) if inprocess else None
+        if module is not None:
+            guard_flag = getattr(module, 'HOOK_FLAG', hook_flag_name)
+            if flag_disabled(guard_flag, getattr(module, 'FLAG_REQUIRED', False)):
+                continue
+        runs.append(_GuardRun(script_path, module))
+
+    if inprocess and runs and payload.get('tool_name') == 'Bash':
+        # 공용 Bash 분석을 가드 시작 전에 1회 수행 (가드들은 캐시된 결과를 공유)
+        from guards.bash_analysis import analyze_payload  # noqa: PLC0415
+        analyze_payload(payload)
+
+    cache = None
+    cache_key = ''
+    if inprocess and runs and _decision_cache_enabled(flags):
+        from guards.decision_cache import get_cache, is_cacheable  # noqa: PLC0415
+        cache = get_cache(_find_project_root())
+        cache_key = cache.key(payload)
+        cached = cache.lookup(cache_key)
+        for r in runs:
+            if r.module is None:
+                continue
+            r.cacheable = is_cacheable(r.module, payload)
+            if r.cacheable and r.name in cached:
+                r.use_cached(cached[r.name])
+
+    pending = [r for r in runs if not r.cached]
+    parallel = len(pending) > 1 and _parallel_guards_enabled(flags)
+    if parallel:
+        # deny 가 나오면 그 가드 스레드가 후순위 가드를 바로 취소한다 (아직 시작 전이면 건너뜀)
+        for idx, r in enumerate(runs):
+            r.followers = runs[idx + 1:]
+        for r in pending:
+            t = threading.Thread(target=r.run, args=(payload, stdin_data), daemon=True)
+            t.start()
+            _PENDING_GUARD_THREADS.append(t)
+
+    decision: Decision | None = None
+    timings: list[GuardTiming] = []
+    for idx, r in enumerate(runs):
+        if not parallel and not r.cached:
+            r.run(payload, stdin_data)
+        r.done.wait()
+        timings.append(r.timing())
+        if r.decision is not None and r.decision.is_deny:
+            decision = r.decision
+            if parallel:
+                for rest in runs[idx + 1:]:
+                    rest.cancel()
+                    timings.append(rest.timing())
+            break
+
+    if cache is not None:
+        fresh = {
+            r.name: r.decision
+            for r in runs
+            if r.cacheable and not r.cached and not r.cancelled
+            and r.done.is_set() and r.outcome != 'error'
+        }
+        cache.store(cache_key, fresh)
+
+    hook_spans.set_tool(payload.get('tool_name', ''))
+    for r, t in zip(runs, timings):
+        r.record_span(t, decided=decision is not None and r.decision is decision)
+    return decision, timings
+
+
+def wait_pending_guards(timeout: float = 5.0) -> None:
+    """조기 deny 이후에도 실행 중인 가드 스레드의 종료를 기다린다.
+
+    단발 프로세스에서는 daemon 스레드라 호출할 필요가 없다. 상주 데몬(hook_daemon.py)은
+    다음 요청에서 os.environ을 교체하기 전에 이 함수로 이전 요청의 가드를 정리한다.
+
+    Args:
+        timeout: 전체 대기 한도 (초).
+    """
+    deadline = time.monotonic() + timeout
+    while _PENDING_GUARD_THREADS:
+        t = _PENDING_GUARD_THREADS.pop()
+        t.join(max(0.0, deadline - time.monotonic()))
 
 
 def _find_workflow_log(log_dir: str | None = None) -> str | None:
@@ -225,6 +778,7 @@ def dispatch_async(
     else:
         stderr_target = subprocess.DEVNULL
 
+    started = time.perf_counter()
     try:
         proc = subprocess.Popen(
             [sys.executable, script_path],
@@ -235,12 +789,22 @@ def dispatch_async(
     finally:
         if stderr_target is not subprocess.DEVNULL:
             stderr_target.close()
+    spawned = time.perf_counter()
 
     try:
         proc.stdin.write(stdin_data)
         proc.stdin.close()
     except BrokenPipeError:
         sys.stderr.write(f"[WARN] dispatch_async: BrokenPipeError for {script_path}\n")
+    # fire-and-forget 이므로 run 은 stdin 전달까지의 시간이다
+    finished = time.perf_counter()
+    hook_spans.record(
+        'dispatch_async',
+        _script_name(script_path),
+        (finished - started) * 1000.0,
+        spawn_ms=(spawned - started) * 1000.0,
+        run_ms=(finished - spawned) * 1000.0,
+    )
     return proc
 
 
@@ -267,7 +831,19 @@ def run_inline(
     if not is_enabled(flags, hook_flag_name):
         return 0
 
-    return main_func(stdin_data)
+    started = time.perf_counter()
+    outcome = 'error'
+    try:
+        code = main_func(stdin_data)
+        outcome = str(code)
+        return code
+    finally:
+        hook_spans.record(
+            'inline',
+            getattr(main_func, '__name__', hook_flag_name),
+            (time.perf_counter() - started) * 1000.0,
+            outcome=outcome,
+        )
 
 
 def scripts_dir(*parts: str) -> str:
@@ -0,0 +1,202 @@
+"""Thin client for the resident hook daemon (hook_daemon.py).
+
+HOOK_DAEMON=true 일 때 pre-tool-use / post-tool-use / subagent-stop 디스패처가
+가장 먼저 호출한다. stdin 을 Unix 소켓(.claude-organic/.hook-daemon.sock)으로
+데몬에 전달하고 응답(stdout/stderr/exit code)을 그대로 중계한 뒤 종료한다.
+
+데몬이 없거나 응답하지 못하면 아무것도 출력하지 않고 반환하며, 호출자는
+기존 경로(디스패처 main())로 계속 진행한다. 이때 읽어 둔 stdin 은 sys.stdin 에
+되돌려 두므로 main() 은 변경 없이 동일한 입력을 읽는다.
+
+cold start 비용을 늘리지 않도록 표준 라이브러리 최소 모듈만 import 한다.
+
+주요 함수:
+    daemon_enabled: HOOK_DAEMON 토글 판정 (os.environ > .settings)
+    socket_path: 데몬 소켓 경로
+    relay_to_daemon: 디스패처 진입점 (응답 시 sys.exit)
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import socket
+import sys
+
+_CW_DIR: str = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+SOCKET_NAME: str = '.hook-daemon.sock'
+PID_NAME: str = '.hook-daemon.pid'
+
+# AF_UNIX sun_path 한계(108바이트)보다 여유 있게 제한
+MAX_SOCKET_PATH: int = 100
+
+CONNECT_TIMEOUT: float = 0.5
+RESPONSE_TIMEOUT: float = 30.0
+
+
+def socket_path() -> str:
+    """데몬 Unix 소켓 경로를 반환한다.
+
+    Returns:
+        .claude-organic/.hook-daemon.sock 절대 경로.
+    """
+    return os.path.join(_CW_DIR, SOCKET_NAME)
+
+
+def pid_path() -> str:
+    """데몬 pid/lock 파일 경로를 반환한다.
+
+    Returns:
+        .claude-organic/.hook-daemon.pid 절대 경로.
+    """
+    return os.path.join(_CW_DIR, PID_NAME)
+
+
+def daemon_enabled() -> bool:
+    """HOOK_DAEMON 토글을 판정한다. 기본값은 비활성(opt-in).
+
+    HOOK_DAEMON 환경변수가 있으면 우선 적용하고, 없으면 .claude-organic/.settings 를 읽는다.
+
+    Returns:
+        데몬 경유가 활성이면 True.
+    """
+    value = os.environ.get('HOOK_DAEMON', '').strip()
+    if not value:
+        try:
+            with open(os.path.join(_CW_DIR, '.settings'), 'r', encoding='utf-8') as f:
+                for line in f:
+                    key, sep, val = line.strip().partition('=')
+                    if sep and key.strip() == 'HOOK_DAEMON':
+                        value = val.strip()
+        except OSError:
+            return False
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+def _recv_all(sock: socket.socket) -> bytes:
+    """EOF 까지 소켓 데이터를 모두 읽는다."""
+    chunks: list[bytes] = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def request(hook_name: str, stdin_data: bytes) -> tuple[int, bytes, bytes] | None:
+    """데몬에 훅 실행을 요청하고 결과를 반환한다.
+
+    요청 형식: 헤더 JSON 한 줄({"hook", "cwd", "env"}) + stdin 원문, 이후 송신 종료.
+    응답 형식: 헤더 JSON 한 줄({"exit", "stdout", "stderr"} 바이트 길이) + stdout + stderr.
+    데몬이 리로드 중이면 헤더에 {"reload": true} 만 담아 응답한다.
+
+    Args:
+        hook_name: 'pre-tool-use' | 'post-tool-use' | 'subagent-stop'.
+        stdin_data: 훅 stdin 원문.
+
+    Returns:
+        (exit code, stdout, stderr) 또는 데몬 미가용/리로드/프로토콜 오류 시 None.
+    """
+    path = socket_path()
+    if len(path) > MAX_SOCKET_PATH or not os.path.exists(path):
+        return None
+
+    header = json.dumps({
+        'hook': hook_name,
+        'cwd': os.getcwd(),
+        'env': dict(os.environ),
+    }, ensure_ascii=False).encode('utf-8')
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(path)
+            sock.settimeout(RESPONSE_TIMEOUT)
+            sock.sendall(header + b'\n' + stdin_data)
+            sock.shutdown(socket.SHUT_WR)
+            raw = _recv_all(sock)
+    except OSError:
+        return None
+
+    head, sep, body = raw.partition(b'\n')
+    if not sep:
+        return None
+    try:
+        meta = json.loads(head)
+        if meta.get('reload'):
+            return None
+        out_len = int(meta['stdout'])
+        err_len = int(meta['stderr'])
+        exit_code = int(meta['exit'])
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if len(body) != out_len + err_len:
+        return None
+    return exit_code, body[:out_len], body[out_len:]
+
+
+def daemon_down() -> bool:
+    """소켓이 없거나 연결이 거부되면(데몬 비정상 종료 후 stale 소켓) True."""
+    path = socket_path()
+    if len(path) > MAX_SOCKET_PATH:
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return True
+    except OSError:
+        return False
+    return False
+
+
+def spawn_daemon() -> None:
+    """데몬을 백그라운드(새 세션)로 기동한다. 이미 실행 중이면 데몬 쪽에서 즉시 종료한다."""
+    import subprocess  # noqa: PLC0415 — 기동 경로에서만 필요
+
+    daemon_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hook_daemon.py')
+    try:
+        subprocess.Popen(
+            [sys.executable, daemon_script],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def relay_to_daemon(hook_name: str) -> None:
+    """디스패처 진입점: 데몬이 응답하면 결과를 중계하고 종료한다.
+
+    HOOK_DAEMON 비활성이면 stdin 을 건드리지 않고 즉시 반환한다.
+    데몬이 응답하지 못하면 stdin 을 sys.stdin 에 복원하고 반환하며,
+    데몬이 내려가 있으면 다음 호출을 위해 데몬을 기동한다.
+
+    Args:
+        hook_name: 'pre-tool-use' | 'post-tool-use' | 'subagent-stop'.
+    """
+    if not daemon_enabled():
+        return
+
+    stdin_data = sys.stdin.buffer.read()
+    result = request(hook_name, stdin_data)
+    if result is None:
+        sys.stdin = io.TextIOWrapper(io.BytesIO(stdin_data), encoding='utf-8')
+        if daemon_down():
+            spawn_daemon()
+        return
+
+    exit_code, out, err = result
+    if out:
+        sys.stdout.buffer.write(out)
+        sys.stdout.flush()
+    if err:
+        sys.stderr.buffer.write(err)
+        sys.stderr.flush()
+    sys.exit(exit_code)
@@ -0,0 +1,325 @@
+#!/usr/bin/env -S python3 -u
+"""Resident hook daemon (opt-in, HOOK_DAEMON=true).
+
+pre-tool-use / post-tool-use / subagent-stop 디스패처 모듈과 가드 모듈,
+파싱된 .settings 플래그, 해석된 프로젝트 루트를 한 프로세스에 상주시켜
+훅 이벤트마다 반복되던 python cold start 와 import/설정 파싱 비용을 제거한다.
+
+hook_client.py 가 Unix 소켓(.claude-organic/.hook-daemon.sock)으로 보낸 요청을
+순차 처리한다. 요청마다 클라이언트의 환경변수와 cwd 를 그대로 적용한 뒤
+디스패처 main() 을 stdin/stdout/stderr 를 치환한 상태로 호출하고,
+출력과 exit code 를 응답한다. 요청을 순차 처리하므로 os.environ 교체는 안전하다.
+
+수명 관리:
+  - 중복 실행 방지: .hook-daemon.pid 에 flock (보유 중인 데몬이 있으면 즉시 종료)
+  - 유휴 종료: HOOK_DAEMON_IDLE_SECONDS(기본 900초) 동안 요청이 없으면 종료
+  - 리로드: .settings, hooks/*.py, engine/guards/*.py, engine/common.py,
+    engine/constants.py, engine/root_cache.py 의 mtime 이 바뀌면 해당 요청에 reload 를 응답(클라이언트는
+    기존 경로로 폴백)하고 자기 자신을 재실행(os.execv)하여 모듈을 새로 적재한다.
+  - SIGTERM/atexit: 소켓과 pid 파일 정리
+
+사용법:
+    python3 .claude-organic/hooks/hook_daemon.py
+"""
+
+from __future__ import annotations
+
+import atexit
+import fcntl
+import glob
+import importlib.util
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import traceback
+from types import ModuleType
+
+_HOOKS_DIR: str = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _HOOKS_DIR)
+
+_engine_dir: str = os.path.normpath(os.path.join(_HOOKS_DIR, '..', 'engine'))
+if _engine_dir not in sys.path:
+    sys.path.insert(0, _engine_dir)
+
+from dispatcher import hook_span, wait_pending_guards  # noqa: E402
+from hook_client import MAX_SOCKET_PATH, pid_path, socket_path  # noqa: E402
+
+# 데몬이 실행할 수 있는 디스패처 (훅 이름 -> 스크립트 파일명)
+HOOK_SCRIPTS: dict[str, str] = {
+    'pre-tool-use': 'pre-tool-use.py',
+    'post-tool-use': 'post-tool-use.py',
+    'subagent-stop': 'subagent-stop.py',
+}
+
+DEFAULT_IDLE_SECONDS: int = 900
+_REQUEST_READ_TIMEOUT: float = 5.0
+_LISTEN_BACKLOG: int = 32
+
+_hook_modules: dict[str, ModuleType] = {}
+
+
+# ---------------------------------------------------------------------------
+# 변경 감지
+# ---------------------------------------------------------------------------
+
+def _watched_files() -> list[str]:
+    """리로드 판정 대상 파일 목록을 반환한다."""
+    cw_dir = os.path.dirname(_HOOKS_DIR)
+    files = [
+        os.path.join(cw_dir, '.settings'),
+        os.path.join(_engine_dir, 'common.py'),
+        os.path.join(_engine_dir, 'constants.py'),
+        os.path.join(_engine_dir, 'root_cache.py'),
+        os.path.join(_engine_dir, 'git_state.py'),
+        os.path.join(_engine_dir, 'workflow_registry.py'),
+        os.path.join(_engine_dir, 'flow', 'hook_spans.py'),
+    ]
+    files.extend(sorted(glob.glob(os.path.join(_HOOKS_DIR, '*.py'))))
+    files.extend(sorted(glob.glob(os.path.join(_engine_dir, 'guards', '*.py'))))
+    return files
+
+
+def _fingerprint() -> tuple[tuple[str, int], ...]:
+    """감시 파일의 (경로, mtime_ns) 튜플을 반환한다. 없는 파일은 mtime 0."""
+    result: list[tuple[str, int]] = []
+    for path in _watched_files():
+        try:
+            result.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            result.append((path, 0))
+    return tuple(result)
+
+
+# ---------------------------------------------------------------------------
+# 훅 실행
+# ---------------------------------------------------------------------------
+
+def _load_hook(hook_name: str) -> ModuleType:
+    """디스패처 스크립트를 모듈로 적재한다 (프로세스 내 캐시).
+
+    Args:
+        hook_name: HOOK_SCRIPTS 키.
+
+    Returns:
+        디스패처 모듈 (``__main__`` 블록은 실행되지 않는다).
+    """
+    module = _hook_modules.get(hook_name)
+    if module is None:
+        path = os.path.join(_HOOKS_DIR, HOOK_SCRIPTS[hook_name])
+        spec = importlib.util.spec_from_file_location(
+            '_hook_' + hook_name.replace('-', '_'), path,
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _hook_modules[hook_name] = module
+    return module
+
+
+def _exit_code(exc: SystemExit, stderr: io.TextIOWrapper) -> int:
+    """SystemExit 를 인터프리터와 동일한 규칙으로 exit code 로 변환한다."""
+    code = exc.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    stderr.write(f"{code}\n")
+    return 1
+
+
+def run_hook(hook_name: str, stdin_data: bytes) -> tuple[int, bytes, bytes]:
+    """디스패처 main() 을 표준 입출력을 치환한 상태로 실행한다.
+
+    Args:
+        hook_name: HOOK_SCRIPTS 키.
+        stdin_data: 훅 stdin 원문.
+
+    Returns:
+        (exit code, stdout 바이트, stderr 바이트).
+    """
+    out_buf = io.BytesIO()
+    err_buf = io.BytesIO()
+    saved = (sys.stdin, sys.stdout, sys.stderr)
+    sys.stdin = io.TextIOWrapper(io.BytesIO(stdin_data), encoding='utf-8')
+    sys.stdout = io.TextIOWrapper(out_buf, encoding='utf-8', write_through=True)
+    sys.stderr = io.TextIOWrapper(err_buf, encoding='utf-8', write_through=True)
+    exit_code = 0
+    try:
+        with hook_span(hook_name):
+            _load_hook(hook_name).main()
+    except SystemExit as exc:
+        exit_code = _exit_code(exc, sys.stderr)
+    except Exception:  # noqa: BLE001
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            stream.flush()
+            stream.detach()
+        sys.stdin, sys.stdout, sys.stderr = saved
+    return exit_code, out_buf.getvalue(), err_buf.getvalue()
+
+
+def _apply_client_context(env: dict[str, str], cwd: str) -> None:
+    """클라이언트 프로세스의 환경변수와 cwd 를 데몬 프로세스에 적용한다."""
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        os.chdir(cwd)
+    except OSError:
+        pass
+
+
+def _reap_children() -> None:
+    """dispatch_async 등으로 생성된 종료 자식 프로세스를 회수한다."""
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+# ---------------------------------------------------------------------------
+# 소켓 서버
+# ---------------------------------------------------------------------------
+
+def _read_request(conn: socket.socket) -> tuple[dict, bytes] | None:
+    """요청(헤더 JSON 한 줄 + stdin 원문)을 읽는다. 형식 오류면 None."""
+    conn.settimeout(_REQUEST_READ_TIMEOUT)
+    chunks: list[bytes] = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    head, sep, body = b''.join(chunks).partition(b'\n')
+    if not sep:
+        return None
+    try:
+        meta = json.loads(head)
+    except ValueError:
+        return None
+    if not isinstance(meta, dict) or meta.get('hook') not in HOOK_SCRIPTS:
+        return None
+    return meta, body
+
+
+def _respond(conn: socket.socket, exit_code: int, out: bytes, err: bytes) -> None:
+    """응답(헤더 JSON 한 줄 + stdout + stderr)을 전송한다."""
+    head = json.dumps({'exit': exit_code, 'stdout': len(out), 'stderr': len(err)})
+    conn.sendall(head.encode('utf-8') + b'\n' + out + err)
+
+
+def _idle_seconds() -> int:
+    """HOOK_DAEMON_IDLE_SECONDS 설정값(초)을 반환한다."""
+    from common import read_env  # noqa: PLC0415
+    try:
+        value = int(os.environ.get('HOOK_DAEMON_IDLE_SECONDS') or read_env('HOOK_DAEMON_IDLE_SECONDS') or 0)
+    except ValueError:
+        value = 0
+    return value if value > 0 else DEFAULT_IDLE_SECONDS
+
+
+def _acquire_pid_lock() -> int | None:
+    """pid 파일에 배타 flock 을 건다. 다른 데몬이 보유 중이면 None."""
+    fd = os.open(pid_path(), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    os.ftruncate(fd, 0)
+    os.write(fd, f"{os.getpid()}\n".encode())
+    return fd
+
+
+def serve() -> int:
+    """데몬 메인 루프. 유휴 종료 시 0, 기동 불가 시 1 을 반환한다.
+
+    리로드가 필요하면 반환하지 않고 os.execv 로 재실행한다.
+    """
+    sock_path = socket_path()
+    if len(sock_path) > MAX_SOCKET_PATH:
+        return 1
+
+    lock_fd = _acquire_pid_lock()
+    if lock_fd is None:
+        return 1
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    def _cleanup() -> None:
+        server.close()
+        try:
+            os.unlink(sock_path)
+        except OSError:
+            pass
+        try:
+            os.unlink(pid_path())
+        except OSError:
+            pass
+        os.close(lock_fd)
+
+    def _on_sigterm(signum: int, frame: object) -> None:
+        sys.exit(0)
+
+    atexit.register(_cleanup)
+    signal.signal(signal.SIGTERM, _on_sigterm)
+
+    # flock 보유 = 유일한 데몬 → 남은 소켓은 stale
+    try:
+        os.unlink(sock_path)
+    except FileNotFoundError:
+        pass
+    server.bind(sock_path)
+    server.listen(_LISTEN_BACKLOG)
+    server.settimeout(_idle_seconds())
+
+    # 디스패처/가드 모듈 선적재
+    for hook_name in HOOK_SCRIPTS:
+        _load_hook(hook_name)
+    baseline = _fingerprint()
+
+    while True:
+        try:
+            conn, _ = server.accept()
+        except socket.timeout:
+            return 0
+
+        reload_needed = False
+        with conn:
+            try:
+                request = _read_request(conn)
+                if request is None:
+                    continue
+                meta, stdin_data = request
+                if _fingerprint() != baseline:
+                    conn.sendall(b'{"reload": true}\n')
+                    reload_needed = True
+                else:
+                    _apply_client_context(meta.get('env') or {}, meta.get('cwd') or '/')
+                    exit_code, out, err = run_hook(meta['hook'], stdin_data)
+                    _respond(conn, exit_code, out, err)
+                    # 조기 deny 로 남은 가드 스레드가 다음 요청의 환경을 보지 않도록 정리
+                    wait_pending_guards()
+            except OSError:
+                pass
+        _reap_children()
+
+        if reload_needed:
+            atexit.unregister(_cleanup)
+            _cleanup()
+            os.execv(sys.executable, [sys.executable, os.path.abspath(__file__)])
+
+
+def main() -> None:
+    """CLI 진입점."""
+    sys.exit(serve())
+
+
+if __name__ == '__main__':
+    main()
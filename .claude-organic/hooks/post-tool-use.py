@@ -15,8 +15,15 @@ import subprocess
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+if __name__ == '__main__':
+    # HOOK_DAEMON 활성 시 상주 데몬에 위임 (응답하면 여기서 종료, 아니면 아래 기존 경로)
+    from hook_client import relay_to_daemon
+    relay_to_daemon('post-tool-use')
+
 from dispatcher import (
+    capture_payload,
     dispatch_async,
+    hook_span,
     load_env_flags,
     scripts_dir,
 )
@@ -27,6 +34,8 @@ _engine_dir: str = os.path.normpath(
 if _engine_dir not in sys.path:
     sys.path.insert(0, _engine_dir)
 
+from flow import hook_spans  # noqa: E402
+
 
 # ---------------------------------------------------------------------------
 # metrics 헬퍼
@@ -173,6 +182,8 @@ def main() -> None:
 
     tool_name = payload.get('tool_name', '')
     tool_input = payload.get('tool_input', {})
+    hook_spans.set_tool(tool_name)
+    capture_payload('post-tool-use', payload)
 
     # --- metrics: tool.call 이벤트 기록 (모든 도구 대상) ---
     # 기존 hook 로직과 독립적으로 수행. 실패해도 hook 동작에 영향 없음.
@@ -349,4 +360,5 @@ def _record_subagent_metrics(
 
 
 if __name__ == '__main__':
-    main()
+    with hook_span('post-tool-use'):
+        main()
@@ -3,6 +3,16 @@
 
 Routes hook logic based on tool_name extracted from stdin JSON.
 Uses dispatcher.py utilities for flag-based conditional execution.
+Sync guards are evaluated in-process via their evaluate() plugin API
+(guards/guard_api.py); HOOK_GUARD_INPROCESS=false restores one subprocess per guard.
+Guards for a tool_name run concurrently (HOOK_GUARD_PARALLEL=false runs them serially);
+repeated inputs reuse cached decisions (engine/guards/decision_cache.py, HOOK_GUARD_CACHE=false disables);
+per-guard wall time and the hook total are recorded as latency spans in the
+per-day spool (engine/flow/hook_spans.py).
+HOOK_PAYLOAD_CORPUS=true records the anonymized payload for engine/bench/hook_replay.py.
+Large Write/Edit payloads are scanned only for their routing fields (engine/guards/payload_scan.py);
+the file body is decoded only for guards that declare NEEDS_CONTENT.
+With HOOK_DAEMON=true the event is relayed to the resident hook_daemon.py first.
 
 라우팅 테이블:
   Write|Edit|MultiEdit|NotebookEdit       -> rules_auto_approve         (HOOK_RULES_AUTO_APPROVE, sync, fast-path)
@@ -27,11 +37,17 @@ import os
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+if __name__ == '__main__':
+    # HOOK_DAEMON 활성 시 상주 데몬에 위임 (응답하면 여기서 종료, 아니면 아래 기존 경로)
+    from hook_client import relay_to_daemon
+    relay_to_daemon('pre-tool-use')
+
 from dispatcher import (
-    collect_exit_codes,
-    collect_outputs,
-    dispatch,
+    capture_payload,
     dispatch_async,
+    evaluate_guard,
+    evaluate_guards,
+    hook_span,
     load_env_flags,
     scripts_dir,
 )
@@ -42,6 +58,29 @@ _engine_dir: str = os.path.normpath(
 if _engine_dir not in sys.path:
     sys.path.insert(0, _engine_dir)
 
+from flow import hook_spans  # noqa: E402
+from guards.payload_scan import parse_tool_payload  # noqa: E402
+
+
+_WRITE_TOOLS: tuple[str, ...] = ('Write', 'Edit', 'MultiEdit', 'NotebookEdit')
+_WRITE_BASH_TOOLS: tuple[str, ...] = _WRITE_TOOLS + ('Bash',)
+
+# 동기 가드 라우팅 테이블 (선언 순서 = 우선순위, 첫 deny가 최종 결정)
+# (대상 tool_name 목록, HOOK_* 플래그, engine/guards/ 하위 스크립트)
+_SYNC_GUARDS: list[tuple[tuple[str, ...], str, str]] = [
+    (_WRITE_BASH_TOOLS, 'HOOK_HOOKS_SELF_PROTECT', 'hooks_self_guard.py'),
+    (('Bash',), 'HOOK_DANGEROUS_COMMAND', 'dangerous_command_guard.py'),
+    (('Bash',), 'HOOK_DIRECT_PATH_GUARD', 'direct_path_guard.py'),
+    (('Bash',), 'HOOK_MAIN_BRANCH_GUARD', 'main_branch_guard.py'),
+    (('Bash',), 'HOOK_KANBAN_SUBCOMMAND_GUARD', 'kanban_subcommand_guard.py'),
+    (('Bash',), 'HOOK_DONE_RELATION_GUARD', 'done_relation_guard.py'),
+    (('Bash',), 'HOOK_WORKTREE_REMOVE_GUARD', 'worktree_remove_guard.py'),
+    (_WRITE_BASH_TOOLS, 'HOOK_MAIN_SESSION_GUARD', 'main_session_guard.py'),
+    (_WRITE_BASH_TOOLS, 'HOOK_READONLY_SESSION_GUARD', 'readonly_session_guard.py'),
+    (_WRITE_BASH_TOOLS, 'HOOK_WORKTREE_PATH_GUARD', 'worktree_path_guard.py'),
+    (('Task',), 'HOOK_AGENT_INVESTIGATION_GUARD', 'agent_investigation_guard.py'),
+]
+
 
 # ---------------------------------------------------------------------------
 # metrics 헬퍼
@@ -114,53 +153,49 @@ def _record_tool_deny_metrics(
 # Main dispatcher
 # ---------------------------------------------------------------------------
 
+def _emit(decision_json: str) -> None:
+    """판정 JSON 한 줄을 stdout에 기록하고 종료한다 (가드 스크립트 출력과 동일한 바이트)."""
+    sys.stdout.buffer.write((decision_json + '\n').encode('utf-8'))
+    sys.stdout.flush()
+    sys.exit(0)
+
+
 def main() -> None:
     """Dispatch pre-tool-use hooks based on tool_name.
 
-    Reads JSON from stdin, extracts tool_name, and dispatches
-    the appropriate sync or async hook scripts. Exits with the
-    first non-zero exit code from synchronous hooks.
+    Reads JSON from stdin, extracts tool_name, and evaluates the
+    sync guards registered for it concurrently. The first deny in
+    _SYNC_GUARDS order is relayed; otherwise an allow decision is emitted.
     """
     stdin_data = sys.stdin.buffer.read()
 
-    # Parse tool_name from JSON input
+    # Parse tool_name from JSON input (large Write/Edit bodies are left undecoded)
     try:
-        payload = json.loads(stdin_data)
+        payload = parse_tool_payload(stdin_data)
     except (json.JSONDecodeError, ValueError):
         sys.exit(0)
 
     tool_name = payload.get('tool_name', '')
+    hook_spans.set_tool(tool_name)
 
     flags = load_env_flags()
-    sync_results = []
+    capture_payload('pre-tool-use', payload, flags)
     # Other tool_name values (Read, Glob, Grep, WebFetch, etc.) pass through without hook processing
 
     # --- Write|Edit|MultiEdit|NotebookEdit: rules-auto-approve (sync, fast-path) ---
     # .claude/rules/ 경로 대상 파일 수정 요청을 가드 체인 실행 전에 선제 처리한다.
     # allow 응답이 반환되면 나머지 가드 체인을 스킵하고 즉시 allow 출력 후 종료한다.
     # 이를 통해 hooks_self_guard, main_session_guard 등이 우발적으로 deny하는 것을 방지한다.
-    if tool_name in ('Write', 'Edit', 'MultiEdit', 'NotebookEdit'):
-        r = dispatch(
+    if tool_name in _WRITE_TOOLS:
+        decision = evaluate_guard(
             'HOOK_RULES_AUTO_APPROVE',
             scripts_dir('guards', 'rules_auto_approve.py'),
+            payload,
             stdin_data,
             flags=flags,
-            capture_output=True,
         )
-        if r is not None and r.stdout and b'allow' in r.stdout:
-            sys.stdout.buffer.write(r.stdout)
-            sys.exit(0)
-
-    # --- Write|Edit|MultiEdit|NotebookEdit|Bash: hooks-self-guard (sync) ---
-    if tool_name in ('Write', 'Edit', 'MultiEdit', 'NotebookEdit', 'Bash'):
-        r = dispatch(
-            'HOOK_HOOKS_SELF_PROTECT',
-            scripts_dir('guards', 'hooks_self_guard.py'),
-            stdin_data,
-            flags=flags,
-            capture_output=True,
-        )
-        sync_results.append(r)
+        if decision is not None and decision.is_allow:
+            _emit(decision.to_json())
 
     # --- AskUserQuestion: slack-ask (async, fire-and-forget) ---
     if tool_name == 'AskUserQuestion':
@@ -171,139 +206,26 @@ def main() -> None:
             flags=flags,
         )
 
-    # --- Bash: dangerous-command-guard (sync) ---
-    if tool_name == 'Bash':
-        r = dispatch(
-            'HOOK_DANGEROUS_COMMAND',
-            scripts_dir('guards', 'dangerous_command_guard.py'),
-            stdin_data,
-            flags=flags,
-            capture_output=True,
-        )
-        sync_results.append(r)
-
-    # --- Bash: direct-path-guard (sync) ---
-    if tool_name == 'Bash':
-        r = dispatch(
-            'HOOK_DIRECT_PATH_GUARD',
-            scripts_dir('guards', 'direct_path_guard.py'),
-            stdin_data,
-            flags=flags,
-            capture_output=True,
-        )
-        sync_results.append(r)
-
-    # --- Bash: main-branch-guard (sync) ---
-    if tool_name == 'Bash':
-        r = dispatch(
-            'HOOK_MAIN_BRANCH_GUARD',
-            scripts_dir('guards', 'main_branch_guard.py'),
-            stdin_data,
-            flags=flags,
-            capture_output=True,
-        )
-        sync_results.append(r)
-
-    # --- Bash: kanban-subcommand-guard (sync) ---
-    if tool_name == 'Bash':
-        r = dispatch(
-            'HOOK_KANBAN_SUBCOMMAND_GUARD',
-            scripts_dir('guards', 'kanban_subcommand_guard.py'),
-            stdin_data,
-            flags=flags,
-            capture_output=True,
-        )
-        sync_results.append(r)
-
-    # --- Bash: done-relation-guard (sync) ---
-    if tool_name == 'Bash':
-        r = dispatch(
-            'HOOK_DONE_RELATION_GUARD',
-            scripts_dir('guards', 'done_relation_guard.py'),
-            stdin_data,
-            flags=flags,
-            capture_output=True,
-        )
-        sync_results.append(r)
-
-    # --- Bash: worktree-remove-guard (sync) ---
-    if tool_name == 'Bash':
-        r = dispatch(
-            'HOOK_WORKTREE_REMOVE_GUARD',
-            scripts_dir('guards', 'worktree_remove_guard.py'),
-            stdin_data,
-            flags=flags,
-            capture_output=True,
-        )
-        sync_results.append(r)
-
-    # --- Write|Edit|MultiEdit|NotebookEdit|Bash: main-session-guard (sync) ---
-    if tool_name in ('Write', 'Edit', 'MultiEdit', 'NotebookEdit', 'Bash'):
-        r = dispatch(
-            'HOOK_MAIN_SESSION_GUARD',
-            scripts_dir('guards', 'main_session_guard.py'),
-            stdin_data,
-            flags=flags,
-            capture_output=True,
-        )
-        sync_results.append(r)
-
-    # --- Write|Edit|MultiEdit|NotebookEdit|Bash: readonly-session-guard (sync) ---
-    if tool_name in ('Write', 'Edit', 'MultiEdit', 'NotebookEdit', 'Bash'):
-        r = dispatch(
-            'HOOK_READONLY_SESSION_GUARD',
-            scripts_dir('guards', 'readonly_session_guard.py'),
-            stdin_data,
-            flags=flags,
-            capture_output=True,
-        )
-        sync_results.append(r)
-
-    # --- Write|Edit|MultiEdit|NotebookEdit|Bash: worktree-path-guard (sync) ---
-    if tool_name in ('Write', 'Edit', 'MultiEdit', 'NotebookEdit', 'Bash'):
-        r = dispatch(
-            'HOOK_WORKTREE_PATH_GUARD',
-            scripts_dir('guards', 'worktree_path_guard.py'),
-            stdin_data,
-            flags=flags,
-            capture_output=True,
-        )
-        sync_results.append(r)
-
-    # --- Task: agent-investigation-guard (sync) ---
-    if tool_name == 'Task':
-        r = dispatch(
-            'HOOK_AGENT_INVESTIGATION_GUARD',
-            scripts_dir('guards', 'agent_investigation_guard.py'),
-            stdin_data,
-            flags=flags,
-            capture_output=True,
-        )
-        sync_results.append(r)
-
-    # If any guard emitted a deny JSON, relay the first one and exit 0
-    for r in sync_results:
-        if r is not None and r.stdout and b'deny' in r.stdout:
-            # --- metrics: tool.deny 이벤트 기록 (deny 결정 시에만) ---
-            try:
-                deny_reason = ''
-                try:
-                    deny_data = json.loads(r.stdout)
-                    hook_out = deny_data.get('hookSpecificOutput', {})
-                    deny_reason = hook_out.get('permissionDecisionReason', '')
-                except Exception:  # noqa: BLE001
-                    pass
-                if not deny_reason:
-                    deny_reason = 'guard denied'
-                tool_use_id_str = payload.get('tool_use_id', '') or ''
-                tool_input_val = payload.get('tool_input')
-                _record_tool_deny_metrics(
-                    tool_name, tool_use_id_str, deny_reason, tool_input_val
-                )
-            except Exception:  # noqa: BLE001
-                pass
-            sys.stdout.buffer.write(r.stdout)
-            sys.exit(0)
+    # --- sync guards: 동시 실행, 테이블 순서상 첫 deny가 최종 결정 ---
+    guards = [
+        (hook_flag, scripts_dir('guards', script_name))
+        for tool_names, hook_flag, script_name in _SYNC_GUARDS
+        if tool_name in tool_names
+    ]
+    decision, _timings = evaluate_guards(guards, payload, stdin_data, flags=flags)
+    tool_use_id_str = payload.get('tool_use_id', '') or ''
+
+    if decision is not None:
+        # --- metrics: tool.deny 이벤트 기록 (deny 결정 시에만) ---
+        try:
+            deny_reason = decision.reason or 'guard denied'
+            tool_input_val = payload.get('tool_input')
+            _record_tool_deny_metrics(
+                tool_name, tool_use_id_str, deny_reason, tool_input_val
+            )
+        except Exception:  # noqa: BLE001
+            pass
+        _emit(decision.to_json())
 
     # No guard blocked: emit allow JSON so Claude Code skips confirm prompt
     allow_payload = {
@@ -318,4 +240,5 @@ def main() -> None:
 
 
 if __name__ == '__main__':
-    main()
+    with hook_span('pre-tool-use'):
+        main()
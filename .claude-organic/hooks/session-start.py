@@ -10,21 +10,28 @@ dispatcher.py 유틸리티를 사용하여 플래그 기반 조건부 실행을
 
 또한 CLAUDE_ENV_FILE 메커니즘을 통해 Bash tool 환경에 .claude-organic/bin
 PATH를 주입한다(ensure_bin_path.sh).
+
+컨텍스트 압축/초기화(source=compact/clear) 시에는 UserPromptSubmit 칸반 변경분 주입 상태
+(engine/flow/kanban_delta.py)를 지워 다음 turn 에 전체 스냅샷이 다시 주입되게 한다.
 """
 
 from __future__ import annotations
 
+import json
 import os
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from dispatcher import (
+    _find_project_root,
     collect_exit_codes,
     dispatch,
     load_env_flags,
     scripts_dir,
 )
 
+from flow import kanban_delta
+
 
 def main() -> None:
     """SessionStart 훅을 디스패치한다.
@@ -41,6 +48,8 @@ def main() -> None:
     flags = load_env_flags()
     sync_results = []
 
+    _reset_kanban_delta(stdin_data)
+
     # --- Bash tool 환경 PATH 주입 (stdout 없음, CLAUDE_ENV_FILE에 export 작성) ---
     # ensure_bin_path.sh는 CLAUDE_ENV_FILE에 .claude-organic/bin PATH export를 추가한다.
     # Claude Code는 CLAUDE_ENV_FILE의 export 문을 이후 Bash tool 실행 환경에 적용한다.
@@ -73,6 +82,16 @@ def main() -> None:
     sys.exit(collect_exit_codes(sync_results))
 
 
+def _reset_kanban_delta(stdin_data: bytes) -> None:
+    """압축/초기화된 세션의 칸반 변경분 주입 상태를 지운다 (직전 주입 내용이 컨텍스트에서 사라졌으므로)."""
+    try:
+        payload = json.loads(stdin_data) if stdin_data else {}
+        if payload.get('source') in ('compact', 'clear') and payload.get('session_id'):
+            kanban_delta.reset(_find_project_root(), str(payload['session_id']))
+    except Exception:
+        pass
+
+
 def _trigger_memory_gc_session() -> None:
     import subprocess
     project_dir = os.environ.get('CLAUDE_PROJECT_DIR') or os.path.dirname(
@@ -11,9 +11,15 @@ import os
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+if __name__ == '__main__':
+    # HOOK_DAEMON 활성 시 상주 데몬에 위임 (응답하면 여기서 종료, 아니면 아래 기존 경로)
+    from hook_client import relay_to_daemon
+    relay_to_daemon('subagent-stop')
+
 from dispatcher import (
     load_env_flags,
     dispatch_async,
+    hook_span,
     scripts_dir,
 )
 
@@ -76,4 +82,5 @@ def main() -> None:
 
 
 if __name__ == '__main__':
-    main()
+    with hook_span('subagent-stop'):
+        main()